@@ -0,0 +1,149 @@
+"""
+Orchestration cost per URL, measured offline with replayed extractions.
+
+The benchmark writes a cassette with a single ``default.json`` template, so
+any number of synthetic URLs can be "extracted" by ReplayExtractor without a
+network and without recording every URL. It then runs the metadata-only mode
+of yt-dl-cli (Config -> DIContainer -> AsyncOrchestrator, records written as
+JSON Lines to /dev/null) in two variants:
+
+    orchestrator   the worker handler is a no-op returning a fixed record, so
+                   the figure is the pure cost of the bounded queue, the
+                   thread pool hand-off and the result callback
+    replay         full extraction through yt-dlp with the replay extractor,
+                   with optional injected latency and failure rate
+
+The report shows wall time, URLs per second and the cost per URL, which makes
+regressions in the orchestration layer visible at 10k–1M URL scale and
+reproducible on a CI box.
+
+Usage:
+    $ python benchmarks/bench_orchestration.py --urls 100000 --workers 8 --modes orchestrator
+    $ python benchmarks/bench_orchestration.py --urls 2000 --workers 4 --latency 0.01 \\
+          --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.config.config import Config  # noqa: E402
+from yt_dl_cli.core.orchestration import AsyncOrchestrator, DIContainer  # noqa: E402
+
+TEMPLATE = {
+    "title": "Synthetic",
+    "duration": 212,
+    "extractor": "replay",
+    "extractor_key": "Replay",
+    "formats": [
+        {"format_id": "18", "ext": "mp4", "height": 360, "vcodec": "avc1.42001E",
+         "acodec": "mp4a.40.2", "filesize": 12_000_000, "url": "https://cdn.invalid/18.mp4"},
+        {"format_id": "137", "ext": "mp4", "height": 1080, "vcodec": "avc1.640028",
+         "acodec": "none", "filesize": 90_000_000, "url": "https://cdn.invalid/137.mp4"},
+        {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2",
+         "abr": 128, "filesize": 3_400_000, "url": "https://cdn.invalid/140.m4a"},
+    ],
+}
+
+
+def quiet_logger() -> logging.Logger:
+    """Return a logger that drops everything below CRITICAL."""
+    logger = logging.getLogger("yt_dl_cli.bench")
+    logger.handlers[:] = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.CRITICAL)
+    return logger
+
+
+def synthetic_urls(count: int) -> List[str]:
+    """Return ``count`` distinct synthetic video URLs."""
+    return [f"https://www.youtube.com/watch?v=bench{i:07d}" for i in range(count)]
+
+
+def run(
+    mode: str, urls: List[str], workers: int, cassette: Path, latency: float, error_rate: float
+) -> Tuple[float, Dict[str, int]]:
+    """Run one metadata-only batch and return its wall time and stats summary."""
+    config = Config(
+        save_dir=cassette.parent,
+        max_workers=workers,
+        quality="best",
+        audio_only=False,
+        urls=urls,
+        metadata_only=True,
+        metadata_output=Path(os.devnull),
+        replay_dir=cassette,
+        replay_latency=latency,
+        replay_error_rate=error_rate,
+    )
+    core = DIContainer.create_downloader_core(config, logger=quiet_logger())
+    if mode == "orchestrator":
+        stats = core.stats
+
+        def extract_metadata(url: str) -> Dict[str, object]:
+            stats.record_success()
+            return {"url": url, "ok": True}
+
+        core.extract_metadata = extract_metadata  # type: ignore[method-assign]
+
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+            start = time.perf_counter()
+            with core:
+                asyncio.run(AsyncOrchestrator(core, config).run())
+            wall = time.perf_counter() - start
+    return wall, core.stats.get_summary()
+
+
+def rows(args: argparse.Namespace, cassette: Path) -> Iterator[str]:
+    """Run every requested mode and worker count and yield report rows."""
+    urls = synthetic_urls(args.urls)
+    for mode in args.modes.split(","):
+        for workers in (int(w) for w in args.workers.split(",")):
+            wall, summary = run(mode, urls, workers, cassette, args.latency, args.error_rate)
+            yield (
+                f"{mode:>12} {workers:>7} {len(urls):>9} {summary['success']:>9} "
+                f"{summary['failed']:>7} {wall:>9.2f} {len(urls) / wall:>10.0f} "
+                f"{wall / len(urls) * 1e6:>12.1f}"
+            )
+
+
+def main() -> None:
+    """Parse arguments, run the batches and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--urls", type=int, default=1000, help="Number of synthetic URLs")
+    parser.add_argument("--workers", default="1,4,8", help="Comma-separated worker counts")
+    parser.add_argument(
+        "--modes", default="orchestrator,replay", help="Comma-separated: orchestrator,replay"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Replay latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Replay failure rate")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="yt-dl-replay-") as tmp:
+        cassette = Path(tmp) / "cassette"
+        cassette.mkdir()
+        (cassette / "default.json").write_text(json.dumps(TEMPLATE), encoding="utf-8")
+        header = (
+            f"{'mode':>12} {'workers':>7} {'urls':>9} {'ok':>9} {'failed':>7} "
+            f"{'wall s':>9} {'urls/s':>10} {'us per url':>12}"
+        )
+        print(f"latency {args.latency * 1000:.0f} ms, error rate {args.error_rate:.2%}")
+        print(header)
+        print("-" * len(header))
+        for row in rows(args, cassette):
+            print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
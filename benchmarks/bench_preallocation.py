@@ -0,0 +1,175 @@
+"""
+Fragmentation and sequential read benchmark for preallocated downloads.
+
+The benchmark imitates parallel downloads writing to the same file system:
+``N`` writer threads append chunks to their own file in lock-step rounds and
+sync after every round, so block allocation happens interleaved, as it does
+when many slow network transfers run at once. Every scenario is run once
+with plain appends and once with the files preallocated through
+``yt_dl_cli.utils.preallocate.fallocate`` (FALLOC_FL_KEEP_SIZE), as
+``--preallocate`` does.
+
+For every file the report shows the number of extents (via the FIEMAP
+ioctl, "-" where unavailable) and the sequential read throughput after the
+file's pages were evicted from the page cache (posix_fadvise DONTNEED), i.e.
+what a media server or a later copy sees. Run it on the target array (e.g.
+``--dir /srv/media/bench``); tmpfs has no extents to fragment.
+
+Usage:
+    $ python benchmarks/bench_preallocation.py --writers 8,16 --file-size 256M \\
+          --chunk-size 1M --dir /srv/media/bench
+"""
+
+import argparse
+from dataclasses import dataclass
+import fcntl
+import os
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.utils.preallocate import fallocate  # noqa: E402
+from yt_dl_cli.utils.validators import ArgValidator  # noqa: E402
+
+FS_IOC_FIEMAP = 0xC020660B
+FIEMAP_FLAG_SYNC = 0x01
+READ_SIZE = 1024 * 1024
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one scenario."""
+
+    writers: int
+    preallocated: bool
+    file_size: int
+    write_wall: float
+    read_wall: float
+    extents: List[Optional[int]]
+
+    @property
+    def write_throughput(self) -> float:
+        """Aggregate write throughput in bytes per second."""
+        return self.writers * self.file_size / self.write_wall if self.write_wall else 0.0
+
+    @property
+    def read_throughput(self) -> float:
+        """Sequential read throughput in bytes per second (files read one by one)."""
+        return self.writers * self.file_size / self.read_wall if self.read_wall else 0.0
+
+    @property
+    def mean_extents(self) -> Optional[float]:
+        """Mean extents per file, or None if FIEMAP is unavailable."""
+        known = [count for count in self.extents if count is not None]
+        return statistics.mean(known) if known else None
+
+
+def count_extents(path: str) -> Optional[int]:
+    """Return the number of extents of a file (FIEMAP), or None if unsupported."""
+    request = struct.pack("=QQIIII", 0, 2**64 - 1, FIEMAP_FLAG_SYNC, 0, 0, 0)
+    with open(path, "rb") as f:
+        try:
+            response = fcntl.ioctl(f.fileno(), FS_IOC_FIEMAP, request)
+        except OSError:
+            return None
+    return struct.unpack("=QQIIII", response)[3]
+
+
+def write_files(paths: List[str], file_size: int, chunk_size: int, preallocate: bool) -> float:
+    """Write the files in interleaved, synced rounds; return the wall time."""
+    rounds = -(-file_size // chunk_size)
+    barrier = threading.Barrier(len(paths))
+    chunk = os.urandom(chunk_size)
+
+    def writer(path: str) -> None:
+        with open(path, "wb") as f:
+            if preallocate:
+                fallocate(f.fileno(), file_size)
+            for index in range(rounds):
+                f.write(chunk[: min(chunk_size, file_size - index * chunk_size)])
+                f.flush()
+                os.fdatasync(f.fileno())
+                barrier.wait()
+
+    threads = [threading.Thread(target=writer, args=(path,)) for path in paths]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def read_files(paths: List[str]) -> float:
+    """Read the files sequentially with a cold page cache; return the wall time."""
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, "rb", buffering=0) as f:
+            while f.read(READ_SIZE):
+                pass
+    return time.perf_counter() - start
+
+
+def run_scenario(
+    directory: str, writers: int, file_size: int, chunk_size: int, preallocate: bool
+) -> ScenarioResult:
+    """Write, measure and delete one set of files."""
+    with tempfile.TemporaryDirectory(dir=directory, prefix="prealloc-") as workdir:
+        paths = [os.path.join(workdir, f"video{index:02d}.mp4") for index in range(writers)]
+        write_wall = write_files(paths, file_size, chunk_size, preallocate)
+        extents = [count_extents(path) for path in paths]
+        read_wall = read_files(paths)
+    return ScenarioResult(writers, preallocate, file_size, write_wall, read_wall, extents)
+
+
+def format_report(results: List[ScenarioResult]) -> str:
+    """Render results as a fixed-width table."""
+    header = (
+        f"{'writers':>7} {'prealloc':>8} {'extents':>8} {'max ext':>8} "
+        f"{'write MiB/s':>12} {'read MiB/s':>11}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        known = [count for count in result.extents if count is not None]
+        lines.append(
+            f"{result.writers:>7} {'yes' if result.preallocated else 'no':>8} "
+            f"{'-' if result.mean_extents is None else f'{result.mean_extents:.1f}':>8} "
+            f"{max(known) if known else '-':>8} "
+            f"{result.write_throughput / 1024**2:>12.1f} "
+            f"{result.read_throughput / 1024**2:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Parse arguments, run the scenarios and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--writers", default="8,16", help="Comma-separated writer counts")
+    parser.add_argument("--file-size", type=ArgValidator.validate_size, default="256M")
+    parser.add_argument("--chunk-size", type=ArgValidator.validate_size, default="1M")
+    parser.add_argument("--dir", default=".", help="Directory on the file system to test")
+    args = parser.parse_args()
+
+    results = []
+    for writers in (int(value) for value in args.writers.split(",")):
+        for preallocate in (False, True):
+            results.append(
+                run_scenario(args.dir, writers, args.file_size, args.chunk_size, preallocate)
+            )
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
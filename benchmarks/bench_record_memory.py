@@ -0,0 +1,131 @@
+"""
+Memory benchmark: raw yt-dlp info dictionaries vs. slotted VideoRecords.
+
+The benchmark simulates ``N`` in-flight downloads (one per worker). For every
+video it builds a synthetic info dictionary shaped like a real YouTube
+extraction (formats with signed URLs and HTTP headers, thumbnails, subtitles
+and automatic captions), then either keeps the dictionary alive for the whole
+"download" (the old behaviour) or projects it into a VideoRecord and drops the
+dictionary (the current behaviour of VideoInfoExtractor.extract_record).
+
+Memory is measured with tracemalloc. The report shows, per in-flight video,
+the memory still retained while downloads are running and the peak reached
+while the batch was being set up.
+
+Usage:
+    $ python benchmarks/bench_record_memory.py --videos 32 --formats 80
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.core.records import VideoRecord  # noqa: E402
+
+LANGUAGES = [f"l{i:03d}" for i in range(150)]
+CAPTION_EXTS = ["json3", "srv1", "srv2", "srv3", "ttml", "vtt"]
+
+
+def make_info(index: int, n_formats: int) -> Dict[str, Any]:
+    """Build a synthetic info dictionary resembling a YouTube extraction."""
+    video_id = f"vid{index:08d}"
+    headers = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 " + video_id,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-us,en;q=0.5",
+        "Sec-Fetch-Mode": "navigate",
+    }
+    formats = []
+    for i in range(n_formats):
+        formats.append(
+            {
+                "format_id": str(100 + i),
+                "format_note": f"{144 * (1 + i % 8)}p",
+                "ext": "mp4" if i % 3 else "webm",
+                "protocol": "https",
+                "url": (
+                    f"https://rr{i % 9}---sn-abc.googlevideo.com/videoplayback?"
+                    f"id={video_id}&itag={100 + i}&sig=" + "x" * 900
+                ),
+                "width": 256 * (1 + i % 8),
+                "height": 144 * (1 + i % 8),
+                "fps": 30,
+                "vcodec": "avc1.64001F" if i % 4 else "none",
+                "acodec": "mp4a.40.2" if i % 4 == 0 else "none",
+                "tbr": 100.0 + i,
+                "filesize": 1_000_000 + i,
+                "http_headers": dict(headers),
+                "downloader_options": {"http_chunk_size": 10485760},
+                "fragments": None,
+            }
+        )
+    return {
+        "id": video_id,
+        "title": f"Synthetic video {index}",
+        "duration": 600,
+        "extractor_key": "Youtube",
+        "webpage_url": f"https://www.youtube.com/watch?v={video_id}",
+        "description": "d" * 5000,
+        "formats": formats,
+        "thumbnails": [
+            {"url": f"https://i.ytimg.com/vi/{video_id}/{i}.jpg?sqp=" + "t" * 80, "id": str(i)}
+            for i in range(40)
+        ],
+        "subtitles": {
+            lang: [{"ext": ext, "url": f"https://yt/api/timedtext?lang={lang}&fmt={ext}"}]
+            for lang in LANGUAGES[:10]
+            for ext in CAPTION_EXTS
+        },
+        "automatic_captions": {
+            lang: [
+                {"ext": ext, "url": f"https://yt/api/timedtext?v={video_id}&tlang={lang}&fmt={ext}"}
+                for ext in CAPTION_EXTS
+            ]
+            for lang in LANGUAGES
+        },
+        "http_headers": headers,
+        "requested_formats": [formats[1], formats[0]],
+    }
+
+
+def measure(n_videos: int, n_formats: int, keep: Callable[[int, Dict[str, Any]], Any]
+            ) -> Tuple[int, int]:
+    """Return (retained, peak) bytes for holding ``n_videos`` in-flight items."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    in_flight: List[Any] = []
+    for i in range(n_videos):
+        in_flight.append(keep(i, make_info(i, n_formats)))
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del in_flight
+    return retained, peak
+
+
+def main() -> None:
+    """Run the benchmark and print a per-video memory report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--videos", type=int, default=32, help="in-flight videos")
+    parser.add_argument("--formats", type=int, default=80, help="formats per video")
+    args = parser.parse_args()
+
+    scenarios = {
+        "raw info dict": lambda i, info: info,
+        "VideoRecord": lambda i, info: VideoRecord.from_info(f"https://youtu.be/{i}", info),
+    }
+    print(f"{args.videos} in-flight videos, {args.formats} formats each")
+    print(f"{'scenario':<16}{'retained/video':>18}{'peak/video':>16}")
+    for name, keep in scenarios.items():
+        retained, peak = measure(args.videos, args.formats, keep)
+        print(
+            f"{name:<16}{retained / args.videos / 1024:>15.1f} KB"
+            f"{peak / args.videos / 1024:>13.1f} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
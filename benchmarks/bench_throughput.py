@@ -0,0 +1,193 @@
+"""
+End-to-end throughput benchmark against a local synthetic media server.
+
+The benchmark starts ``media_server.MediaServer`` on the loopback interface,
+then runs real yt-dl-cli batches against it: a Config is built, the
+downloader is assembled by ``DIContainer`` and driven by ``AsyncOrchestrator``
+exactly as the CLI does, and yt-dlp extracts and downloads every URL over
+HTTP. No network access is needed.
+
+For every worker count the batch is repeated into a fresh directory and the
+report shows wall time, aggregate throughput, items per second and the
+per-item latency distribution (extraction + download, as seen by a worker).
+With a per-connection ``--bandwidth`` the ideal result is linear scaling until
+the server-side pacing or the host becomes the bottleneck; ``--latency`` adds
+a fixed delay to every HTTP response and shows how much of the per-item cost
+is request overhead.
+
+Usage:
+    $ python benchmarks/bench_throughput.py --workers 1,2,4,8 \\
+          --progressive 16 --hls 8 --file-size 4M --bandwidth 2M --latency 0.02
+"""
+
+import argparse
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from media_server import MediaServer, MediaServerConfig  # noqa: E402
+from yt_dl_cli.config.config import Config  # noqa: E402
+from yt_dl_cli.core.orchestration import AsyncOrchestrator, DIContainer  # noqa: E402
+from yt_dl_cli.utils.validators import ArgValidator  # noqa: E402
+
+
+@dataclass
+class BatchResult:
+    """Measurements of one batch run."""
+
+    workers: int
+    items: int
+    success: int
+    failed: int
+    wall: float
+    bytes_received: int
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate throughput in bytes per second."""
+        return self.bytes_received / self.wall if self.wall else 0.0
+
+    def latency_percentile(self, fraction: float) -> float:
+        """Return the given percentile of the per-item latency in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def quiet_logger() -> logging.Logger:
+    """Return a logger that drops everything below ERROR."""
+    logger = logging.getLogger("yt_dl_cli.bench")
+    logger.handlers[:] = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.ERROR)
+    return logger
+
+
+def run_batch(urls: List[str], workers: int, save_dir: str, verbose: bool = False) -> BatchResult:
+    """Download ``urls`` with ``workers`` workers the way the CLI does.
+
+    Args:
+        urls (List[str]): URLs served by the media server.
+        workers (int): Number of concurrent workers.
+        save_dir (str): Empty directory to download into.
+        verbose (bool): Keep yt-dlp console output. Defaults to False.
+
+    Returns:
+        BatchResult: Timing and outcome of the batch.
+    """
+    config = Config(
+        save_dir=save_dir, max_workers=workers, quality="best", audio_only=False, urls=urls
+    )
+    core = DIContainer.create_downloader_core(config, logger=quiet_logger())
+    latencies: List[float] = []
+    download_single = core.download_single
+
+    def timed_download(url: str) -> None:
+        started = time.perf_counter()
+        try:
+            download_single(url)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    core.download_single = timed_download  # type: ignore[method-assign]
+    sink = open(os.devnull, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(sink)
+        if not verbose:
+            stack.enter_context(contextlib.redirect_stdout(sink))
+            stack.enter_context(contextlib.redirect_stderr(sink))
+        started = time.perf_counter()
+        with core:
+            asyncio.run(AsyncOrchestrator(core, config).run())
+        wall = time.perf_counter() - started
+
+    received = sum(
+        entry.stat().st_size for entry in os.scandir(save_dir) if entry.is_file()
+    )
+    return BatchResult(
+        workers=workers,
+        items=len(urls),
+        success=core.stats.success,
+        failed=core.stats.failed,
+        wall=wall,
+        bytes_received=received,
+        latencies=latencies,
+    )
+
+
+def format_report(results: List[BatchResult]) -> str:
+    """Render results as a fixed-width table."""
+    header = (
+        f"{'workers':>7} {'items':>6} {'ok':>5} {'fail':>5} {'wall s':>8} "
+        f"{'MiB/s':>8} {'items/s':>8} {'p50 s':>7} {'p95 s':>7} {'max s':>7} {'speedup':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    base: Optional[float] = None
+    for result in results:
+        base = base or result.throughput
+        lines.append(
+            f"{result.workers:>7} {result.items:>6} {result.success:>5} {result.failed:>5} "
+            f"{result.wall:>8.2f} {result.throughput / 1024**2:>8.2f} "
+            f"{result.items / result.wall:>8.2f} "
+            f"{statistics.median(result.latencies or [0]):>7.3f} "
+            f"{result.latency_percentile(0.95):>7.3f} {max(result.latencies or [0]):>7.3f} "
+            f"{result.throughput / base if base else 0:>7.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Parse arguments, run the batches and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated worker counts")
+    parser.add_argument("--progressive", type=int, default=16, help="Progressive items")
+    parser.add_argument("--hls", type=int, default=4, help="HLS items")
+    parser.add_argument("--file-size", type=ArgValidator.validate_size, default="4M")
+    parser.add_argument("--segment-size", type=ArgValidator.validate_size, default="256K")
+    parser.add_argument("--segments", type=int, default=8, help="Segments per HLS item")
+    parser.add_argument(
+        "--bandwidth", type=ArgValidator.validate_size, default=None,
+        help="Per-connection bandwidth per second, e.g. 2M (default: unthrottled)",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-response delay (s)")
+    parser.add_argument("--verbose", action="store_true", help="Show yt-dlp output")
+    args = parser.parse_args()
+
+    media = MediaServerConfig(
+        file_size=args.file_size,
+        segment_size=args.segment_size,
+        segments=args.segments,
+        bandwidth=args.bandwidth,
+        latency=args.latency,
+    )
+    results = []
+    with MediaServer(media) as server:
+        for workers in (int(w) for w in args.workers.split(",")):
+            urls = server.progressive_urls(args.progressive, prefix=f"w{workers}p")
+            urls += server.hls_urls(args.hls, prefix=f"w{workers}h")
+            with tempfile.TemporaryDirectory(prefix="yt-dl-bench-") as save_dir:
+                results.append(run_batch(urls, workers, save_dir, args.verbose))
+
+    bandwidth = f"{args.bandwidth / 1024**2:.2f} MiB/s" if args.bandwidth else "unthrottled"
+    print(
+        f"{args.progressive} progressive x {args.file_size / 1024**2:.2f} MiB, "
+        f"{args.hls} HLS x {args.segments} x {args.segment_size / 1024:.0f} KiB, "
+        f"per-connection {bandwidth}, latency {args.latency * 1000:.0f} ms"
+    )
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Local synthetic media server for offline end-to-end benchmarks.
+
+The server runs in a background thread on 127.0.0.1 and serves deterministic
+synthetic media that yt-dlp's generic extractor downloads like real content:
+
+    /progressive/<name>.mp4             single progressive file (Range supported)
+    /hls/<name>.m3u8                    HLS media playlist
+    /hls/<name>/seg<N>.ts               HLS segments
+
+Every response waits ``latency`` seconds before the headers are sent and the
+body is written in small chunks paced to ``bandwidth`` bytes per second per
+connection, so worker-count scaling can be measured against a link with known
+characteristics. Nothing leaves the loopback interface.
+
+Classes:
+    MediaServerConfig: Sizes, bandwidth and latency of the synthetic media
+    ServerStats: Thread-safe request and byte counters
+    MediaServer: Threaded HTTP server serving the synthetic media
+
+Example:
+    >>> with MediaServer(MediaServerConfig(bandwidth=2_000_000, latency=0.05)) as server:
+    ...     urls = server.progressive_urls(8) + server.hls_urls(4)
+    ...     # run a batch against urls
+    >>> server.stats.requests
+    24
+"""
+
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import re
+import threading
+import time
+from typing import List, Optional, Tuple
+
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+@dataclass
+class MediaServerConfig:
+    """Characteristics of the synthetic media and of the simulated link.
+
+    Attributes:
+        file_size (int): Size of every progressive file in bytes.
+        segment_size (int): Size of every HLS segment in bytes.
+        segments (int): Number of segments per HLS playlist.
+        segment_duration (float): Advertised duration of an HLS segment.
+        bandwidth (Optional[float]): Per-connection pacing in bytes per
+            second, or None for unthrottled loopback speed.
+        latency (float): Delay in seconds before every response.
+        chunk_size (int): Size of the paced body writes.
+    """
+
+    file_size: int = 4 * 1024 * 1024
+    segment_size: int = 256 * 1024
+    segments: int = 8
+    segment_duration: float = 4.0
+    bandwidth: Optional[float] = None
+    latency: float = 0.0
+    chunk_size: int = 16 * 1024
+
+
+class ServerStats:
+    """Thread-safe request and byte counters of a MediaServer."""
+
+    def __init__(self) -> None:
+        """Initialize zeroed counters."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+
+    def add(self, sent: int) -> None:
+        """Record a finished response of ``sent`` body bytes."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent
+
+
+def synthetic_bytes(seed: str, size: int) -> bytes:
+    """Return ``size`` deterministic bytes derived from ``seed``."""
+    block = (seed.encode() + b"\x00" * 61)[:61] * 1024
+    repeats, rest = divmod(size, len(block))
+    return block * repeats + block[:rest]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler serving progressive files and HLS playlists."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence the default per-request logging."""
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """Serve headers only."""
+        self._serve(head=True)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve headers and body."""
+        self._serve(head=False)
+
+    def _route(self) -> Optional[Tuple[str, bytes]]:
+        """Map the request path to a content type and body."""
+        config = self.server.media_config
+        path = self.path.split("?", 1)[0]
+        match = re.fullmatch(r"/progressive/([\w-]+)\.mp4", path)
+        if match:
+            return "video/mp4", synthetic_bytes(match.group(1), config.file_size)
+        match = re.fullmatch(r"/hls/([\w-]+)\.m3u8", path)
+        if match:
+            lines = [
+                "#EXTM3U",
+                "#EXT-X-VERSION:3",
+                f"#EXT-X-TARGETDURATION:{int(config.segment_duration + 0.999)}",
+                "#EXT-X-MEDIA-SEQUENCE:0",
+            ]
+            for index in range(config.segments):
+                lines.append(f"#EXTINF:{config.segment_duration:.3f},")
+                lines.append(f"{match.group(1)}/seg{index}.ts")
+            lines.append("#EXT-X-ENDLIST")
+            body = ("\n".join(lines) + "\n").encode()
+            return "application/vnd.apple.mpegurl", body
+        match = re.fullmatch(r"/hls/([\w-]+)/seg(\d+)\.ts", path)
+        if match and int(match.group(2)) < config.segments:
+            seed = f"{match.group(1)}-{match.group(2)}"
+            return "video/mp2t", synthetic_bytes(seed, config.segment_size)
+        return None
+
+    def _serve(self, head: bool) -> None:
+        """Send a (possibly partial) response paced to the configured bandwidth."""
+        config = self.server.media_config
+        if config.latency:
+            time.sleep(config.latency)
+        routed = self._route()
+        if routed is None:
+            self.send_error(404)
+            return
+        content_type, body = routed
+
+        start, end = 0, len(body) - 1
+        match = _RANGE_RE.fullmatch(self.headers.get("Range", ""))
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else end
+            else:
+                start = max(len(body) - int(match.group(2)), 0)
+            end = min(end, len(body) - 1)
+            if start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        if head:
+            self.server.stats.add(0)
+            return
+
+        sent = 0
+        began = time.monotonic()
+        view = memoryview(body)[start:end + 1]
+        try:
+            for offset in range(0, len(view), config.chunk_size):
+                chunk = view[offset:offset + config.chunk_size]
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                if config.bandwidth:
+                    ahead = sent / config.bandwidth - (time.monotonic() - began)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.server.stats.add(sent)
+
+
+class _Server(ThreadingHTTPServer):
+    """ThreadingHTTPServer carrying the media configuration and counters."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, config: MediaServerConfig) -> None:
+        """Bind to an ephemeral loopback port."""
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.media_config = config
+        self.stats = ServerStats()
+
+
+class MediaServer:
+    """Background HTTP server serving synthetic progressive and HLS media.
+
+    Attributes:
+        config (MediaServerConfig): Media sizes and link characteristics.
+        stats (ServerStats): Requests served and body bytes sent.
+    """
+
+    def __init__(self, config: Optional[MediaServerConfig] = None) -> None:
+        """Create the server (not started).
+
+        Args:
+            config (Optional[MediaServerConfig]): Media and link settings.
+                Defaults to MediaServerConfig().
+        """
+        self.config = config or MediaServerConfig()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> ServerStats:
+        """ServerStats: Counters of the running (or last) server."""
+        assert self._server is not None, "server not started"
+        return self._server.stats
+
+    @property
+    def base_url(self) -> str:
+        """str: Root URL of the running server."""
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MediaServer":
+        """Start serving in a daemon thread."""
+        self._server = _Server(self.config)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="media-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MediaServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def progressive_urls(self, count: int, prefix: str = "p") -> List[str]:
+        """Return ``count`` distinct progressive media URLs."""
+        return [f"{self.base_url}/progressive/{prefix}{i:05d}.mp4" for i in range(count)]
+
+    def hls_urls(self, count: int, prefix: str = "h") -> List[str]:
+        """Return ``count`` distinct HLS playlist URLs."""
+        return [f"{self.base_url}/hls/{prefix}{i:05d}.m3u8" for i in range(count)]
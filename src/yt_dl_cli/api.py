@@ -0,0 +1,210 @@
+"""
+Embeddable asynchronous library API.
+
+VideoDownloader is built for the command line: it parses sys.argv, runs its
+own event loop with asyncio.run, reports only through the log and calls
+sys.exit on errors. This module exposes the same download engine to
+applications that run their own asyncio event loop and need the outcome of
+every URL:
+
+- ``iter_downloads`` is an async generator yielding a DownloadResult for
+  every URL as soon as it finishes,
+- ``download_many`` awaits all URLs and returns the results in input order.
+
+Both run on the caller's event loop, never call sys.exit and never raise for
+a failed URL: failures are reported as results with status "failed" and the
+exception class and message. The blocking per-URL work runs in a thread pool,
+which can be supplied by the caller (e.g. to share it with other work or to
+bound concurrency across several calls).
+
+Functions:
+    iter_downloads: Stream per-URL results in completion order
+    download_many: Return per-URL results in input order
+
+Example:
+    >>> from yt_dl_cli.api import download_many
+    >>> config = Config(save_dir=Path("downloads"), max_workers=4)
+    >>> results = await download_many(["https://youtu.be/xyz"], config)
+    >>> [(r.status, r.path, r.bytes) for r in results]
+    [('downloaded', 'downloads/Title.mp4', 12345678)]
+"""
+
+import asyncio
+import contextlib
+from concurrent.futures import Executor, ThreadPoolExecutor
+import functools
+import itertools
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import DownloaderCore
+from yt_dl_cli.core.orchestration import DIContainer
+from yt_dl_cli.core.records import DownloadResult
+from yt_dl_cli.interfaces.interfaces import ILogger
+from yt_dl_cli.utils.tracing import url_host
+
+
+def _download(core: DownloaderCore, url: str, submitted: float) -> DownloadResult:
+    """
+    Download one URL in a worker thread within its root span.
+
+    Args:
+        core (DownloaderCore): Download engine.
+        url (str): URL to download.
+        submitted (float): perf_counter time at which the URL was submitted.
+
+    Returns:
+        DownloadResult: Result of the URL; unexpected exceptions are turned
+        into failed results.
+    """
+    queued = time.perf_counter() - submitted
+    tracer = core.tracer
+    root = tracer.start_span("url", url=url, host=url_host(url))
+    try:
+        result = core.profiler.run(
+            functools.partial(tracer.run, root, core.download_result), url
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        root.set_error(repr(e))
+        core.stats.record_failure()
+        result = DownloadResult.failure(url, e)
+    finally:
+        root.add_event("done")
+        root.end()
+    result.timings["queued"] = queued
+    return result
+
+
+async def _open_core(
+    stack: contextlib.AsyncExitStack, config: Config, logger: Optional[ILogger]
+) -> DownloaderCore:
+    """
+    Build a core in the loop's default executor and close it there on exit.
+
+    Closing waits for pending post-processing and moves, so neither step
+    runs on the event loop.
+
+    Args:
+        stack (contextlib.AsyncExitStack): Stack that closes the core.
+        config (Config): Download configuration.
+        logger (Optional[ILogger]): Logger of the core.
+
+    Returns:
+        DownloaderCore: The new core.
+    """
+    loop = asyncio.get_running_loop()
+    core = await loop.run_in_executor(None, DIContainer.create_downloader_core, config, logger)
+    stack.push_async_exit(functools.partial(loop.run_in_executor, None, core.__exit__))
+    return core
+
+
+async def _run(
+    urls: Iterable[str],
+    config: Config,
+    executor: Optional[Executor],
+    core: Optional[DownloaderCore],
+    logger: Optional[ILogger],
+) -> AsyncIterator[Tuple[int, DownloadResult]]:
+    """
+    Download the URLs and yield ``(input index, result)`` pairs as they finish.
+
+    At most ``config.max_workers`` URLs are in flight at a time. A core or
+    thread pool created here is closed when the generator finishes or is
+    closed early; URLs that have not started by then are not downloaded.
+    A core built here is created and closed off the event loop (see
+    _open_core).
+    """
+    loop = asyncio.get_running_loop()
+    async with contextlib.AsyncExitStack() as stack:
+        if core is None:
+            core = await _open_core(stack, config, logger)
+        pool = executor or ThreadPoolExecutor(
+            max_workers=config.max_workers, thread_name_prefix="yt-dl-api"
+        )
+        pending = enumerate(url.strip() for url in urls if url and url.strip())
+        in_flight: Dict["asyncio.Future[DownloadResult]", int] = {}
+
+        def submit_more(core: DownloaderCore) -> None:
+            free = config.max_workers - len(in_flight)
+            for index, url in itertools.islice(pending, max(free, 0)):
+                future = loop.run_in_executor(pool, _download, core, url, time.perf_counter())
+                in_flight[future] = index
+
+        try:
+            submit_more(core)
+            while in_flight:
+                finished, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                ready = [(in_flight.pop(future), future.result()) for future in finished]
+                submit_more(core)
+                for item in ready:
+                    yield item
+        finally:
+            # Only in_flight URLs were submitted to the pool; cancelling them
+            # cancels the ones that have not started yet.
+            for future in in_flight:
+                future.cancel()
+            if executor is None:
+                await loop.run_in_executor(None, pool.shutdown)
+
+
+async def iter_downloads(
+    urls: Iterable[str],
+    config: Config,
+    *,
+    executor: Optional[Executor] = None,
+    core: Optional[DownloaderCore] = None,
+    logger: Optional[ILogger] = None,
+) -> AsyncIterator[DownloadResult]:
+    """
+    Download URLs on the running event loop, yielding results as they finish.
+
+    Args:
+        urls (Iterable[str]): URLs to download; blank entries are ignored.
+            The iterable is consumed lazily, one URL per free worker.
+        config (Config): Download configuration; ``config.urls`` is ignored
+            and ``config.max_workers`` bounds the URLs in flight.
+        executor (Optional[Executor]): Pool running the blocking downloads.
+            Defaults to a private ThreadPoolExecutor of max_workers threads.
+            A supplied executor is not shut down.
+        core (Optional[DownloaderCore]): Download engine to reuse across
+            calls (keeps its caches warm). Defaults to one built from
+            ``config`` by the DI container and closed at the end.
+        logger (Optional[ILogger]): Logger of a core built here. Defaults to
+            the application logger for config.save_dir.
+
+    Yields:
+        DownloadResult: Result of every URL in completion order.
+
+    Example:
+        >>> async for result in iter_downloads(urls, config):
+        ...     print(result.url, result.status, result.timings["total"])
+    """
+    async for _, result in _run(urls, config, executor, core, logger):
+        yield result
+
+
+async def download_many(
+    urls: Iterable[str],
+    config: Config,
+    *,
+    executor: Optional[Executor] = None,
+    core: Optional[DownloaderCore] = None,
+    logger: Optional[ILogger] = None,
+) -> List[DownloadResult]:
+    """
+    Download URLs on the running event loop and return all results.
+
+    Takes the same arguments as iter_downloads.
+
+    Returns:
+        List[DownloadResult]: One result per (non-blank) URL, in input order.
+
+    Example:
+        >>> results = await download_many(urls, config, executor=pool)
+        >>> failed = [r for r in results if not r.ok]
+    """
+    indexed = [item async for item in _run(urls, config, executor, core, logger)]
+    return [result for _, result in sorted(indexed, key=lambda item: item[0])]
@@ -1,3 +1,5 @@
+# pylint: disable=too-many-instance-attributes, too-many-branches, too-many-statements
+
 """
 Configuration Management Module
 
@@ -10,13 +12,22 @@ providing a centralized way to manage application settings with proper error han
 
 Classes:
     **Config**: Main configuration dataclass with validation
+    **ServerConfig**: Listening address of the ``serve`` daemon
 """
 
 from dataclasses import dataclass, field
+import os
 from pathlib import Path
-from typing import List
+import socket
+from typing import Dict, List, Optional
 
+from yt_dl_cli.core.scheduling import FIFO, POLICIES
 from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.utils.disk_space import FULL_POLICIES, HOLD
+from yt_dl_cli.utils.stream_sink import AUTO, FRAMED, FRAMINGS, RAW
+
+DEFAULT_CODECS: List[str] = ["avc1", "mp4a"]
+"""Codec prefixes preferred when ranking formats, unless configured."""
 
 
 @dataclass
@@ -35,9 +46,140 @@ class Config:
         max_workers (int): Maximum number of concurrent download threads.
                           Must be at least 1.
         quality (str): Video quality preference. Valid options are:
-                      'best', 'worst', '720', '480', '360'.
+                      'best', 'worst', '1080', '720', '480', '360'.
         audio_only (bool): Whether to download only audio (MP3) instead of video.
         urls (List[str]): List of URLs to download. Defaults to empty list.
+        metadata_only (bool): Whether to only extract metadata for each URL and
+                             emit it as JSON Lines instead of downloading.
+        metadata_output (Optional[Path]): File that receives the JSON Lines
+                                         metadata records. None means stdout.
+        rank_formats (bool): Whether to rank the extracted formats and download
+                            explicit format ids instead of static selectors.
+                            Default False (opt-in); enabled by max_filesize,
+                            prefer_progressive=False or non-default
+                            preferred_codecs.
+        max_filesize (Optional[int]): Size budget in bytes used when ranking
+                                     formats. None means no budget.
+        prefer_progressive (bool): Prefer a single audio+video format over a
+                                  separate video+audio pair of the same quality.
+        preferred_codecs (List[str]): Codec prefixes in order of preference
+                                     used when ranking formats.
+        deadline (Optional[float]): Target completion time of the batch in
+                                   seconds. When set, video quality is adapted
+                                   per item to the measured throughput.
+        max_bandwidth (Optional[int]): Process-wide download bandwidth cap in
+                                       bytes per second shared by all workers.
+                                       None means unlimited.
+        replay_dir (Optional[Path]): Cassette directory to serve extractions
+                                    (and recorded media) from instead of the
+                                    network. None disables replay.
+        replay_latency (float): Injected delay per replayed extraction in seconds.
+        replay_error_rate (float): Fraction of replayed extractions that fail.
+        record_dir (Optional[Path]): Cassette directory that extractions and
+                                    downloads of this run are recorded into.
+        profile (bool): Whether to time the stages of every item and log a
+                       per-stage summary table at the end of the batch.
+        profile_output (Optional[Path]): File that receives the merged
+                                        cProfile statistics of all workers.
+                                        Setting it enables profile.
+        trace_output (Optional[Path]): File that receives per-URL lifecycle
+                                      trace spans as OTLP JSON lines. None
+                                      disables tracing.
+        queue_path (Optional[Path]): Shared SQLite work queue that URLs are
+                                    pulled from (the configured URLs are
+                                    added to it first). None processes the
+                                    URL list directly.
+        lease_time (float): Seconds a claimed URL stays leased to this
+                           process without a heartbeat.
+        queue_wal (bool): Use SQLite WAL journaling for the work queue
+                         (all processes on one host). Disable it for a
+                         queue on network storage shared by several machines.
+        worker_id (str): Id of this process in the work queue. Defaults to
+                        "<hostname>:<pid>".
+        reuse_sessions (bool): Keep a warm YoutubeDL per worker thread for
+                              extractions instead of creating one per URL.
+        metadata_cache_size (int): Extracted records kept in memory so
+                                  repeated URLs skip extraction. 0 disables
+                                  the cache.
+        metadata_cache_ttl (float): Seconds a cached record stays valid.
+        schedule (str): Order in which URLs are queued: "fifo" (file order),
+                       "sjf" (smallest first) or "ljf" (largest first).
+        priorities (Dict[str, int]): Priority per URL from the links file;
+                                    higher priorities are queued first.
+        batch_size (int): URLs of the same extractor handed to one worker as
+                         a micro-batch and downloaded through one yt-dlp
+                         session. 1 disables batching.
+        expand_playlists (bool): Expand playlist and channel URLs into their
+                                videos page by page while the first videos
+                                are already downloading.
+        playlist_lookahead (int): Expanded videos queued ahead of the
+                                 workers; enumeration pauses while the
+                                 queue is full.
+        disk_margin (Optional[int]): Bytes kept free in the save directory.
+                                    When set, a download starts only if its
+                                    expected size fits into the free space
+                                    minus the margin and the reservations of
+                                    running downloads. None disables the check.
+        disk_full_policy (str): What happens to a download that does not fit:
+                               "hold" waits for running downloads to finish,
+                               "skip" fails it right away.
+        postprocess_workers (Optional[int]): Size of the process pool that
+                                            merges and audio extractions are
+                                            handed to, so download workers
+                                            do not wait for ffmpeg. 0 means
+                                            one process per CPU; None runs
+                                            post-processing in the download
+                                            thread.
+        stream_output (Optional[str]): Stream media bytes to "-" (stdout) or
+                                      a named pipe instead of saving files.
+                                      None saves files to save_dir.
+        stream_framing (str): "raw" (media bytes of a single URL), "framed"
+                             (multiplexed container for batches) or "auto"
+                             (raw for one URL, framed otherwise). Resolved
+                             to "raw" or "framed" on validation.
+        storage (Optional[str]): Where downloaded files are moved: an
+                                s3://bucket/prefix URL or a directory.
+                                Files are uploaded while they download and
+                                published atomically. None keeps them in
+                                save_dir.
+        storage_endpoint (Optional[str]): Endpoint URL of an S3-compatible
+                                         server. None uses AWS_ENDPOINT_URL
+                                         or AWS.
+        staging_dir (Optional[Path]): Fast local directory where yt-dlp
+                                     writes fragments, .part files and
+                                     merges; finished files are moved into
+                                     save_dir by a background mover. None
+                                     works in save_dir directly.
+        preallocate (bool): Reserve the blocks of downloads whose format has
+                           a known size with fallocate before they are
+                           written, so parallel downloads do not fragment.
+        buffer_size (Optional[int]): Initial read block size of yt-dlp's HTTP
+                                    downloader (buffersize). None keeps
+                                    yt-dlp's default of 1 KiB.
+        http_chunk_size (Optional[int]): Download files in ranged requests of
+                                        this size. None uses one request
+                                        unless the extractor asks for chunks.
+        no_resize_buffer (bool): Keep the block size fixed instead of
+                                adapting it to the measured rate.
+        tune_transfers (bool): Calibrate buffer and chunk sizes per host by
+                              measuring the first MiBs of downloads with
+                              different settings; explicitly configured
+                              values are kept.
+        tuning_file (Optional[Path]): Where calibration results are kept
+                                     across runs. Setting it enables
+                                     tune_transfers. Defaults to
+                                     save_dir/.transfer_tuning.json.
+        keep_alive (bool): Send the HTTP requests of all extractions and
+                          downloads over a process-wide pool of keep-alive
+                          connections instead of a new connection each.
+        keep_alive_per_host (int): Idle connections the pool keeps per host.
+        dns_cache (bool): Answer the host lookups of all connections from a
+                         process-wide DNS cache.
+        dns_ttl (float): Time, in seconds, a cached DNS answer is reused.
+        cache_dir (Optional[Path]): Shared yt-dlp cache directory for
+                                   signature and player data; each yt-dlp
+                                   version uses its own subdirectory. None
+                                   keeps yt-dlp's per-user cache.
 
     Raises:
         ValueError: If max_workers is less than 1 or quality is not in valid options.
@@ -58,6 +200,52 @@ class Config:
     quality: str
     audio_only: bool
     urls: List[str] = field(default_factory=list)
+    metadata_only: bool = False
+    metadata_output: Optional[Path] = None
+    rank_formats: bool = False
+    max_filesize: Optional[int] = None
+    prefer_progressive: bool = True
+    preferred_codecs: List[str] = field(default_factory=lambda: list(DEFAULT_CODECS))
+    deadline: Optional[float] = None
+    max_bandwidth: Optional[int] = None
+    replay_dir: Optional[Path] = None
+    replay_latency: float = 0.0
+    replay_error_rate: float = 0.0
+    record_dir: Optional[Path] = None
+    profile: bool = False
+    profile_output: Optional[Path] = None
+    trace_output: Optional[Path] = None
+    queue_path: Optional[Path] = None
+    lease_time: float = 300.0
+    queue_wal: bool = True
+    reuse_sessions: bool = False
+    metadata_cache_size: int = 0
+    metadata_cache_ttl: float = 3600.0
+    schedule: str = FIFO
+    priorities: Dict[str, int] = field(default_factory=dict)
+    batch_size: int = 1
+    expand_playlists: bool = False
+    playlist_lookahead: int = 20
+    disk_margin: Optional[int] = None
+    disk_full_policy: str = HOLD
+    postprocess_workers: Optional[int] = None
+    stream_output: Optional[str] = None
+    stream_framing: str = AUTO
+    storage: Optional[str] = None
+    storage_endpoint: Optional[str] = None
+    staging_dir: Optional[Path] = None
+    preallocate: bool = False
+    buffer_size: Optional[int] = None
+    http_chunk_size: Optional[int] = None
+    no_resize_buffer: bool = False
+    tune_transfers: bool = False
+    tuning_file: Optional[Path] = None
+    keep_alive: bool = False
+    keep_alive_per_host: int = 4
+    dns_cache: bool = False
+    dns_ttl: float = 60.0
+    cache_dir: Optional[Path] = None
+    worker_id: str = ""
 
     def __post_init__(self) -> None:
         """
@@ -69,8 +257,40 @@ class Config:
 
         Validation rules:
         - max_workers must be at least 1
-        - quality must be one of: 'best', 'worst', '720', '480', '360'
+        - quality must be one of: 'best', 'worst', '1080', '720', '480', '360'
+        - max_filesize, if set, must be positive; it, prefer_progressive=False
+          and non-default preferred_codecs enable rank_formats
+        - deadline, if set, must be positive
+        - max_bandwidth, if set, must be positive
+        - replay_latency must not be negative, replay_error_rate must be
+          between 0 and 1, and replay_dir and record_dir are exclusive
         - save_dir is converted to Path object if provided as string
+        - metadata_output is converted to Path object if provided as string
+        - profile_output is converted to Path object and enables profile
+        - trace_output is converted to Path object if provided as string
+        - lease_time must be positive and queue_path cannot be combined with
+          metadata_only; queue_path is converted to Path object
+        - worker_id defaults to "<hostname>:<pid>"
+        - metadata_cache_size must not be negative
+        - schedule must be one of "fifo", "sjf" or "ljf"
+        - batch_size must be at least 1
+        - playlist_lookahead must be at least 1
+        - disk_margin, if set, must not be negative and disk_full_policy must
+          be "hold" or "skip"
+        - postprocess_workers, if set, must not be negative
+        - stream_output cannot be combined with metadata_only, stream_framing
+          must be "auto", "raw" or "framed", and raw streaming needs exactly
+          one URL, no work queue and no playlist expansion; "auto" is resolved
+        - storage cannot be combined with stream_output or
+          postprocess_workers, and s3:// URLs must name a bucket
+        - staging_dir cannot be combined with stream_output or
+          postprocess_workers; it is converted to Path object
+        - buffer_size and http_chunk_size, if set, must be positive;
+          tuning_file enables tune_transfers, which defaults it to
+          save_dir/.transfer_tuning.json
+        - keep_alive_per_host must be at least 1
+        - dns_ttl must be positive
+        - cache_dir is converted to Path object if provided as string
 
         Raises:
             ValueError: If max_workers is less than 1 with descriptive message.
@@ -90,12 +310,172 @@ class Config:
         if self.max_workers < 1:
             raise ValueError(Messages.Config.INVALID_WORKERS(workers=self.max_workers))
 
-        valid_qualities = ["best", "worst", "720", "480", "360"]
+        valid_qualities = ["best", "worst", "1080", "720", "480", "360"]
         if self.quality not in valid_qualities:
             raise ValueError(
                 Messages.Config.INVALID_QUALITY(
                     valid=f"{', '.join(valid_qualities)}", quality=self.quality
                 )
             )
+        if self.max_filesize is not None and self.max_filesize <= 0:
+            raise ValueError(
+                Messages.Config.INVALID_FILESIZE(filesize=self.max_filesize)
+            )
+        if (
+            self.max_filesize is not None
+            or not self.prefer_progressive
+            or list(self.preferred_codecs) != DEFAULT_CODECS
+        ):
+            self.rank_formats = True
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError(Messages.Config.INVALID_DEADLINE(deadline=self.deadline))
+        if self.max_bandwidth is not None and self.max_bandwidth <= 0:
+            raise ValueError(
+                Messages.Config.INVALID_BANDWIDTH(bandwidth=self.max_bandwidth)
+            )
+        if self.replay_latency < 0:
+            raise ValueError(
+                Messages.Config.INVALID_REPLAY_LATENCY(latency=self.replay_latency)
+            )
+        if not 0.0 <= self.replay_error_rate <= 1.0:
+            raise ValueError(
+                Messages.Config.INVALID_ERROR_RATE(rate=self.replay_error_rate)
+            )
+        if self.replay_dir is not None and self.record_dir is not None:
+            raise ValueError(Messages.Config.REPLAY_RECORD_CONFLICT())
+        if self.lease_time <= 0:
+            raise ValueError(Messages.Config.INVALID_LEASE(lease=self.lease_time))
+        if self.queue_path is not None and self.metadata_only:
+            raise ValueError(Messages.Config.QUEUE_METADATA_CONFLICT())
+        if self.metadata_cache_size < 0:
+            raise ValueError(
+                Messages.Config.INVALID_CACHE_SIZE(size=self.metadata_cache_size)
+            )
+        if self.schedule not in POLICIES:
+            raise ValueError(
+                Messages.Config.INVALID_SCHEDULE(schedule=self.schedule, valid=POLICIES)
+            )
+        if self.batch_size < 1:
+            raise ValueError(Messages.Config.INVALID_BATCH_SIZE(size=self.batch_size))
+        if self.playlist_lookahead < 1:
+            raise ValueError(
+                Messages.Config.INVALID_LOOKAHEAD(lookahead=self.playlist_lookahead)
+            )
+        if self.disk_margin is not None and self.disk_margin < 0:
+            raise ValueError(Messages.Config.INVALID_DISK_MARGIN(margin=self.disk_margin))
+        if self.disk_full_policy not in FULL_POLICIES:
+            raise ValueError(
+                Messages.Config.INVALID_DISK_POLICY(
+                    policy=self.disk_full_policy, valid=FULL_POLICIES
+                )
+            )
+        if self.postprocess_workers is not None and self.postprocess_workers < 0:
+            raise ValueError(
+                Messages.Config.INVALID_POSTPROCESS_WORKERS(workers=self.postprocess_workers)
+            )
+        if self.stream_framing not in FRAMINGS:
+            raise ValueError(
+                Messages.Config.INVALID_STREAM_FRAMING(
+                    framing=self.stream_framing, valid=FRAMINGS
+                )
+            )
+        if self.stream_output is not None:
+            self._validate_stream()
+        if self.storage is not None:
+            self._validate_storage()
+        if self.staging_dir is not None:
+            for option in ("stream_output", "postprocess_workers"):
+                if getattr(self, option) is not None:
+                    raise ValueError(Messages.Config.STAGING_CONFLICT(option=option))
+            self.staging_dir = Path(self.staging_dir)
         if not isinstance(self.save_dir, Path):
             self.save_dir = Path(self.save_dir)
+        self._validate_transfer()
+        if self.metadata_output is not None and not isinstance(
+            self.metadata_output, Path
+        ):
+            self.metadata_output = Path(self.metadata_output)
+        if self.replay_dir is not None and not isinstance(self.replay_dir, Path):
+            self.replay_dir = Path(self.replay_dir)
+        if self.record_dir is not None and not isinstance(self.record_dir, Path):
+            self.record_dir = Path(self.record_dir)
+        if self.profile_output is not None:
+            self.profile_output = Path(self.profile_output)
+            self.profile = True
+        if self.trace_output is not None and not isinstance(self.trace_output, Path):
+            self.trace_output = Path(self.trace_output)
+        if self.queue_path is not None and not isinstance(self.queue_path, Path):
+            self.queue_path = Path(self.queue_path)
+        if self.cache_dir is not None and not isinstance(self.cache_dir, Path):
+            self.cache_dir = Path(self.cache_dir)
+        if not self.worker_id:
+            self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _validate_transfer(self) -> None:
+        """Validate the transfer settings and resolve the calibration file."""
+        for option in ("buffer_size", "http_chunk_size"):
+            size = getattr(self, option)
+            if size is not None and size <= 0:
+                raise ValueError(Messages.Config.INVALID_TRANSFER_SIZE(option=option, size=size))
+        if self.keep_alive_per_host < 1:
+            raise ValueError(
+                Messages.Config.INVALID_KEEP_ALIVE(count=self.keep_alive_per_host)
+            )
+        if self.dns_ttl <= 0:
+            raise ValueError(Messages.Config.INVALID_DNS_TTL(ttl=self.dns_ttl))
+        if self.tuning_file is not None:
+            self.tuning_file = Path(self.tuning_file)
+            self.tune_transfers = True
+        elif self.tune_transfers:
+            self.tuning_file = self.save_dir / ".transfer_tuning.json"
+
+    def _validate_stream(self) -> None:
+        """Validate stream mode and resolve the "auto" framing."""
+        if self.metadata_only:
+            raise ValueError(Messages.Config.STREAM_CONFLICT())
+        single = len(self.urls) == 1 and self.queue_path is None and not self.expand_playlists
+        if self.stream_framing == AUTO:
+            self.stream_framing = RAW if single else FRAMED
+        elif self.stream_framing == RAW and not single:
+            raise ValueError(Messages.Config.RAW_STREAM_BATCH(count=len(self.urls)))
+
+    def _validate_storage(self) -> None:
+        """Validate the storage URL and the options it cannot be combined with."""
+        if self.stream_output is not None:
+            raise ValueError(Messages.Config.STORAGE_CONFLICT(option="stream_output"))
+        if self.postprocess_workers is not None:
+            raise ValueError(Messages.Config.STORAGE_CONFLICT(option="postprocess_workers"))
+        url = self.storage or ""
+        if url.startswith("s3://") and not url[5:].split("/", 1)[0]:
+            raise ValueError(Messages.Config.INVALID_STORAGE(url=url))
+
+
+@dataclass
+class ServerConfig:
+    """
+    Listening address and job history of the ``yt-dl-cli serve`` daemon.
+
+    Attributes:
+        host (str): Interface the HTTP API listens on. Defaults to loopback.
+        port (int): TCP port (0 picks a free port). Defaults to 8765.
+        socket_path (Optional[Path]): Unix socket to listen on instead of
+                                     TCP. Defaults to None.
+        max_jobs (int): Finished jobs whose status is kept for queries.
+
+    Raises:
+        ValueError: If the port is out of range or max_jobs is less than 1.
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 8765
+    socket_path: Optional[Path] = None
+    max_jobs: int = 1000
+
+    def __post_init__(self) -> None:
+        """Validate the port and job history size and convert socket_path to Path."""
+        if not 0 <= self.port <= 65535:
+            raise ValueError(Messages.Config.INVALID_PORT(port=self.port))
+        if self.max_jobs < 1:
+            raise ValueError(Messages.Config.INVALID_MAX_JOBS(jobs=self.max_jobs))
+        if self.socket_path is not None and not isinstance(self.socket_path, Path):
+            self.socket_path = Path(self.socket_path)
@@ -0,0 +1,231 @@
+"""
+Shared, pre-warmed yt-dlp cache directory.
+
+yt-dlp caches data it derives from YouTube's player JavaScript (signature
+and n-parameter functions, signature timestamps) in its cache directory,
+``~/.cache/yt-dlp`` by default. That directory is private to a user and a
+container, so fresh nodes start cold, and the first extractions of a batch
+all download and evaluate the same player code while the workers race to
+populate the cache.
+
+A SharedCacheDir points every YoutubeDL of the process at an explicit
+directory that can be shared by workers and nodes (e.g. on a volume
+mounted into every container):
+
+- Layout: ``<root>/yt-dlp-<version>/<section>/<key>.json``. Each yt-dlp
+  version gets its own subdirectory, so nodes running different versions
+  never read each other's entries (yt-dlp only rejects entries written by
+  versions older than it expects, not by newer ones).
+- Writes: yt-dlp writes every entry to a temporary file next to it and
+  renames it into place, so readers never see a partial entry and
+  concurrent writers of an entry replace each other with equal data.
+  ``prepare`` removes temporary files left behind by killed writers.
+
+``yt-dl-cli warmup`` fills the directory before the workers start by
+extracting a few videos (without downloading them), so the first
+extractions of every node find the player data on disk.
+
+Classes:
+    SharedCacheDir: Versioned cache directory handed to yt-dlp
+    CacheDirStrategy: Format strategy adding the cache directory to the options
+
+Functions:
+    warmup: Extract URLs to populate a cache directory
+    warmup_command: Entry point of ``yt-dl-cli warmup``
+
+Example:
+    >>> cache = SharedCacheDir(Path("/shared/yt-dlp-cache"))
+    >>> warmup(cache, WARMUP_URLS, logger)
+    {'entries': 3, 'added': 3, 'failed': 0}
+    >>> strategy = CacheDirStrategy(strategy, cache)  # every download uses it
+"""
+
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import yt_dlp  # type: ignore
+
+from yt_dl_cli.core.core import create_youtube_dl
+from yt_dl_cli.core.records import VideoRecord
+from yt_dl_cli.i18n.init import setup_i18n
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+from yt_dl_cli.interfaces.strategies import IFormatStrategy
+from yt_dl_cli.utils.logger import LoggerFactory
+from yt_dl_cli.utils.parser import parse_warmup_arguments
+
+WARMUP_URLS = ("https://www.youtube.com/watch?v=jNQXAC9IVRw",)
+"""Videos extracted by ``yt-dl-cli warmup`` when no URLs are given."""
+
+STALE_TMP_AGE = 3600.0
+"""Seconds after which a temporary file of the cache counts as abandoned."""
+
+
+class SharedCacheDir:
+    """
+    yt-dlp cache directory of one yt-dlp version below a shared root.
+
+    Attributes:
+        root (Path): Shared directory, e.g. on a volume of all nodes.
+        path (Path): Directory of the running yt-dlp version, passed to
+            yt-dlp as ``cachedir``.
+    """
+
+    def __init__(self, root: Path, version: str = yt_dlp.version.__version__) -> None:
+        """
+        Initialize the cache directory; nothing is created yet.
+
+        Args:
+            root (Path): Shared directory.
+            version (str): yt-dlp version naming the subdirectory. Defaults
+                to the installed version.
+        """
+        self.root = Path(root)
+        self.path = self.root / f"yt-dlp-{version}"
+
+    def opts(self) -> Dict[str, Any]:
+        """Return the yt-dlp options using this directory."""
+        return {"cachedir": str(self.path)}
+
+    def prepare(
+        self, max_tmp_age: float = STALE_TMP_AGE, clock: Callable[[], float] = time.time
+    ) -> int:
+        """
+        Create the directory and remove abandoned temporary files.
+
+        Temporary files younger than ``max_tmp_age`` may belong to a writer
+        on another node and are kept.
+
+        Args:
+            max_tmp_age (float): Age in seconds after which a temporary file
+                is removed. Defaults to STALE_TMP_AGE.
+            clock (Callable[[], float]): Wall clock, comparable with file
+                modification times. Defaults to time.time.
+
+        Returns:
+            int: Number of removed files.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        removed = 0
+        for tmp in self.path.glob("*/*.tmp"):
+            try:
+                if clock() - tmp.stat().st_mtime > max_tmp_age:
+                    tmp.unlink()
+                    removed += 1
+            except OSError:
+                pass  # removed by another node in the meantime
+        return removed
+
+    def entries(self) -> Dict[str, int]:
+        """
+        Count the cached entries.
+
+        Returns:
+            Dict[str, int]: Number of entries per cache section (e.g.
+            "youtube-sigfuncs").
+        """
+        counts: Dict[str, int] = {}
+        for entry in self.path.glob("*/*.json"):
+            counts[entry.parent.name] = counts.get(entry.parent.name, 0) + 1
+        return counts
+
+
+class CacheDirStrategy(IFormatStrategy):
+    """
+    Format strategy wrapper pointing every YoutubeDL at a shared cache directory.
+
+    Extractions and downloads take their yt-dlp options from the strategy,
+    so adding ``cachedir`` here reaches every YoutubeDL the core creates.
+    """
+
+    def __init__(self, strategy: IFormatStrategy, cache: SharedCacheDir) -> None:
+        """Wrap a strategy."""
+        self.strategy = strategy
+        self.cache = cache
+
+    def get_opts(self) -> Dict[str, Any]:
+        """Return the wrapped options with the cache directory."""
+        opts = self.strategy.get_opts()
+        opts.update(self.cache.opts())
+        return opts
+
+    def select_format(self, record: VideoRecord) -> Optional[str]:
+        """Return the wrapped selection."""
+        return self.strategy.select_format(record)
+
+    def plan_items(self, count: int) -> None:
+        """Pass the number of remaining items to the wrapped strategy."""
+        self.strategy.plan_items(count)
+
+
+def warmup(
+    cache: SharedCacheDir,
+    urls: Sequence[str],
+    logger: ILogger,
+    extractors: Sequence[Any] = (),
+) -> Dict[str, int]:
+    """
+    Populate a cache directory by extracting URLs without downloading them.
+
+    All URLs are extracted by one YoutubeDL, so a player shared by several
+    videos is only processed once. A failed extraction is logged and does
+    not stop the others.
+
+    Args:
+        cache (SharedCacheDir): Directory to populate.
+        urls (Sequence[str]): Videos to extract.
+        logger (ILogger): Receives the progress and the summary.
+        extractors (Sequence[Any]): Extractor plugins registered ahead of
+            the built-in ones. Defaults to none.
+
+    Returns:
+        Dict[str, int]: entries (in the cache afterwards), added (by this
+        warm-up) and failed (URLs).
+    """
+    removed = cache.prepare()
+    if removed:
+        logger.info(Messages.Cache.CLEANED(count=removed, path=cache.path))
+    logger.info(Messages.Cache.WARMING(path=cache.path, count=len(urls)))
+    before = sum(cache.entries().values())
+    started = time.monotonic()
+    failed = 0
+    opts = dict(cache.opts(), quiet=True, no_warnings=True, skip_download=True)
+    with create_youtube_dl(opts, extractors) as ydl:
+        for url in urls:
+            try:
+                ydl.extract_info(url, download=False)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                failed += 1
+                logger.warning(Messages.Extractor.ERROR_EXTRACT(url=url, error=e))
+    entries = sum(cache.entries().values())
+    logger.info(
+        Messages.Cache.WARMED(
+            elapsed=time.monotonic() - started,
+            entries=entries,
+            added=entries - before,
+            failed=failed,
+        )
+    )
+    return {"entries": entries, "added": entries - before, "failed": failed}
+
+
+def warmup_command(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of ``yt-dl-cli warmup``.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments after ``warmup``. Defaults
+            to None (``sys.argv[2:]``).
+
+    Returns:
+        int: Exit status: 0 if every URL was extracted, 1 otherwise.
+    """
+    setup_i18n()
+    cache_dir, log_dir, urls = parse_warmup_arguments(
+        sys.argv[2:] if argv is None else argv
+    )
+    logger = LoggerFactory.get_logger(log_dir)
+    result = warmup(SharedCacheDir(cache_dir), urls or WARMUP_URLS, logger)
+    return 1 if result["failed"] else 0
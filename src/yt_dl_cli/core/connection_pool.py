@@ -0,0 +1,413 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Process-wide keep-alive connection pool for yt-dlp's HTTP requests.
+
+yt-dlp's urllib request handler sends every request with ``Connection:
+close``, and every YoutubeDL builds its own handlers, so each extraction
+API call, manifest and media request pays a new TCP (and TLS) handshake.
+For batches of short clips from the same CDN the handshakes dominate the
+transfer time.
+
+The ConnectionPool keeps finished HTTP/1.1 connections open, per scheme,
+host, port and TLS settings, and hands them to the next request for the
+same origin, whichever YoutubeDL or worker thread sends it. It is used
+through PooledRH, a request handler that yt-dlp prefers over its urllib
+handler while a pool is installed. PooledRH only replaces the opening of
+connections; cookies, redirects, decompression and error mapping are
+those of the urllib handler. Requests through a proxy are left to the
+urllib handler.
+
+yt-dlp's urllib handler lives in a private module. If a yt-dlp release
+moves it, POOL_SUPPORTED is False, PooledRH is not registered and the
+pool is not used (the DI container logs a warning and keeps yt-dlp's
+default handlers).
+
+A connection is returned to the pool only when its response was read to
+the end and the server did not ask to close it. At most
+``max_idle_per_host`` idle connections are kept per origin; idle
+connections older than ``idle_timeout`` are closed instead of reused. A
+request on a reused connection that the server has closed in the meantime
+is retried once on a new connection.
+
+Classes:
+    ConnectionPool: Idle connections per origin, with reuse statistics
+    PooledRH: yt-dlp request handler sending requests over the pool
+
+Example:
+    >>> pool = ConnectionPool(max_idle_per_host=4)
+    >>> pool.install()  # all YoutubeDL instances of the process use it
+    >>> # ... extractions and downloads ...
+    >>> pool.report(logger)
+    >>> pool.close()
+"""
+
+import functools
+import http.client
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Callable, ClassVar, Dict, Hashable, List, Optional, Tuple
+
+from yt_dlp.networking.common import register_preference, register_rh  # type: ignore
+from yt_dlp.networking.exceptions import UnsupportedRequest  # type: ignore
+
+try:
+    from yt_dlp.networking._urllib import UrllibRH  # type: ignore
+except ImportError:  # private module of yt-dlp, not part of its stable API
+    UrllibRH = None  # pylint: disable=invalid-name
+
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+
+POOL_SUPPORTED = UrllibRH is not None
+"""Whether the installed yt-dlp provides the urllib handler PooledRH extends."""
+
+_STALE_ERRORS = (ConnectionError, http.client.BadStatusLine)
+"""Errors of a reused connection that the server closed while it was idle."""
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """HTTP response returning its connection to the pool once read to the end."""
+
+    release: Optional[Callable[[bool], None]] = None
+
+    def _close_conn(self) -> None:
+        """Close the body; the connection is reusable if the body was complete."""
+        complete = not self.will_close and (bool(self.chunked) or self.length == 0)
+        super()._close_conn()  # type: ignore[misc]
+        self._finish(complete)
+
+    def close(self) -> None:
+        """Close the response; an unread body makes the connection unusable."""
+        if self.fp is not None:
+            self._finish(False)
+        super().close()
+
+    def _finish(self, reusable: bool) -> None:
+        """Hand the connection back exactly once."""
+        release, self.release = self.release, None
+        if release is not None:
+            release(reusable)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of idle keep-alive connections per origin.
+
+    Attributes:
+        max_idle_per_host (int): Idle connections kept per origin.
+        idle_timeout (float): Seconds an idle connection may be reused.
+        requests (int): Requests sent over pooled connections.
+        reused (int): Requests sent over a connection of an earlier request.
+        connections (int): Connections opened.
+        handshake_time (float): Seconds spent opening connections (DNS,
+            TCP and TLS).
+    """
+
+    def __init__(
+        self,
+        max_idle_per_host: int = 4,
+        idle_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_idle_per_host (int): Idle connections kept per origin.
+                Defaults to 4.
+            idle_timeout (float): Seconds an idle connection may be reused.
+                Defaults to 30.0.
+            clock (Callable[[], float]): Monotonic clock. Defaults to
+                time.monotonic.
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.requests = 0
+        self.reused = 0
+        self.connections = 0
+        self.handshake_time = 0.0
+        self._idle: Dict[Hashable, List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def reuse_ratio(self) -> float:
+        """float: Share of requests sent over a reused connection."""
+        return self.reused / self.requests if self.requests else 0.0
+
+    def acquire(self, key: Hashable) -> Optional[http.client.HTTPConnection]:
+        """
+        Take an idle connection of an origin out of the pool.
+
+        Args:
+            key (Hashable): Origin and connection settings.
+
+        Returns:
+            Optional[http.client.HTTPConnection]: The most recently used
+            connection that has not timed out, or None.
+        """
+        expired = []
+        found = None
+        now = self.clock()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn, since = idle.pop()
+                if now - since <= self.idle_timeout:
+                    found = conn
+                    break
+                expired.append(conn)
+        for conn in expired:
+            conn.close()
+        return found
+
+    def release(self, key: Hashable, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        """
+        Return a connection after its response was closed.
+
+        Args:
+            key (Hashable): Origin the connection belongs to.
+            conn (http.client.HTTPConnection): The connection.
+            reusable (bool): Whether another request may be sent over it.
+        """
+        if reusable and conn.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append((conn, self.clock()))
+                    return
+        conn.close()
+
+    def record(self, reused: bool, handshake: Optional[float] = None) -> None:
+        """Count a request and, for a new connection, its setup time."""
+        with self._lock:
+            self.requests += 1
+            if reused:
+                self.reused += 1
+            if handshake is not None:
+                self.connections += 1
+                self.handshake_time += handshake
+
+    def idle_count(self) -> int:
+        """Return the number of idle connections in the pool."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the pool statistics.
+
+        Returns:
+            Dict[str, Any]: requests, reused, reuse_ratio, connections,
+            handshake_time (seconds) and handshake_avg (seconds per
+            connection).
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "reused": self.reused,
+                "reuse_ratio": self.reused / self.requests if self.requests else 0.0,
+                "connections": self.connections,
+                "handshake_time": self.handshake_time,
+                "handshake_avg": (
+                    self.handshake_time / self.connections if self.connections else 0.0
+                ),
+            }
+
+    def report(self, logger: ILogger) -> None:
+        """
+        Log the reuse ratio and the time spent opening connections.
+
+        Args:
+            logger (ILogger): Logger receiving the summary.
+        """
+        summary = self.summary()
+        logger.info(
+            Messages.Connections.STATS(
+                requests=summary["requests"],
+                reused=summary["reused"],
+                ratio=summary["reuse_ratio"] * 100,
+                connections=summary["connections"],
+                handshake=summary["handshake_time"],
+                average=summary["handshake_avg"] * 1000,
+            )
+        )
+
+    def install(self) -> None:
+        """Make every YoutubeDL of the process send its HTTP requests over this pool."""
+        PooledRH.pool = self
+
+    def close(self) -> None:
+        """Uninstall the pool and close its idle connections."""
+        if PooledRH.pool is self:
+            PooledRH.pool = None
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+
+class _PooledHTTPHandler(urllib.request.BaseHandler):
+    """urllib opener handler taking connections from a ConnectionPool."""
+
+    handler_order = 400  # ahead of the urllib handler's fresh connections
+
+    def __init__(
+        self,
+        context: Any,
+        source_address: Optional[str],
+        settings: Tuple[Any, ...],
+    ) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            context (Any): SSL context of new HTTPS connections.
+            source_address (Optional[str]): Local address to bind to.
+            settings (Tuple[Any, ...]): TLS settings that are part of the
+                pool key, so connections are only reused with equal settings.
+        """
+        self._context = context
+        self._source_address = source_address
+        self._settings = settings
+
+    def http_open(self, req: urllib.request.Request) -> Optional[http.client.HTTPResponse]:
+        """Send a plain HTTP request over a pooled connection."""
+        return self._open(http.client.HTTPConnection, req)
+
+    def https_open(self, req: urllib.request.Request) -> Optional[http.client.HTTPResponse]:
+        """Send an HTTPS request over a pooled connection."""
+        return self._open(http.client.HTTPSConnection, req, context=self._context)
+
+    def _open(
+        self, conn_class: Any, req: urllib.request.Request, **kwargs: Any
+    ) -> Optional[http.client.HTTPResponse]:
+        """Send a request, reusing an idle connection of its origin if possible."""
+        pool = PooledRH.pool
+        if pool is None or req.has_proxy() or getattr(req, "_tunnel_host", None):
+            return None  # left to the urllib handler
+        key = (req.type, req.host, self._settings, self._source_address)
+        conn = pool.acquire(key)
+        handshake = None
+        if conn is None:
+            conn, handshake = self._connect(conn_class, req, kwargs)
+        try:
+            response = self._send(conn, req)
+        except _STALE_ERRORS:
+            conn.close()
+            if handshake is not None or not isinstance(req.data, (bytes, type(None))):
+                raise
+            conn, handshake = self._connect(conn_class, req, kwargs)
+            response = self._send(conn, req)
+        pool.record(handshake is None, handshake)
+        response.release = functools.partial(pool.release, key, conn)
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        return response
+
+    def _connect(
+        self, conn_class: Any, req: urllib.request.Request, kwargs: Dict[str, Any]
+    ) -> Tuple[http.client.HTTPConnection, float]:
+        """Open a new connection; return it with its setup time."""
+        if self._source_address:
+            kwargs = dict(kwargs, source_address=(self._source_address, 0))
+        conn = conn_class(req.host, timeout=req.timeout, **kwargs)
+        conn.response_class = _PooledResponse
+        started = time.perf_counter()
+        try:
+            conn.connect()
+        except OSError as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        return conn, time.perf_counter() - started
+
+    @staticmethod
+    def _send(conn: http.client.HTTPConnection, req: urllib.request.Request) -> Any:
+        """Send the request like urllib does, but without ``Connection: close``."""
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        conn.timeout = req.timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(req.timeout)
+        try:
+            conn.request(
+                req.get_method(),
+                req.selector,
+                req.data,
+                headers,
+                encode_chunked=req.has_header("Transfer-encoding"),
+            )
+            return conn.getresponse()
+        except _STALE_ERRORS:
+            raise
+        except OSError as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        except BaseException:
+            conn.close()
+            raise
+
+
+class PooledRH(UrllibRH if POOL_SUPPORTED else object):  # type: ignore[misc]
+    """
+    yt-dlp request handler sending HTTP(S) requests over the installed pool.
+
+    The handler is registered with yt-dlp when this module is imported (if
+    POOL_SUPPORTED), but only accepts requests while a ConnectionPool is
+    installed; otherwise, and for requests through a proxy, yt-dlp uses its
+    urllib handler.
+    """
+
+    _SUPPORTED_URL_SCHEMES = ("http", "https")
+    _SUPPORTED_PROXY_SCHEMES = ()
+    _SUPPORTED_FEATURES = ()
+    RH_NAME = "pooled"
+
+    pool: ClassVar[Optional[ConnectionPool]] = None
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the handler; file URLs are always left to urllib."""
+        super().__init__(**kwargs)
+        self._SUPPORTED_URL_SCHEMES = PooledRH._SUPPORTED_URL_SCHEMES
+
+    def _validate(self, request: Any) -> None:
+        """Reject requests while no pool is installed."""
+        if PooledRH.pool is None:
+            raise UnsupportedRequest("no connection pool is installed")
+        super()._validate(request)
+
+    def _create_instance(
+        self, proxies: Any, cookiejar: Any, legacy_ssl_support: Optional[bool] = None
+    ) -> urllib.request.OpenerDirector:
+        """Build the urllib opener with the pooled handler in front."""
+        opener = super()._create_instance(proxies, cookiejar, legacy_ssl_support)
+        settings = (
+            self.verify,
+            self.legacy_ssl_support if legacy_ssl_support is None else legacy_ssl_support,
+            self.prefer_system_certs,
+            tuple(sorted(self._client_cert.items())),
+        )
+        opener.add_handler(
+            _PooledHTTPHandler(
+                self._make_sslcontext(legacy_ssl_support=legacy_ssl_support),
+                self.source_address,
+                settings,
+            )
+        )
+        return opener
+
+
+def _prefer_pool(handler: Any, request: Any) -> int:
+    """Prefer the pooled handler while a pool is installed."""
+    del handler, request
+    return 500 if PooledRH.pool is not None else 0
+
+
+if POOL_SUPPORTED:
+    register_rh(PooledRH)
+    register_preference(PooledRH)(_prefer_pool)
@@ -1,5 +1,5 @@
 # pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
-# pylint: disable=broad-exception-caught
+# pylint: disable=broad-exception-caught, too-many-lines
 
 """
 YT-DL-CLI Video Downloader Core Module.
@@ -168,17 +168,189 @@ See Also:
 """
 
 
-from typing import Any, Dict
+import contextlib
+import copy
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence
 
 import yt_dlp  # type: ignore
 
+from yt_dl_cli.core.connection_pool import ConnectionPool
+from yt_dl_cli.core.dns_cache import DNSCache
+from yt_dl_cli.core.playlists import PlaylistExpander
+from yt_dl_cli.core.postprocessing import HandoffYoutubeDL, PostProcessingPool
+from yt_dl_cli.core.records import (
+    DownloadResult,
+    DownloadStatus,
+    RecordCache,
+    TransferInfo,
+    VideoRecord,
+)
+from yt_dl_cli.utils.bandwidth import BandwidthLimiter
+from yt_dl_cli.utils.disk_space import (
+    DiskSpaceAdmission,
+    InsufficientDiskSpace,
+    Reservation,
+    expected_download_size,
+)
+from yt_dl_cli.utils.mover import BackgroundMover
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.storage import StorageUploader
+from yt_dl_cli.utils.tracing import NullTracer
+from yt_dl_cli.utils.transfer_tuning import TransferTuner
 from yt_dl_cli.i18n.messages import Messages
-from yt_dl_cli.interfaces.interfaces import IFileChecker, ILogger, IStatsCollector
+from yt_dl_cli.interfaces.interfaces import (
+    IFileChecker,
+    ILogger,
+    IStatsCollector,
+    IWorkQueue,
+)
 from yt_dl_cli.interfaces.strategies import IFormatStrategy
 from yt_dl_cli.utils.utils import FilenameSanitizer
 from yt_dl_cli.config.config import Config
 
 
+def _file_size(path: Path) -> int:
+    """Return the size of ``path`` in bytes, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def create_youtube_dl(
+    opts: Dict[str, Any],
+    extractors: Sequence[Any] = (),
+    factory: Optional[Callable[..., yt_dlp.YoutubeDL]] = None,
+) -> yt_dlp.YoutubeDL:
+    """
+    Create a YoutubeDL instance with additional extractor plugins.
+
+    The plugins are registered ahead of yt-dlp's built-in extractors, so they
+    get the first chance to claim a URL (e.g. ReplayExtractor serving recorded
+    fixtures). Every YoutubeDL gets its own shallow copy of each plugin,
+    because yt-dlp binds an extractor instance to the YoutubeDL it was added to.
+
+    Args:
+        opts (Dict[str, Any]): yt-dlp options.
+        extractors (Sequence[Any]): yt-dlp InfoExtractor instances to register
+            first. Defaults to none (a plain YoutubeDL).
+        factory (Optional[Callable[..., yt_dlp.YoutubeDL]]): YoutubeDL class
+            to instantiate, e.g. HandoffYoutubeDL. Defaults to yt_dlp.YoutubeDL.
+
+    Returns:
+        yt_dlp.YoutubeDL: Ready-to-use instance.
+    """
+    factory = factory or yt_dlp.YoutubeDL
+    if not extractors:
+        return factory(opts)
+    ydl = factory(opts, auto_init=False)
+    for extractor in extractors:
+        ydl.add_info_extractor(copy.copy(extractor))
+    ydl.add_default_info_extractors()
+    return ydl
+
+
+PER_DOWNLOAD_OPTS = ("outtmpl", "format", "buffersize", "http_chunk_size", "noresizebuffer")
+"""Options that may differ between the downloads of one batch session."""
+
+
+def retarget_youtube_dl(ydl: yt_dlp.YoutubeDL, opts: Dict[str, Any]) -> None:
+    """
+    Apply the per-download options of ``opts`` to an open YoutubeDL.
+
+    yt-dlp parses the output template and the format selector when a
+    YoutubeDL is created; both are replaced here, the transfer options are
+    read by each download anyway.
+
+    Args:
+        ydl (yt_dlp.YoutubeDL): Session of a batch.
+        opts (Dict[str, Any]): Options of the next download; PER_DOWNLOAD_OPTS
+            missing from it are reset to yt-dlp's defaults.
+    """
+    for key in PER_DOWNLOAD_OPTS[1:]:
+        if key in opts:
+            ydl.params[key] = opts[key]
+        else:
+            ydl.params.pop(key, None)
+    outtmpl = opts.get("outtmpl", yt_dlp.utils.DEFAULT_OUTTMPL["default"])
+    templates = dict(ydl.params.get("outtmpl") or {})
+    templates.update(outtmpl if isinstance(outtmpl, dict) else {"default": outtmpl})
+    ydl.params["outtmpl"] = templates
+    selector = opts.get("format")
+    ydl.format_selector = (
+        selector
+        if selector in (None, "-") or callable(selector)
+        else ydl.build_format_selector(selector)
+    )
+
+
+class SessionCache:
+    """
+    Warm YoutubeDL instances kept per thread for repeated extractions.
+
+    Creating a YoutubeDL (option parsing, extractor registration, cookie and
+    HTTP setup) costs tens of milliseconds, which dominates extraction from
+    fast or cached sources. A long-running process reuses one instance per
+    worker thread and distinct option set instead. Instances are never shared
+    between threads, because YoutubeDL is not thread-safe.
+
+    Attributes:
+        max_per_thread (int): Option sets kept per thread; the least recently
+            created session is closed when the limit is exceeded.
+    """
+
+    def __init__(self, max_per_thread: int = 4) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_per_thread (int): Sessions kept per thread. Defaults to 4.
+        """
+        self.max_per_thread = max_per_thread
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[yt_dlp.YoutubeDL] = []
+
+    def get(self, opts: Dict[str, Any], extractors: Sequence[Any] = ()) -> yt_dlp.YoutubeDL:
+        """
+        Return the calling thread's session for ``opts``, creating it if needed.
+
+        Args:
+            opts (Dict[str, Any]): yt-dlp options.
+            extractors (Sequence[Any]): Extractor plugins of a new session.
+
+        Returns:
+            yt_dlp.YoutubeDL: Warm session; do not close it.
+        """
+        sessions: Dict[str, yt_dlp.YoutubeDL] = self._local.__dict__.setdefault("sessions", {})
+        key = json.dumps(opts, sort_keys=True, default=repr)
+        ydl = sessions.get(key)
+        if ydl is None:
+            if len(sessions) >= self.max_per_thread:
+                self._discard(sessions.pop(next(iter(sessions))))
+            ydl = sessions[key] = create_youtube_dl(dict(opts), extractors)
+            with self._lock:
+                self._sessions.append(ydl)
+        return ydl
+
+    def _discard(self, ydl: yt_dlp.YoutubeDL) -> None:
+        """Close an evicted session."""
+        with self._lock:
+            self._sessions.remove(ydl)
+        ydl.close()
+
+    def close(self) -> None:
+        """Close the sessions of all threads."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for ydl in sessions:
+            ydl.close()
+
+
 class VideoInfoExtractor:
     """
     Handles extraction of video metadata without downloading content.
@@ -259,7 +431,14 @@ class VideoInfoExtractor:
         Messages.Extractor: Localized error messages
     """
 
-    def __init__(self, logger: ILogger):
+    def __init__(
+        self,
+        logger: ILogger,
+        extractors: Sequence[Any] = (),
+        recorder: Optional[Any] = None,
+        sessions: Optional["SessionCache"] = None,
+        record_cache: Optional[RecordCache] = None,
+    ):
         """
         Initialize the video info extractor with a logger.
 
@@ -274,6 +453,17 @@ class VideoInfoExtractor:
                              log levels for the application context. The logger
                              will receive messages at various levels (INFO, WARNING,
                              ERROR) depending on the extraction outcomes.
+            extractors (Sequence[Any]): yt-dlp extractor plugins registered
+                             ahead of the built-in ones, e.g. ReplayExtractor.
+                             Defaults to none.
+            recorder (Optional[Any]): Object with a ``record_info(url, info)``
+                             method called after every successful extraction,
+                             e.g. CassetteRecorder. Defaults to None.
+            sessions (Optional[SessionCache]): Warm YoutubeDL instances
+                             reused across extractions instead of creating
+                             one per call. Defaults to None.
+            record_cache (Optional[RecordCache]): Cache of extracted records
+                             consulted by extract_record. Defaults to None.
 
         Note:
             The constructor is lightweight and doesn't perform any I/O operations
@@ -281,6 +471,11 @@ class VideoInfoExtractor:
             extract_info method to keep initialization fast and predictable.
         """
         self.logger = logger
+        self.extractors = tuple(extractors)
+        self.recorder = recorder
+        self.sessions = sessions
+        self.record_cache = record_cache
+        self._local = threading.local()
 
     def extract_info(self, url: str, opts: Dict[str, Any]) -> Any:
         """
@@ -392,7 +587,9 @@ class VideoInfoExtractor:
         Note:
             This method is designed to be called multiple times with different
             URLs and options. Each call creates a fresh yt-dlp instance to
-            ensure isolation and prevent state contamination between extractions.
+            ensure isolation and prevent state contamination between extractions,
+            unless a SessionCache was injected; then the calling thread's warm
+            instance for the same options is reused.
 
             Errors are logged but not raised, allowing the calling code to
             handle None return values gracefully and continue processing other
@@ -404,22 +601,79 @@ class VideoInfoExtractor:
             yt_dlp.utils.ExtractorError: Extractor-specific error handling
             Messages.Extractor: Localized error message definitions
         """
+        self._local.error = None
         try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
+            with self._session(opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 if info is None:
                     raise yt_dlp.DownloadError(Messages.Extractor.ERROR_NO_INFO())
+                if self.recorder is not None:
+                    self.recorder.record_info(url, info)
                 return info
         except yt_dlp.DownloadError as e:
+            self._local.error = e
             self.logger.error(Messages.Extractor.ERROR_EXTRACT(url=url, error=e))
             return None
         except yt_dlp.utils.ExtractorError as e:
+            self._local.error = e
             self.logger.error(Messages.Extractor.ERROR_EXTRACT(url=url, error=e))
             return None
         except Exception as e:
+            self._local.error = e
             self.logger.error(Messages.Extractor.ERROR_EXTRACT(url=url, error=e))
             return None
 
+    def last_error(self) -> Optional[BaseException]:
+        """
+        Return the error of the calling thread's last failed extraction.
+
+        Returns:
+            Optional[BaseException]: Exception caught by the last extract_info
+            call in this thread, or None if it succeeded.
+        """
+        return getattr(self._local, "error", None)
+
+    def _session(self, opts: Dict[str, Any]) -> ContextManager[yt_dlp.YoutubeDL]:
+        """Return a warm session (kept open) or a fresh YoutubeDL (closed after use)."""
+        if self.sessions is not None:
+            return contextlib.nullcontext(self.sessions.get(opts, self.extractors))
+        return create_youtube_dl(opts, self.extractors)
+
+    def extract_record(self, url: str, opts: Dict[str, Any]) -> Optional[VideoRecord]:
+        """
+        Extract video information and project it into a compact VideoRecord.
+
+        This is the preferred entry point for the download workflow. The full
+        yt-dlp info dictionary (every format with its signed URL and HTTP
+        headers, thumbnails, subtitles, automatic captions, ...) only lives for
+        the duration of this call; callers get a slotted record holding just
+        the fields the core and the format strategies need, so the raw
+        dictionary is released before the download phase starts.
+
+        Args:
+            url (str): Video URL to extract information from.
+            opts (Dict[str, Any]): yt-dlp configuration options for the extraction.
+
+        Records are served from and stored in the injected RecordCache, if
+        any; records hold no signed media URLs, so they stay valid for the
+        cache's lifetime.
+
+        Returns:
+            Optional[VideoRecord]: Compact record of the video, or None if the
+                extraction failed (errors are logged by extract_info).
+        """
+        if self.record_cache is not None:
+            cached = self.record_cache.get(url)
+            if cached is not None:
+                return cached
+        info = self.extract_info(url, opts)
+        if info is None:
+            return None
+        record = VideoRecord.from_info(url, info)
+        if self.record_cache is not None:
+            self.record_cache.put(url, record)
+        return record
+
 
 class DownloadExecutor:
     """
@@ -506,7 +760,14 @@ class DownloadExecutor:
         Messages.Executor: Localized error and status messages
     """
 
-    def __init__(self, logger: ILogger):
+    def __init__(
+        self,
+        logger: ILogger,
+        progress_hooks: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
+        extractors: Sequence[Any] = (),
+        postprocessor_hooks: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
+        postprocessing: Optional[PostProcessingPool] = None,
+    ):
         """
         Initialize the download executor with a logger.
 
@@ -521,6 +782,19 @@ class DownloadExecutor:
                              levels for the application context. The logger will
                              receive messages at various levels (INFO, WARNING, ERROR)
                              depending on download outcomes and progress.
+            progress_hooks (Optional[List[Callable]]): yt-dlp progress hooks
+                             added to every download, e.g. a shared
+                             ThroughputMonitor. Defaults to None.
+            extractors (Sequence[Any]): yt-dlp extractor plugins registered
+                             ahead of the built-in ones (the download
+                             re-extracts the URL). Defaults to none.
+            postprocessor_hooks (Optional[List[Callable]]): yt-dlp
+                             post-processor hooks added to every download,
+                             e.g. a StageProfiler. Defaults to None.
+            postprocessing (Optional[PostProcessingPool]): Pool that merges
+                             and audio extractions are handed to instead of
+                             running them in the download thread. Defaults
+                             to None.
 
         Example:
             Creating an executor with a custom logger:
@@ -540,6 +814,61 @@ class DownloadExecutor:
             execute_download method to keep initialization fast and predictable.
         """
         self.logger = logger
+        self.progress_hooks = list(progress_hooks or [])
+        self.extractors = tuple(extractors)
+        self.postprocessor_hooks = list(postprocessor_hooks or [])
+        self.postprocessing = postprocessing
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def batch_session(self) -> Iterator[None]:
+        """
+        Share one YoutubeDL between the calling thread's downloads in the block.
+
+        The session is created by the first download and reused by the
+        following ones with their own output template, format and transfer
+        options, so yt-dlp's initialization and extractor state (logins,
+        player caches) are paid for once per batch. A download with other
+        options opens a new session, and a download that raised an error
+        closes it, so the next one starts from a clean session.
+
+        Example:
+            >>> with executor.batch_session():
+            ...     for url in batch:
+            ...         executor.execute_download(url, opts_for(url))
+        """
+        self._local.batching = True
+        try:
+            yield
+        finally:
+            self._local.batching = False
+            self._close_session()
+
+    def _session(
+        self, opts: Dict[str, Any], factory: Optional[Callable[..., yt_dlp.YoutubeDL]]
+    ) -> ContextManager[yt_dlp.YoutubeDL]:
+        """Return the batch session (kept open) or a fresh YoutubeDL (closed after use)."""
+        if not getattr(self._local, "batching", False):
+            return create_youtube_dl(opts, self.extractors, factory)
+        shared = {key: value for key, value in opts.items() if key not in PER_DOWNLOAD_OPTS}
+        session = getattr(self._local, "session", None)
+        if session is not None and session[0] != shared:
+            self._close_session()
+            session = None
+        if session is None:
+            ydl = create_youtube_dl(opts, self.extractors, factory)
+            self._local.session = (shared, ydl)
+        else:
+            ydl = session[1]
+            retarget_youtube_dl(ydl, opts)
+        return contextlib.nullcontext(ydl)
+
+    def _close_session(self) -> None:
+        """Close the calling thread's batch session, if any."""
+        session = getattr(self._local, "session", None)
+        self._local.session = None
+        if session is not None:
+            session[1].close()
 
     def execute_download(self, url: str, opts: Dict[str, Any]) -> bool:
         """
@@ -577,9 +906,8 @@ class DownloadExecutor:
                                   - "writeinfojson": Save metadata to JSON file
                                   - "writesubtitles": Download subtitle files
                                   - "embedsubs": Embed subtitles in video file
-                                  - "extractaudio": Extract audio only
-                                  - "audioformat": Audio format specification
                                   - "postprocessors": Post-processing operations
+                                    (e.g. FFmpegExtractAudio)
 
         Returns:
             bool: True if the download completed successfully, False if it failed.
@@ -638,9 +966,10 @@ class DownloadExecutor:
             >>> opts = {
             ...     "format": "bestaudio/best",
             ...     "outtmpl": "/music/%(title)s.%(ext)s",
-            ...     "extractaudio": True,
-            ...     "audioformat": "mp3",
-            ...     "audioquality": "192K"
+            ...     "postprocessors": [
+            ...         {"key": "FFmpegExtractAudio", "preferredcodec": "mp3",
+            ...          "preferredquality": "192"}
+            ...     ],
             ... }
             >>> success = executor.execute_download(url, opts)
 
@@ -656,29 +985,86 @@ class DownloadExecutor:
         Note:
             This method is designed to be called multiple times with different
             URLs and options. Each call creates a fresh yt-dlp instance to
-            ensure isolation and prevent state contamination between downloads.
+            ensure isolation and prevent state contamination between downloads,
+            except within batch_session, where the thread's downloads share one.
 
             All exceptions are caught and logged, ensuring that one failed
             download doesn't crash the entire application. This makes the method
             safe for use in concurrent environments and batch processing scenarios.
 
+            With a post-processing pool, the method returns as soon as the raw
+            files are on disk: merges and audio extractions are submitted to
+            the pool (waiting only while the pool is full), and the reported
+            path is the file the pool will write.
+
         See Also:
             yt_dlp.YoutubeDL: Primary download engine documentation
             yt_dlp.DownloadError: Download-related error handling
             Messages.Executor: Localized error and status message definitions
             Config: Configuration options that affect download behavior
         """
+        transfer = self._local.transfer = TransferInfo()
+        opts = dict(opts)
+        opts["progress_hooks"] = [
+            *opts.get("progress_hooks", []),
+            *self.progress_hooks,
+            self._track_progress,
+        ]
+        opts["postprocessor_hooks"] = [
+            *opts.get("postprocessor_hooks", []),
+            *self.postprocessor_hooks,
+            self._track_postprocessor,
+        ]
+        factory = HandoffYoutubeDL if self.postprocessing is not None else None
         try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
+            with self._session(opts, factory) as ydl:
                 ydl.download([url])
+                self._hand_off(ydl)
                 return True
         except yt_dlp.DownloadError as e:
+            transfer.error = e
+            self._close_session()
             self.logger.error(Messages.Executor.ERROR_DOWNLOAD(url=url, error=e))
             return False
         except Exception as e:
+            transfer.error = e
+            self._close_session()
             self.logger.error(Messages.Executor.ERROR_DOWNLOAD(url=url, error=e))
             return False
 
+    def _hand_off(self, ydl: yt_dlp.YoutubeDL) -> None:
+        """Submit the post-processing recorded by a HandoffYoutubeDL to the pool."""
+        if self.postprocessing is None:
+            return
+        handoffs, ydl.handoffs = getattr(ydl, "handoffs", []), []
+        for job in handoffs:
+            self._local.transfer.path = job.output
+            self.postprocessing.submit(job)
+
+    def _track_progress(self, status: Dict[str, Any]) -> None:
+        """Progress hook recording finished files in the thread's TransferInfo."""
+        transfer = getattr(self._local, "transfer", None)
+        if transfer is None or status.get("status") != "finished":
+            return
+        transfer.bytes += int(status.get("total_bytes") or status.get("downloaded_bytes") or 0)
+        transfer.path = status.get("filename") or transfer.path
+
+    def _track_postprocessor(self, status: Dict[str, Any]) -> None:
+        """Post-processor hook recording the final (merged) file path."""
+        transfer = getattr(self._local, "transfer", None)
+        if transfer is not None and status.get("status") == "finished":
+            transfer.path = (status.get("info_dict") or {}).get("filepath") or transfer.path
+
+    def last_transfer(self) -> TransferInfo:
+        """
+        Return what was observed during the calling thread's last download.
+
+        Returns:
+            TransferInfo: Final path, transferred bytes and error of the last
+            execute_download call in this thread.
+        """
+        return getattr(self._local, "transfer", None) or TransferInfo()
+
 
 # -------------------- Core Downloader --------------------
 class DownloaderCore:
@@ -691,6 +1077,7 @@ class DownloaderCore:
     single download operation.
     """
 
+    # pylint: disable-next=too-many-locals
     def __init__(
         self,
         config: Config,
@@ -700,6 +1087,18 @@ class DownloaderCore:
         file_checker: IFileChecker,
         info_extractor: VideoInfoExtractor,
         download_executor: DownloadExecutor,
+        bandwidth_limiter: Optional[BandwidthLimiter] = None,
+        profiler: Optional[NullProfiler] = None,
+        tracer: Optional[NullTracer] = None,
+        work_queue: Optional[IWorkQueue] = None,
+        admission: Optional[DiskSpaceAdmission] = None,
+        postprocessing: Optional[PostProcessingPool] = None,
+        uploader: Optional[StorageUploader] = None,
+        mover: Optional[BackgroundMover] = None,
+        transfer_tuner: Optional[TransferTuner] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        dns_cache: Optional[DNSCache] = None,
+        playlist_expander: Optional[PlaylistExpander] = None,
     ):
         """
         Initialize the downloader core with all required dependencies.
@@ -712,6 +1111,43 @@ class DownloaderCore:
             file_checker (FileSystemChecker): File system operations
             info_extractor (VideoInfoExtractor): Video metadata extraction
             download_executor (DownloadExecutor): Actual download execution
+            bandwidth_limiter (Optional[BandwidthLimiter]): Process-wide
+                bandwidth cap shared by all downloads (its progress hook must
+                be installed on the executor). Defaults to None.
+            profiler (Optional[NullProfiler]): Stage profiler the orchestrator
+                runs every item through and reports at the end. Defaults to a
+                NullProfiler.
+            tracer (Optional[NullTracer]): Tracer receiving the lifecycle
+                spans of every URL. Defaults to a NullTracer.
+            work_queue (Optional[IWorkQueue]): Shared queue the orchestrator
+                pulls URLs from instead of the configured list. Defaults to
+                None.
+            admission (Optional[DiskSpaceAdmission]): Reserves the expected
+                size of every download against the free disk space (its
+                progress hook must be installed on the executor). Defaults to
+                None (no check).
+            postprocessing (Optional[PostProcessingPool]): Post-processing
+                pool shared with the executor, drained by the orchestrator
+                before the final report. Defaults to None.
+            uploader (Optional[StorageUploader]): Moves every downloaded file
+                to a storage backend (its progress hook must be installed on
+                the executor). Defaults to None (files stay in save_dir).
+            mover (Optional[BackgroundMover]): Moves finished files from
+                config.staging_dir into save_dir in the background, drained
+                by the orchestrator before the final report. Defaults to None.
+            transfer_tuner (Optional[TransferTuner]): Supplies the buffer and
+                HTTP chunk sizes of every download, calibrated per host when
+                configured (its progress hook must be installed on the
+                executor). Defaults to None (yt-dlp's defaults).
+            connection_pool (Optional[ConnectionPool]): Installed keep-alive
+                pool, whose reuse statistics the orchestrator reports.
+                Defaults to None (a connection per request).
+            dns_cache (Optional[DNSCache]): Installed DNS cache, whose hit
+                and miss counters the orchestrator reports. Defaults to None
+                (every connection asks the system resolver).
+            playlist_expander (Optional[PlaylistExpander]): Expands playlist
+                URLs into video URLs for expand_playlist. Defaults to None
+                (URLs are downloaded as given).
         """
         self.config = config
         self.strategy = strategy
@@ -720,6 +1156,18 @@ class DownloaderCore:
         self.file_checker = file_checker
         self.info_extractor = info_extractor
         self.download_executor = download_executor
+        self.bandwidth_limiter = bandwidth_limiter
+        self.profiler = profiler or NullProfiler()
+        self.tracer = tracer or NullTracer()
+        self.work_queue = work_queue
+        self.admission = admission
+        self.postprocessing = postprocessing
+        self.uploader = uploader
+        self.mover = mover
+        self.transfer_tuner = transfer_tuner
+        self.connection_pool = connection_pool
+        self.dns_cache = dns_cache
+        self.playlist_expander = playlist_expander
         self._resources: list[Any] = []
 
     def __enter__(self):
@@ -759,47 +1207,317 @@ class DownloaderCore:
         """
         self._resources.append(resource)
 
-    def download_single(self, url: str) -> None:
+    def set_bandwidth_limit(self, rate: Optional[float]) -> None:
+        """
+        Change the process-wide bandwidth cap while downloads are running.
+
+        Args:
+            rate (Optional[float]): New cap in bytes per second, or None to
+                remove it. Ignored if no limiter was injected.
+        """
+        if self.bandwidth_limiter is not None:
+            self.bandwidth_limiter.set_rate(rate)
+
+    def batch_session(self) -> ContextManager[None]:
+        """
+        Process the calling thread's downloads in the block through one session.
+
+        Returns:
+            ContextManager[None]: The executor's batch_session, or a no-op
+            context for executors without sessions (e.g. streaming).
+        """
+        session = getattr(self.download_executor, "batch_session", None)
+        return session() if session is not None else contextlib.nullcontext()
+
+    def expand_playlist(self, url: str) -> Iterator[str]:
+        """
+        Yield the video URLs of a playlist URL, fetching its pages on demand.
+
+        Args:
+            url (str): Video, playlist or channel URL.
+
+        Yields:
+            str: Video URLs in playlist order; the URL itself if it is not a
+            playlist or no playlist expander is configured.
+        """
+        if self.playlist_expander is None:
+            yield url
+            return
+        opts = self.strategy.get_opts()
+        opts.update({"quiet": True, "no_warnings": True, "skip_download": True})
+        yield from self.playlist_expander.expand(url, opts)
+
+    def download_single(self, url: str) -> str:
         """
         Download a single video from the provided URL.
 
+        Thin wrapper around download_result for callers that only need the
+        outcome (the orchestrator, the work queue and the serve daemon).
+
+        Args:
+            url (str): Video URL to download
+
+        Returns:
+            str: The outcome, a DownloadStatus value.
+        """
+        return self.download_result(url).status
+
+    # pylint: disable-next=too-many-locals,too-many-statements,too-many-branches
+    def download_result(self, url: str) -> DownloadResult:
+        """
+        Download a single video and return a structured result.
+
         This method orchestrates the complete download process for a single URL:
-        1. Extract video information to get title and check availability
+        1. Extract video information (as a compact VideoRecord) to get title
+           and check availability
         2. Create sanitized filename and check if file already exists
-        3. Skip download if file exists, otherwise proceed with download
-        4. Update statistics based on the outcome
+        3. Skip download if file exists, otherwise let the strategy pick
+           explicit format ids from the extracted formats
+        4. Reserve the expected size on disk (when admission control is
+           configured; a download that does not fit fails without starting)
+           and download
+        5. Move the file to the storage backend, when one is configured,
+           or queue its move from the staging directory into save_dir
+        6. Update statistics based on the outcome
+
+        Each phase is recorded as a child span ("extracting", "checking",
+        "reserving", "downloading", "storing") of the tracer's active span,
+        and the outcome is set as an attribute of the active span (the
+        per-URL root span when run by the orchestrator). The phases are also
+        timed with a monotonic clock for the result's ``timings``.
 
         Args:
             url (str): Video URL to download
 
+        Returns:
+            DownloadResult: Status, file path, bytes, per-phase timings and,
+            for failures, the exception class and message.
+
         Note:
             This method handles all error conditions gracefully and updates
             statistics appropriately. It's designed to be called concurrently
             for multiple URLs.
         """
+        tracer = self.tracer
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
         base_opts = self.strategy.get_opts()
         base_opts.update({"ignoreerrors": True, "no_warnings": False})
-        info = self.info_extractor.extract_info(url, base_opts)
-        if info is None:
+        with tracer.span("extracting") as span:
+            record = self.info_extractor.extract_record(url, base_opts)
+            if record is not None:
+                span.set_attribute("extractor", record.extractor or "")
+                span.set_attribute("video_id", record.id or "")
+        timings["extract"] = time.perf_counter() - started
+        if record is None:
+            tracer.current().set_attribute("outcome", DownloadStatus.FAILED)
             self.stats.record_failure()
-            return
+            timings["total"] = timings["extract"]
+            return DownloadResult.failure(
+                url, self.info_extractor.last_error(), timings=timings
+            )
 
-        title = info.get("title", "Unknown")
+        title = record.title or "Unknown"
         sanitized = FilenameSanitizer.sanitize(title)
         ext = "mp3" if self.config.audio_only else "mp4"
         filepath = self.config.save_dir / f"{sanitized}.{ext}"
 
-        if self.file_checker.exists(filepath):
+        mark = time.perf_counter()
+        with tracer.span("checking", path=str(filepath)):
+            exists = self.file_checker.exists(filepath)
+        timings["check"] = time.perf_counter() - mark
+        if exists:
+            tracer.current().set_attribute("outcome", DownloadStatus.SKIPPED)
             self.logger.info(Messages.Core.SKIP_EXISTS(title=title))
             self.stats.record_skip()
-            return
+            timings["total"] = time.perf_counter() - started
+            if self.uploader is not None:
+                path = self.uploader.storage.location(filepath.name)
+            else:
+                path = str(filepath)
+            return DownloadResult(
+                url,
+                DownloadStatus.SKIPPED,
+                title=title,
+                path=path,
+                bytes=_file_size(filepath),
+                timings=timings,
+            )
 
         opts = base_opts.copy()
-        opts["outtmpl"] = str(self.config.save_dir / f"{sanitized}.%(ext)s")
+        work_dir = self.config.staging_dir or self.config.save_dir
+        opts["outtmpl"] = str(work_dir / f"{sanitized}.%(ext)s")
+        selector = self.strategy.select_format(record)
+        if selector:
+            opts["format"] = selector
+        if self.transfer_tuner is not None:
+            opts.update(self.transfer_tuner.settings_for(url).opts())
+
+        try:
+            reservation = self._reserve(record, selector, title, timings)
+        except InsufficientDiskSpace as e:
+            tracer.current().set_attribute("outcome", DownloadStatus.FAILED)
+            self.stats.record_failure()
+            timings["total"] = time.perf_counter() - started
+            return DownloadResult.failure(url, e, title=title, timings=timings)
 
         self.logger.info(Messages.Core.START_DOWNLOAD(title=title))
-        if self.download_executor.execute_download(url, opts):
-            self.stats.record_success()
-            self.logger.info(Messages.Core.DONE_DOWNLOAD(title=title))
-        else:
+        mark = time.perf_counter()
+        try:
+            with tracer.span("downloading", format=selector or "") as span:
+                ok = self.download_executor.execute_download(url, opts)
+                if not ok:
+                    span.set_error("download failed")
+        finally:
+            if reservation is not None and self.admission is not None:
+                self.admission.release(reservation)
+        transfer = self.download_executor.last_transfer()
+        timings["download"] = time.perf_counter() - mark
+        path = transfer.path
+        if self.uploader is not None:
+            try:
+                path = self._store(ok, path or str(filepath), title, timings)
+            except OSError as e:
+                ok = False
+                transfer.error = e
+        elif ok and self.mover is not None and path:
+            path = str(self.mover.submit(Path(path), self.config.save_dir))
+        timings["total"] = time.perf_counter() - started
+        status = DownloadStatus.DOWNLOADED if ok else DownloadStatus.FAILED
+        tracer.current().set_attribute("outcome", status)
+        if not ok:
+            self.stats.record_failure()
+            return DownloadResult.failure(
+                url, transfer.error, title=title, timings=timings
+            )
+        self.stats.record_success()
+        self.logger.info(Messages.Core.DONE_DOWNLOAD(title=title))
+        return DownloadResult(
+            url,
+            status,
+            title=title,
+            path=path,
+            bytes=transfer.bytes,
+            timings=timings,
+        )
+
+    def _reserve(
+        self,
+        record: VideoRecord,
+        selector: Optional[str],
+        title: str,
+        timings: Dict[str, float],
+    ) -> Optional[Reservation]:
+        """
+        Reserve disk space for the selected formats of a record.
+
+        Args:
+            record (VideoRecord): Extracted metadata of the download.
+            selector (Optional[str]): Format selector chosen by the strategy.
+            title (str): Title used in the log message.
+            timings (Dict[str, float]): Result timings; "reserve" is added
+                (it includes the time a held download waited).
+
+        Returns:
+            Optional[Reservation]: The reservation to release after the
+            download, or None if no admission control is configured.
+
+        Raises:
+            InsufficientDiskSpace: If the download does not fit and is not
+                held (or can never fit).
+        """
+        if self.admission is None:
+            return None
+        expected = expected_download_size(record, selector)
+        merge = "+" in (selector or "").split("/", 1)[0]
+        mark = time.perf_counter()
+        with self.tracer.span("reserving", bytes=expected or 0) as span:
+            reservation = self.admission.reserve(expected, merge=merge)
+            if reservation is None:
+                span.set_error("insufficient disk space")
+        timings["reserve"] = time.perf_counter() - mark
+        if reservation is None:
+            message = Messages.Core.NO_DISK_SPACE(title=title, size=expected)
+            self.logger.warning(message)
+            raise InsufficientDiskSpace(message)
+        return reservation
+
+    def _store(self, ok: bool, path: str, title: str, timings: Dict[str, float]) -> str:
+        """
+        Move a downloaded file to storage, or discard its uploads on failure.
+
+        Args:
+            ok (bool): Whether the download succeeded.
+            path (str): Final local path of the download.
+            title (str): Title used in the log message.
+            timings (Dict[str, float]): Result timings; "store" is added.
+
+        Returns:
+            str: Storage location of the file (the local path if not ok).
+
+        Raises:
+            OSError: If the file could not be stored (the local file is kept).
+        """
+        assert self.uploader is not None
+        if not ok:
+            self.uploader.discard()
+            return path
+        mark = time.perf_counter()
+        try:
+            with self.tracer.span("storing", path=path) as span:
+                try:
+                    return self.uploader.commit(path)
+                except OSError as e:
+                    span.set_error(str(e))
+                    self.logger.error(Messages.Core.ERROR_STORE(title=title, error=e))
+                    raise
+        finally:
+            timings["store"] = time.perf_counter() - mark
+
+    def probe(self, url: str) -> Optional[VideoRecord]:
+        """
+        Extract the compact record of a URL without downloading or counting it.
+
+        Used by the metadata-only mode and by the scheduler, which needs the
+        duration and expected size of every item before queueing it. With a
+        record cache the later download reuses the probed record.
+
+        Args:
+            url (str): Video URL to probe
+
+        Returns:
+            Optional[VideoRecord]: Extracted record, or None if the extraction
+            failed (the error is logged by the extractor).
+        """
+        opts = self.strategy.get_opts()
+        opts.update({"quiet": True, "no_warnings": True, "skip_download": True})
+        return self.info_extractor.extract_record(url, opts)
+
+    def extract_metadata(self, url: str) -> Dict[str, Any]:
+        """
+        Extract a compact metadata record for a single URL without downloading.
+
+        This is the unit of work of the metadata-only mode. It only runs the
+        info extractor: no file existence check is made and the download
+        executor is never touched. The extractor reduces the full yt-dlp info
+        dictionary to a VideoRecord right away, so only the compact record is
+        serialized.
+
+        Args:
+            url (str): Video URL to extract metadata from
+
+        Returns:
+            Dict[str, Any]: Compact metadata record. Always contains "url" and
+                "ok"; successful records additionally carry the fields of
+                VideoRecord.to_dict() (id, title, duration, extractor,
+                filesize and a reduced formats list).
+        """
+        record = self.probe(url)
+        if record is None:
             self.stats.record_failure()
+            return {"url": url, "ok": False}
+
+        self.stats.record_success()
+        result = record.to_dict()
+        result["ok"] = True
+        return result
@@ -0,0 +1,247 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Process-wide DNS resolution cache for yt-dlp's connections.
+
+Every new connection of yt-dlp's request handlers, and of the keep-alive
+pool, resolves its host with ``socket.getaddrinfo``, which asks the system
+resolver each time. With many workers opening connections to the same few
+API and CDN hosts, these lookups add latency and, under load, run into
+resolver timeouts.
+
+The DNSCache answers repeated lookups from memory. Once installed, it
+replaces ``socket.getaddrinfo`` for the whole process, so every request
+handler created by the core uses it. Addresses are still resolved by the
+system resolver (hosts file, search domains and address sorting included);
+the cache only decides how long an answer is reused:
+
+- A successful answer is kept for ``ttl`` seconds. getaddrinfo does not
+  report the TTL of the DNS record, and asking for it would take a second
+  query per miss, so the lifetime is fixed and configurable instead.
+- A name that does not exist is remembered for ``negative_ttl`` seconds, so
+  a bad host fails fast instead of asking the resolver again for every URL.
+- When the resolver fails temporarily, an expired answer is used again
+  instead of failing the connection.
+
+Concurrent lookups of the same host wait for one resolver call. IP
+literals are passed through without caching.
+
+Classes:
+    DNSCache: getaddrinfo answers with TTLs, negative entries and counters
+
+Example:
+    >>> cache = DNSCache(ttl=60.0)
+    >>> cache.install()  # all connections of the process use it
+    >>> # ... extractions and downloads ...
+    >>> cache.report(logger)
+    >>> cache.close()
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+
+NEGATIVE_TTL = 10.0
+"""Seconds a name that does not exist is remembered."""
+
+_NEGATIVE_ERRORS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+"""getaddrinfo errors meaning the name does not exist, as opposed to a failed lookup."""
+
+AddrInfo = List[Tuple[Any, ...]]
+
+
+class _Entry:
+    """Cached answer of one lookup."""
+
+    def __init__(
+        self, result: Optional[AddrInfo], error: Optional[socket.gaierror], expires: float
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.expires = expires
+
+
+class DNSCache:
+    """
+    Thread-safe cache of getaddrinfo answers.
+
+    Attributes:
+        ttl (float): Seconds an answer is reused.
+        negative_ttl (float): Seconds a name that does not exist is
+            remembered.
+        hits (int): Lookups answered from the cache (negative ones included).
+        misses (int): Lookups passed to the system resolver.
+        negative_hits (int): Lookups failed from a negative entry.
+        stale (int): Lookups answered with an expired entry because the
+            resolver failed.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        negative_ttl: float = NEGATIVE_TTL,
+        resolver: Optional[Callable[..., AddrInfo]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl (float): Seconds an answer is reused. Defaults to 60.0.
+            negative_ttl (float): Seconds a name that does not exist is
+                remembered, at most ttl. Defaults to NEGATIVE_TTL.
+            resolver (Optional[Callable[..., AddrInfo]]): getaddrinfo used
+                for misses. Defaults to the one installed when the cache is
+                installed.
+            clock (Callable[[], float]): Monotonic clock. Defaults to
+                time.monotonic.
+        """
+        self.ttl = ttl
+        self.negative_ttl = min(negative_ttl, ttl)
+        self.resolver = resolver
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.stale = 0
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._pending: Dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._original: Optional[Callable[..., AddrInfo]] = None
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def getaddrinfo(
+        self,
+        host: Any,
+        port: Any,
+        family: int = 0,
+        type: int = 0,  # pylint: disable=redefined-builtin
+        proto: int = 0,
+        flags: int = 0,
+    ) -> AddrInfo:
+        """
+        Resolve a host like socket.getaddrinfo, answering from the cache.
+
+        Raises:
+            socket.gaierror: If the name does not exist (possibly from a
+                negative entry) or the lookup failed without a usable
+                expired answer.
+        """
+        resolver = self.resolver or self._original or socket.getaddrinfo
+        args = (host, port, family, type, proto, flags)
+        if not isinstance(host, str) or _is_literal(host):
+            return resolver(*args)
+        key = (host.lower(), port, family, type, proto, flags)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires > self.clock():
+                    self.hits += 1
+                    if entry.error is not None:
+                        self.negative_hits += 1
+                        raise entry.error
+                    return list(entry.result or [])
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    self.misses += 1
+                    break
+            pending.wait()  # another thread is resolving the same host
+        try:
+            return self._resolve(key, entry, resolver, args)
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+
+    def _resolve(
+        self,
+        key: Hashable,
+        expired: Optional[_Entry],
+        resolver: Callable[..., AddrInfo],
+        args: Tuple[Any, ...],
+    ) -> AddrInfo:
+        """Ask the resolver and store the answer or the missing name."""
+        try:
+            result = resolver(*args)
+        except socket.gaierror as e:
+            if e.errno in _NEGATIVE_ERRORS:
+                self._store(key, _Entry(None, e, self.clock() + self.negative_ttl))
+                raise
+            if expired is None or expired.result is None:
+                raise
+            with self._lock:
+                self.stale += 1
+            return list(expired.result)
+        self._store(key, _Entry(list(result), None, self.clock() + self.ttl))
+        return result
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        """Keep an entry until it is replaced by the next lookup of its key."""
+        with self._lock:
+            self._entries[key] = entry
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dict[str, Any]: hits, misses, hit_ratio, negative_hits, stale and
+            entries (cached lookups).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "negative_hits": self.negative_hits,
+                "stale": self.stale,
+                "entries": len(self._entries),
+            }
+
+    def report(self, logger: ILogger) -> None:
+        """
+        Log the hit and miss counters.
+
+        Args:
+            logger (ILogger): Logger receiving the summary.
+        """
+        summary = self.summary()
+        logger.info(
+            Messages.Dns.STATS(
+                hits=summary["hits"],
+                misses=summary["misses"],
+                ratio=summary["hit_ratio"] * 100,
+                negative=summary["negative_hits"],
+                stale=summary["stale"],
+            )
+        )
+
+    def install(self) -> None:
+        """Make every connection of the process resolve its host through this cache."""
+        if self._original is None:
+            self._original = socket.getaddrinfo
+            socket.getaddrinfo = self.getaddrinfo  # type: ignore[assignment]
+
+    def close(self) -> None:
+        """Restore the previous getaddrinfo and forget the cached answers."""
+        original, self._original = self._original, None
+        if original is not None and getattr(socket.getaddrinfo, "__self__", None) is self:
+            socket.getaddrinfo = original
+        with self._lock:
+            self._entries.clear()
+
+
+def _is_literal(host: str) -> bool:
+    """Return whether a host is an IP address rather than a name."""
+    try:
+        ipaddress.ip_address(host.strip("[]").split("%", 1)[0])
+    except ValueError:
+        return False
+    return True
@@ -31,18 +31,70 @@ Dependencies:
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+import functools
+import itertools
 import time
-from typing import Optional
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from yt_dl_cli.config.config import Config
-from yt_dl_cli.core.core import DownloadExecutor, DownloaderCore, VideoInfoExtractor
+from yt_dl_cli.core.cache_dir import CacheDirStrategy, SharedCacheDir
+from yt_dl_cli.core.connection_pool import POOL_SUPPORTED, ConnectionPool
+from yt_dl_cli.core.dns_cache import DNSCache
+from yt_dl_cli.core.playlists import PlaylistExpander
+from yt_dl_cli.core.core import (
+    DownloadExecutor,
+    DownloaderCore,
+    DownloadStatus,
+    SessionCache,
+    VideoInfoExtractor,
+    create_youtube_dl,
+)
+from yt_dl_cli.core.postprocessing import PostProcessingPool
+from yt_dl_cli.core.records import RecordCache
+from yt_dl_cli.core.scheduling import FIFO, cost_table, micro_batches, order_urls
+from yt_dl_cli.core.streaming import NoFileChecker, StreamExecutor, StreamingStrategy
+from yt_dl_cli.core.replay import Cassette, CassetteRecorder, ReplayExtractor
+from yt_dl_cli.core.work_queue import LEASED, PENDING, LeaseKeeper, SQLiteWorkQueue
 from yt_dl_cli.i18n.messages import Messages
-from yt_dl_cli.interfaces.interfaces import ILogger
+from yt_dl_cli.interfaces.interfaces import (
+    IFileChecker,
+    ILogger,
+    IStatsCollector,
+    IStorageBackend,
+    IWorkQueue,
+)
+from yt_dl_cli.utils.bandwidth import BandwidthLimiter
+from yt_dl_cli.utils.disk_space import DiskSpaceAdmission
 from yt_dl_cli.utils.logger import LoggerFactory
+from yt_dl_cli.utils.metadata_writer import MetadataWriter
+from yt_dl_cli.utils.mover import BackgroundMover
+from yt_dl_cli.utils.preallocate import Preallocator
+from yt_dl_cli.utils.profiler import NullProfiler, StageProfiler
+from yt_dl_cli.utils.s3 import S3Storage
 from yt_dl_cli.utils.stats_manager import StatsManager
+from yt_dl_cli.utils.storage import StorageFileChecker, StorageUploader, create_storage
+from yt_dl_cli.utils.stream_sink import FRAMED, StreamSink
+from yt_dl_cli.utils.throughput import ThroughputMonitor
+from yt_dl_cli.utils.tracing import NullTracer, OTLPFileExporter, Tracer, url_host
+from yt_dl_cli.utils.transfer_tuning import TransferSettings, TransferTuner
 from yt_dl_cli.interfaces.strategies import get_strategy
 from yt_dl_cli.utils.utils import FileSystemChecker
 
+# Methods timed as the "log" and "stats" stages in profiling mode.
+_LOG_METHODS = ("debug", "info", "warning", "error", "critical")
+_STATS_METHODS = ("record_success", "record_failure", "record_late_failure", "record_skip")
+
 
 class AsyncOrchestrator:
     """
@@ -97,6 +149,7 @@ class AsyncOrchestrator:
         """
         self.core = core
         self.config = config
+        self.queue_poll_interval = 1.0
 
     async def run(self) -> None:
         """
@@ -106,18 +159,45 @@ class AsyncOrchestrator:
         1. Validates that there are URLs to download
         2. Logs the start of operations with worker and URL counts
         3. Creates a thread pool with the configured number of workers
-        4. Submits all download tasks to the thread pool using run_in_executor
-        5. Waits for all downloads to complete using asyncio.gather
+        4. Feeds URLs through a bounded queue to worker coroutines that
+           run each download in the thread pool using run_in_executor
+        5. Waits for all downloads (and the post-processing pool) to complete
         6. Measures total elapsed time and generates final statistics report
 
-        The method uses asyncio.gather() to wait for all downloads to complete,
-        ensuring that statistics are only reported after all work is done.
-        Downloads run in threads to avoid blocking the asyncio event loop,
-        since yt-dlp operations are CPU and I/O intensive.
+        When ``config.metadata_only`` is set, the same worker pool runs
+        ``DownloaderCore.extract_metadata`` instead of downloading, and every
+        record is streamed to a MetadataWriter as soon as it is available.
+
+        With ``config.batch_size`` above 1, the URLs are grouped by
+        extractor into micro-batches of that size (see ``micro_batches``);
+        a worker downloads the URLs of a batch one after the other within
+        the core's batch_session, so they share one yt-dlp session. Every
+        URL still gets its own result, statistics and root span.
+
+        With ``config.expand_playlists``, playlist and channel URLs are
+        replaced by their videos (see ``DownloaderCore.expand_playlist``).
+        In the plain download and metadata modes with the FIFO schedule,
+        the videos are enumerated page by page while the workers download
+        them, at most ``config.playlist_lookahead`` videos ahead. The work
+        queue, the SJF/LJF schedules, micro-batching and a deadline need the
+        complete list, so they expand all playlists first. The format
+        strategy is then told the real number of items (``plan_items``),
+        in queue mode the number of pending and leased URLs of the queue.
+
+        When the core has a work queue, the configured URLs are added to it
+        and the workers claim URLs from the queue until it is drained (see
+        ``_run_queue_workers``), so several processes can share one job.
+
+        URLs are pulled lazily by a fixed number of workers rather than
+        submitted all at once, so the number of in-flight items (and the
+        memory they hold) is bounded by the worker count regardless of the
+        length of the URL list. Downloads run in threads to avoid blocking
+        the asyncio event loop, since yt-dlp operations are CPU and I/O
+        intensive.
 
         Raises:
             Exception: Any exception from individual downloads will be propagated
-                      after other downloads complete (due to asyncio.gather behavior).
+                      to the caller.
 
         Note:
             If no URLs are configured, the method logs a warning and returns early
@@ -130,26 +210,387 @@ class AsyncOrchestrator:
             # ... downloads execute concurrently ...
             # Logs: Final statistics report with timing information
         """
-        if not self.config.urls:
+        work_queue = self.core.work_queue
+        if not self.config.urls and work_queue is None:
             self.core.logger.warning(Messages.Orchestrator.NO_URLS())
             return
 
+        start = time.time()
+        expand = self.config.expand_playlists
+        lookahead = self.config.playlist_lookahead if expand else None
+        if work_queue is not None:
+            self.core.logger.info(
+                Messages.Orchestrator.STARTING_QUEUE(
+                    queue=self.config.queue_path,
+                    worker=self.config.worker_id,
+                    workers=self.config.max_workers,
+                )
+            )
+            urls = await self._schedule(await self._expand_all(self.config.urls))
+            await self._run_queue_workers(work_queue, self.core.download_single, urls)
+        elif self.config.metadata_only:
+            if not expand:
+                self.core.logger.info(
+                    Messages.Orchestrator.STARTING_METADATA(
+                        count=len(self.config.urls), workers=self.config.max_workers
+                    )
+                )
+            with MetadataWriter(self.config.metadata_output) as writer:
+                await self._run_workers(
+                    self._expanding(self.config.urls) if expand else self.config.urls,
+                    self.core.extract_metadata,
+                    writer.write,
+                    lookahead,
+                )
+        else:
+            batch_size = self.config.batch_size
+            # a deadline plans quality by the number of items, which is only
+            # known once the playlists are expanded completely
+            lazy = (
+                expand
+                and self.config.schedule == FIFO
+                and batch_size == 1
+                and self.config.deadline is None
+            )
+            urls = self.config.urls if lazy else await self._expand_all(self.config.urls)
+            urls = await self._schedule(urls)
+            if lazy:
+                # _expanding logs the expansion; the number of videos is
+                # only known once the playlists have been enumerated
+                await self._run_workers(
+                    self._expanding(urls), self.core.download_single, lookahead=lookahead
+                )
+            else:
+                self.core.logger.info(
+                    Messages.Orchestrator.STARTING(
+                        count=len(urls), workers=self.config.max_workers
+                    )
+                )
+                self.core.strategy.plan_items(len(urls))
+                await self._run_downloads(urls, batch_size)
+
+        await self._drain_postprocessing()
+        await self._drain_mover()
+        elapsed = time.time() - start
+        self.core.stats.report(self.core.logger, elapsed)
+        if self.core.postprocessing is not None:
+            self.core.postprocessing.report(self.core.logger)
+        if self.core.mover is not None:
+            self.core.mover.report(self.core.logger)
+        self.core.profiler.report(self.core.logger, elapsed)
+        if self.core.connection_pool is not None:
+            self.core.connection_pool.report(self.core.logger)
+        if self.core.dns_cache is not None:
+            self.core.dns_cache.report(self.core.logger)
+
+    async def _run_downloads(self, urls: List[str], batch_size: int) -> None:
+        """
+        Download a list of URLs, in micro-batches of one extractor if configured.
+
+        Args:
+            urls (List[str]): URLs in queue order.
+            batch_size (int): URLs per micro-batch; 1 downloads them one by one.
+        """
+        if batch_size > 1:
+            batches = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: list(micro_batches(urls, batch_size))
+            )
+            self.core.logger.info(
+                Messages.Orchestrator.BATCHED(count=len(urls), batches=len(batches))
+            )
+            await self._run_workers(batches, self.core.download_single)
+        else:
+            await self._run_workers(urls, self.core.download_single)
+
+    async def _drain_postprocessing(self) -> None:
+        """Wait for the post-processing pool, so the report covers its jobs."""
+        pool = self.core.postprocessing
+        if pool is None or not pool.pending:
+            return
+        self.core.logger.info(Messages.PostProcessing.WAITING(count=pool.pending))
+        await asyncio.get_running_loop().run_in_executor(None, pool.join)
+
+    async def _drain_mover(self) -> None:
+        """Wait for the staging mover, so the report counts the files it failed to move."""
+        mover = self.core.mover
+        if mover is None or not mover.pending:
+            return
+        self.core.logger.info(Messages.Mover.WAITING(count=mover.pending))
+        await asyncio.get_running_loop().run_in_executor(None, mover.join)
+
+    async def _expand_all(self, urls: List[str]) -> List[str]:
+        """
+        Replace playlist URLs by their videos before the URLs are scheduled.
+
+        Args:
+            urls (List[str]): Configured URLs.
+
+        Returns:
+            List[str]: Video URLs, or the URLs unchanged if expand_playlists
+            is not configured.
+        """
+        if not self.config.expand_playlists:
+            return urls
+        videos = itertools.chain.from_iterable(map(self.core.expand_playlist, urls))
+        expanded = await asyncio.get_running_loop().run_in_executor(None, list, videos)
+        self.core.logger.info(
+            Messages.Orchestrator.EXPANDED(count=len(urls), entries=len(expanded))
+        )
+        return expanded
+
+    async def _expanding(self, urls: List[str]) -> AsyncIterator[str]:
+        """
+        Yield the videos of the URLs while their playlists are enumerated.
+
+        The expansion runs in its own thread, one video at a time: the
+        next video (and the next page of a playlist) is only requested when
+        the consumer asks for it, so enumeration pauses while the work
+        queue is full.
+
+        Args:
+            urls (List[str]): Configured URLs in queue order.
+
+        Yields:
+            str: Video URLs.
+        """
         self.core.logger.info(
-            Messages.Orchestrator.STARTING(
-                count=len(self.config.urls), workers=self.config.max_workers
+            Messages.Orchestrator.EXPANDING(
+                count=len(urls), lookahead=self.config.playlist_lookahead
             )
         )
-        start = time.time()
+        videos = itertools.chain.from_iterable(map(self.core.expand_playlist, urls))
         loop = asyncio.get_running_loop()
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
-            tasks = [
-                loop.run_in_executor(pool, self.core.download_single, url)
-                for url in self.config.urls
-            ]
-            await asyncio.gather(*tasks)
+        count = 0
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            while True:
+                video = await loop.run_in_executor(pool, next, videos, None)
+                if video is None:
+                    break
+                count += 1
+                yield video
+        self.core.logger.info(Messages.Orchestrator.EXPANDED(count=len(urls), entries=count))
+
+    async def _schedule(self, urls: List[str]) -> List[str]:
+        """
+        Order the URLs by their priorities and the configured schedule.
 
-        elapsed = time.time() - start
-        self.core.stats.report(self.core.logger, elapsed)
+        For the SJF and LJF policies every URL is probed first (extracted
+        without downloading, on ``max_workers`` threads) to estimate its
+        size; the records stay in the core's record cache, so the download
+        does not extract them again. FIFO only applies the priorities.
+
+        Args:
+            urls (List[str]): URLs in file order.
+
+        Returns:
+            List[str]: URLs in the order they should be queued.
+        """
+        policy = self.config.schedule
+        costs = None
+        if policy != FIFO:
+            self.core.logger.info(
+                Messages.Orchestrator.SCHEDULING(count=len(urls), policy=policy)
+            )
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+                records = await asyncio.gather(
+                    *(loop.run_in_executor(pool, self.core.probe, url) for url in urls)
+                )
+            costs = cost_table(urls, records)
+        return order_urls(urls, policy, self.config.priorities, costs)
+
+    async def _run_workers(
+        self,
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        handler: Callable[[str], Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        lookahead: Optional[int] = None,
+    ) -> None:
+        """
+        Run a blocking handler for every item on a bounded pool of workers.
+
+        A producer coroutine feeds items into a bounded asyncio.Queue and
+        ``max_workers`` worker coroutines pull from it, each executing the
+        handler in a ThreadPoolExecutor. Results are passed to ``on_result``
+        on the event loop thread as soon as each item completes, so the
+        callback never needs its own locking. An item that is a list of URLs
+        (a micro-batch) is handled by one worker thread, URL by URL.
+
+        Args:
+            items (Union[Iterable[Any], AsyncIterable[Any]]): Work items
+                (URLs or lists of URLs), consumed lazily.
+            handler (Callable[[str], Any]): Blocking function run per item
+                in the thread pool.
+            on_result (Optional[Callable[[Any], None]]): Callback invoked with
+                each handler result in completion order. Defaults to None.
+            lookahead (Optional[int]): Items queued ahead of the workers.
+                Defaults to None (twice the number of workers).
+        """
+        workers = self.config.max_workers
+        tracer = self.core.tracer
+        queue: "asyncio.Queue[Optional[Tuple[Any, int]]]" = asyncio.Queue(
+            maxsize=lookahead or workers * 2
+        )
+
+        async def produce() -> None:
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    await queue.put((item, tracer.clock()))
+            else:
+                for item in items:
+                    await queue.put((item, tracer.clock()))
+            for _ in range(workers):
+                await queue.put(None)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+
+            async def consume() -> None:
+                while True:
+                    entry = await queue.get()
+                    if entry is None:
+                        return
+                    if isinstance(entry[0], list):
+                        results = await asyncio.get_running_loop().run_in_executor(
+                            pool, self._run_batch, handler, *entry
+                        )
+                    else:
+                        results = [await self._process(pool, handler, *entry)]
+                    if on_result is not None:
+                        for result in results:
+                            on_result(result)
+
+            await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+
+    async def _run_queue_workers(
+        self, work_queue: IWorkQueue, handler: Callable[[str], str], urls: List[str]
+    ) -> None:
+        """
+        Process URLs claimed from a shared work queue until it is drained.
+
+        The given URLs are added to the queue first, in scheduled order
+        (URLs that are already queued or finished are ignored). Each of ``max_workers``
+        worker coroutines then claims a URL with a lease, runs the handler in
+        the thread pool and records the returned DownloadStatus. A
+        LeaseKeeper renews the leases of running items in the background.
+        When nothing can be claimed, a worker exits if no URL is pending or
+        leased anymore, and otherwise polls, because leases held by other
+        nodes may still expire and be reassigned.
+
+        Args:
+            work_queue (IWorkQueue): Queue shared with other processes.
+            handler (Callable[[str], str]): Blocking per-URL function
+                returning a DownloadStatus value.
+            urls (List[str]): URLs this process adds to the queue.
+        """
+        config = self.config
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=config.max_workers) as pool:
+            if urls:
+                added = await loop.run_in_executor(pool, work_queue.add, urls)
+                self.core.logger.info(Messages.Orchestrator.QUEUE_SEEDED(added=added))
+            counts = await loop.run_in_executor(pool, work_queue.counts)
+            self.core.strategy.plan_items(counts.get(PENDING, 0) + counts.get(LEASED, 0))
+
+            with LeaseKeeper(work_queue, config.lease_time, self.core.logger) as keeper:
+
+                async def consume() -> None:
+                    while True:
+                        lease = await loop.run_in_executor(
+                            pool, work_queue.claim, config.worker_id, config.lease_time
+                        )
+                        if lease is None:
+                            counts = await loop.run_in_executor(pool, work_queue.counts)
+                            if not counts.get(PENDING) and not counts.get(LEASED):
+                                return
+                            await asyncio.sleep(self.queue_poll_interval)
+                            continue
+                        keeper.track(lease)
+                        status = DownloadStatus.FAILED
+                        try:
+                            status = await self._process(
+                                pool, handler, lease.url, self.core.tracer.clock()
+                            )
+                        finally:
+                            keeper.untrack(lease)
+                            held = await loop.run_in_executor(
+                                pool, work_queue.complete, lease, status
+                            )
+                            if not held:
+                                self.core.logger.warning(
+                                    Messages.Orchestrator.LEASE_LOST(url=lease.url)
+                                )
+
+                await asyncio.gather(*(consume() for _ in range(config.max_workers)))
+
+    async def _process(
+        self, pool: ThreadPoolExecutor, handler: Callable[[str], Any], item: str, queued_ns: int
+    ) -> Any:
+        """
+        Run the handler for one item in the thread pool within its root span.
+
+        Every item gets a root "url" span from the moment it was queued until
+        it is done, with a "queued" child span for the wait for a free
+        worker. The root span is active in the worker thread while the
+        handler runs, so the handler's spans become its children.
+
+        Args:
+            pool (ThreadPoolExecutor): Pool running the handler.
+            handler (Callable[[str], Any]): Blocking per-item function.
+            item (str): Work item (URL).
+            queued_ns (int): Tracer time at which the item was queued.
+
+        Returns:
+            Any: Result of the handler.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            pool, self._run_traced, handler, item, queued_ns
+        )
+
+    def _run_traced(self, handler: Callable[[str], Any], item: str, queued_ns: int) -> Any:
+        """Run the handler for one item in the calling worker thread within its root span."""
+        tracer = self.core.tracer
+        root = tracer.start_span("url", start_ns=queued_ns, url=item, host=url_host(item))
+        tracer.start_span("queued", parent=root, start_ns=queued_ns).end()
+        try:
+            return self.core.profiler.run(functools.partial(tracer.run, root, handler), item)
+        except BaseException as e:
+            root.set_error(repr(e))
+            raise
+        finally:
+            root.add_event("done")
+            root.end()
+
+    def _run_batch(
+        self, handler: Callable[[str], Any], batch: List[str], queued_ns: int
+    ) -> List[Any]:
+        """
+        Run the handler for every URL of a micro-batch in the calling worker thread.
+
+        The URLs share the core's batch_session. Each URL gets its own root
+        span, whose "queued" child lasts until the URL's turn in the batch.
+        An exception of one URL does not stop the others; the first one is
+        raised after the batch.
+
+        Args:
+            handler (Callable[[str], Any]): Blocking per-URL function.
+            batch (List[str]): URLs of one extractor.
+            queued_ns (int): Tracer time at which the batch was queued.
+
+        Returns:
+            List[Any]: Handler results of the URLs, in batch order.
+        """
+        results = []
+        error: Optional[BaseException] = None
+        with self.core.batch_session():
+            for url in batch:
+                try:
+                    results.append(self._run_traced(handler, url, queued_ns))
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    error = error or e
+        if error is not None:
+            raise error
+        return results
 
 
 # -------------------- Dependency Injection Container --------------------
@@ -175,6 +616,90 @@ class DIContainer:
     """
 
     @staticmethod
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _create_executor(
+        config: Config,
+        logger: ILogger,
+        progress_hooks: List[Callable[[Dict[str, Any]], None]],
+        postprocessor_hooks: List[Callable[[Dict[str, Any]], None]],
+        extractors: List[Any],
+        stats: IStatsCollector,
+    ) -> Tuple[Any, Optional[PostProcessingPool], Optional[StreamSink]]:
+        """
+        Create the download executor with its post-processing pool or stream sink.
+
+        Returns:
+            Tuple[Any, Optional[PostProcessingPool], Optional[StreamSink]]: A
+            StreamExecutor with its sink in stream mode, else a
+            DownloadExecutor with its post-processing pool (if configured).
+        """
+        if config.stream_output is not None:
+            sink = StreamSink(config.stream_output, config.stream_framing == FRAMED)
+            return StreamExecutor(logger, sink, progress_hooks, extractors), None, sink
+        postprocessing = (
+            PostProcessingPool(config.postprocess_workers or None, logger, stats=stats)
+            if config.postprocess_workers is not None
+            else None
+        )
+        executor = DownloadExecutor(
+            logger, progress_hooks, extractors, postprocessor_hooks, postprocessing
+        )
+        return executor, postprocessing, None
+
+    @staticmethod
+    def _create_file_handling(
+        config: Config, logger: ILogger, stats: IStatsCollector
+    ) -> Tuple[
+        IFileChecker,
+        Optional[IStorageBackend],
+        Optional[StorageUploader],
+        Optional[BackgroundMover],
+    ]:
+        """
+        Create what decides where finished files end up.
+
+        Returns:
+            Tuple: The file checker, the storage backend and its uploader
+            (when storage is configured) and the staging mover (when
+            staging_dir is configured without storage, which takes staged
+            files directly).
+        """
+        if config.stream_output is not None:
+            return NoFileChecker(), None, None, None
+        storage = (
+            create_storage(config.storage, config.storage_endpoint) if config.storage else None
+        )
+        uploader = StorageUploader(storage) if storage is not None else None
+        mover = None
+        if config.staging_dir is not None:
+            config.staging_dir.mkdir(parents=True, exist_ok=True)
+            if uploader is None:
+                mover = BackgroundMover(logger, stats=stats)
+        if storage is not None:
+            return StorageFileChecker(storage), storage, uploader, mover
+        return FileSystemChecker(), None, None, mover
+
+    @staticmethod
+    def _create_transfer_tuner(config: Config, logger: ILogger) -> Optional[TransferTuner]:
+        """
+        Create the transfer tuner, if any transfer setting is configured.
+
+        Returns:
+            Optional[TransferTuner]: Tuner handing out the configured sizes,
+            calibrating them per host with tune_transfers, or None.
+        """
+        settings = TransferSettings(
+            config.buffer_size,
+            config.http_chunk_size,
+            False if config.no_resize_buffer else None,
+        )
+        if not config.tune_transfers and settings == TransferSettings():
+            return None
+        path = config.tuning_file if config.tune_transfers else None
+        return TransferTuner(settings, path, logger)
+
+    @staticmethod
+    # pylint: disable-next=too-many-locals,too-many-statements,too-many-branches
     def create_downloader_core(
         config: Config, logger: Optional[ILogger] = None
     ) -> DownloaderCore:
@@ -187,10 +712,47 @@ class DIContainer:
 
         Components created and wired:
         - Logger: Configured for the specified save directory
+        - Throughput monitor: Shared by the executor's progress hooks and the
+          adaptive quality strategy when a deadline is configured
+        - Bandwidth limiter: Process-wide token bucket all downloads draw
+          from, capped at max_bandwidth (or unlimited, adjustable at runtime)
         - Format strategy: Selected based on audio_only configuration
         - Statistics manager: For tracking download results
         - File system checker: For file existence validation
+        - Replay extractor / cassette recorder: When replay_dir or record_dir
+          is configured, for offline and reproducible runs
+        - Session and record caches: Warm YoutubeDL instances per worker and
+          an in-memory cache of extracted records, when enabled (a
+          non-FIFO schedule always gets a record cache large enough for the
+          batch, so the scheduling probe is not repeated by the download)
         - Video info extractor: For metadata retrieval
+        - Stream sink and executor: In stream mode (stream_output), media is
+          streamed to stdout or a named pipe instead of files; the strategy
+          only selects streamable formats and no file is checked for existence
+        - Post-processing pool: Separate process pool for ffmpeg merges and
+          audio extractions, when postprocess_workers is configured
+        - Storage backend and uploader: When storage is configured, files
+          are uploaded while they download and moved to the backend, and
+          existing files are looked up there
+        - Staging mover: Background mover of finished files from staging_dir
+          into save_dir, when staging_dir is configured (files go to the
+          storage backend directly if one is configured)
+        - Preallocator: Progress hook reserving the blocks of downloads with
+          a known size, when preallocate is configured
+        - Transfer tuner: Buffer and HTTP chunk sizes of every download,
+          calibrated per host and stored in tuning_file when tune_transfers
+          is configured
+        - Connection pool: Process-wide keep-alive connections used by all
+          YoutubeDL instances, when keep_alive is configured
+        - DNS cache: Process-wide cache of the host lookups of all
+          connections, when dns_cache is configured
+        - Shared cache directory: yt-dlp cache of signature and player data
+          used by every YoutubeDL, when cache_dir is configured
+        - Playlist expander: Enumerates playlist URLs page by page, when
+          expand_playlists is configured
+        - Disk space admission: Reserves the expected size of every download
+          against the free space of staging_dir (or save_dir), when
+          disk_margin is configured
         - Download executor: For actual download operations
         - DownloaderCore: Main coordinator with all dependencies injected
 
@@ -223,12 +785,109 @@ class DIContainer:
             of object graph construction.
         """
         logger = logger or LoggerFactory.get_logger(config.save_dir)
-        strategy = get_strategy(config)
-        stats = StatsManager()
-        file_checker = FileSystemChecker()
-        info_extractor = VideoInfoExtractor(logger)
-        download_executor = DownloadExecutor(logger)
-        return DownloaderCore(
+        profiler = (
+            StageProfiler(config.profile_output) if config.profile else NullProfiler()
+        )
+        logger = profiler.wrap(logger, {name: "log" for name in _LOG_METHODS})
+        tracer = (
+            Tracer(OTLPFileExporter(config.trace_output))
+            if config.trace_output
+            else NullTracer()
+        )
+        monitor = ThroughputMonitor() if config.deadline else None
+        bandwidth_limiter = BandwidthLimiter(config.max_bandwidth)
+        streaming = config.stream_output is not None
+        strategy = get_strategy(config, monitor)
+        if streaming:
+            strategy = StreamingStrategy(strategy)
+        if config.cache_dir is not None:
+            cache = SharedCacheDir(config.cache_dir)
+            cache.prepare()
+            strategy = CacheDirStrategy(strategy, cache)
+        stats = profiler.wrap(StatsManager(), {name: "stats" for name in _STATS_METHODS})
+        checker, storage, uploader, mover = DIContainer._create_file_handling(
+            config, logger, stats
+        )
+        file_checker = profiler.wrap(checker, {"exists": "check"})
+        work_queue = (
+            SQLiteWorkQueue(config.queue_path, wal=config.queue_wal)
+            if config.queue_path
+            else None
+        )
+        extractors = []
+        if config.replay_dir is not None:
+            extractors.append(
+                ReplayExtractor(
+                    Cassette(config.replay_dir),
+                    latency=config.replay_latency,
+                    error_rate=config.replay_error_rate,
+                )
+            )
+        recorder = CassetteRecorder(Cassette(config.record_dir)) if config.record_dir else None
+        sessions = SessionCache() if config.reuse_sessions or config.batch_size > 1 else None
+        cache_size: Optional[int] = config.metadata_cache_size
+        if config.schedule != FIFO and not config.metadata_only:
+            # keep every probed record until its download reuses it; the
+            # number of items is only known once playlists are expanded
+            cache_size = None
+        record_cache = (
+            RecordCache(cache_size, config.metadata_cache_ttl) if cache_size != 0 else None
+        )
+        info_extractor = profiler.wrap(
+            VideoInfoExtractor(logger, extractors, recorder, sessions, record_cache),
+            {"extract_info": "extract", "extract_record": "extract"},
+        )
+        progress_hooks = [bandwidth_limiter.progress_hook]
+        if config.preallocate and not streaming:
+            progress_hooks.append(Preallocator().progress_hook)
+        transfer_tuner = DIContainer._create_transfer_tuner(config, logger)
+        connection_pool = None
+        if config.keep_alive and not POOL_SUPPORTED:
+            logger.warning(Messages.Connections.UNSUPPORTED())
+        elif config.keep_alive:
+            connection_pool = ConnectionPool(config.keep_alive_per_host)
+            connection_pool.install()
+        dns_cache = None
+        if config.dns_cache:
+            dns_cache = DNSCache(config.dns_ttl)
+            dns_cache.install()
+        if transfer_tuner is not None and transfer_tuner.calibrating:
+            progress_hooks.append(transfer_tuner.progress_hook)
+        postprocessor_hooks = []
+        admission = None
+        if config.disk_margin is not None and not streaming:
+            admission = profiler.wrap(
+                DiskSpaceAdmission(
+                    config.staging_dir or config.save_dir,
+                    config.disk_margin,
+                    config.disk_full_policy,
+                ),
+                {"reserve": "admission"},
+            )
+            progress_hooks.append(admission.progress_hook)
+        if uploader is not None:
+            progress_hooks.append(uploader.progress_hook)
+        if monitor:
+            progress_hooks.append(monitor.progress_hook)
+        if recorder and not streaming:
+            progress_hooks.append(recorder.progress_hook)
+        if isinstance(profiler, StageProfiler):
+            progress_hooks.append(profiler.progress_hook)
+            postprocessor_hooks.append(profiler.postprocessor_hook)
+        if isinstance(tracer, Tracer):
+            progress_hooks.append(tracer.progress_hook)
+            postprocessor_hooks.append(tracer.postprocessor_hook)
+        executor, postprocessing, sink = DIContainer._create_executor(
+            config, logger, progress_hooks, postprocessor_hooks, extractors, stats
+        )
+        download_executor = profiler.wrap(executor, {"execute_download": "download"})
+        playlist_expander = None
+        if config.expand_playlists:
+            playlist_expander = PlaylistExpander(
+                logger, functools.partial(create_youtube_dl, extractors=extractors)
+            )
+
+        core = DownloaderCore(
             config=config,
             strategy=strategy,
             stats=stats,
@@ -236,4 +895,36 @@ class DIContainer:
             file_checker=file_checker,
             info_extractor=info_extractor,
             download_executor=download_executor,
+            bandwidth_limiter=bandwidth_limiter,
+            profiler=profiler,
+            tracer=tracer,
+            work_queue=work_queue,
+            admission=admission,
+            postprocessing=postprocessing,
+            uploader=uploader,
+            mover=mover,
+            transfer_tuner=transfer_tuner,
+            connection_pool=connection_pool,
+            dns_cache=dns_cache,
+            playlist_expander=playlist_expander,
         )
+        core.register_resource(tracer)
+        if isinstance(storage, S3Storage):
+            core.register_resource(storage)
+        if mover is not None:
+            core.register_resource(mover)
+        if transfer_tuner is not None:
+            core.register_resource(transfer_tuner)
+        if connection_pool is not None:
+            core.register_resource(connection_pool)
+        if dns_cache is not None:
+            core.register_resource(dns_cache)
+        if sink is not None:
+            core.register_resource(sink)
+        if postprocessing is not None:
+            core.register_resource(postprocessing)
+        if work_queue is not None:
+            core.register_resource(work_queue)
+        if sessions is not None:
+            core.register_resource(sessions)
+        return core
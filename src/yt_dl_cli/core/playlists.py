@@ -0,0 +1,168 @@
+"""
+Lazy expansion of playlist and channel URLs into video URLs.
+
+A plain yt-dlp extraction of a playlist processes every entry before it
+returns, so for a channel with 20,000 uploads the first download only
+starts after all pages have been fetched and all entries are held in
+memory (yt-dlp's ``lazy_playlist`` option fetches pages on demand, but
+still collects the processed entries before returning).
+
+The PlaylistExpander extracts a URL without processing it and walks the
+extractor's own entries instead: generators and paged lists fetch the next
+page only when the entries of the previous one have been consumed. The
+video URLs are yielded one at a time, so the caller decides how far the
+enumeration runs ahead (the orchestrator bounds it with a queue of
+``playlist_lookahead`` entries).
+
+- URLs that yt-dlp's URL patterns identify as single videos are yielded
+  unchanged without any extraction.
+- Entries that refer to further playlists (e.g. the tabs of a channel) are
+  expanded as well, up to ``max_depth`` levels.
+- A failed extraction is logged and the URL is yielded unchanged, so the
+  download reports the failure; a failed page ends its playlist.
+
+Classes:
+    PlaylistExpander: Yields the video URLs of playlists page by page
+
+Example:
+    >>> expander = PlaylistExpander(logger)
+    >>> for url in expander.expand("https://www.youtube.com/@channel/videos", opts):
+    ...     queue.put(url)  # the first page is downloading while the next is fetched
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+import yt_dlp  # type: ignore
+from yt_dlp.utils import PagedList  # type: ignore
+
+from yt_dl_cli.core.scheduling import extractor_class
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+
+MAX_DEPTH = 2
+"""Nesting levels expanded by default: a channel, its tabs and their videos."""
+
+_REFERENCES = ("url", "url_transparent")
+_PLAYLISTS = ("playlist", "multi_video")
+_END = object()
+
+
+def is_single_video(url: str) -> Optional[bool]:
+    """
+    Return whether a URL is known to be a single video, from its pattern alone.
+
+    Args:
+        url (str): Video or playlist URL.
+
+    Returns:
+        Optional[bool]: True for a video, False for a playlist and None if
+        the extractor can return either.
+    """
+    extractor = extractor_class(url)
+    return extractor.is_single_video(url) if extractor is not None else None
+
+
+def _lazy_entries(entries: Iterable[Any]) -> Iterator[Any]:
+    """Iterate playlist entries, fetching pages only as they are reached."""
+    if isinstance(entries, PagedList):
+        # getslice() would collect all pages into one list first
+        return entries._getslice(0, None)  # pylint: disable=protected-access
+    return iter(entries)
+
+
+class PlaylistExpander:
+    """
+    Expands playlist URLs into the URLs of their videos, page by page.
+
+    Attributes:
+        logger (ILogger): Receives failed extractions.
+        factory (Callable[[Dict[str, Any]], yt_dlp.YoutubeDL]): Creates the
+            YoutubeDL of an expansion from yt-dlp options.
+        max_depth (int): Nested playlists expanded below a URL.
+    """
+
+    def __init__(
+        self,
+        logger: ILogger,
+        factory: Callable[[Dict[str, Any]], yt_dlp.YoutubeDL] = yt_dlp.YoutubeDL,
+        max_depth: int = MAX_DEPTH,
+    ) -> None:
+        """
+        Initialize the expander.
+
+        Args:
+            logger (ILogger): Receives failed extractions.
+            factory (Callable[[Dict[str, Any]], yt_dlp.YoutubeDL]): Creates
+                YoutubeDL instances, e.g. with extractor plugins. Defaults to
+                yt_dlp.YoutubeDL.
+            max_depth (int): Nested playlists expanded below a URL. Defaults
+                to MAX_DEPTH.
+        """
+        self.logger = logger
+        self.factory = factory
+        self.max_depth = max_depth
+
+    def expand(self, url: str, opts: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the video URLs of a URL, fetching playlist pages on demand.
+
+        Args:
+            url (str): Video, playlist or channel URL.
+            opts (Dict[str, Any]): yt-dlp options of the extraction.
+
+        Yields:
+            str: Video URLs in playlist order; the URL itself if it is not
+            a playlist.
+        """
+        if is_single_video(url):
+            yield url
+            return
+        with self.factory(opts) as ydl:
+            yield from self._extract(ydl, url, self.max_depth)
+
+    def _extract(self, ydl: yt_dlp.YoutubeDL, url: str, depth: int) -> Iterator[str]:
+        """Extract a URL without processing it and yield its videos."""
+        try:
+            info = ydl.extract_info(url, download=False, process=False)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning(Messages.Extractor.ERROR_EXTRACT(url=url, error=e))
+            info = None
+        if not info or info.get("_type", "video") == "video":
+            yield url
+            return
+        yield from self._entry(ydl, info, depth)
+
+    def _entry(self, ydl: yt_dlp.YoutubeDL, entry: Dict[str, Any], depth: int) -> Iterator[str]:
+        """Yield the videos of one entry: a video, a reference or a nested playlist."""
+        kind = entry.get("_type", "video")
+        if kind in _PLAYLISTS:
+            yield from self._entries(ydl, entry, depth)
+            return
+        if kind in _REFERENCES:
+            url = entry.get("url")
+        else:
+            url = entry.get("webpage_url") or entry.get("original_url") or entry.get("url")
+        if not url:
+            return
+        if kind in _REFERENCES and depth > 0 and not is_single_video(url):
+            yield from self._extract(ydl, url, depth - 1)
+        else:
+            yield url
+
+    def _entries(
+        self, ydl: yt_dlp.YoutubeDL, playlist: Dict[str, Any], depth: int
+    ) -> Iterator[str]:
+        """Yield the videos of a playlist's entries as its pages arrive."""
+        entries = playlist.get("entries")
+        entries = _lazy_entries(entries if entries is not None else ())
+        while True:
+            try:
+                entry = next(entries, _END)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                source = playlist.get("webpage_url") or playlist.get("id")
+                self.logger.warning(Messages.Extractor.ERROR_EXTRACT(url=source, error=e))
+                return
+            if entry is _END:
+                return
+            if isinstance(entry, dict):  # None marks an unavailable entry
+                yield from self._entry(ydl, entry, depth)
@@ -0,0 +1,327 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Post-processing pool decoupled from the network workers.
+
+yt-dlp merges separately downloaded video and audio formats (and converts
+audio) with ffmpeg inside the same call that transferred the data, so a
+worker thread spends the whole remux or transcode not downloading anything.
+With a PostProcessingPool the download executor runs yt-dlp with a
+HandoffYoutubeDL, which records the post-processing an item needs instead
+of running it. The raw files are handed to a bounded process pool, and the
+network worker moves on to its next URL right away.
+
+The pool runs one ffmpeg command per job in a separate process, with its
+own concurrency (the CPU count by default). The number of jobs that are
+queued or running is bounded: when ffmpeg falls behind, hand-offs block, so
+raw files do not pile up on disk without limit.
+
+Classes:
+    PostProcessJob: Raw files and the output they are turned into
+    HandoffYoutubeDL: YoutubeDL that records post-processing jobs
+    PostProcessingPool: Bounded process pool running the jobs
+
+Functions:
+    ffmpeg_command: ffmpeg command line of a job
+    run_job: Run a job (in a pool process)
+
+Example:
+    >>> pool = PostProcessingPool(max_workers=4, logger=logger)
+    >>> executor = DownloadExecutor(logger, postprocessing=pool)
+    >>> executor.execute_download(url, {"format": "137+140"})  # returns before the merge
+    >>> pool.join()  # wait for all merges
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import yt_dlp  # type: ignore
+
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger, IStatsCollector
+
+AUDIO_CODECS: Dict[str, Tuple[str, str]] = {
+    "mp3": ("libmp3lame", "mp3"),
+    "m4a": ("aac", "m4a"),
+    "opus": ("libopus", "opus"),
+    "flac": ("flac", "flac"),
+}
+"""ffmpeg encoder and file extension per audio format."""
+
+
+@dataclass(frozen=True)
+class PostProcessJob:
+    """
+    Post-processing of one downloaded item.
+
+    Attributes:
+        output (str): Final file path.
+        parts (Tuple[str, ...]): Raw files as downloaded; several parts are
+            merged, a single part is converted to ``audio_format``.
+        audio_format (Optional[str]): Audio format (a key of AUDIO_CODECS) to
+            extract, or None to keep the streams as they are.
+    """
+
+    output: str
+    parts: Tuple[str, ...]
+    audio_format: Optional[str] = None
+
+
+def ffmpeg_command(job: PostProcessJob, target: str, ffmpeg: str = "ffmpeg") -> List[str]:
+    """
+    Build the ffmpeg command line of a job.
+
+    Merges copy all streams of all parts without re-encoding; audio
+    extraction drops the video and encodes the audio with the format's
+    encoder.
+
+    Args:
+        job (PostProcessJob): Job to run.
+        target (str): File ffmpeg writes (a temporary name of job.output).
+        ffmpeg (str): ffmpeg executable. Defaults to "ffmpeg".
+
+    Returns:
+        List[str]: Command line.
+    """
+    command = [ffmpeg, "-y", "-nostdin", "-loglevel", "error"]
+    for part in job.parts:
+        command += ["-i", part]
+    if job.audio_format:
+        encoder = AUDIO_CODECS[job.audio_format][0]
+        command += ["-vn", "-c:a", encoder]
+    else:
+        for index in range(len(job.parts)):
+            command += ["-map", str(index)]
+        command += ["-c", "copy"]
+    return command + [target]
+
+
+def run_job(job: PostProcessJob, ffmpeg: str = "ffmpeg") -> str:
+    """
+    Run a job: write the output atomically and delete the raw parts.
+
+    Executed in a pool process.
+
+    Args:
+        job (PostProcessJob): Job to run.
+        ffmpeg (str): ffmpeg executable. Defaults to "ffmpeg".
+
+    Returns:
+        str: The output path.
+
+    Raises:
+        OSError: If ffmpeg cannot be started or fails; the raw parts are kept.
+    """
+    output = Path(job.output)
+    temp = output.with_name(f"{output.stem}.temp{output.suffix}")
+    process = subprocess.run(
+        ffmpeg_command(job, str(temp), ffmpeg),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if process.returncode != 0:
+        temp.unlink(missing_ok=True)
+        lines = process.stderr.strip().splitlines()
+        raise OSError(lines[-1] if lines else f"ffmpeg exited with status {process.returncode}")
+    os.replace(temp, output)
+    for part in job.parts:
+        if Path(part) != output:
+            Path(part).unlink(missing_ok=True)
+    return job.output
+
+
+class HandoffYoutubeDL(yt_dlp.YoutubeDL):
+    """
+    YoutubeDL recording the merges and audio extractions it would run.
+
+    yt-dlp downloads the parts of a merged format to ``<name>.f<id>.<ext>``
+    and then calls ``post_process`` with the merged file name. Here, items
+    that need ffmpeg are recorded in ``handoffs`` with their raw files and
+    left unprocessed; other items are post-processed as usual. Audio is
+    extracted when the options configure yt-dlp's FFmpegExtractAudio
+    post-processor with a ``preferredcodec`` the pool can encode (a key of
+    AUDIO_CODECS), like the audio strategy does. Items are only handed off
+    if the pool reproduces every configured post-processor; with other
+    codecs or post-processors yt-dlp runs the whole chain itself (merge
+    included), so the output does not depend on the pool.
+
+    Attributes:
+        handoffs (List[PostProcessJob]): Jobs recorded during download().
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the instance with an empty hand-off list."""
+        super().__init__(*args, **kwargs)
+        self.handoffs: List[PostProcessJob] = []
+
+    def post_process(self, filename, info, files_to_move=None):
+        """Record a job for merges and audio extraction, post-process the rest."""
+        parts = tuple(info.get("__files_to_merge") or (filename,))
+        supported, audio_format = self._audio_format()
+        if not supported or (len(parts) < 2 and audio_format is None):
+            return super().post_process(filename, info, files_to_move)
+        output = filename
+        if audio_format is not None:
+            output = str(Path(filename).with_suffix("." + AUDIO_CODECS[audio_format][1]))
+        self.handoffs.append(PostProcessJob(output, parts, audio_format))
+        info["filepath"] = output
+        return info
+
+    def _audio_format(self) -> Tuple[bool, Optional[str]]:
+        """
+        Check the configured post-processors against what the pool can run.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the pool reproduces every
+            configured post-processor, and the codec of the configured
+            FFmpegExtractAudio (None if there is none).
+        """
+        audio_format = None
+        for postprocessor in self.params.get("postprocessors") or ():
+            codec = postprocessor.get("preferredcodec")
+            if postprocessor.get("key") != "FFmpegExtractAudio" or codec not in AUDIO_CODECS:
+                return False, None
+            audio_format = codec
+        return True, audio_format
+
+
+class PostProcessingPool:
+    """
+    Bounded process pool running post-processing jobs off the network workers.
+
+    ``submit`` is called by download threads and blocks while ``max_pending``
+    jobs are queued or running. Results are logged when a job finishes; the
+    download of a failed job, already counted as successful, is turned into
+    a failure in the statistics.
+
+    Attributes:
+        max_workers (int): Concurrent ffmpeg processes.
+        max_pending (int): Jobs that may be queued or running at once.
+        completed (int): Jobs that finished successfully.
+        failed (int): Jobs that failed.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        logger: Optional[ILogger] = None,
+        ffmpeg: Optional[str] = None,
+        max_pending: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        stats: Optional[IStatsCollector] = None,
+    ) -> None:
+        """
+        Initialize the pool; worker processes are started on demand.
+
+        Args:
+            max_workers (Optional[int]): Concurrent jobs. Defaults to the
+                number of CPUs.
+            logger (Optional[ILogger]): Receives a message per finished job.
+                Defaults to None.
+            ffmpeg (Optional[str]): ffmpeg executable. Defaults to the one
+                found on PATH.
+            max_pending (Optional[int]): Jobs that may be queued or running
+                before submit blocks. Defaults to twice max_workers.
+            executor (Optional[Executor]): Executor running run_job,
+                injectable for testing. Defaults to a ProcessPoolExecutor
+                using the "spawn" start method (safe with the download
+                threads).
+            stats (Optional[IStatsCollector]): Statistics whose success of a
+                download is turned into a failure when its job fails.
+                Defaults to None.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.logger = logger
+        self.ffmpeg = ffmpeg or shutil.which("ffmpeg") or "ffmpeg"
+        self.stats = stats
+        self.completed = 0
+        self.failed = 0
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """int: Jobs queued or running."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, job: PostProcessJob) -> "Future[str]":
+        """
+        Hand a job to the pool, waiting while max_pending jobs are in flight.
+
+        Args:
+            job (PostProcessJob): Job to run.
+
+        Returns:
+            Future[str]: Resolves to the output path.
+        """
+        self._slots.acquire()  # pylint: disable=consider-using-with
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(run_job, job, self.ffmpeg)
+        except BaseException:
+            self._finished()
+            raise
+        future.add_done_callback(lambda done: self._report(job, done))
+        return future
+
+    def _report(self, job: PostProcessJob, future: "Future[str]") -> None:
+        """Log and count a finished job and free its slot."""
+        error = future.exception()
+        with self._lock:
+            if error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+                if self.stats is not None:
+                    self.stats.record_late_failure()
+        if self.logger is not None:
+            if error is None:
+                self.logger.info(Messages.PostProcessing.DONE(path=job.output))
+            else:
+                self.logger.error(Messages.PostProcessing.FAILED(path=job.output, error=error))
+        self._finished()
+
+    def _finished(self) -> None:
+        """Free a slot and wake up join()."""
+        with self._lock:
+            self._pending -= 1
+            self._idle.notify_all()
+        self._slots.release()
+
+    def report(self, logger: ILogger) -> None:
+        """
+        Log the number of finished and failed jobs.
+
+        Args:
+            logger (ILogger): Logger receiving the summary.
+        """
+        with self._lock:
+            completed, failed = self.completed, self.failed
+        logger.info(Messages.PostProcessing.STATS(completed=completed, failed=failed))
+
+    def join(self) -> None:
+        """Wait until all submitted jobs have finished."""
+        with self._lock:
+            self._idle.wait_for(lambda: self._pending == 0)
+
+    def close(self) -> None:
+        """Wait for all jobs and stop the worker processes."""
+        self.join()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,463 @@
+# pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
+
+"""
+Compact video metadata records.
+
+yt-dlp returns a very large info dictionary for every video: each format with
+its signed URL and HTTP headers, thumbnails, subtitles and automatic captions
+in every language. A single YouTube info dictionary is often hundreds of
+kilobytes, and keeping it alive for the duration of a download multiplies
+that by the number of concurrent workers.
+
+This module defines small ``__slots__`` records that hold only the fields the
+downloader core and the format strategies actually use. The extractor projects
+the raw dictionary into a VideoRecord immediately after extraction so the raw
+dictionary can be garbage collected before the (long) download phase starts.
+
+Classes:
+    FormatRecord: Slotted projection of a single yt-dlp format entry
+    VideoRecord: Slotted projection of a yt-dlp info dictionary
+    DownloadStatus: Outcomes of downloading a single URL
+    TransferInfo: What the executor observed while downloading a URL
+    DownloadResult: Structured outcome of downloading a single URL
+    RecordCache: Thread-safe LRU cache of VideoRecords with expiry
+
+Example:
+    >>> info = {"id": "abc", "title": "Video", "duration": 60, "formats": [
+    ...     {"format_id": "18", "ext": "mp4", "height": 360, "filesize": 1000,
+    ...      "url": "https://cdn.example.com/v.mp4"}]}
+    >>> record = VideoRecord.from_info("https://example.com/watch?v=abc", info)
+    >>> record.title, record.formats[0].host
+    ('Video', 'cdn.example.com')
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class FormatRecord:
+    """
+    Slotted projection of a single yt-dlp format entry.
+
+    Only the attributes needed for format selection and planning are kept.
+    The (long, signed) media URL is reduced to its host name.
+
+    Attributes:
+        format_id (str): yt-dlp format identifier (e.g. "137")
+        ext (Optional[str]): Container extension (e.g. "mp4")
+        width (Optional[int]): Frame width in pixels
+        height (Optional[int]): Frame height in pixels
+        fps (Optional[float]): Frame rate
+        vcodec (Optional[str]): Video codec, "none" for audio-only formats
+        acodec (Optional[str]): Audio codec, "none" for video-only formats
+        tbr (Optional[float]): Total bitrate in KBit/s
+        abr (Optional[float]): Audio bitrate in KBit/s
+        filesize (Optional[int]): Exact or approximate size in bytes
+        protocol (Optional[str]): Transfer protocol (e.g. "https", "m3u8_native")
+        host (Optional[str]): Host name the media is served from
+    """
+
+    __slots__ = (
+        "format_id",
+        "ext",
+        "width",
+        "height",
+        "fps",
+        "vcodec",
+        "acodec",
+        "tbr",
+        "abr",
+        "filesize",
+        "protocol",
+        "host",
+    )
+
+    def __init__(
+        self,
+        format_id: str,
+        ext: Optional[str] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        fps: Optional[float] = None,
+        vcodec: Optional[str] = None,
+        acodec: Optional[str] = None,
+        tbr: Optional[float] = None,
+        abr: Optional[float] = None,
+        filesize: Optional[int] = None,
+        protocol: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the format record.
+
+        Args:
+            format_id (str): yt-dlp format identifier
+            ext (Optional[str]): Container extension
+            width (Optional[int]): Frame width in pixels
+            height (Optional[int]): Frame height in pixels
+            fps (Optional[float]): Frame rate
+            vcodec (Optional[str]): Video codec name or "none"
+            acodec (Optional[str]): Audio codec name or "none"
+            tbr (Optional[float]): Total bitrate in KBit/s
+            abr (Optional[float]): Audio bitrate in KBit/s
+            filesize (Optional[int]): Exact or approximate size in bytes
+            protocol (Optional[str]): Transfer protocol
+            host (Optional[str]): Host name the media is served from
+        """
+        self.format_id = format_id
+        self.ext = ext
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.vcodec = vcodec
+        self.acodec = acodec
+        self.tbr = tbr
+        self.abr = abr
+        self.filesize = filesize
+        self.protocol = protocol
+        self.host = host
+
+    @classmethod
+    def from_info(cls, fmt: Dict[str, Any]) -> "FormatRecord":
+        """
+        Project a yt-dlp format dictionary into a FormatRecord.
+
+        Args:
+            fmt (Dict[str, Any]): Entry of the ``formats`` list of an info dict
+
+        Returns:
+            FormatRecord: Compact record for the format.
+        """
+        url = fmt.get("url")
+        format_id = fmt.get("format_id")
+        return cls(
+            format_id="" if format_id is None else str(format_id),
+            ext=fmt.get("ext"),
+            width=fmt.get("width"),
+            height=fmt.get("height"),
+            fps=fmt.get("fps"),
+            vcodec=fmt.get("vcodec"),
+            acodec=fmt.get("acodec"),
+            tbr=fmt.get("tbr"),
+            abr=fmt.get("abr"),
+            filesize=fmt.get("filesize") or fmt.get("filesize_approx"),
+            protocol=fmt.get("protocol"),
+            host=urlsplit(url).hostname if isinstance(url, str) else None,
+        )
+
+    @property
+    def has_video(self) -> bool:
+        """bool: Whether the format carries a video stream (unknown counts as yes)."""
+        return self.vcodec != "none"
+
+    @property
+    def has_audio(self) -> bool:
+        """bool: Whether the format carries an audio stream (unknown counts as yes)."""
+        return self.acodec != "none"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Record fields with None values omitted.
+        """
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        }
+
+    def __repr__(self) -> str:
+        """Return a short debugging representation."""
+        return f"FormatRecord({self.format_id!r}, ext={self.ext!r}, height={self.height!r})"
+
+
+class VideoRecord:
+    """
+    Slotted projection of a yt-dlp info dictionary.
+
+    Holds the identification fields used by DownloaderCore (title, id,
+    extractor), the sizing fields used for planning (duration, filesize) and a
+    tuple of FormatRecord objects for format ranking strategies. Everything
+    else in the info dictionary is dropped.
+
+    Attributes:
+        url (str): Source URL the record was extracted from
+        id (Optional[str]): Video identifier on the platform
+        title (Optional[str]): Video title
+        duration (Optional[float]): Duration in seconds
+        extractor (Optional[str]): yt-dlp extractor key (e.g. "Youtube")
+        webpage_url (Optional[str]): Canonical page URL
+        filesize (Optional[int]): Expected size of the default selection in bytes
+        format_id (Optional[str]): Format id yt-dlp selected by default
+        formats (Tuple[FormatRecord, ...]): Available formats
+    """
+
+    __slots__ = (
+        "url",
+        "id",
+        "title",
+        "duration",
+        "extractor",
+        "webpage_url",
+        "filesize",
+        "format_id",
+        "formats",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        id: Optional[str] = None,  # pylint: disable=redefined-builtin
+        title: Optional[str] = None,
+        duration: Optional[float] = None,
+        extractor: Optional[str] = None,
+        webpage_url: Optional[str] = None,
+        filesize: Optional[int] = None,
+        format_id: Optional[str] = None,
+        formats: Tuple[FormatRecord, ...] = (),
+    ) -> None:
+        """
+        Initialize the video record.
+
+        Args:
+            url (str): Source URL the record was extracted from
+            id (Optional[str]): Video identifier on the platform
+            title (Optional[str]): Video title
+            duration (Optional[float]): Duration in seconds
+            extractor (Optional[str]): yt-dlp extractor key
+            webpage_url (Optional[str]): Canonical page URL
+            filesize (Optional[int]): Expected size of the default selection
+            format_id (Optional[str]): Format id yt-dlp selected by default
+            formats (Tuple[FormatRecord, ...]): Available formats
+        """
+        self.url = url
+        self.id = id
+        self.title = title
+        self.duration = duration
+        self.extractor = extractor
+        self.webpage_url = webpage_url
+        self.filesize = filesize
+        self.format_id = format_id
+        self.formats = formats
+
+    @classmethod
+    def from_info(cls, url: str, info: Dict[str, Any]) -> "VideoRecord":
+        """
+        Project a yt-dlp info dictionary into a VideoRecord.
+
+        The returned record does not reference the info dictionary or any of
+        its nested containers, so the dictionary can be released as soon as
+        the caller drops it.
+
+        Args:
+            url (str): Source URL the info was extracted from
+            info (Dict[str, Any]): Full yt-dlp info dictionary
+
+        Returns:
+            VideoRecord: Compact record for the video.
+        """
+        requested = info.get("requested_formats") or [info]
+        sizes = [f.get("filesize") or f.get("filesize_approx") for f in requested]
+        return cls(
+            url=url,
+            id=info.get("id"),
+            title=info.get("title"),
+            duration=info.get("duration"),
+            extractor=info.get("extractor_key") or info.get("extractor"),
+            webpage_url=info.get("webpage_url"),
+            filesize=sum(sizes) if all(sizes) else None,
+            format_id=info.get("format_id"),
+            formats=tuple(FormatRecord.from_info(f) for f in info.get("formats") or ()),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a compact JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Record fields with None values omitted and formats
+                converted with FormatRecord.to_dict().
+        """
+        record: Dict[str, Any] = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if name == "formats":
+                value = [fmt.to_dict() for fmt in value]
+            if value is not None:
+                record[name] = value
+        return record
+
+    def __repr__(self) -> str:
+        """Return a short debugging representation."""
+        return (
+            f"VideoRecord({self.url!r}, title={self.title!r}, "
+            f"formats={len(self.formats)})"
+        )
+
+
+class DownloadStatus:
+    """
+    Outcomes of DownloaderCore.download_single.
+
+    The values are plain strings so they can be stored as they are (e.g. as
+    the final state of a URL in a work queue) and used as span attributes.
+    """
+
+    DOWNLOADED = "downloaded"
+    """The file was downloaded."""
+
+    SKIPPED = "skipped"
+    """The file already existed."""
+
+    FAILED = "failed"
+    """Extraction or download failed."""
+
+
+@dataclass
+class TransferInfo:
+    """
+    What the download executor observed while downloading one URL.
+
+    Attributes:
+        path (Optional[str]): Final file path (after merging), if known.
+        bytes (int): Bytes of all transferred files.
+        error (Optional[BaseException]): Exception that made the download
+            fail, if any.
+    """
+
+    path: Optional[str] = None
+    bytes: int = 0
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class DownloadResult:
+    """
+    Structured outcome of downloading a single URL.
+
+    Attributes:
+        url (str): Requested URL.
+        status (str): A DownloadStatus value.
+        title (Optional[str]): Video title, if extraction succeeded.
+        path (Optional[str]): Path of the downloaded or existing file.
+        bytes (int): Bytes transferred, or the size of the existing file for
+            skipped URLs.
+        timings (Dict[str, float]): Seconds spent per phase ("extract",
+            "check", "download", "total"; "queued" when run by the API).
+        error (Optional[str]): Exception class name for failed URLs.
+        message (Optional[str]): Error message for failed URLs.
+    """
+
+    url: str
+    status: str
+    title: Optional[str] = None
+    path: Optional[str] = None
+    bytes: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    message: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """bool: True unless the URL failed."""
+        return self.status != DownloadStatus.FAILED
+
+    @classmethod
+    def failure(
+        cls, url: str, error: Optional[BaseException], **fields: Any
+    ) -> "DownloadResult":
+        """
+        Create the result of a failed URL.
+
+        Args:
+            url (str): Requested URL.
+            error (Optional[BaseException]): Cause of the failure, if known.
+            **fields: Further DownloadResult fields.
+
+        Returns:
+            DownloadResult: Result with status FAILED.
+        """
+        return cls(
+            url,
+            DownloadStatus.FAILED,
+            error=type(error).__name__ if error is not None else None,
+            message=str(error) if error is not None else None,
+            **fields,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class RecordCache:
+    """
+    Thread-safe LRU cache of VideoRecords keyed by URL, with expiry.
+
+    Used by long-running processes so repeated submissions of a URL skip the
+    metadata extraction. Records only hold metadata (media URLs are reduced
+    to host names), so they do not go stale when signed URLs expire; the
+    time to live bounds how old titles and format lists may get.
+
+    Attributes:
+        max_entries (Optional[int]): Maximum number of cached records; None
+            keeps every record until it expires.
+        ttl (float): Seconds a record stays valid.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that were not.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (Optional[int]): Maximum number of records, or None
+                for no limit. Defaults to 1024.
+            ttl (float): Record lifetime in seconds. Defaults to one hour.
+            clock (Callable[[], float]): Monotonic clock. Defaults to
+                time.monotonic.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, VideoRecord]]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[VideoRecord]:
+        """Return the cached record of a URL, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[url]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, url: str, record: VideoRecord) -> None:
+        """Cache a record, evicting the least recently used one if full."""
+        with self._lock:
+            self._entries[url] = (self._clock() + self.ttl, record)
+            self._entries.move_to_end(url)
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of cached records (including expired ones)."""
+        return len(self._entries)
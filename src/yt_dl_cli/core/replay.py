@@ -0,0 +1,319 @@
+# pylint: disable=abstract-method, arguments-differ
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+
+"""
+Record/replay extraction fixtures.
+
+Benchmarks of the orchestration layer need extraction without the internet
+and with reproducible timing. This module provides a cassette directory that
+stores sanitized yt-dlp info dictionaries (and optionally the downloaded media)
+per URL, a yt-dlp extractor plugin that serves them back, and a recorder that
+fills a cassette during a normal online run.
+
+Cassette layout::
+
+    <cassette>/info/<ab>/<sha1(url)>.json              recorded info dictionary
+    <cassette>/media/<ab>/<sha1(url)>/<format_id>.<ext> recorded media (optional)
+    <cassette>/default.json                            template for unknown URLs
+
+Files are sharded by the first two hex digits of the key, so lookups stay
+O(1) and directories stay small at 10k–1M recorded URLs. The optional
+``default.json`` template answers every URL that was not recorded (with a
+per-URL id and title), which lets synthetic batches of any size run from a
+single fixture.
+
+Classes:
+    Cassette: Directory of recorded info dictionaries and media
+    ReplayExtractor: yt-dlp extractor serving a Cassette with injected latency/errors
+    CassetteRecorder: Records extractions and finished downloads into a Cassette
+
+Example:
+    >>> cassette = Cassette(Path("fixtures/cassette"))
+    >>> extractor = VideoInfoExtractor(logger, [ReplayExtractor(cassette, latency=0.05)])
+    >>> record = extractor.extract_record("https://www.youtube.com/watch?v=abc", {})
+"""
+
+import copy
+import hashlib
+import json
+import os
+from pathlib import Path
+import random
+import shutil
+import time
+from typing import Any, Dict, Optional
+
+import yt_dlp  # type: ignore
+from yt_dlp.extractor.common import InfoExtractor  # type: ignore
+from yt_dlp.utils import ExtractorError  # type: ignore
+
+# Keys added by yt-dlp while processing a result; they are recomputed on replay.
+_PROCESSING_KEYS = ("_filename", "filename", "epoch", "_version", "_has_drm")
+
+
+class Cassette:
+    """
+    Directory of recorded yt-dlp info dictionaries and media files.
+
+    Attributes:
+        root (Path): Cassette directory.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize the cassette (the directory is created lazily on write).
+
+        Args:
+            root (Path): Cassette directory.
+        """
+        self.root = Path(root)
+        self._template: Optional[Dict[str, Any]] = None
+        self._template_loaded = False
+
+    @staticmethod
+    def key(url: str) -> str:
+        """Return the storage key (SHA-1 hex digest) of a URL."""
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def info_path(self, url: str) -> Path:
+        """Return the path of the recorded info dictionary of a URL."""
+        key = self.key(url)
+        return self.root / "info" / key[:2] / f"{key}.json"
+
+    def media_dir(self, url: str) -> Path:
+        """Return the directory holding the recorded media of a URL."""
+        key = self.key(url)
+        return self.root / "media" / key[:2] / key
+
+    def _default(self) -> Optional[Dict[str, Any]]:
+        """Load (once) and return the optional default.json template."""
+        if not self._template_loaded:
+            path = self.root / "default.json"
+            if path.is_file():
+                self._template = json.loads(path.read_text(encoding="utf-8"))
+            self._template_loaded = True
+        return self._template
+
+    def has(self, url: str) -> bool:
+        """Return True if the URL was recorded or a default template exists."""
+        return self.info_path(url).is_file() or self._default() is not None
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the info dictionary for a URL with recorded media substituted.
+
+        Formats whose media was recorded point to the local file. When any
+        media was recorded for the URL, formats without media are dropped so
+        a replayed download never falls back to the network.
+
+        Args:
+            url (str): Source URL.
+
+        Returns:
+            Optional[Dict[str, Any]]: Info dictionary, or None if the URL is
+            unknown and there is no default template.
+        """
+        path = self.info_path(url)
+        if path.is_file():
+            info = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            template = self._default()
+            if template is None:
+                return None
+            info = copy.deepcopy(template)
+            video_id = self.key(url)[:16]
+            info["id"] = video_id
+            info["title"] = f"{info.get('title', 'video')} {video_id}"
+        info["webpage_url"] = url
+
+        media_dir = self.media_dir(url)
+        media = (
+            {entry.stem: entry for entry in media_dir.iterdir()} if media_dir.is_dir() else {}
+        )
+        if media and info.get("formats"):
+            formats = []
+            for fmt in info["formats"]:
+                local = media.get(str(fmt.get("format_id")))
+                if local is not None:
+                    fmt.update(url=local.resolve().as_uri(), protocol="https")
+                    fmt.pop("fragments", None)
+                    fmt.pop("http_headers", None)
+                    formats.append(fmt)
+            info["formats"] = formats
+        return info
+
+    def save_info(self, url: str, info: Dict[str, Any]) -> Path:
+        """
+        Store a sanitized info dictionary for a URL.
+
+        Args:
+            url (str): Source URL.
+            info (Dict[str, Any]): JSON-serializable info dictionary (see
+                ``YoutubeDL.sanitize_info``).
+
+        Returns:
+            Path: Path of the written file.
+        """
+        record = {
+            key: value
+            for key, value in info.items()
+            if key not in _PROCESSING_KEYS
+            and not key.startswith("requested_")
+            and not key.startswith("__")
+        }
+        path = self.info_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    def save_media(self, url: str, format_id: str, source: Path) -> Path:
+        """
+        Copy a downloaded media file into the cassette.
+
+        Args:
+            url (str): Source URL the media belongs to.
+            format_id (str): yt-dlp format id of the file.
+            source (Path): Downloaded file.
+
+        Returns:
+            Path: Path of the stored copy.
+        """
+        target_dir = self.media_dir(url)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / f"{format_id}{source.suffix}"
+        shutil.copyfile(source, target)
+        return target
+
+
+class ReplayExtractor(InfoExtractor):
+    """
+    yt-dlp extractor plugin serving info dictionaries from a Cassette.
+
+    A copy of the instance is registered on every YoutubeDL ahead of the
+    built-in extractors (see create_youtube_dl in the core module), so it
+    answers every URL it claims without touching the network. Latency and
+    failures can be injected to model real extraction; both are derived from
+    the URL and the seed, so a run is reproducible regardless of thread
+    scheduling.
+
+    Attributes:
+        cassette (Cassette): Source of recorded info dictionaries.
+        latency (float): Base delay per extraction in seconds.
+        jitter (float): Extra uniformly distributed delay in seconds.
+        error_rate (float): Fraction of extractions that fail (0.0–1.0).
+        passthrough (bool): Let unrecorded URLs fall through to the real
+            extractors instead of failing.
+        seed (int): Seed for the injected latency and failures.
+    """
+
+    IE_NAME = "replay"
+    IE_DESC = "Recorded extraction fixtures"
+    _VALID_URL = r"(?P<id>.+)"
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        passthrough: bool = False,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the replay extractor.
+
+        Args:
+            cassette (Cassette): Source of recorded info dictionaries.
+            latency (float): Base delay per extraction in seconds. Defaults to 0.
+            jitter (float): Extra random delay in seconds. Defaults to 0.
+            error_rate (float): Fraction of extractions that fail. Defaults to 0.
+            passthrough (bool): Let unrecorded URLs use the real extractors.
+                Defaults to False (strictly offline).
+            seed (int): Seed for injected latency and failures. Defaults to 0.
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.passthrough = passthrough
+        self.seed = seed
+
+    def set_downloader(self, downloader: Any) -> None:
+        """Bind to a YoutubeDL and allow the file:// URLs of recorded media."""
+        super().set_downloader(downloader)
+        if downloader is not None:
+            downloader.params.setdefault("enable_file_urls", True)
+
+    def suitable(self, url: str) -> bool:  # type: ignore[override]
+        """Claim recorded URLs, or every URL unless passthrough is enabled."""
+        return not self.passthrough or self.cassette.has(url)
+
+    def _real_extract(self, url: str) -> Dict[str, Any]:
+        """Serve the recorded info dictionary after the injected delay."""
+        rng = random.Random(f"{self.seed}:{url}")
+        delay = self.latency + self.jitter * rng.random()
+        if delay > 0:
+            time.sleep(delay)
+        if self.error_rate and rng.random() < self.error_rate:
+            raise ExtractorError("injected replay failure", expected=True)
+        info = self.cassette.load(url)
+        if info is None:
+            raise ExtractorError(f"{url} is not recorded in {self.cassette.root}", expected=True)
+        return info
+
+
+class CassetteRecorder:
+    """
+    Records extractions and finished downloads of an online run into a Cassette.
+
+    ``record_info`` is called by VideoInfoExtractor after every successful
+    extraction; ``progress_hook`` is installed on the DownloadExecutor and
+    copies each finished file into the cassette under the format id it was
+    downloaded as.
+
+    Attributes:
+        cassette (Cassette): Cassette being filled.
+        record_media (bool): Whether finished downloads are copied as well.
+    """
+
+    def __init__(self, cassette: Cassette, record_media: bool = True) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            cassette (Cassette): Cassette to fill.
+            record_media (bool): Copy finished downloads into the cassette.
+                Defaults to True.
+        """
+        self.cassette = cassette
+        self.record_media = record_media
+
+    def record_info(self, url: str, info: Dict[str, Any]) -> None:
+        """
+        Store the sanitized info dictionary of an extraction.
+
+        Args:
+            url (str): URL passed to the extractor.
+            info (Dict[str, Any]): Info dictionary returned by yt-dlp.
+        """
+        self.cassette.save_info(
+            url, yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
+        )
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp progress hook copying finished files into the cassette.
+
+        Args:
+            status (Dict[str, Any]): Progress dictionary passed by yt-dlp.
+        """
+        if not self.record_media or status.get("status") != "finished":
+            return
+        info = status.get("info_dict") or {}
+        url = info.get("original_url") or info.get("webpage_url")
+        filename = status.get("filename")
+        if url and filename and info.get("format_id"):
+            self.cassette.save_media(url, str(info["format_id"]), Path(filename))
@@ -0,0 +1,242 @@
+"""
+Ordering of download batches.
+
+URLs are handed to the workers in the order of the links file by default
+(FIFO). When the batch mixes very long and very short items, the order
+matters: one 10-hour archive at the top of the file keeps a worker busy
+while thousands of clips wait behind it. This module orders a batch before
+it is queued:
+
+- ``fifo``: file order,
+- ``sjf`` (shortest job first): smallest expected downloads first, which
+  minimizes the mean completion time of the items,
+- ``ljf`` (longest job first): largest expected downloads first, which
+  keeps the workers evenly busy and minimizes the makespan of the batch.
+
+The expected cost of an item comes from its extracted metadata: the
+(approximate) file size of the default format selection, or the duration at
+a nominal bitrate when no size is known. Items whose cost cannot be
+determined (e.g. failed extractions) are queued after all others.
+
+Explicit priorities take precedence over every policy: a line of the links
+file may carry a ``priority=N`` annotation after the URL, and items with a
+higher priority are queued first (the default priority is 0).
+
+The ordered URLs can also be grouped into micro-batches of URLs handled by
+the same yt-dlp extractor, so that one worker processes them in a row with
+one yt-dlp session (see ``DownloadExecutor.batch_session``). A batch starts
+with the first URL not yet batched and takes the following URLs of its
+extractor, so batches are handed out in the order of their first URL.
+
+Functions:
+    parse_link_line: Split a links file line into URL and priority
+    estimate_cost: Expected download size of an extracted video
+    order_urls: Order URLs by priority and policy
+    cost_table: Estimated costs of probed URLs
+    extractor_class: yt-dlp extractor class that handles a URL
+    extractor_key: Name of the yt-dlp extractor that handles a URL
+    micro_batches: Group URLs of the same extractor into batches
+
+Example:
+    >>> parse_link_line("https://youtu.be/xyz priority=5")
+    ('https://youtu.be/xyz', 5)
+    >>> order_urls(["a", "b", "c"], SJF, costs={"a": 900, "b": 10, "c": None})
+    ['b', 'a', 'c']
+    >>> list(micro_batches(["yt1", "vimeo1", "yt2"], 2, key=lambda u: u[:-1]))
+    [['yt1', 'yt2'], ['vimeo1']]
+"""
+
+from collections import deque
+import functools
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import yt_dlp  # type: ignore
+
+from yt_dl_cli.core.records import VideoRecord
+
+FIFO = "fifo"
+"""Keep the order of the links file."""
+
+SJF = "sjf"
+"""Shortest (smallest) job first."""
+
+LJF = "ljf"
+"""Longest (largest) job first."""
+
+POLICIES = (FIFO, SJF, LJF)
+"""All scheduling policies."""
+
+NOMINAL_BYTES_PER_SECOND = 250_000
+"""Bitrate (2 Mbit/s) used to turn a duration into a size estimate."""
+
+
+def parse_link_line(line: str) -> Tuple[str, Optional[int]]:
+    """
+    Split a line of the links file into its URL and optional priority.
+
+    The URL is the first whitespace-separated token. A following
+    ``priority=N`` token sets the priority; other tokens are ignored.
+
+    Args:
+        line (str): Stripped, non-empty, non-comment line.
+
+    Returns:
+        Tuple[str, Optional[int]]: URL and priority (None if not annotated).
+
+    Raises:
+        ValueError: If the priority is not an integer.
+    """
+    url, *annotations = line.split()
+    priority = None
+    for annotation in annotations:
+        key, sep, value = annotation.partition("=")
+        if sep and key.lower() == "priority":
+            priority = int(value)
+    return url, priority
+
+
+def estimate_cost(record: Optional[VideoRecord]) -> Optional[float]:
+    """
+    Estimate the download size of an extracted video in bytes.
+
+    Args:
+        record (Optional[VideoRecord]): Extracted metadata, or None if the
+                                        extraction failed.
+
+    Returns:
+        Optional[float]: The known (approximate) file size, else the duration
+        at NOMINAL_BYTES_PER_SECOND, else None.
+    """
+    if record is None:
+        return None
+    if record.filesize:
+        return float(record.filesize)
+    if record.duration:
+        return float(record.duration) * NOMINAL_BYTES_PER_SECOND
+    return None
+
+
+def order_urls(
+    urls: Sequence[str],
+    policy: str,
+    priorities: Optional[Mapping[str, int]] = None,
+    costs: Optional[Mapping[str, Optional[float]]] = None,
+) -> List[str]:
+    """
+    Order URLs by priority, then by the scheduling policy.
+
+    The sort is stable: URLs with equal priority and cost (and all URLs
+    under FIFO) keep their original order.
+
+    Args:
+        urls (Sequence[str]): URLs in file order.
+        policy (str): One of POLICIES.
+        priorities (Optional[Mapping[str, int]]): Priority per URL; higher
+            runs first, missing URLs have priority 0.
+        costs (Optional[Mapping[str, Optional[float]]]): Expected cost per
+            URL for SJF and LJF; missing or None costs are queued last.
+
+    Returns:
+        List[str]: URLs in the order they should be queued.
+    """
+    priorities = priorities or {}
+    costs = costs or {}
+    sign = {SJF: 1.0, LJF: -1.0}.get(policy, 0.0)
+
+    def key(url: str) -> Tuple[int, bool, float]:
+        cost = costs.get(url)
+        return (-priorities.get(url, 0), sign != 0.0 and cost is None, sign * (cost or 0.0))
+
+    return sorted(urls, key=key)
+
+
+def cost_table(
+    urls: Sequence[str], records: Sequence[Optional[VideoRecord]]
+) -> Dict[str, Optional[float]]:
+    """
+    Build the cost mapping of order_urls from probed records.
+
+    Args:
+        urls (Sequence[str]): Probed URLs.
+        records (Sequence[Optional[VideoRecord]]): Record of each URL, None
+                                                   for failed probes.
+
+    Returns:
+        Dict[str, Optional[float]]: Estimated cost per URL.
+    """
+    return {url: estimate_cost(record) for url, record in zip(urls, records)}
+
+
+@functools.lru_cache(maxsize=1)
+def _extractor_classes() -> Tuple[Any, ...]:
+    """yt-dlp's extractor classes in matching order, loaded once."""
+    return tuple(yt_dlp.extractor.gen_extractor_classes())
+
+
+def extractor_class(url: str) -> Optional[Any]:
+    """
+    Return the yt-dlp extractor class that handles a URL.
+
+    Only the URL patterns are matched, like yt-dlp does before extracting;
+    nothing is downloaded.
+
+    Args:
+        url (str): Video or playlist URL.
+
+    Returns:
+        Optional[Any]: The first suitable extractor class, or None if no
+        extractor matches.
+    """
+    for extractor in _extractor_classes():
+        if extractor.suitable(url):
+            return extractor
+    return None
+
+
+def extractor_key(url: str) -> str:
+    """
+    Return the key of the yt-dlp extractor that handles a URL.
+
+    Args:
+        url (str): Video or playlist URL.
+
+    Returns:
+        str: Extractor key, e.g. "Youtube" or "Generic".
+    """
+    extractor = extractor_class(url)
+    return extractor.ie_key() if extractor is not None else "Generic"
+
+
+def micro_batches(
+    urls: Sequence[str], size: int, key: Callable[[str], str] = extractor_key
+) -> Iterator[List[str]]:
+    """
+    Group URLs of the same extractor into batches of at most ``size`` URLs.
+
+    Every batch starts with the first URL that is not in a batch yet and
+    continues with the next URLs of its extractor, so the order of the
+    URLs (priorities and scheduling policy) decides which batch runs
+    first, and URLs of one extractor stay in order.
+
+    Args:
+        urls (Sequence[str]): URLs in the order they should be queued.
+        size (int): Largest batch.
+        key (Callable[[str], str]): Grouping key of a URL. Defaults to
+            extractor_key.
+
+    Yields:
+        List[str]: URLs of one batch.
+    """
+    keys = [key(url) for url in urls]
+    groups: Dict[str, Deque[int]] = {}
+    for index, group in enumerate(keys):
+        groups.setdefault(group, deque()).append(index)
+    batched = [False] * len(urls)
+    for index, group in enumerate(keys):
+        if batched[index]:
+            continue
+        pending = groups[group]
+        batch = [pending.popleft() for _ in range(min(size, len(pending)))]
+        for member in batch:
+            batched[member] = True
+        yield [urls[member] for member in batch]
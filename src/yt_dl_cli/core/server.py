@@ -0,0 +1,497 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Long-running download daemon with a local JSON submission API.
+
+``yt-dl-cli serve`` keeps one DownloaderCore and its worker pool alive and
+accepts URL submissions over local HTTP (loopback TCP by default, or a Unix
+socket). Because the process outlives every batch, the state that a one-shot
+run rebuilds for each invocation stays warm between submissions:
+
+- extraction sessions (one YoutubeDL per worker thread, see SessionCache),
+- extracted records (RecordCache), so submitting a URL again skips the
+  extraction round trips,
+- the archive index of finished URLs, loaded once from the save directory
+  and kept in memory, so finished URLs are answered without any work.
+
+API (all bodies are JSON):
+
+- ``POST /jobs`` with ``{"urls": [...]}`` queues a job and returns it (202)
+- ``GET /jobs`` lists the known jobs
+- ``GET /jobs/<id>`` returns one job with the status of every URL
+- ``GET /health`` returns worker, job, statistics and cache counters
+
+Classes:
+    Job: A submitted batch of URLs and its progress
+    ArchiveIndex: In-memory index of finished URLs backed by a file
+    DownloadService: Runs submitted jobs on a long-lived DownloaderCore
+
+Functions:
+    create_server: Bind the HTTP API to TCP or a Unix socket
+    serve: Entry point of ``yt-dl-cli serve``
+
+Example:
+    $ yt-dl-cli serve -d ~/Videos -w 4 &
+    $ curl -s -d '{"urls": ["https://youtu.be/xyz"]}' http://127.0.0.1:8765/jobs
+    {"id": "1", "state": "queued", ...}
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import os
+from pathlib import Path
+import socketserver
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from yt_dl_cli.config.config import ServerConfig
+from yt_dl_cli.core.core import DownloaderCore
+from yt_dl_cli.core.orchestration import DIContainer
+from yt_dl_cli.core.records import DownloadStatus
+from yt_dl_cli.i18n.init import setup_i18n
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.utils.parser import parse_serve_arguments
+from yt_dl_cli.utils.tracing import url_host
+
+ARCHIVE_NAME = ".yt-dl-archive"
+"""File in the save directory listing the URLs the daemon has finished."""
+
+QUEUED = "queued"
+"""State of a job none of whose URLs has started."""
+
+RUNNING = "running"
+"""State of a job with URLs in progress."""
+
+DONE = "done"
+"""State of a job whose URLs have all finished."""
+
+
+class Job:
+    """
+    A submitted batch of URLs and its progress.
+
+    Attributes:
+        id (str): Job identifier.
+        results (Dict[str, Optional[str]]): Status of every URL, a
+            DownloadStatus value or None while it is pending.
+        state (str): QUEUED, RUNNING or DONE.
+        created (float): Submission time (Unix time).
+        finished (Optional[float]): Completion time (Unix time).
+        errors (Dict[str, str]): Unexpected errors of failed URLs.
+    """
+
+    def __init__(self, job_id: str, urls: Sequence[str]) -> None:
+        """
+        Create a queued job.
+
+        Args:
+            job_id (str): Job identifier.
+            urls (Sequence[str]): URLs of the job; duplicates are merged.
+        """
+        self.id = job_id
+        self.results: Dict[str, Optional[str]] = dict.fromkeys(urls)
+        self.state = QUEUED
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.errors: Dict[str, str] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON representation of the job."""
+        counts: Dict[str, int] = {}
+        for status in self.results.values():
+            key = status or "pending"
+            counts[key] = counts.get(key, 0) + 1
+        return {
+            "id": self.id,
+            "state": self.state,
+            "created": self.created,
+            "finished": self.finished,
+            "counts": counts,
+            "urls": dict(self.results),
+            "errors": dict(self.errors),
+        }
+
+
+class ArchiveIndex:
+    """
+    In-memory index of finished URLs backed by an append-only file.
+
+    The file is read once when the daemon starts; after that membership tests
+    never touch the disk and every finished URL is appended as one line.
+
+    Attributes:
+        path (Optional[Path]): Backing file. None keeps the index in memory.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Load the index.
+
+        Args:
+            path (Optional[Path]): Backing file; a missing file is an empty
+                                   index. Defaults to None.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._urls: Set[str] = set()
+        if path is not None and path.is_file():
+            with path.open(encoding="utf-8") as fh:
+                self._urls.update(line.strip() for line in fh if line.strip())
+
+    def __contains__(self, url: object) -> bool:
+        """Return True if ``url`` has been finished."""
+        return url in self._urls
+
+    def __len__(self) -> int:
+        """Return the number of finished URLs."""
+        return len(self._urls)
+
+    def add(self, url: str) -> None:
+        """
+        Record a finished URL.
+
+        Args:
+            url (str): URL to add; already indexed URLs are ignored.
+        """
+        with self._lock:
+            if url in self._urls:
+                return
+            self._urls.add(url)
+            if self.path is not None:
+                with self.path.open("a", encoding="utf-8") as fh:
+                    fh.write(url + "\n")
+
+
+class DownloadService:
+    """
+    Runs submitted jobs on a long-lived DownloaderCore.
+
+    All jobs share one worker pool of ``config.max_workers`` threads, so the
+    per-thread extraction sessions stay warm, and URLs of different jobs are
+    downloaded in submission order.
+
+    Attributes:
+        core (DownloaderCore): Download engine shared by all jobs.
+        archive (ArchiveIndex): Index of finished URLs.
+        max_jobs (int): Finished jobs kept for status queries.
+    """
+
+    def __init__(
+        self,
+        core: DownloaderCore,
+        archive: Optional[ArchiveIndex] = None,
+        max_jobs: int = 1000,
+    ) -> None:
+        """
+        Start the worker pool.
+
+        Args:
+            core (DownloaderCore): Configured download engine.
+            archive (Optional[ArchiveIndex]): Index of finished URLs.
+                                              Defaults to an in-memory index.
+            max_jobs (int): Finished jobs kept for status queries.
+                            Defaults to 1000.
+        """
+        self.core = core
+        self.archive = archive if archive is not None else ArchiveIndex()
+        self.max_jobs = max_jobs
+        self.started = time.monotonic()
+        self._pool = ThreadPoolExecutor(
+            max_workers=core.config.max_workers, thread_name_prefix="yt-dl-serve"
+        )
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self._queued: "Set[Future[None]]" = set()
+
+    def submit(self, urls: Iterable[str]) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            urls (Iterable[str]): URLs to download.
+
+        Returns:
+            Job: The queued job.
+        """
+        with self._lock:
+            job = Job(str(next(self._ids)), [url.strip() for url in urls])
+            self._jobs[job.id] = job
+            self._trim()
+        self.core.logger.info(
+            Messages.Server.JOB_SUBMITTED(job=job.id, count=len(job.results))
+        )
+        for url in job.results:
+            future = self._pool.submit(self._run, job, url, self.core.tracer.clock())
+            with self._lock:
+                self._queued.add(future)
+            future.add_done_callback(self._forget)
+        return job
+
+    def _forget(self, future: "Future[None]") -> None:
+        """Drop a finished or cancelled URL from the queued set."""
+        with self._lock:
+            self._queued.discard(future)
+
+    def _trim(self) -> None:
+        """Forget the oldest finished jobs beyond max_jobs (lock held)."""
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in [i for i, job in self._jobs.items() if job.state == DONE][:excess]:
+            del self._jobs[job_id]
+
+    def _run(self, job: Job, url: str, queued_ns: int) -> None:
+        """
+        Process one URL of a job in a worker thread.
+
+        Any exception marks the URL as failed with its error, so the job
+        always finishes.
+        """
+        with self._lock:
+            job.state = RUNNING
+        status = DownloadStatus.FAILED
+        try:
+            if url in self.archive:
+                self.core.stats.record_skip()
+                status = DownloadStatus.SKIPPED
+            else:
+                status = self._download(url, queued_ns)
+                if status != DownloadStatus.FAILED:
+                    self.archive.add(url)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            status = DownloadStatus.FAILED
+            self.core.logger.error(Messages.Executor.ERROR_DOWNLOAD(url=url, error=e))
+            with self._lock:
+                job.errors[url] = str(e)
+        finally:
+            with self._lock:
+                job.results[url] = status
+                if all(result is not None for result in job.results.values()):
+                    job.state = DONE
+                    job.finished = time.time()
+
+    def _download(self, url: str, queued_ns: int) -> str:
+        """Download one URL within its root span and return its status."""
+        core = self.core
+        tracer = core.tracer
+        root = tracer.start_span("url", start_ns=queued_ns, url=url, host=url_host(url))
+        tracer.start_span("queued", parent=root, start_ns=queued_ns).end()
+        try:
+            return core.profiler.run(
+                functools.partial(tracer.run, root, core.download_single), url
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            root.set_error(repr(e))
+            core.logger.error(Messages.Executor.ERROR_DOWNLOAD(url=url, error=e))
+            core.stats.record_failure()
+            return DownloadStatus.FAILED
+        finally:
+            root.add_event("done")
+            root.end()
+
+    def job(self, job_id: str) -> Optional[Job]:
+        """Return the job with the given id, or None if it is unknown."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """Return the JSON representation of all known jobs."""
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Return the daemon's counters.
+
+        Returns:
+            Dict[str, Any]: Uptime, workers, jobs per state, download
+            statistics, metadata cache hits and misses and archive size.
+        """
+        with self._lock:
+            states: Dict[str, int] = {}
+            for job in self._jobs.values():
+                states[job.state] = states.get(job.state, 0) + 1
+        cache = getattr(self.core.info_extractor, "record_cache", None)
+        return {
+            "status": "ok",
+            "uptime": time.monotonic() - self.started,
+            "workers": self.core.config.max_workers,
+            "jobs": states,
+            "stats": self.core.stats.get_summary(),
+            "metadata_cache": (
+                {"size": len(cache), "hits": cache.hits, "misses": cache.misses}
+                if cache is not None
+                else None
+            ),
+            "archive": len(self.archive),
+        }
+
+    def close(self) -> None:
+        """Cancel queued URLs and wait for running downloads to finish."""
+        with self._lock:
+            queued = list(self._queued)
+        for future in queued:
+            future.cancel()
+        self._pool.shutdown(wait=True)
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    """JSON request handler of the submission API."""
+
+    server_version = "yt-dl-cli"
+
+    @property
+    def service(self) -> DownloadService:
+        """DownloadService: Service of the server."""
+        return self.server.service  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handle job status and health queries."""
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/health":
+            self._send(200, self.service.health())
+        elif path == "/jobs":
+            self._send(200, {"jobs": self.service.jobs()})
+        elif path.startswith("/jobs/"):
+            job = self.service.job(path[len("/jobs/"):])
+            if job is None:
+                self._send(404, {"error": Messages.Server.UNKNOWN_JOB()})
+            else:
+                self._send(200, job.to_dict())
+        else:
+            self._send(404, {"error": Messages.Server.UNKNOWN_PATH(path=self.path)})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Handle job submissions."""
+        if self.path.rstrip("/") != "/jobs":
+            self._send(404, {"error": Messages.Server.UNKNOWN_PATH(path=self.path)})
+            return
+        header = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send(400, {"error": Messages.Server.INVALID_LENGTH(length=header)})
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"null")
+        except ValueError:
+            body = None
+        urls = body.get("urls") if isinstance(body, dict) else None
+        if (
+            not isinstance(urls, list)
+            or not urls
+            or not all(isinstance(url, str) and url.strip() for url in urls)
+        ):
+            self._send(400, {"error": Messages.Server.INVALID_SUBMISSION()})
+            return
+        self._send(202, self.service.submit(urls).to_dict())
+
+    def _send(self, status: int, body: Any) -> None:
+        """Write a JSON response."""
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Log requests at debug level instead of writing them to stderr."""
+        self.service.core.logger.debug(format % args)
+
+    def address_string(self) -> str:
+        """Return the client address; Unix socket clients have none."""
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+
+class _TCPServer(ThreadingHTTPServer):
+    """Threading HTTP server on a TCP address."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: DownloadService) -> None:
+        """Bind the server and attach the service."""
+        self.service = service
+        super().__init__(address, _ApiHandler)
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    """Threading HTTP server on a Unix socket."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, service: DownloadService) -> None:
+        """Bind the server to ``path``, replacing a stale socket file."""
+        self.service = service
+        if path.is_socket():
+            path.unlink()
+        super().__init__(str(path), _ApiHandler)
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        try:
+            os.unlink(self.server_address)  # type: ignore[arg-type]
+        except OSError:
+            pass
+
+
+def create_server(
+    service: DownloadService, server_config: ServerConfig
+) -> socketserver.BaseServer:
+    """
+    Bind the submission API.
+
+    Args:
+        service (DownloadService): Service handling the requests.
+        server_config (ServerConfig): Listening address.
+
+    Returns:
+        socketserver.BaseServer: Bound server; call serve_forever() to run it.
+    """
+    if server_config.socket_path is not None:
+        return _UnixServer(server_config.socket_path, service)
+    return _TCPServer((server_config.host, server_config.port), service)
+
+
+def serve(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Entry point of ``yt-dl-cli serve``.
+
+    Builds the download engine once through the DI container, binds the
+    submission API and serves until interrupted (Ctrl+C). Running downloads
+    are finished before the process exits and the statistics of the whole
+    session are reported.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments after ``serve``. Defaults
+                                        to None (``sys.argv[2:]``).
+    """
+    setup_i18n()
+    config, server_config = parse_serve_arguments(sys.argv[2:] if argv is None else argv)
+    core = DIContainer.create_downloader_core(config)
+    with core:
+        service = DownloadService(
+            core, ArchiveIndex(config.save_dir / ARCHIVE_NAME), server_config.max_jobs
+        )
+        server = create_server(service, server_config)
+        address = server_config.socket_path or (
+            f"http://{server_config.host}:{getattr(server, 'server_port')}"
+        )
+        core.logger.info(Messages.Server.LISTENING(address=address))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            core.logger.info(Messages.Server.STOPPING())
+        finally:
+            server.server_close()
+            service.close()
+            core.stats.report(core.logger, time.monotonic() - service.started)
+            core.profiler.report(core.logger, time.monotonic() - service.started)
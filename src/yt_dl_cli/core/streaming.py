@@ -0,0 +1,255 @@
+"""
+Streaming of media bytes to stdout or a named pipe.
+
+In stream mode nothing is written to the save directory: the selected
+format of every URL is fetched over HTTP and its bytes are written to a
+StreamSink (raw for a single URL, framed for batches; see
+yt_dl_cli.utils.stream_sink) as they arrive, so a consumer such as a
+transcription pipeline reads them without a write and read-back of a
+temporary file.
+
+Only formats yt-dlp downloads with a plain HTTP(S) transfer can be streamed;
+the strategy is wrapped so it never selects formats that need an ffmpeg
+merge, and audio is streamed in its source container (e.g. m4a or webm).
+
+Classes:
+    StreamExecutor: Download executor streaming into a StreamSink
+    StreamingStrategy: Strategy decorator selecting streamable formats
+    NoFileChecker: File checker for stream mode (nothing exists on disk)
+
+Functions:
+    streamable_selector: Drop merged alternatives from a format selector
+
+Example:
+    >>> sink = StreamSink("-", framed=False)
+    >>> executor = StreamExecutor(logger, sink)
+    >>> executor.execute_download(url, {"format": "bestaudio"})
+"""
+
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import yt_dlp  # type: ignore
+from yt_dlp.networking import Request  # type: ignore
+
+from yt_dl_cli.core.core import create_youtube_dl
+from yt_dl_cli.core.records import TransferInfo, VideoRecord
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+from yt_dl_cli.interfaces.strategies import IFormatStrategy
+from yt_dl_cli.utils.stream_sink import StreamSink
+
+BLOCK_SIZE = 256 * 1024
+"""Bytes read from the network per data frame."""
+
+
+def streamable_selector(selector: Optional[str]) -> Optional[str]:
+    """
+    Remove the alternatives of a format selector that need a merge.
+
+    Args:
+        selector (Optional[str]): yt-dlp format selector, e.g.
+            ``"137+140/18/best"``.
+
+    Returns:
+        Optional[str]: The single-file alternatives (``"18/best"``), or None
+        if there are none.
+    """
+    if not selector:
+        return None
+    alternatives = [alt for alt in selector.split("/") if "+" not in alt]
+    return "/".join(alternatives) or None
+
+
+class StreamExecutor:
+    """
+    Download executor streaming the selected format into a StreamSink.
+
+    Drop-in replacement for DownloadExecutor (``execute_download`` and
+    ``last_transfer``). Each call extracts the URL with the given options,
+    then fetches the selected format over HTTP, honoring yt-dlp's
+    ``http_chunk_size`` with Range requests, and reports progress to the
+    same progress hooks a yt-dlp download would.
+
+    Attributes:
+        logger (ILogger): Receives download errors.
+        sink (StreamSink): Shared output.
+        progress_hooks (List[Callable]): Hooks called with yt-dlp style
+            progress dictionaries.
+    """
+
+    def __init__(
+        self,
+        logger: ILogger,
+        sink: StreamSink,
+        progress_hooks: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
+        extractors: Sequence[Any] = (),
+        block_size: int = BLOCK_SIZE,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            logger (ILogger): Logger for download errors.
+            sink (StreamSink): Output shared by all workers.
+            progress_hooks (Optional[List[Callable]]): yt-dlp progress hooks,
+                e.g. the bandwidth limiter. Defaults to None.
+            extractors (Sequence[Any]): yt-dlp extractor plugins registered
+                ahead of the built-in ones. Defaults to none.
+            block_size (int): Bytes per network read and data frame.
+                Defaults to BLOCK_SIZE.
+        """
+        self.logger = logger
+        self.sink = sink
+        self.progress_hooks = list(progress_hooks or [])
+        self.extractors = tuple(extractors)
+        self.block_size = block_size
+        self._local = threading.local()
+
+    def execute_download(self, url: str, opts: Dict[str, Any]) -> bool:
+        """
+        Stream the format selected by ``opts`` for a URL.
+
+        Args:
+            url (str): Video URL.
+            opts (Dict[str, Any]): yt-dlp options; "format" selects the
+                format (alternatives that need a merge are dropped).
+
+        Returns:
+            bool: True if the whole file was streamed, False otherwise (the
+            error is logged and, in framed mode, sent in the end frame).
+        """
+        transfer = self._local.transfer = TransferInfo(path=self.sink.name)
+        opts = dict(opts, quiet=True, no_warnings=True, logtostderr=True)
+        opts["format"] = streamable_selector(opts.get("format")) or "best"
+        stream_id = None
+        try:
+            with create_youtube_dl(opts, self.extractors) as ydl:
+                info = ydl.extract_info(url, download=False)
+                if info is None:
+                    raise yt_dlp.DownloadError(Messages.Extractor.ERROR_NO_INFO())
+                if info.get("requested_formats") or info.get("protocol") not in ("http", "https"):
+                    raise yt_dlp.DownloadError(
+                        Messages.Stream.NOT_STREAMABLE(format=info.get("format_id"))
+                    )
+                stream_id = self.sink.start(
+                    {
+                        "url": url,
+                        "title": info.get("title"),
+                        "ext": info.get("ext"),
+                        "format_id": info.get("format_id"),
+                        "filesize": info.get("filesize") or info.get("filesize_approx"),
+                    }
+                )
+                self._stream(ydl, info, stream_id, transfer)
+            self.sink.end(stream_id, {"status": "finished", "bytes": transfer.bytes})
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            transfer.error = e
+            self.logger.error(Messages.Executor.ERROR_DOWNLOAD(url=url, error=e))
+            if stream_id is not None:
+                self._end_failed(stream_id, transfer)
+            return False
+
+    def _end_failed(self, stream_id: int, transfer: TransferInfo) -> None:
+        """Send the end frame of a failed stream, if the target still accepts it."""
+        try:
+            self.sink.end(
+                stream_id,
+                {"status": "error", "bytes": transfer.bytes, "error": str(transfer.error)},
+            )
+        except OSError:
+            pass
+
+    def _stream(
+        self, ydl: yt_dlp.YoutubeDL, info: Dict[str, Any], stream_id: int, transfer: TransferInfo
+    ) -> None:
+        """Fetch the format and write it to the sink, reporting progress."""
+        total = info.get("filesize") or info.get("filesize_approx")
+        status = {
+            "status": "downloading",
+            "filename": f"{self.sink.name}#{stream_id}",
+            "info_dict": info,
+            "downloaded_bytes": 0,
+            "total_bytes": total,
+        }
+        for block in self._blocks(ydl, info):
+            self.sink.data(stream_id, block)
+            transfer.bytes += len(block)
+            self._report(dict(status, downloaded_bytes=transfer.bytes))
+        self._report(dict(status, status="finished", downloaded_bytes=transfer.bytes))
+
+    def _report(self, status: Dict[str, Any]) -> None:
+        """Call every progress hook."""
+        for hook in self.progress_hooks:
+            hook(status)
+
+    def _blocks(self, ydl: yt_dlp.YoutubeDL, info: Dict[str, Any]) -> Iterator[bytes]:
+        """Read the media in blocks, chunk by chunk when http_chunk_size is set."""
+        headers = dict(info.get("http_headers") or {})
+        chunk = (info.get("downloader_options") or {}).get("http_chunk_size")
+        total = info.get("filesize")
+        start = 0
+        while True:
+            if chunk:
+                headers["Range"] = f"bytes={start}-{start + chunk - 1}"
+            received = 0
+            with ydl.urlopen(Request(info["url"], headers=headers)) as response:
+                partial = response.status == 206
+                while True:
+                    block = response.read(self.block_size)
+                    if not block:
+                        break
+                    received += len(block)
+                    yield block
+            start += received
+            if not (chunk and partial) or received < chunk or (total and start >= total):
+                return
+
+    def last_transfer(self) -> TransferInfo:
+        """
+        Return what was observed during the calling thread's last stream.
+
+        Returns:
+            TransferInfo: Target name, streamed bytes and error.
+        """
+        return getattr(self._local, "transfer", None) or TransferInfo()
+
+
+class StreamingStrategy(IFormatStrategy):
+    """
+    Strategy decorator for stream mode.
+
+    Keeps the wrapped strategy's choices but drops alternatives that need an
+    ffmpeg merge and any post-processors (audio is streamed in its source
+    container), and sends yt-dlp's screen output to stderr so stdout only
+    carries media.
+    """
+
+    def __init__(self, strategy: IFormatStrategy) -> None:
+        """Wrap a strategy."""
+        self.strategy = strategy
+
+    def get_opts(self) -> Dict[str, Any]:
+        """Return the wrapped options without post-processors, logging to stderr."""
+        opts = self.strategy.get_opts()
+        opts.pop("postprocessors", None)
+        opts["logtostderr"] = True
+        return opts
+
+    def select_format(self, record: VideoRecord) -> Optional[str]:
+        """Return the wrapped selection without merged alternatives."""
+        return streamable_selector(self.strategy.select_format(record))
+
+    def plan_items(self, count: int) -> None:
+        """Pass the number of remaining items to the wrapped strategy."""
+        self.strategy.plan_items(count)
+
+
+class NoFileChecker:
+    """File checker for stream mode: files in the save directory are irrelevant."""
+
+    def exists(self, filepath: Path) -> bool:  # pylint: disable=unused-argument
+        """Return False: every URL is streamed."""
+        return False
@@ -0,0 +1,447 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Shared work queue with time-bounded leases.
+
+Large jobs can be spread over several yt-dl-cli processes or machines that
+pull URLs from one durable queue instead of hand-split links files. Every
+worker claims a URL with a lease that expires after ``lease_time`` seconds,
+keeps renewing it (heartbeat) while the download is in progress and records
+the outcome when it is done. If a node dies its leases expire and the URLs
+are handed to the next worker that asks. Finished URLs stay in the queue as
+a common archive: adding them again (e.g. every node starting with the same
+links file) is a no-op, so a finished URL is never downloaded twice.
+
+Two implementations of the IWorkQueue protocol are provided:
+
+- SQLiteWorkQueue: a single SQLite file shared by all processes. Claims run
+  in ``BEGIN IMMEDIATE`` transactions, so two workers never hold the same
+  URL. WAL journaling is used by default; it requires all processes to run
+  on the same host. For a queue on network storage (NFS, SMB) shared by
+  several machines pass ``wal=False`` so the rollback journal and the file
+  system's locks are used instead.
+- MemoryWorkQueue: an in-process implementation with the same semantics,
+  used for tests and single-process runs.
+
+Lease expiry is compared with wall-clock time (time.time) because leases
+are shared between machines; node clocks should be synchronized (NTP) to
+well within the lease time.
+
+Classes:
+    Lease: A claimed URL
+    SQLiteWorkQueue: Durable queue in a SQLite file
+    MemoryWorkQueue: In-process queue
+    LeaseKeeper: Background thread renewing the leases of a process
+
+Example:
+    >>> queue = SQLiteWorkQueue(Path("/shared/job.db"))
+    >>> queue.add(urls)
+    >>> lease = queue.claim("node-1:4242", lease_time=300)
+    >>> queue.heartbeat(lease, lease_time=300)
+    >>> queue.complete(lease, DownloadStatus.DOWNLOADED)
+"""
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from yt_dl_cli.core.records import DownloadStatus
+from yt_dl_cli.interfaces.interfaces import ILogger, IWorkQueue
+
+PENDING = "pending"
+"""State of a URL that waits for a worker."""
+
+LEASED = "leased"
+"""State of a URL claimed by a worker (its lease may have expired)."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    token TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS items_state ON items (state, seq);
+"""
+
+
+@dataclass(frozen=True)
+class Lease:
+    """
+    A URL claimed from a work queue.
+
+    Attributes:
+        url (str): Claimed URL.
+        worker (str): Id of the worker holding the lease.
+        token (str): Random token proving ownership of this claim; a URL that
+            was reassigned gets a new token, so a late heartbeat or completion
+            of the previous holder is rejected.
+        attempts (int): Number of times the URL has been claimed, including
+            this claim.
+    """
+
+    url: str
+    worker: str
+    token: str
+    attempts: int
+
+
+class SQLiteWorkQueue:
+    """
+    Durable work queue stored in a SQLite database file.
+
+    Every thread uses its own connection, so one instance can be shared by
+    all workers of a process.
+
+    Attributes:
+        path (Path): Database file.
+        max_attempts (int): Claims after which an expired lease marks the URL
+            as failed instead of reassigning it (protects against URLs that
+            crash the worker).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_attempts: int = 3,
+        wal: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Open (and create if needed) the queue database.
+
+        Args:
+            path (Path): Database file; parent directories are created.
+            max_attempts (int): Claims per URL before it is failed.
+                Defaults to 3.
+            wal (bool): Use WAL journaling (same-host processes only).
+                Defaults to True.
+            clock (Callable[[], float]): Wall clock in seconds. Defaults to
+                time.time.
+        """
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self._wal = wal
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self.path), timeout=60.0, isolation_level=None, check_same_thread=False
+            )
+            connection.execute(f"PRAGMA journal_mode={'WAL' if self._wal else 'DELETE'}")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def add(self, urls: Iterable[str]) -> int:
+        """
+        Add URLs that are not in the queue yet.
+
+        Args:
+            urls (Iterable[str]): URLs to add, in processing order.
+
+        Returns:
+            int: Number of URLs that were new.
+        """
+        connection = self._connection()
+        before = connection.total_changes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT OR IGNORE INTO items (url, updated) VALUES (?, ?)",
+                ((url, self._clock()) for url in urls),
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return connection.total_changes - before
+
+    def claim(self, worker: str, lease_time: float) -> Optional[Lease]:
+        """
+        Claim the next pending URL, or a URL whose lease has expired.
+
+        Args:
+            worker (str): Id of the claiming worker.
+            lease_time (float): Lease duration in seconds.
+
+        Returns:
+            Optional[Lease]: The lease, or None if nothing can be claimed now.
+        """
+        connection = self._connection()
+        now = self._clock()
+        token = os.urandom(8).hex()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "UPDATE items SET state = ?, updated = ? "
+                "WHERE state = ? AND lease_until < ? AND attempts >= ?",
+                (DownloadStatus.FAILED, now, LEASED, now, self.max_attempts),
+            )
+            row = connection.execute(
+                "SELECT seq, url, attempts FROM items WHERE state = ? ORDER BY seq LIMIT 1",
+                (PENDING,),
+            ).fetchone() or connection.execute(
+                "SELECT seq, url, attempts FROM items WHERE state = ? AND lease_until < ? "
+                "ORDER BY lease_until LIMIT 1",
+                (LEASED, now),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE items SET state = ?, worker = ?, token = ?, lease_until = ?, "
+                    "attempts = attempts + 1, updated = ? WHERE seq = ?",
+                    (LEASED, worker, token, now + lease_time, now, row[0]),
+                )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        if row is None:
+            return None
+        return Lease(url=row[1], worker=worker, token=token, attempts=row[2] + 1)
+
+    def heartbeat(self, lease: Lease, lease_time: float) -> bool:
+        """
+        Extend a lease.
+
+        Args:
+            lease (Lease): Lease to extend.
+            lease_time (float): New lease duration from now in seconds.
+
+        Returns:
+            bool: False if the lease is no longer held (it expired and the
+            URL was reassigned or completed).
+        """
+        now = self._clock()
+        cursor = self._connection().execute(
+            "UPDATE items SET lease_until = ?, updated = ? "
+            "WHERE url = ? AND token = ? AND state = ?",
+            (now + lease_time, now, lease.url, lease.token, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, lease: Lease, status: str) -> bool:
+        """
+        Record the outcome of a leased URL.
+
+        Args:
+            lease (Lease): Lease of the processed URL.
+            status (str): A DownloadStatus value.
+
+        Returns:
+            bool: False if the lease is no longer held; the outcome is then
+            not recorded.
+        """
+        cursor = self._connection().execute(
+            "UPDATE items SET state = ?, lease_until = NULL, updated = ? "
+            "WHERE url = ? AND token = ? AND state = ?",
+            (status, self._clock(), lease.url, lease.token, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of URLs per state."""
+        rows = self._connection().execute(
+            "SELECT state, COUNT(*) FROM items GROUP BY state"
+        ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+class _Item:
+    """Queue entry of MemoryWorkQueue."""
+
+    __slots__ = ("state", "token", "lease_until", "attempts")
+
+    def __init__(self) -> None:
+        self.state = PENDING
+        self.token: Optional[str] = None
+        self.lease_until = 0.0
+        self.attempts = 0
+
+
+class MemoryWorkQueue:
+    """
+    In-process work queue with the semantics of SQLiteWorkQueue.
+
+    Attributes:
+        max_attempts (int): Claims after which an expired lease fails the URL.
+    """
+
+    def __init__(self, max_attempts: int = 3, clock: Callable[[], float] = time.time) -> None:
+        """
+        Initialize an empty queue.
+
+        Args:
+            max_attempts (int): Claims per URL before it is failed. Defaults to 3.
+            clock (Callable[[], float]): Clock in seconds. Defaults to time.time.
+        """
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._items: Dict[str, _Item] = {}
+
+    def add(self, urls: Iterable[str]) -> int:
+        """Add URLs that are not in the queue yet and return how many were new."""
+        added = 0
+        with self._lock:
+            for url in urls:
+                if url not in self._items:
+                    self._items[url] = _Item()
+                    added += 1
+        return added
+
+    def claim(self, worker: str, lease_time: float) -> Optional[Lease]:
+        """Claim the next pending URL, or a URL whose lease has expired."""
+        with self._lock:
+            now = self._clock()
+            expired = None
+            for url, item in self._items.items():
+                if item.state == PENDING:
+                    break
+                if item.state == LEASED and item.lease_until < now:
+                    if item.attempts >= self.max_attempts:
+                        item.state = DownloadStatus.FAILED
+                    elif expired is None:
+                        expired = url
+            else:
+                if expired is None:
+                    return None
+                url = expired
+            item = self._items[url]
+            item.state = LEASED
+            item.token = os.urandom(8).hex()
+            item.lease_until = now + lease_time
+            item.attempts += 1
+            return Lease(url=url, worker=worker, token=item.token, attempts=item.attempts)
+
+    def heartbeat(self, lease: Lease, lease_time: float) -> bool:
+        """Extend a lease; return False if it is no longer held."""
+        with self._lock:
+            item = self._items.get(lease.url)
+            if item is None or item.state != LEASED or item.token != lease.token:
+                return False
+            item.lease_until = self._clock() + lease_time
+            return True
+
+    def complete(self, lease: Lease, status: str) -> bool:
+        """Record the outcome of a leased URL; return False if the lease was lost."""
+        with self._lock:
+            item = self._items.get(lease.url)
+            if item is None or item.state != LEASED or item.token != lease.token:
+                return False
+            item.state = status
+            return True
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of URLs per state."""
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for item in self._items.values():
+                counts[item.state] = counts.get(item.state, 0) + 1
+        return counts
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class LeaseKeeper:
+    """
+    Background thread renewing the leases held by a process.
+
+    Leases are renewed every third of the lease time, so a lease survives two
+    missed heartbeats (e.g. a stalled disk) before it can be reassigned.
+    Leases that could not be renewed are collected in ``lost``.
+
+    Attributes:
+        lost (set): URLs whose lease was lost while being processed.
+    """
+
+    def __init__(
+        self,
+        work_queue: IWorkQueue,
+        lease_time: float,
+        logger: Optional[ILogger] = None,
+    ) -> None:
+        """
+        Initialize the keeper (started by entering it as a context manager).
+
+        Args:
+            work_queue (IWorkQueue): Queue the leases belong to.
+            lease_time (float): Lease duration in seconds.
+            logger (Optional[ILogger]): Receives heartbeat errors. Defaults
+                to None.
+        """
+        self.work_queue = work_queue
+        self.lease_time = lease_time
+        self.logger = logger
+        self.lost: set = set()
+        self._leases: Dict[str, Lease] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-keeper", daemon=True)
+
+    def track(self, lease: Lease) -> None:
+        """Start renewing a lease."""
+        with self._lock:
+            self._leases[lease.token] = lease
+
+    def untrack(self, lease: Lease) -> None:
+        """Stop renewing a lease."""
+        with self._lock:
+            self._leases.pop(lease.token, None)
+
+    def renew(self) -> None:
+        """Renew all tracked leases once."""
+        with self._lock:
+            leases = list(self._leases.values())
+        for lease in leases:
+            try:
+                held = self.work_queue.heartbeat(lease, self.lease_time)
+            except sqlite3.Error as e:
+                if self.logger is not None:
+                    self.logger.warning(str(e))
+                continue
+            if not held:
+                self.untrack(lease)
+                self.lost.add(lease.url)
+
+    def _run(self) -> None:
+        """Renew leases until stopped."""
+        while not self._stop.wait(self.lease_time / 3):
+            self.renew()
+
+    def __enter__(self) -> "LeaseKeeper":
+        """Start the heartbeat thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the heartbeat thread."""
+        self._stop.set()
+        self._thread.join()
@@ -181,6 +181,128 @@ class Messages:
         )
         """Message displayed when an unsupported quality setting is specified."""
 
+        INVALID_FILESIZE = LazyTranslation(
+            "max_filesize must be a positive number of bytes, got {filesize}"
+        )
+        """Message displayed when a non-positive size budget is specified."""
+
+        INVALID_DEADLINE = LazyTranslation(
+            "deadline must be a positive number of seconds, got {deadline}"
+        )
+        """Message displayed when a non-positive batch deadline is specified."""
+
+        INVALID_BANDWIDTH = LazyTranslation(
+            "max_bandwidth must be a positive number of bytes per second, got {bandwidth}"
+        )
+        """Message displayed when a non-positive bandwidth cap is specified."""
+
+        INVALID_TRANSFER_SIZE = LazyTranslation(
+            "{option} must be a positive number of bytes, got {size}"
+        )
+        """Message displayed when a non-positive buffer or HTTP chunk size is specified."""
+
+        INVALID_KEEP_ALIVE = LazyTranslation(
+            "keep_alive_per_host must be at least 1, got {count}"
+        )
+        """Message displayed when the pool would keep no connection per host."""
+
+        INVALID_DNS_TTL = LazyTranslation("dns_ttl must be positive, got {ttl}")
+        """Message displayed when a non-positive DNS cache lifetime is specified."""
+
+        INVALID_REPLAY_LATENCY = LazyTranslation(
+            "replay_latency must not be negative, got {latency}"
+        )
+        """Message displayed when a negative replay latency is specified."""
+
+        INVALID_ERROR_RATE = LazyTranslation(
+            "replay_error_rate must be between 0 and 1, got {rate}"
+        )
+        """Message displayed when the injected error rate is out of range."""
+
+        REPLAY_RECORD_CONFLICT = LazyTranslation(
+            "replay_dir and record_dir cannot be used together"
+        )
+        """Message displayed when both replay and record modes are requested."""
+
+        INVALID_LEASE = LazyTranslation(
+            "lease_time must be a positive number of seconds, got {lease}"
+        )
+        """Message displayed when a non-positive work-queue lease is specified."""
+
+        QUEUE_METADATA_CONFLICT = LazyTranslation(
+            "queue_path and metadata_only cannot be used together"
+        )
+        """Message displayed when the work queue is combined with metadata-only mode."""
+
+        INVALID_CACHE_SIZE = LazyTranslation(
+            "metadata_cache_size must not be negative, got {size}"
+        )
+        """Message displayed when a negative metadata cache size is specified."""
+
+        INVALID_SCHEDULE = LazyTranslation(
+            "schedule must be one of {valid}, got '{schedule}'"
+        )
+        """Message displayed when an unknown scheduling policy is specified."""
+
+        INVALID_BATCH_SIZE = LazyTranslation("batch_size must be at least 1, got {size}")
+        """Message displayed when a micro-batch would hold no URL."""
+
+        INVALID_LOOKAHEAD = LazyTranslation(
+            "playlist_lookahead must be at least 1, got {lookahead}"
+        )
+        """Message displayed when playlist expansion could not queue any video."""
+
+        INVALID_DISK_MARGIN = LazyTranslation(
+            "disk_margin must not be negative, got {margin}"
+        )
+        """Message displayed when a negative free-space margin is specified."""
+
+        INVALID_POSTPROCESS_WORKERS = LazyTranslation(
+            "postprocess_workers must not be negative, got {workers}"
+        )
+        """Message displayed when a negative post-processing pool size is specified."""
+
+        INVALID_STREAM_FRAMING = LazyTranslation(
+            "stream_framing must be one of {valid}, got '{framing}'"
+        )
+        """Message displayed when an unknown stream framing is specified."""
+
+        RAW_STREAM_BATCH = LazyTranslation(
+            "raw streaming needs exactly one URL, got {count}; use framed streaming for batches"
+        )
+        """Message displayed when raw streaming is requested for several URLs."""
+
+        STREAM_CONFLICT = LazyTranslation(
+            "stream_output cannot be combined with metadata_only"
+        )
+        """Message displayed when stream mode is combined with metadata-only mode."""
+
+        INVALID_STORAGE = LazyTranslation(
+            "storage URL '{url}' names no bucket; use s3://bucket/prefix"
+        )
+        """Message displayed when an s3:// storage URL has no bucket."""
+
+        STORAGE_CONFLICT = LazyTranslation(
+            "storage cannot be combined with {option}"
+        )
+        """Message displayed when storage is combined with an incompatible option."""
+
+        STAGING_CONFLICT = LazyTranslation(
+            "staging_dir cannot be combined with {option}"
+        )
+        """Message displayed when a staging directory is combined with an incompatible option."""
+
+        INVALID_DISK_POLICY = LazyTranslation(
+            "disk_full_policy must be one of {valid}, got '{policy}'"
+        )
+        """Message displayed when an unknown disk-full policy is specified."""
+
+        INVALID_PORT = LazyTranslation("port must be between 0 and 65535, got {port}")
+        """Message displayed when the server port is out of range."""
+
+        INVALID_MAX_JOBS = LazyTranslation("max_jobs must be at least 1, got {jobs}")
+        """Message displayed when the server job history size is less than 1."""
+
     class Core:
         """
         Messages used by the core downloader component.
@@ -200,6 +322,14 @@ class Messages:
         DONE_DOWNLOAD = LazyTranslation("[DONE] {title}")
         """Message displayed when a download completes successfully."""
 
+        NO_DISK_SPACE = LazyTranslation(
+            "Not enough disk space for {title} ({size} bytes expected)"
+        )
+        """Message displayed when a download is refused because it would not fit on disk."""
+
+        ERROR_STORE = LazyTranslation("Failed to store {title}: {error}")
+        """Message displayed when a downloaded file cannot be moved to storage."""
+
         ERROR_RESOURCE_CLOSE = LazyTranslation("Error closing resource: {error}")
         """Message displayed when there's an error during resource cleanup."""
 
@@ -230,6 +360,124 @@ class Messages:
         ERROR_DOWNLOAD = LazyTranslation("Download failed for {url}: {error}")
         """Message displayed when a download operation fails."""
 
+    class Stream:
+        """
+        Messages used by the stream mode.
+
+        This group contains messages about media that is streamed to stdout
+        or a named pipe instead of being saved to files.
+        """
+
+        NOT_STREAMABLE = LazyTranslation(
+            "format {format} cannot be streamed: it needs merging or is not a plain HTTP download"
+        )
+        """Message displayed when the selected format cannot be streamed."""
+
+    class PostProcessing:
+        """
+        Messages used by the post-processing pool.
+
+        This group contains messages about merges and audio extractions that
+        run in the separate post-processing pool after the download finished.
+        """
+
+        DONE = LazyTranslation("[PROCESSED] {path}")
+        """Message displayed when a merge or audio extraction has finished."""
+
+        FAILED = LazyTranslation("Post-processing failed for {path}: {error}")
+        """Message displayed when a merge or audio extraction fails."""
+
+        WAITING = LazyTranslation("Waiting for {count} post-processing jobs")
+        """Message displayed when the batch waits for the post-processing pool."""
+
+        STATS = LazyTranslation("Post-processing: {completed} done, {failed} failed")
+        """Message displayed with the job counters of the post-processing pool."""
+
+    class Mover:
+        """
+        Messages used by the staging directory mover.
+
+        This group contains messages about finished files that are moved from
+        the staging directory into the save directory in the background.
+        """
+
+        FAILED = LazyTranslation("Failed to move {path} into the library: {error}")
+        """Message displayed when a staged file cannot be moved."""
+
+        WAITING = LazyTranslation("Waiting for {count} files to be moved into the library")
+        """Message displayed when the batch waits for the mover."""
+
+        STATS = LazyTranslation("Moved into the library: {moved} files, {failed} failed")
+        """Message displayed with the counters of the mover."""
+
+    class Tuning:
+        """
+        Messages used by the transfer settings calibration.
+
+        This group contains messages about the buffer and HTTP chunk sizes
+        measured per host and the file they are stored in.
+        """
+
+        CALIBRATED = LazyTranslation("Calibrated transfer settings for {host}: {settings}")
+        """Message displayed when the fastest settings of a host were found."""
+
+        SAVE_FAILED = LazyTranslation("Failed to save transfer calibration to {path}: {error}")
+        """Message displayed when the calibration file cannot be written."""
+
+    class Connections:
+        """
+        Messages used by the keep-alive connection pool.
+
+        This group contains the summary of connection reuse printed with the
+        final statistics.
+        """
+
+        STATS = LazyTranslation(
+            "Connections: {requests} requests, {reused} reused ({ratio:.0f}%), "
+            "{connections} opened in {handshake:.2f}s ({average:.0f} ms each)"
+        )
+        """Message displayed with the reuse ratio and handshake time of the pool."""
+
+        UNSUPPORTED = LazyTranslation(
+            "--keep-alive is not supported by this yt-dlp version; "
+            "using its default connections"
+        )
+        """Warning displayed when yt-dlp lacks the handler the pool extends."""
+
+    class Dns:
+        """
+        Messages used by the DNS resolution cache.
+
+        This group contains the summary of cache hits and misses printed with
+        the final statistics.
+        """
+
+        STATS = LazyTranslation(
+            "DNS cache: {hits} hits, {misses} misses ({ratio:.0f}% hit rate), "
+            "{negative} negative hits, {stale} stale answers"
+        )
+        """Message displayed with the hit and miss counters of the DNS cache."""
+
+    class Cache:
+        """
+        Messages used by the shared yt-dlp cache directory.
+
+        This group contains the progress and summary messages of the
+        ``warmup`` command.
+        """
+
+        WARMING = LazyTranslation("Warming the yt-dlp cache in {path} with {count} URLs")
+        """Message displayed when a cache warm-up starts."""
+
+        WARMED = LazyTranslation(
+            "Cache warm-up finished in {elapsed:.1f}s: {entries} entries "
+            "({added} new), {failed} URLs failed"
+        )
+        """Message displayed with the result of a cache warm-up."""
+
+        CLEANED = LazyTranslation("Removed {count} stale temporary files from {path}")
+        """Message displayed when abandoned temporary cache files were removed."""
+
     class Stats:
         """
         Messages and formatting used for statistics reporting.
@@ -260,6 +508,17 @@ class Messages:
         ELAPSED = LazyTranslation("Elapsed time: {elapsed:.2f}s")
         """Message showing total elapsed time for the operation."""
 
+        PROFILE_TITLE = LazyTranslation("PROFILE (stage: calls, total, mean, max, share):")
+        """Title heading for the per-stage profile table."""
+
+        PROFILE_ROW = LazyTranslation(
+            "  {stage:<12} {calls:>7} {total:>9.3f}s {mean:>9.2f}ms {max:>9.2f}ms {share:>6.1f}%"
+        )
+        """Row of the per-stage profile table."""
+
+        PROFILE_SAVED = LazyTranslation("cProfile statistics saved to {path}")
+        """Message showing where the merged cProfile statistics were written."""
+
         FOOTER = "=" * 40
         """Decorative footer line for statistics reports."""
 
@@ -280,6 +539,71 @@ class Messages:
         )
         """Message displayed when beginning a batch download operation."""
 
+        STARTING_METADATA = LazyTranslation(
+            "Extracting metadata of {count} items with {workers} workers"
+        )
+        """Message displayed when beginning a metadata-only batch operation."""
+
+        STARTING_QUEUE = LazyTranslation(
+            "Processing work queue {queue} as {worker} with {workers} workers"
+        )
+        """Message displayed when beginning to process a shared work queue."""
+
+        QUEUE_SEEDED = LazyTranslation("Added {added} new URLs to the work queue")
+        """Message displayed after the configured URLs were added to the work queue."""
+
+        SCHEDULING = LazyTranslation(
+            "Probing {count} items to schedule them by {policy}"
+        )
+        """Message displayed before the metadata probe of a scheduled batch."""
+
+        BATCHED = LazyTranslation("Grouped {count} items into {batches} batches by extractor")
+        """Message displayed after the URLs were grouped into micro-batches."""
+
+        EXPANDING = LazyTranslation(
+            "Expanding playlists of {count} URLs, at most {lookahead} videos ahead"
+        )
+        """Message displayed when playlists are expanded while downloading."""
+
+        EXPANDED = LazyTranslation("Expanded {count} URLs into {entries} videos")
+        """Message displayed when all playlists were enumerated."""
+
+        LEASE_LOST = LazyTranslation(
+            "Lease on {url} expired before completion; the result was not recorded"
+        )
+        """Message displayed when a work-queue lease was reassigned to another worker."""
+
+    class Server:
+        """
+        Messages used by the ``serve`` daemon.
+
+        This group contains the daemon's log messages and the error messages
+        returned by its JSON submission API.
+        """
+
+        LISTENING = LazyTranslation("Listening for submissions on {address}")
+        """Message displayed when the daemon is ready to accept submissions."""
+
+        STOPPING = LazyTranslation("Stopping; waiting for running downloads to finish")
+        """Message displayed when the daemon is interrupted."""
+
+        JOB_SUBMITTED = LazyTranslation("Job {job} submitted with {count} URLs")
+        """Message displayed when a job is queued."""
+
+        INVALID_SUBMISSION = LazyTranslation(
+            "Expected a JSON object with a non-empty list of URLs in 'urls'"
+        )
+        """Error returned for a malformed job submission."""
+
+        INVALID_LENGTH = LazyTranslation("Invalid Content-Length: {length}")
+        """Error returned when a submission has a malformed Content-Length."""
+
+        UNKNOWN_JOB = LazyTranslation("Unknown job")
+        """Error returned when a job id is not known."""
+
+        UNKNOWN_PATH = LazyTranslation("Unknown path: {path}")
+        """Error returned for a request to an unsupported path."""
+
     class CLI:
         """
         Messages used in the command-line interface.
@@ -295,6 +619,20 @@ class Messages:
         FILE_READ_ERROR = LazyTranslation("Error reading '{file}': {error}")
         """Message displayed when there's an error reading an input file."""
 
+        INVALID_PRIORITY = LazyTranslation(
+            "Ignoring invalid priority in line '{line}' of '{file}'"
+        )
+        """Message displayed when a links file line has a non-integer priority."""
+
+        CONFLICT = LazyTranslation("argument {option}: not allowed with argument {other}")
+        """Message displayed when two command line options cannot be combined."""
+
+        RAW_STREAM_BATCH = LazyTranslation(
+            "--stream-framing raw needs exactly one URL without --queue or --expand-playlists, "
+            "got {count} URLs; use --stream-framing framed for batches"
+        )
+        """Message displayed when raw streaming is requested for a batch."""
+
         USER_INTERRUPT = LazyTranslation("Download interrupted by user.")
         """Message displayed when the user interrupts the download process (Ctrl+C)."""
 
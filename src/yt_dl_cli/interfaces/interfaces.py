@@ -10,9 +10,12 @@ The protocols follow the Dependency Inversion Principle, allowing high-level
 modules to depend on abstractions rather than concrete implementations.
 """
 
-from typing import Protocol, Any
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Protocol
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from yt_dl_cli.core.work_queue import Lease
+
 
 class ILogger(Protocol):
     """
@@ -157,6 +160,18 @@ class IStatsCollector(Protocol):
             None
         """
 
+    def record_late_failure(self) -> None:
+        """
+        Turn a recorded success into a failure.
+
+        This method should be called when work that continues in the
+        background after an operation was recorded as successful (such as
+        post-processing or moving a file) fails.
+
+        Returns:
+            None
+        """
+
     def record_skip(self) -> None:
         """
         Record a skipped operation.
@@ -239,3 +254,155 @@ class IFileChecker(Protocol):
                 "file exists but is not accessible".
         """
         ...
+
+
+class IWorkQueue(Protocol):
+    """
+    Protocol defining the interface for shared work queues with leases.
+
+    A work queue hands URLs to workers of one or more processes. A claimed
+    URL is leased to a worker for a limited time; the worker renews the lease
+    while it is busy and records the outcome when done. URLs whose lease
+    expires (e.g. because the node died) are handed to the next worker, so no
+    URL is lost and no URL is processed by two live workers at once.
+
+    Implementations must be safe to use from several threads and, for shared
+    backends, from several processes.
+    """
+
+    def add(self, urls: Iterable[str]) -> int:
+        """
+        Add URLs that are not in the queue yet.
+
+        URLs already in the queue, including finished ones, are ignored.
+
+        Args:
+            urls (Iterable[str]): URLs to add, in processing order.
+
+        Returns:
+            int: Number of URLs that were new.
+        """
+        ...
+
+    def claim(self, worker: str, lease_time: float) -> Optional["Lease"]:
+        """
+        Claim the next available URL.
+
+        Args:
+            worker (str): Id of the claiming worker.
+            lease_time (float): Lease duration in seconds.
+
+        Returns:
+            Optional[Lease]: The lease, or None if no URL is available now.
+        """
+        ...
+
+    def heartbeat(self, lease: "Lease", lease_time: float) -> bool:
+        """
+        Extend a lease by ``lease_time`` seconds from now.
+
+        Returns:
+            bool: False if the lease is no longer held.
+        """
+        ...
+
+    def complete(self, lease: "Lease", status: str) -> bool:
+        """
+        Record the outcome (a DownloadStatus value) of a leased URL.
+
+        Returns:
+            bool: False if the lease is no longer held and nothing was recorded.
+        """
+        ...
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Return the number of URLs per state.
+
+        States are "pending", "leased" and the DownloadStatus values of
+        finished URLs.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the resources of the queue."""
+        ...
+
+
+class IStorageWriter(Protocol):
+    """
+    Protocol defining the interface for an object being written to storage.
+
+    Data written to a writer is not visible under its name until commit()
+    succeeds; commit() publishes the whole object at once, so readers never
+    observe a partially written file. abort() discards everything written.
+    """
+
+    def write(self, data: bytes) -> None:
+        """
+        Append data to the object.
+
+        Args:
+            data (bytes): Next bytes of the object.
+        """
+        ...
+
+    def commit(self) -> None:
+        """
+        Publish the object atomically under its name.
+
+        Raises:
+            OSError: If the object could not be stored; nothing is published.
+        """
+        ...
+
+    def abort(self) -> None:
+        """Discard the object and everything written so far."""
+        ...
+
+
+class IStorageBackend(Protocol):
+    """
+    Protocol defining the interface for the storage downloaded files end up in.
+
+    A storage backend stores objects under flat names (the file names of the
+    downloads) below a location chosen by the implementation, e.g. a local
+    directory or an S3 bucket and prefix. Implementations must be safe to use
+    from several download threads.
+    """
+
+    def exists(self, name: str) -> bool:
+        """
+        Check whether an object is stored under a name.
+
+        Args:
+            name (str): Object name, e.g. "Title.mp4".
+
+        Returns:
+            bool: True if a committed object exists under the name.
+        """
+        ...
+
+    def writer(self, name: str) -> IStorageWriter:
+        """
+        Start writing an object.
+
+        Args:
+            name (str): Name the object is published under on commit.
+
+        Returns:
+            IStorageWriter: Writer receiving the object's bytes.
+        """
+        ...
+
+    def location(self, name: str) -> str:
+        """
+        Return where an object is stored, e.g. a path or an s3:// URL.
+
+        Args:
+            name (str): Object name.
+
+        Returns:
+            str: Location reported in download results.
+        """
+        ...
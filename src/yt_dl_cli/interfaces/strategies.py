@@ -1,3 +1,5 @@
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+
 """
 Format strategy implementations for media download configuration.
 
@@ -13,7 +15,11 @@ configuration parsing and strategy instantiation.
 
 Classes:
     IFormatStrategy: Abstract base class defining the strategy interface
+    FormatCostModel: Configurable preferences used to rank extracted formats
+    FormatChoice: A ranked candidate (single progressive format or video+audio pair)
+    FormatRanker: Ranking engine working on the extracted formats list
     VideoFormatStrategy: Concrete strategy for video downloads with quality control
+    AdaptiveQualityStrategy: Video strategy fitting quality to a batch deadline
     AudioFormatStrategy: Concrete strategy for audio-only downloads
 
 Functions:
@@ -36,8 +42,8 @@ Example:
     >>>
     >>> audio_strategy = get_strategy(AudioConfig())
     >>> audio_opts = audio_strategy.get_opts()
-    >>> print(audio_opts)
-    {'format': 'bestaudio/best', 'extractaudio': True, 'audioformat': 'mp3'}
+    >>> print(audio_opts["format"], audio_opts["postprocessors"])
+    bestaudio/best [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3'}]
 
     >>> # High-quality video configuration
     >>> class VideoConfig:
@@ -56,7 +62,13 @@ Note:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from dataclasses import dataclass, replace
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+
+from yt_dl_cli.core.records import FormatRecord, VideoRecord
+from yt_dl_cli.utils.throughput import ThroughputMonitor
 
 
 class IFormatStrategy(ABC):
@@ -80,6 +92,311 @@ class IFormatStrategy(ABC):
             NotImplementedError: If called on the abstract base class.
         """
 
+    # pylint: disable-next=unused-argument
+    def select_format(self, record: VideoRecord) -> Optional[str]:
+        """Select explicit format ids from the extracted formats of a video.
+
+        Strategies that can rank the actual ``formats`` of an extracted video
+        override this method to return an explicit yt-dlp format selector
+        (e.g. ``"18"`` or ``"137+140"``). The default implementation returns
+        None, which keeps the static selector from get_opts().
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            Optional[str]: Format selector to use instead of the static one,
+            or None to keep get_opts()["format"].
+        """
+        return None
+
+    def plan_items(self, count: int) -> None:
+        """Set the number of items still to be started in this run.
+
+        Called by the orchestrator once the real number of items is known
+        (after playlist expansion, or from a shared work queue). Strategies
+        that plan across the batch override this method; the default
+        implementation ignores it.
+
+        Args:
+            count (int): Items whose format has not been selected yet.
+        """
+
+
+@dataclass
+class FormatCostModel:
+    """Preferences used by FormatRanker to rank extracted formats.
+
+    Candidates are compared on, in order of importance: whether they fit the
+    size budget, their quality (height for video, audio bitrate for audio),
+    whether they avoid a separate audio+video fetch and ffmpeg merge, how well
+    their codecs match the preferred codecs, and finally their bitrate.
+
+    Attributes:
+        max_height (Optional[int]): Highest acceptable video height, None for
+            no limit.
+        max_filesize (Optional[int]): Size budget in bytes. Candidates whose
+            (estimated) size exceeds it are only used if nothing fits, in
+            which case the smallest one wins.
+        prefer_progressive (bool): Prefer a single format carrying both audio
+            and video over a video+audio pair of the same quality.
+        preferred_codecs (Tuple[str, ...]): Codec prefixes in order of
+            preference (e.g. ``("avc1", "mp4a")``), matched against both the
+            video and the audio codec.
+        video_exts (Tuple[str, ...]): Allowed containers for video formats.
+        audio_exts (Tuple[str, ...]): Allowed containers for audio formats.
+    """
+
+    max_height: Optional[int] = None
+    max_filesize: Optional[int] = None
+    prefer_progressive: bool = True
+    preferred_codecs: Tuple[str, ...] = ("avc1", "mp4a")
+    video_exts: Tuple[str, ...] = ("mp4",)
+    audio_exts: Tuple[str, ...] = ("m4a", "mp4")
+
+    def codec_score(self, codec: Optional[str]) -> int:
+        """Score a codec by its position in preferred_codecs (higher is better).
+
+        Args:
+            codec (Optional[str]): Codec string such as "avc1.640028".
+
+        Returns:
+            int: ``len(preferred_codecs) - index`` of the first matching
+            prefix, or 0 if the codec is unknown or not preferred.
+        """
+        if not codec or codec == "none":
+            return 0
+        for index, prefix in enumerate(self.preferred_codecs):
+            if codec.startswith(prefix):
+                return len(self.preferred_codecs) - index
+        return 0
+
+
+class FormatChoice:
+    """A ranked download candidate.
+
+    Attributes:
+        formats (Tuple[FormatRecord, ...]): One progressive format, or a
+            video-only format followed by an audio-only format.
+        size (Optional[int]): Known or estimated total size in bytes.
+        quality (float): Height for video candidates, audio bitrate for
+            audio candidates.
+    """
+
+    __slots__ = ("formats", "size", "quality")
+
+    def __init__(
+        self, formats: Tuple[FormatRecord, ...], size: Optional[int], quality: float
+    ) -> None:
+        """Initialize the candidate.
+
+        Args:
+            formats (Tuple[FormatRecord, ...]): Formats fetched for the candidate.
+            size (Optional[int]): Known or estimated total size in bytes.
+            quality (float): Quality value used for ranking.
+        """
+        self.formats = formats
+        self.size = size
+        self.quality = quality
+
+    @property
+    def needs_merge(self) -> bool:
+        """bool: Whether the candidate needs separate fetches and a merge."""
+        return len(self.formats) > 1
+
+    @property
+    def selector(self) -> str:
+        """str: Explicit yt-dlp format selector, e.g. "18" or "137+140"."""
+        return "+".join(fmt.format_id for fmt in self.formats)
+
+    def __repr__(self) -> str:
+        """Return a short debugging representation."""
+        return f"FormatChoice({self.selector!r}, size={self.size!r})"
+
+
+class FormatRanker:
+    """Ranking engine that picks explicit format ids from extracted formats.
+
+    Instead of relying on static yt-dlp selector strings, the ranker builds
+    every sensible candidate from a video's ``formats`` list (progressive
+    formats and video+audio pairs), estimates their size, and sorts them by
+    the configured FormatCostModel. A progressive format of the same quality
+    as a video+audio pair wins when ``prefer_progressive`` is set, which
+    avoids two transfers and an ffmpeg merge.
+
+    Attributes:
+        model (FormatCostModel): Preferences used for ranking.
+
+    Example:
+        >>> ranker = FormatRanker(FormatCostModel(max_height=720))
+        >>> choice = ranker.best_video(record)
+        >>> choice.selector if choice else None
+        '22'
+    """
+
+    def __init__(self, model: Optional[FormatCostModel] = None) -> None:
+        """Initialize the ranker.
+
+        Args:
+            model (Optional[FormatCostModel]): Preferences used for ranking.
+                Defaults to FormatCostModel().
+        """
+        self.model = model or FormatCostModel()
+
+    @staticmethod
+    def estimate_size(fmt: FormatRecord, duration: Optional[float]) -> Optional[int]:
+        """Return the known size of a format or estimate it from its bitrate.
+
+        Args:
+            fmt (FormatRecord): Format to size.
+            duration (Optional[float]): Video duration in seconds.
+
+        Returns:
+            Optional[int]: Size in bytes, or None if it cannot be estimated.
+        """
+        if fmt.filesize:
+            return int(fmt.filesize)
+        bitrate = fmt.tbr or fmt.abr
+        if bitrate and duration:
+            return int(bitrate * 1000 / 8 * duration)
+        return None
+
+    def _candidate(
+        self, formats: Tuple[FormatRecord, ...], duration: Optional[float], quality: float
+    ) -> FormatChoice:
+        """Build a FormatChoice with the combined size of its formats."""
+        sizes = [self.estimate_size(fmt, duration) for fmt in formats]
+        size = sum(x for x in sizes if x is not None) if all(sizes) else None
+        return FormatChoice(formats, size, quality)
+
+    def video_candidates(self, record: VideoRecord) -> List[FormatChoice]:
+        """Build progressive and video+audio candidates within max_height.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            List[FormatChoice]: Unsorted candidates.
+        """
+        model = self.model
+        videos, audios, progressive = [], [], []
+        for fmt in record.formats:
+            if not fmt.format_id:
+                continue
+            if fmt.has_video and (
+                model.max_height is not None and (fmt.height or 0) > model.max_height
+            ):
+                continue
+            if fmt.has_video and fmt.has_audio and fmt.ext in model.video_exts:
+                progressive.append(fmt)
+            elif fmt.has_video and not fmt.has_audio and fmt.ext in model.video_exts:
+                videos.append(fmt)
+            elif fmt.has_audio and not fmt.has_video and fmt.ext in model.audio_exts:
+                audios.append(fmt)
+
+        candidates = [
+            self._candidate((fmt,), record.duration, float(fmt.height or 0))
+            for fmt in progressive
+        ]
+        best_audio = self._rank(
+            [self._candidate((fmt,), record.duration, float(fmt.abr or fmt.tbr or 0))
+             for fmt in audios]
+        )
+        if best_audio:
+            audio = best_audio[0].formats[0]
+            candidates.extend(
+                self._candidate((fmt, audio), record.duration, float(fmt.height or 0))
+                for fmt in videos
+            )
+        return candidates
+
+    def audio_candidates(self, record: VideoRecord) -> List[FormatChoice]:
+        """Build audio-only candidates.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            List[FormatChoice]: Unsorted candidates.
+        """
+        return [
+            self._candidate((fmt,), record.duration, float(fmt.abr or fmt.tbr or 0))
+            for fmt in record.formats
+            if fmt.has_audio and not fmt.has_video and fmt.format_id
+        ]
+
+    def _sort_key(self, choice: FormatChoice) -> Tuple[Any, ...]:
+        """Ranking key for a candidate (higher sorts first).
+
+        With a size budget, candidates known to fit rank above candidates of
+        unknown size, which in turn rank above candidates known to exceed it.
+        """
+        model = self.model
+        if model.max_filesize is None or (
+            choice.size is not None and choice.size <= model.max_filesize
+        ):
+            fits = 2
+        elif choice.size is None:
+            fits = 1
+        else:
+            fits = 0
+        progressive = model.prefer_progressive and not choice.needs_merge
+        codecs = sum(
+            model.codec_score(fmt.vcodec if fmt.has_video else None)
+            + model.codec_score(fmt.acodec if fmt.has_audio else None)
+            for fmt in choice.formats
+        )
+        bitrate = sum(fmt.tbr or fmt.abr or 0 for fmt in choice.formats)
+        return (fits, choice.quality, progressive, codecs, bitrate)
+
+    def _rank(self, candidates: Sequence[FormatChoice]) -> List[FormatChoice]:
+        """Sort candidates best first according to the cost model.
+
+        If a size budget is set and every candidate is known to exceed it, the
+        candidates are ordered by size instead so the smallest download is
+        chosen.
+        """
+        ranked = sorted(candidates, key=self._sort_key, reverse=True)
+        if (
+            ranked
+            and self.model.max_filesize is not None
+            and not self._sort_key(ranked[0])[0]
+        ):
+            ranked.sort(key=lambda c: c.size if c.size is not None else float("inf"))
+        return ranked
+
+    def rank_video(self, record: VideoRecord) -> List[FormatChoice]:
+        """Return video candidates ordered best first.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            List[FormatChoice]: Ranked candidates (possibly empty).
+        """
+        return self._rank(self.video_candidates(record))
+
+    def rank_audio(self, record: VideoRecord) -> List[FormatChoice]:
+        """Return audio-only candidates ordered best first.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            List[FormatChoice]: Ranked candidates (possibly empty).
+        """
+        return self._rank(self.audio_candidates(record))
+
+    def best_video(self, record: VideoRecord) -> Optional[FormatChoice]:
+        """Return the best video candidate, or None if there is none."""
+        ranked = self.rank_video(record)
+        return ranked[0] if ranked else None
+
+    def best_audio(self, record: VideoRecord) -> Optional[FormatChoice]:
+        """Return the best audio-only candidate, or None if there is none."""
+        ranked = self.rank_audio(record)
+        return ranked[0] if ranked else None
+
 
 class VideoFormatStrategy(IFormatStrategy):
     """Strategy for downloading video content with configurable quality settings.
@@ -94,20 +411,28 @@ class VideoFormatStrategy(IFormatStrategy):
             - "best": Downloads highest quality video+audio
             - "worst": Downloads lowest quality video
             - Numeric string (e.g., "720"): Downloads best video up to specified height
+        ranker (Optional[FormatRanker]): Ranking engine used by select_format().
+            When None, only the static selector from get_opts() is used.
     """
 
-    def __init__(self, quality: str):
+    def __init__(self, quality: str, ranker: Optional[FormatRanker] = None):
         """Initialize the video format strategy with a quality setting.
 
         Args:
             quality (str): The desired video quality. Accepts "best", "worst",
                 or a numeric string representing maximum height in pixels.
+            ranker (Optional[FormatRanker]): Ranking engine for explicit
+                format selection. Its cost model's max_height is derived from
+                ``quality``. Defaults to None (static selectors only).
 
         Example:
             >>> strategy = VideoFormatStrategy("720")
-            >>> strategy = VideoFormatStrategy("best")
+            >>> strategy = VideoFormatStrategy("best", FormatRanker())
         """
         self.quality = quality
+        if ranker is not None and quality.isdigit():
+            ranker = FormatRanker(replace(ranker.model, max_height=int(quality)))
+        self.ranker = ranker
 
     def get_opts(self) -> Dict[str, Any]:
         """Generate video download options based on the quality setting.
@@ -136,6 +461,144 @@ class VideoFormatStrategy(IFormatStrategy):
             fmt = f"best[height<={self.quality}][ext=mp4]"
         return {"format": fmt, "merge_output_format": "mp4"}
 
+    def select_format(self, record: VideoRecord) -> Optional[str]:
+        """Pick explicit format ids by ranking the extracted formats.
+
+        The best FormatChoice is returned with the static selector as a
+        fallback (``"137+140/<static>"``), so yt-dlp still succeeds if the
+        formats differ when the download re-extracts the video. The "worst"
+        quality keeps its static selector.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            Optional[str]: Explicit selector, or None when no ranker is set,
+            quality is "worst" or no candidate was found.
+        """
+        if self.ranker is None or self.quality == "worst":
+            return None
+        choice = self.ranker.best_video(record)
+        if choice is None:
+            return None
+        return f"{choice.selector}/{self.get_opts()['format']}"
+
+
+class AdaptiveQualityStrategy(VideoFormatStrategy):
+    """Video strategy that picks the highest quality meeting a batch deadline.
+
+    Instead of a fixed quality for the whole run, each video gets a size
+    budget derived from the measured aggregate throughput of the running
+    batch and the number of videos still to be started::
+
+        budget = (rate * time_left - outstanding_bytes) / remaining_items
+
+    where ``outstanding_bytes`` is what the in-flight downloads still have to
+    transfer. The ranker then picks the highest quality whose (estimated)
+    size fits the budget, or the smallest candidate if none does. Until a
+    throughput has been measured the budget is unlimited, and ``quality``
+    always acts as an upper bound on the height.
+
+    Items that are skipped or fail before format selection still count as
+    remaining, which makes the plan err on the side of lower quality. The
+    initial item count is corrected through plan_items once the orchestrator
+    knows the real one (e.g. after playlist expansion).
+
+    Attributes:
+        quality (str): Upper quality bound (see VideoFormatStrategy).
+        ranker (FormatRanker): Ranking engine used for every selection.
+        monitor (ThroughputMonitor): Aggregate throughput of the batch.
+        deadline (float): Target completion time in seconds from creation.
+        remaining (int): Items that have not had their format selected yet.
+    """
+
+    def __init__(
+        self,
+        quality: str,
+        monitor: ThroughputMonitor,
+        deadline: float,
+        total_items: int,
+        ranker: Optional[FormatRanker] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the adaptive strategy and start the deadline clock.
+
+        Args:
+            quality (str): Upper quality bound: "best" or a numeric height.
+            monitor (ThroughputMonitor): Monitor fed by the download progress
+                hooks of all workers.
+            deadline (float): Target completion time of the batch in seconds.
+            total_items (int): Number of items in the batch, as far as it is
+                known up front; see plan_items.
+            ranker (Optional[FormatRanker]): Ranking engine whose cost model
+                supplies codec/progressive preferences and an optional static
+                size cap. Defaults to FormatRanker().
+            clock (Callable[[], float]): Monotonic clock, injectable for
+                testing. Defaults to time.monotonic.
+        """
+        super().__init__(quality, ranker or FormatRanker())
+        self.monitor = monitor
+        self.deadline = deadline
+        self.remaining = max(total_items, 0)
+        self._clock = clock
+        self._deadline_at = clock() + deadline
+        self._lock = threading.Lock()
+
+    def plan_items(self, count: int) -> None:
+        """Replace the number of remaining items by the real one.
+
+        Args:
+            count (int): Items whose format has not been selected yet.
+        """
+        with self._lock:
+            self.remaining = max(count, 0)
+
+    def item_budget(self, remaining: int) -> Optional[int]:
+        """Compute the size budget for the next item.
+
+        Args:
+            remaining (int): Items left to start, including the next one.
+
+        Returns:
+            Optional[int]: Budget in bytes (0 once the deadline has passed),
+            or None while no throughput has been measured.
+        """
+        rate = self.monitor.rate()
+        if rate is None:
+            return None
+        time_left = self._deadline_at - self._clock()
+        if time_left <= 0:
+            return 0
+        capacity = rate * time_left - self.monitor.outstanding_bytes()
+        return max(int(capacity / max(remaining, 1)), 0)
+
+    def select_format(self, record: VideoRecord) -> Optional[str]:
+        """Pick the highest quality that fits the current per-item budget.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            Optional[str]: Explicit selector with the static one as fallback,
+            or None when quality is "worst" or no candidate was found.
+        """
+        with self._lock:
+            remaining = self.remaining
+            self.remaining = max(remaining - 1, 0)
+        if self.ranker is None or self.quality == "worst":
+            return None
+
+        model = self.ranker.model
+        budget = self.item_budget(remaining)
+        if budget is not None and model.max_filesize is not None:
+            budget = min(budget, model.max_filesize)
+        if budget is not None:
+            model = replace(model, max_filesize=budget)
+        choice = FormatRanker(model).best_video(record)
+        if choice is None:
+            return None
+        return f"{choice.selector}/{self.get_opts()['format']}"
+
 
 class AudioFormatStrategy(IFormatStrategy):
     """Strategy for downloading audio-only content in MP3 format.
@@ -143,8 +606,21 @@ class AudioFormatStrategy(IFormatStrategy):
     This strategy extracts and converts audio streams to MP3 format,
     providing a consistent audio-only download experience regardless
     of the source video format.
+
+    Attributes:
+        ranker (Optional[FormatRanker]): Ranking engine used by select_format().
+            When None, only the static selector from get_opts() is used.
     """
 
+    def __init__(self, ranker: Optional[FormatRanker] = None):
+        """Initialize the audio format strategy.
+
+        Args:
+            ranker (Optional[FormatRanker]): Ranking engine for explicit
+                format selection. Defaults to None (static selectors only).
+        """
+        self.ranker = ranker
+
     def get_opts(self) -> Dict[str, Any]:
         """Generate audio-only download options.
 
@@ -154,19 +630,41 @@ class AudioFormatStrategy(IFormatStrategy):
         Returns:
             Dict[str, Any]: Download options dictionary containing:
                 - "format": Audio format selector for best quality audio
-                - "extractaudio": Boolean flag to enable audio extraction
-                - "audioformat": Target audio format (MP3)
+                - "postprocessors": yt-dlp's FFmpegExtractAudio post-processor
+                  converting the audio to MP3
 
         Example:
             >>> strategy = AudioFormatStrategy()
             >>> opts = strategy.get_opts()
-            >>> print(opts)
-            {'format': 'bestaudio/best', 'extractaudio': True, 'audioformat': 'mp3'}
+            >>> print(opts["postprocessors"])
+            [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3'}]
+        """
+        return {
+            "format": "bestaudio/best",
+            "postprocessors": [{"key": "FFmpegExtractAudio", "preferredcodec": "mp3"}],
+        }
+
+    def select_format(self, record: VideoRecord) -> Optional[str]:
+        """Pick an explicit audio-only format id by ranking extracted formats.
+
+        Args:
+            record (VideoRecord): Compact record of the extracted video.
+
+        Returns:
+            Optional[str]: Explicit selector with the static one as fallback,
+            or None when no ranker is set or no audio-only format exists.
         """
-        return {"format": "bestaudio/best", "extractaudio": True, "audioformat": "mp3"}
+        if self.ranker is None:
+            return None
+        choice = self.ranker.best_audio(record)
+        if choice is None:
+            return None
+        return f"{choice.selector}/{self.get_opts()['format']}"
 
 
-def get_strategy(config) -> IFormatStrategy:
+def get_strategy(
+    config, monitor: Optional[ThroughputMonitor] = None
+) -> IFormatStrategy:
     """Factory function to create appropriate format strategy based on configuration.
 
     This function implements the Factory pattern to instantiate the correct
@@ -177,10 +675,21 @@ def get_strategy(config) -> IFormatStrategy:
         config: Configuration object that must have at least the following attributes:
             - audio_only (bool): Flag indicating if only audio should be downloaded
             - quality (str): Video quality setting (used only when audio_only is False)
+            Optional attributes enabling format ranking (see Config):
+            - rank_formats (bool): Rank extracted formats (default False if absent)
+            - max_filesize (Optional[int]): Size budget in bytes
+            - prefer_progressive (bool): Prefer progressive over merged formats
+            - preferred_codecs (List[str]): Codec prefixes in order of preference
+            - deadline (Optional[float]): Batch deadline in seconds enabling
+              AdaptiveQualityStrategy for video downloads
+        monitor (Optional[ThroughputMonitor]): Monitor fed by the download
+            progress hooks; required for the adaptive strategy to measure
+            throughput. Defaults to None (a fresh, unfed monitor).
 
     Returns:
-        IFormatStrategy: An instance of either AudioFormatStrategy or
-        VideoFormatStrategy based on the configuration.
+        IFormatStrategy: An instance of AudioFormatStrategy,
+        AdaptiveQualityStrategy or VideoFormatStrategy based on the
+        configuration.
 
     Example:
         >>> class Config:
@@ -198,8 +707,25 @@ def get_strategy(config) -> IFormatStrategy:
         >>> isinstance(strategy, VideoFormatStrategy)
         True
     """
+    ranker = None
+    deadline = getattr(config, "deadline", None)
+    if getattr(config, "rank_formats", False) or deadline:
+        model = FormatCostModel(
+            max_filesize=config.max_filesize,
+            prefer_progressive=config.prefer_progressive,
+            preferred_codecs=tuple(config.preferred_codecs),
+        )
+        ranker = FormatRanker(model)
+    if deadline and not config.audio_only:
+        return AdaptiveQualityStrategy(
+            config.quality,
+            monitor or ThroughputMonitor(),
+            deadline,
+            len(config.urls),
+            ranker,
+        )
     return (
-        AudioFormatStrategy()
+        AudioFormatStrategy(ranker)
         if config.audio_only
-        else VideoFormatStrategy(config.quality)
+        else VideoFormatStrategy(config.quality, ranker)
     )
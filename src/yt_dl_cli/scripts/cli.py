@@ -18,8 +18,18 @@ Example:
     Or when installed as a package:
 
     $ yt-dl-cli
+
+    The long-running download daemon is started with the ``serve`` command:
+
+    $ yt-dl-cli serve --port 8765
+
+    A shared yt-dlp cache directory is filled with the ``warmup`` command:
+
+    $ yt-dl-cli warmup --cache-dir /shared/yt-dlp-cache
 """
 
+import sys
+
 from yt_dl_cli.main import VideoDownloader  # type: ignore[import-untyped]
 
 
@@ -37,6 +47,10 @@ def main():
     operations to the VideoDownloader class.
 
     Workflow:
+        0. If the first argument is ``serve``, runs the download daemon
+           (core.server.serve) instead of a one-shot batch; if it is
+           ``warmup``, fills a shared cache directory
+           (core.cache_dir.warmup_command) and exits with its status
         1. Creates a new VideoDownloader instance
         2. Calls the download method to start the download process
         3. The VideoDownloader handles all user interaction, configuration,
@@ -67,5 +81,16 @@ def main():
         config.config: Configuration management for the application
         core.orchestration: Main orchestration logic for download workflows
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        # pylint: disable-next=import-outside-toplevel
+        from yt_dl_cli.core.server import serve
+
+        serve(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "warmup":
+        # pylint: disable-next=import-outside-toplevel
+        from yt_dl_cli.core.cache_dir import warmup_command
+
+        sys.exit(warmup_command(sys.argv[2:]))
     downloader = VideoDownloader()
     downloader.download()
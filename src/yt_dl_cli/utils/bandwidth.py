@@ -0,0 +1,191 @@
+"""
+Process-wide bandwidth limiting.
+
+yt-dlp's ``ratelimit`` option throttles a single YoutubeDL instance, so with
+several concurrent workers the allowance would have to be split up front and
+the share of idle workers would be wasted. This module provides a token
+bucket shared by every worker thread instead: each transfer pays for the
+bytes it has received from the same bucket, so whatever downloads are active
+together use the full allowance, and the rate can be changed while the batch
+is running.
+
+Classes:
+    TokenBucket: Thread-safe token bucket with a debt model and runtime rate changes
+    BandwidthLimiter: yt-dlp progress hook that throttles transfers through a TokenBucket
+
+Example:
+    >>> limiter = BandwidthLimiter(5 * 1024 * 1024)  # 5 MiB/s for all workers
+    >>> opts = {"progress_hooks": [limiter.progress_hook]}
+    >>> # ... later, from any thread:
+    >>> limiter.set_rate(None)  # lift the cap
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket measured in bytes.
+
+    Consumers pay for bytes after they have been transferred. A payment may
+    drive the balance negative; the paying thread then waits until the debt
+    has been refilled at the configured rate. Because all threads share one
+    balance, the aggregate rate of all consumers converges on the configured
+    rate regardless of how many are active.
+
+    Waiting threads re-check the balance whenever the rate changes, so a new
+    rate (or lifting the cap) takes effect immediately.
+
+    Attributes:
+        burst (float): Bucket capacity in seconds of traffic at the current rate.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (Optional[float]): Refill rate in bytes per second, or None
+                for no limit. Defaults to None.
+            burst (float): Capacity in seconds of traffic. Defaults to 1.0.
+            clock (Callable[[], float]): Monotonic clock, injectable for
+                testing. Defaults to time.monotonic.
+        """
+        self.burst = burst
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._rate = rate
+        self._tokens = self._capacity()
+        self._updated = clock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Optional[float]: Current refill rate in bytes per second."""
+        return self._rate
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """
+        Change the rate at runtime and wake up waiting consumers.
+
+        Args:
+            rate (Optional[float]): New rate in bytes per second, or None to
+                remove the limit.
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive or None")
+        with self._cond:
+            self._refill()
+            self._rate = rate
+            self._tokens = min(self._tokens, self._capacity())
+            self._cond.notify_all()
+
+    def consume(self, count: int) -> float:
+        """
+        Pay for ``count`` transferred bytes, blocking while the bucket is in debt.
+
+        Args:
+            count (int): Number of bytes just transferred.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        if count <= 0 or self._rate is None:
+            return 0.0
+        start = self._clock()
+        with self._cond:
+            self._refill()
+            self._tokens -= count
+            while self._rate is not None:
+                self._refill()
+                if self._tokens >= 0:
+                    break
+                self._cond.wait(-self._tokens / self._rate)
+            if self._rate is None:
+                self._tokens = self._capacity()
+        return self._clock() - start
+
+    def _capacity(self) -> float:
+        """Return the bucket capacity in bytes for the current rate."""
+        return self._rate * self.burst if self._rate is not None else 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update; the caller holds the lock."""
+        now = self._clock()
+        if self._rate is not None:
+            self._tokens = min(
+                self._tokens + (now - self._updated) * self._rate, self._capacity()
+            )
+        self._updated = now
+
+
+class BandwidthLimiter:
+    """
+    yt-dlp progress hook that throttles every transfer through one TokenBucket.
+
+    yt-dlp calls progress hooks synchronously from the downloading thread
+    after every received block, with the cumulative ``downloaded_bytes`` of
+    the file. The limiter turns that into a per-block delta and pays for it
+    from the shared bucket; blocking in the hook delays the next read, which
+    throttles the transfer. Adding the same limiter to all downloads gives a
+    single process-wide cap.
+
+    Attributes:
+        bucket (TokenBucket): Shared bucket all transfers draw from.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: float = 1.0) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            rate (Optional[float]): Cap in bytes per second, or None for no
+                limit (the cap can still be set later). Defaults to None.
+            burst (float): Bucket capacity in seconds of traffic. Defaults to 1.0.
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self._lock = threading.Lock()
+        self._downloaded: Dict[str, int] = {}
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Optional[float]: Current cap in bytes per second."""
+        return self.bucket.rate
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """
+        Change the process-wide cap while downloads are running.
+
+        Args:
+            rate (Optional[float]): New cap in bytes per second, or None to
+                remove the limit.
+        """
+        self.bucket.set_rate(rate)
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        Pay for the bytes received since the last report of the same file.
+
+        Args:
+            status (Dict[str, Any]): Progress dictionary passed by yt-dlp.
+        """
+        key = status.get("filename") or status.get("tmpfilename")
+        if not key:
+            return
+        downloaded = status.get("downloaded_bytes") or 0
+        with self._lock:
+            previous = self._downloaded.get(key, 0)
+            if status.get("status") == "downloading":
+                self._downloaded[key] = max(downloaded, previous)
+            else:
+                self._downloaded.pop(key, None)
+        self.bucket.consume(downloaded - previous)
@@ -0,0 +1,229 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Disk-space-aware admission control for downloads.
+
+When the save directory fills up, every download in flight fails late, after
+it has used all of its bandwidth. DiskSpaceAdmission prevents this by
+admitting a download only if its expected size fits into the free space of
+the target file system, minus a safety margin and minus what has already
+been reserved by the downloads in flight.
+
+A reservation shrinks while its download progresses (the progress hook
+reports the bytes already written, which the file system already counts as
+used) and is released when the download ends, successfully or not. Merged
+downloads reserve twice their size, because the separate video and audio
+files and the merged output exist side by side until the merge finishes.
+
+Downloads that do not fit are either held until running downloads release
+their reservations, or skipped right away. A held download whose size does
+not fit even when nothing else is reserved is skipped, since waiting could
+not help.
+
+Classes:
+    InsufficientDiskSpace: Error reported for a download that does not fit
+    Reservation: Space reserved for one download
+    DiskSpaceAdmission: Shared admission controller with a yt-dlp progress hook
+
+Functions:
+    expected_download_size: Expected size of a format selection
+
+Example:
+    >>> admission = DiskSpaceAdmission(Path("downloads"), margin=512 * 1024**2)
+    >>> reservation = admission.reserve(200 * 1024**2)
+    >>> if reservation is not None:
+    ...     try:
+    ...         download()
+    ...     finally:
+    ...         admission.release(reservation)
+"""
+
+from pathlib import Path
+import shutil
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from yt_dl_cli.core.records import VideoRecord
+from yt_dl_cli.interfaces.strategies import FormatRanker
+
+HOLD = "hold"
+"""Wait for running downloads to release space."""
+
+SKIP = "skip"
+"""Skip downloads that do not fit right away."""
+
+FULL_POLICIES = (HOLD, SKIP)
+"""All policies for downloads that do not fit."""
+
+
+class InsufficientDiskSpace(OSError):
+    """Raised (and reported in results) for a download that does not fit."""
+
+
+def expected_download_size(record: VideoRecord, selector: Optional[str]) -> Optional[int]:
+    """
+    Estimate the size of the files a format selection will download.
+
+    The first alternative of an explicit selector (e.g. ``"137+140"`` of
+    ``"137+140/best[ext=mp4]"``) is sized from the extracted formats. Without
+    an explicit selection, or when a format is unknown, the size of yt-dlp's
+    default selection is used.
+
+    Args:
+        record (VideoRecord): Extracted metadata.
+        selector (Optional[str]): Format selector chosen by the strategy.
+
+    Returns:
+        Optional[int]: Expected size in bytes, or None if it is unknown.
+    """
+    if selector:
+        formats = {fmt.format_id: fmt for fmt in record.formats}
+        total = 0
+        for format_id in selector.split("/", 1)[0].split("+"):
+            fmt = formats.get(format_id)
+            size = FormatRanker.estimate_size(fmt, record.duration) if fmt else None
+            if size is None:
+                break
+            total += size
+        else:
+            return total
+    return record.filesize
+
+
+class Reservation:
+    """
+    Space reserved for one download.
+
+    Attributes:
+        size (int): Reserved bytes (twice the expected size for merges).
+        written (Dict[str, int]): Bytes written so far per file.
+    """
+
+    __slots__ = ("size", "written")
+
+    def __init__(self, size: int) -> None:
+        """Create a reservation of ``size`` bytes."""
+        self.size = size
+        self.written: Dict[str, int] = {}
+
+    @property
+    def outstanding(self) -> int:
+        """int: Reserved bytes not yet written to disk."""
+        return max(self.size - sum(self.written.values()), 0)
+
+
+class DiskSpaceAdmission:
+    """
+    Admission controller reserving expected download sizes against free space.
+
+    One instance is shared by all worker threads. ``reserve`` is called before
+    a download starts, ``release`` when it ends; ``progress_hook`` must be
+    registered with yt-dlp so reservations shrink as data is written.
+
+    Attributes:
+        path (Path): Directory on the target file system.
+        margin (int): Bytes that are always kept free.
+        policy (str): HOLD or SKIP for downloads that do not fit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        margin: int = 0,
+        policy: str = HOLD,
+        free_space: Optional[Callable[[Path], int]] = None,
+        recheck_interval: float = 5.0,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            path (Path): Save directory; its file system is checked.
+            margin (int): Safety margin in bytes. Defaults to 0.
+            policy (str): HOLD or SKIP. Defaults to HOLD.
+            free_space (Optional[Callable[[Path], int]]): Returns the free
+                bytes of a path; injectable for testing. Defaults to
+                shutil.disk_usage.
+            recheck_interval (float): Seconds after which held downloads
+                re-check the free space even if no reservation was released
+                (space may be freed by other processes). Defaults to 5.0.
+        """
+        self.path = path
+        self.margin = margin
+        self.policy = policy
+        self.recheck_interval = recheck_interval
+        self._free_space = free_space or (lambda p: shutil.disk_usage(p).free)
+        self._cond = threading.Condition()
+        self._active: Dict[int, Reservation] = {}
+        self._local = threading.local()
+
+    def available(self) -> int:
+        """
+        Return the bytes that can still be reserved.
+
+        Returns:
+            int: Free space minus the margin and the outstanding bytes of all
+            reservations (may be negative).
+        """
+        with self._cond:
+            return self._available_locked()
+
+    def reserve(self, size: Optional[int], merge: bool = False) -> Optional[Reservation]:
+        """
+        Reserve space for a download, waiting under the HOLD policy.
+
+        Downloads of unknown size are admitted with an empty reservation; the
+        margin is the only protection they get.
+
+        Args:
+            size (Optional[int]): Expected size in bytes, or None if unknown.
+            merge (bool): Whether the download is merged from several files.
+
+        Returns:
+            Optional[Reservation]: The reservation (also bound to the calling
+            thread for the progress hook), or None if the download does not
+            fit and is skipped.
+        """
+        needed = (size or 0) * (2 if merge else 1)
+        reservation = Reservation(needed)
+        with self._cond:
+            while needed > self._available_locked():
+                if self.policy != HOLD or not self._active:
+                    return None
+                self._cond.wait(self.recheck_interval)
+            self._active[id(reservation)] = reservation
+        self._local.reservation = reservation
+        return reservation
+
+    def _available_locked(self) -> int:
+        """Return available() while holding the condition's lock."""
+        outstanding = sum(r.outstanding for r in self._active.values())
+        return self._free_space(self.path) - self.margin - outstanding
+
+    def release(self, reservation: Reservation) -> None:
+        """
+        Release a reservation and wake up held downloads.
+
+        Args:
+            reservation (Reservation): Reservation returned by reserve().
+        """
+        with self._cond:
+            self._active.pop(id(reservation), None)
+            self._cond.notify_all()
+        if getattr(self._local, "reservation", None) is reservation:
+            self._local.reservation = None
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp progress hook recording the bytes written by the calling thread.
+
+        Args:
+            status (Dict[str, Any]): Progress dictionary passed by yt-dlp.
+        """
+        reservation = getattr(self._local, "reservation", None)
+        if reservation is None:
+            return
+        key = status.get("filename") or status.get("tmpfilename") or ""
+        written = status.get("downloaded_bytes") or 0
+        with self._cond:
+            reservation.written[key] = int(written)
@@ -0,0 +1,122 @@
+"""
+JSON Lines metadata output module.
+
+This module provides the MetadataWriter class used by the metadata-only mode
+of the application. Instead of collecting all extracted records in memory and
+dumping them at the end, every record is serialized as one compact JSON object
+per line and flushed immediately, so memory usage stays bounded regardless of
+how many URLs are processed and downstream consumers can read results as they
+arrive.
+
+Classes:
+    MetadataWriter: Streaming JSON Lines writer for metadata records
+
+Example:
+    >>> from pathlib import Path
+    >>> with MetadataWriter(Path("metadata.jsonl")) as writer:
+    ...     writer.write({"url": "https://example.com/v", "title": "Video"})
+    >>> writer.count
+    1
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import IO, Any, Dict, Optional
+
+
+class MetadataWriter:
+    """
+    Streaming writer that emits one compact JSON record per line.
+
+    The writer targets either a file or standard output. Records are written
+    and flushed one at a time, which keeps memory usage constant and makes the
+    output consumable by pipelines (e.g. ``jq``) while the batch is running.
+
+    The writer is not thread-safe by itself; it is intended to be used from
+    the single thread that collects results (the asyncio event loop thread
+    in AsyncOrchestrator).
+
+    Attributes:
+        target (Optional[Path]): Output file path, or None for stdout.
+        count (int): Number of records written so far.
+    """
+
+    def __init__(self, target: Optional[Path] = None) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            target (Optional[Path]): File to write records to. Parent
+                directories are created when the writer is opened. If None,
+                records are written to sys.stdout. Defaults to None.
+        """
+        self.target = target
+        self.count = 0
+        self._stream: Optional[IO[str]] = None
+
+    def __enter__(self) -> "MetadataWriter":
+        """
+        Open the output stream.
+
+        Returns:
+            MetadataWriter: Self reference for use in with statements.
+        """
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Close the output stream.
+
+        Args:
+            exc_type: Exception type if an exception occurred
+            exc_val: Exception value if an exception occurred
+            exc_tb: Exception traceback if an exception occurred
+        """
+        self.close()
+
+    def open(self) -> None:
+        """
+        Open the target file (or bind to stdout) if not already open.
+
+        Raises:
+            OSError: If the target file cannot be created.
+        """
+        if self._stream is not None:
+            return
+        if self.target is None:
+            self._stream = sys.stdout
+        else:
+            self.target.parent.mkdir(parents=True, exist_ok=True)
+            self._stream = open(  # pylint: disable=consider-using-with
+                self.target, "w", encoding="utf-8"
+            )
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Serialize a record as a single JSON line and flush it.
+
+        Args:
+            record (Dict[str, Any]): JSON-serializable metadata record.
+        """
+        if self._stream is None:
+            self.open()
+        assert self._stream is not None
+        self._stream.write(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        )
+        self._stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        Close the target file. Standard output is flushed but left open.
+        """
+        if self._stream is None:
+            return
+        if self._stream is sys.stdout:
+            self._stream.flush()
+        else:
+            self._stream.close()
+        self._stream = None
@@ -0,0 +1,252 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Moving finished downloads from a staging directory into the library.
+
+With a staging directory, yt-dlp writes its fragments, ``.part`` files and
+ffmpeg merges on fast local storage, and only the final file is moved into
+the (possibly slow, network mounted) save directory. The move is a rename
+when both directories are on the same file system; otherwise the file is
+copied with a zero-copy transfer in the kernel (``copy_file_range``, or
+``sendfile`` where that is unavailable) into a temporary name and renamed,
+so the library never contains a partial file.
+
+Moves run on a background thread in batches: the mover takes every queued
+file (up to ``batch_size``), moves them one after the other and syncs each
+destination directory once per batch instead of once per file, so download
+workers never wait for the network file system.
+
+Classes:
+    BackgroundMover: Batched mover thread
+
+Functions:
+    move_file: Move a file atomically, across file systems if needed
+
+Example:
+    >>> mover = BackgroundMover(logger)
+    >>> mover.submit(Path("/nvme/stage/Title.mp4"), Path("/nfs/library"))
+    PosixPath('/nfs/library/Title.mp4')
+    >>> mover.close()  # wait for all moves
+"""
+
+import errno
+import os
+from pathlib import Path
+import queue
+import shutil
+import threading
+from typing import List, Optional, Tuple
+
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger, IStatsCollector
+
+CHUNK_SIZE = 64 * 1024 * 1024
+"""Bytes transferred per zero-copy system call."""
+
+
+def _copy_range(src: int, dst: int, size: int) -> None:
+    """Copy ``size`` bytes between file descriptors inside the kernel."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    copied = 0
+    while copied < size:
+        count = min(CHUNK_SIZE, size - copied)
+        if copy_file_range is not None:
+            try:
+                sent = copy_file_range(src, dst, count)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+                copy_file_range = None
+                continue
+        else:
+            sent = os.sendfile(dst, src, None, count)
+        if sent == 0:
+            raise OSError(errno.EIO, "source file shrank while it was copied")
+        copied += sent
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file's data with a zero-copy transfer and its timestamps."""
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        try:
+            _copy_range(source.fileno(), target.fileno(), os.fstat(source.fileno()).st_size)
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+            source.seek(0)
+            target.seek(0)
+            target.truncate()
+            shutil.copyfileobj(source, target, CHUNK_SIZE)
+        target.flush()
+        os.fsync(target.fileno())
+    shutil.copystat(src, dst)
+
+
+def move_file(src: Path, dst: Path) -> None:
+    """
+    Move a file, replacing the destination atomically.
+
+    A rename is used if possible. Across file systems the data is copied
+    into a hidden temporary file next to the destination, which is then
+    renamed over it, and the source is deleted.
+
+    Args:
+        src (Path): File to move.
+        dst (Path): Destination path.
+
+    Raises:
+        OSError: If the file cannot be moved; the source is kept.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    temp = dst.with_name(f".{dst.name}.moving")
+    try:
+        _copy_file(src, temp)
+        os.replace(temp, dst)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    src.unlink()
+
+
+def _sync_dir(path: Path) -> None:
+    """Persist the entries of a directory (best effort)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class BackgroundMover:
+    """
+    Thread moving staged files into their destination directories in batches.
+
+    The download of a file that cannot be moved, already counted as
+    successful, is turned into a failure in the statistics.
+
+    Attributes:
+        batch_size (int): Files moved before the destinations are synced.
+        moved (int): Files moved successfully.
+        failed (int): Files that could not be moved (they stay staged).
+        batches (int): Batches processed.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[ILogger] = None,
+        batch_size: int = 32,
+        stats: Optional[IStatsCollector] = None,
+    ) -> None:
+        """
+        Initialize the mover; its thread starts with the first file.
+
+        Args:
+            logger (Optional[ILogger]): Receives a message per failed move.
+                Defaults to None.
+            batch_size (int): Files moved per batch. Defaults to 32.
+            stats (Optional[IStatsCollector]): Statistics whose success of a
+                download is turned into a failure when its file cannot be
+                moved. Defaults to None.
+        """
+        self.logger = logger
+        self.batch_size = batch_size
+        self.stats = stats
+        self.moved = 0
+        self.failed = 0
+        self.batches = 0
+        self._queue: "queue.Queue[Optional[Tuple[Path, Path]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """int: Files queued or being moved."""
+        return self._queue.unfinished_tasks
+
+    def submit(self, path: Path, directory: Path) -> Path:
+        """
+        Queue a file to be moved into a directory.
+
+        Args:
+            path (Path): Staged file.
+            directory (Path): Destination directory.
+
+        Returns:
+            Path: Where the file will be, once moved.
+        """
+        destination = Path(directory) / Path(path).name
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="staging-mover", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((Path(path), destination))
+        return destination
+
+    def _run(self) -> None:
+        """Move batches until close() queues the stop marker."""
+        while True:
+            batch: List[Optional[Tuple[Path, Path]]] = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            moves = [item for item in batch if item is not None]
+            self._move_batch(moves)
+            for _ in batch:
+                self._queue.task_done()
+            if len(moves) < len(batch):
+                return
+
+    def _move_batch(self, moves: List[Tuple[Path, Path]]) -> None:
+        """Move the files of a batch and sync their destination directories once."""
+        directories = set()
+        for src, dst in moves:
+            try:
+                move_file(src, dst)
+            except OSError as e:
+                self.failed += 1
+                if self.stats is not None:
+                    self.stats.record_late_failure()
+                if self.logger is not None:
+                    self.logger.error(Messages.Mover.FAILED(path=src, error=e))
+                continue
+            self.moved += 1
+            directories.add(dst.parent)
+        for directory in directories:
+            _sync_dir(directory)
+        if moves:
+            self.batches += 1
+
+    def report(self, logger: ILogger) -> None:
+        """
+        Log the number of moved files and failed moves.
+
+        Args:
+            logger (ILogger): Logger receiving the summary.
+        """
+        logger.info(Messages.Mover.STATS(moved=self.moved, failed=self.failed))
+
+    def join(self) -> None:
+        """Wait until all queued files have been moved."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Move the remaining files and stop the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
@@ -1,3 +1,5 @@
+# pylint: disable=too-many-lines
+
 """
 Command line interface argument parsing module for the YouTube downloader CLI.
 
@@ -34,14 +36,63 @@ Dependencies:
 import argparse
 from pathlib import Path
 import sys
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from yt_dl_cli.config.config import Config
+from yt_dl_cli.config.config import DEFAULT_CODECS, Config, ServerConfig
+from yt_dl_cli.core.scheduling import FIFO, POLICIES, parse_link_line
+from yt_dl_cli.utils.disk_space import FULL_POLICIES, HOLD
+from yt_dl_cli.utils.stream_sink import AUTO, FRAMINGS, RAW
 from yt_dl_cli.i18n.messages import Messages
 from yt_dl_cli.utils.validators import ArgValidator
 
+CONFLICTS: Tuple[Tuple[str, str], ...] = (
+    ("queue", "metadata_only"),
+    ("stream", "metadata_only"),
+    ("storage", "stream"),
+    ("storage", "postprocess_workers"),
+    ("staging_dir", "stream"),
+    ("staging_dir", "postprocess_workers"),
+)
+"""Pairs of options (by destination) that cannot be used together."""
+
 
-def parse_arguments() -> Config:
+def check_conflicts(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, urls: List[str]
+) -> None:
+    """
+    Reject combinations of options that cannot be used together.
+
+    Config raises ValueError for these combinations too, which is what API
+    callers see; checking them here reports the command line flags in the
+    usual argparse format instead of a traceback naming Config fields.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser that reports the error.
+        args (argparse.Namespace): Parsed arguments.
+        urls (List[str]): URLs of the batch.
+
+    Raises:
+        SystemExit: Via parser.error() if two conflicting options are given,
+            or raw streaming is requested for a batch.
+    """
+
+    def given(dest: str) -> bool:
+        value = getattr(args, dest)
+        return value is not None and value is not False
+
+    for dest, other in CONFLICTS:
+        if given(dest) and given(other):
+            parser.error(
+                Messages.CLI.CONFLICT(
+                    option="--" + other.replace("_", "-"), other="--" + dest.replace("_", "-")
+                )
+            )
+    single = len(urls) == 1 and not args.queue and not args.expand_playlists
+    if args.stream is not None and args.stream_framing == RAW and not single:
+        parser.error(Messages.CLI.RAW_STREAM_BATCH(count=len(urls)))
+
+
+def parse_arguments() -> Config:  # pylint: disable=too-many-statements
     """
     Parse command line arguments and create application configuration.
 
@@ -80,7 +131,7 @@ def parse_arguments() -> Config:
                             consume more system resources. Default: 2
 
         -q, --quality (str): Preferred video quality for downloads.
-                            Options: "best", "worst", "720", "480", "360"
+                            Options: "best", "worst", "1080", "720", "480", "360"
                             Default: "best"
 
         -a, --audio-only (flag): When present, downloads only the audio
@@ -91,6 +142,164 @@ def parse_arguments() -> Config:
                            this option overrides the --file option completely.
                            Multiple URLs can be specified separated by spaces.
 
+        --metadata-only (flag): Only extract metadata for every URL and emit
+                               one JSON record per line instead of downloading.
+
+        --metadata-output (str): File for the JSON Lines metadata records.
+                                Use "-" for stdout. Default: stdout
+
+        --max-filesize (str): Size budget per video used when ranking formats
+                             (e.g. "500M", "1.5G"). Default: no budget
+
+        --prefer-codecs (str): Comma-separated codec prefixes in order of
+                              preference. Default: "avc1,mp4a"
+
+        --no-prefer-progressive (flag): Do not prefer single audio+video
+                                       formats over video+audio pairs.
+
+        --format-ranking (flag): Rank the extracted formats and download explicit
+                                format ids instead of static yt-dlp selectors.
+                                Implied by --max-filesize, --prefer-codecs and
+                                --no-prefer-progressive.
+
+        --deadline (str): Target completion time of the batch (e.g. "45m",
+                         "2h", "600"). Video quality is then picked per item
+                         from the measured throughput, with --quality as the
+                         upper bound. Default: fixed quality
+
+        --max-bandwidth (str): Download bandwidth cap per second shared by all
+                              workers (e.g. "5M" for 5 MiB/s). Default: unlimited
+
+        --replay-dir (str): Serve extractions (and recorded media) from this
+                           cassette directory instead of the network.
+
+        --replay-latency (float): Injected delay per replayed extraction in
+                                 seconds. Default: 0
+
+        --replay-error-rate (float): Fraction of replayed extractions that
+                                    fail, between 0 and 1. Default: 0
+
+        --record-dir (str): Record extractions and downloads of this run into
+                           a cassette directory for later replay.
+
+        --profile (flag): Time the stages of every item (extraction, file
+                         check, download, post-processing, statistics and
+                         logging) and log a per-stage table at the end.
+
+        --profile-output (str): Also run cProfile in every worker thread and
+                               write the merged pstats file here. Implies
+                               --profile.
+
+        --trace-output (str): Write trace spans of every URL (queued,
+                             extracting, checking, downloading, merging) to
+                             this file as OTLP JSON lines.
+
+        --queue (str): Pull URLs from this shared SQLite work queue (after
+                      adding the given URLs to it). Several processes or
+                      machines can work on one queue.
+
+        --lease (str): Lease time of a claimed URL (e.g. "5m"). A URL whose
+                      worker stops sending heartbeats is reassigned after
+                      this time. Default: 5m
+
+        --worker-id (str): Id of this process in the work queue.
+                          Default: "<hostname>:<pid>"
+
+        --queue-no-wal (flag): Use the rollback journal instead of WAL for a
+                              queue on network storage shared by machines.
+
+        --schedule (str): Order in which URLs are queued: fifo (file order),
+                         sjf (smallest first, lowest mean completion time) or
+                         ljf (largest first, shortest total time).
+                         Default: fifo
+
+        --batch-size (int): Group URLs of the same extractor into batches of
+                           this size; each batch is downloaded by one
+                           worker through one yt-dlp session. Default: 1
+
+        --expand-playlists (flag): Expand playlist and channel URLs into
+                                  their videos page by page; downloads
+                                  start after the first page.
+
+        --playlist-lookahead (int): Expanded videos queued ahead of the
+                                   downloads. Default: 20
+
+        --disk-margin (str): Free space to keep in the save directory, e.g.
+                            2G. Downloads start only if their expected size
+                            fits into the remaining free space.
+                            Default: no check
+
+        --on-disk-full (str): What to do with a download that does not fit:
+                             hold (wait for running downloads) or skip.
+                             Default: hold
+
+        --postprocess-workers (int): Merge and extract audio in a separate
+                                    pool of this many processes (0 or no
+                                    value: one per CPU), so download workers
+                                    move on to the next URL right away.
+                                    Default: in the download worker
+
+        --stream (str): Stream media bytes to "-" (stdout) or a named pipe
+                       (created if missing) instead of saving files.
+
+        --stream-framing (str): raw (media bytes of a single URL), framed
+                               (multiplexed container for batches) or auto.
+                               Default: auto
+
+        --storage (str): Move downloads to s3://bucket/prefix or a
+                        directory, uploading while they download.
+                        Credentials come from the AWS_* environment
+                        variables. Default: keep files in the save directory
+
+        --storage-endpoint (str): Endpoint URL of an S3-compatible server,
+                                 e.g. http://127.0.0.1:9000.
+                                 Default: AWS_ENDPOINT_URL or AWS
+
+        --staging-dir (str): Fast local directory (e.g. NVMe or tmpfs) for
+                            fragments, .part files and merges. Finished
+                            files are moved into the save directory in the
+                            background. Default: work in the save directory
+
+        --preallocate (flag): Reserve the blocks of downloads with a known
+                             size up front (fallocate), so parallel
+                             downloads are not fragmented on disk.
+
+        --buffer-size (str): Initial read block size of the HTTP downloader,
+                            e.g. 64K. Default: yt-dlp's 1 KiB
+
+        --http-chunk-size (str): Download in ranged requests of this size,
+                                e.g. 10M. Default: one request
+
+        --no-resize-buffer (flag): Keep the block size fixed instead of
+                                  adapting it to the measured rate.
+
+        --tune-transfers (flag): Calibrate buffer and chunk sizes per host
+                                by measuring the first MiBs of downloads.
+                                Explicitly set sizes are kept.
+
+        --tuning-file (str): Calibration results kept across runs; implies
+                            --tune-transfers.
+                            Default: <save dir>/.transfer_tuning.json
+
+        --keep-alive (flag): Reuse HTTP connections across requests, URLs
+                            and workers through a process-wide pool and
+                            report the reuse ratio.
+
+        --keep-alive-per-host (int): Idle connections kept per host.
+                                    Default: 4
+
+        --dns-cache (flag): Cache host lookups for all connections,
+                           including failed ones, and report hits and
+                           misses.
+
+        --dns-ttl (str): Time a cached lookup is reused, e.g. 5m.
+                        Default: 60s
+
+        --cache-dir (str): Shared yt-dlp cache directory for signature and
+                          player data, e.g. on a volume of all nodes;
+                          fill it with ``yt-dl-cli warmup``.
+                          Default: yt-dlp's per-user cache
+
     File Format:
         URL files should contain one URL per line. The following format
         is supported:
@@ -102,6 +311,9 @@ def parse_arguments() -> Config:
             # Empty lines above are also ignored
             https://youtube.com/watch?v=video3
 
+            # A priority annotation queues a URL before all lower priorities
+            https://youtube.com/watch?v=urgent priority=10
+
     Error Handling:
         - FileNotFoundError: When the specified URL file doesn't exist,
           an error message is printed to stderr but execution continues
@@ -184,6 +396,282 @@ def parse_arguments() -> Config:
         "--urls", nargs="+", type=str, help="Direct URL list (overrides --file option)"
     )
 
+    # Define metadata-only mode options
+    parser.add_argument(
+        "--metadata-only",
+        action="store_true",
+        help="Only extract metadata and write it as JSON Lines (no downloads)",
+    )
+    parser.add_argument(
+        "--metadata-output",
+        default="-",
+        help="File for JSON Lines metadata records, '-' for stdout (default: -)",
+    )
+
+    # Define format ranking options
+    parser.add_argument(
+        "--max-filesize",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Size budget per video when ranking formats, e.g. 500M or 1.5G "
+        "(implies --format-ranking)",
+    )
+    parser.add_argument(
+        "--prefer-codecs",
+        type=ArgValidator.validate_codec_list,
+        default=None,
+        help="Comma-separated codec preference (default: avc1,mp4a; "
+        "implies --format-ranking)",
+    )
+    parser.add_argument(
+        "--no-prefer-progressive",
+        dest="prefer_progressive",
+        action="store_false",
+        help="Do not prefer single audio+video formats over merged pairs "
+        "(implies --format-ranking)",
+    )
+    parser.add_argument(
+        "--format-ranking",
+        dest="rank_formats",
+        action="store_true",
+        help="Rank extracted formats instead of using static format selectors",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=ArgValidator.validate_duration,
+        default=None,
+        help="Adapt video quality to finish the batch within this time, e.g. 45m or 2h",
+    )
+    parser.add_argument(
+        "--max-bandwidth",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Total download bandwidth per second for all workers, e.g. 5M",
+    )
+
+    # Define record/replay options
+    replay_group = parser.add_mutually_exclusive_group()
+    replay_group.add_argument(
+        "--replay-dir",
+        default=None,
+        help="Serve extractions from a recorded cassette directory (offline)",
+    )
+    replay_group.add_argument(
+        "--record-dir",
+        type=ArgValidator.validate_directory,
+        default=None,
+        help="Record extractions and downloads into a cassette directory",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=ArgValidator.validate_delay,
+        default=0.0,
+        help="Injected delay per replayed extraction in seconds (default: 0)",
+    )
+    parser.add_argument(
+        "--replay-error-rate",
+        type=ArgValidator.validate_fraction,
+        default=0.0,
+        help="Fraction of replayed extractions that fail (default: 0)",
+    )
+
+    # Define profiling options
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Log a per-stage timing table at the end of the batch",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Write merged cProfile statistics of all workers to this file",
+    )
+    parser.add_argument(
+        "--trace-output",
+        default=None,
+        help="Write per-URL trace spans to this file as OTLP JSON lines",
+    )
+
+    # Define work-queue options
+    parser.add_argument(
+        "--queue",
+        default=None,
+        help="Pull URLs from a shared SQLite work queue (several nodes can share it)",
+    )
+    parser.add_argument(
+        "--lease",
+        type=ArgValidator.validate_duration,
+        default=300.0,
+        help="Lease time of a claimed URL, e.g. 5m (default: 5m)",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default="",
+        help="Id of this process in the work queue (default: <hostname>:<pid>)",
+    )
+    parser.add_argument(
+        "--queue-no-wal",
+        dest="queue_wal",
+        action="store_false",
+        help="Do not use WAL for the queue (required on network file systems)",
+    )
+
+    # Define scheduling options
+    parser.add_argument(
+        "--schedule",
+        choices=POLICIES,
+        default=FIFO,
+        help="Queue order: fifo (file order), sjf (smallest first), ljf (largest first)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=ArgValidator.validate_positive_count,
+        default=1,
+        help="URLs of one extractor downloaded through one session (default: 1)",
+    )
+
+    # Define playlist options
+    parser.add_argument(
+        "--expand-playlists",
+        action="store_true",
+        help="Download the videos of playlists and channels while enumerating them",
+    )
+    parser.add_argument(
+        "--playlist-lookahead",
+        type=ArgValidator.validate_positive_count,
+        default=20,
+        help="Expanded videos queued ahead of the downloads (default: 20)",
+    )
+
+    # Define disk space options
+    parser.add_argument(
+        "--disk-margin",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Free space to keep in the save directory, e.g. 2G (enables the check)",
+    )
+    parser.add_argument(
+        "--on-disk-full",
+        dest="disk_full_policy",
+        choices=FULL_POLICIES,
+        default=HOLD,
+        help="hold (wait for running downloads) or skip downloads that do not fit",
+    )
+
+    # Define post-processing options
+    parser.add_argument(
+        "--postprocess-workers",
+        type=ArgValidator.validate_count,
+        nargs="?",
+        const=0,
+        default=None,
+        help="Run ffmpeg merges in a separate pool of N processes (default N: CPU count)",
+    )
+
+    # Define stream options
+    parser.add_argument(
+        "--stream",
+        metavar="TARGET",
+        default=None,
+        help='Stream media to "-" (stdout) or a named pipe instead of saving files',
+    )
+    parser.add_argument(
+        "--stream-framing",
+        choices=FRAMINGS,
+        default=AUTO,
+        help="raw (single URL), framed (batches) or auto (default: auto)",
+    )
+
+    # Define storage options
+    parser.add_argument(
+        "--storage",
+        metavar="URL",
+        default=None,
+        help="Move downloads to s3://bucket/prefix or a directory while they download",
+    )
+    parser.add_argument(
+        "--storage-endpoint",
+        metavar="URL",
+        default=None,
+        help="Endpoint of an S3-compatible server (default: AWS_ENDPOINT_URL or AWS)",
+    )
+
+    # Define staging options
+    parser.add_argument(
+        "--staging-dir",
+        type=ArgValidator.validate_directory,
+        default=None,
+        help="Fast local directory for intermediate files; finished files are moved to -d",
+    )
+
+    # Define preallocation options
+    parser.add_argument(
+        "--preallocate",
+        action="store_true",
+        help="Reserve disk blocks of downloads with a known size before writing them",
+    )
+
+    # Define transfer tuning options
+    parser.add_argument(
+        "--buffer-size",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Initial read block size of the HTTP downloader, e.g. 64K (default: 1K)",
+    )
+    parser.add_argument(
+        "--http-chunk-size",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Download in ranged requests of this size, e.g. 10M",
+    )
+    parser.add_argument(
+        "--no-resize-buffer",
+        action="store_true",
+        help="Keep the block size fixed instead of adapting it to the rate",
+    )
+    parser.add_argument(
+        "--tune-transfers",
+        action="store_true",
+        help="Calibrate buffer and chunk sizes per host and remember the fastest",
+    )
+    parser.add_argument(
+        "--tuning-file",
+        default=None,
+        help="Calibration file kept across runs (default: <dir>/.transfer_tuning.json)",
+    )
+
+    # Define connection options
+    parser.add_argument(
+        "--keep-alive",
+        action="store_true",
+        help="Reuse HTTP connections across requests, URLs and workers",
+    )
+    parser.add_argument(
+        "--keep-alive-per-host",
+        type=ArgValidator.validate_positive_count,
+        default=4,
+        help="Idle connections kept per host with --keep-alive (default: 4)",
+    )
+    parser.add_argument(
+        "--dns-cache",
+        action="store_true",
+        help="Cache DNS lookups of all connections in the process",
+    )
+    parser.add_argument(
+        "--dns-ttl",
+        type=ArgValidator.validate_duration,
+        default=60.0,
+        help="Lifetime of cached DNS answers with --dns-cache (default: 60s)",
+    )
+
+    # Define cache options
+    parser.add_argument(
+        "--cache-dir",
+        type=ArgValidator.validate_directory,
+        default=None,
+        help="Shared yt-dlp cache directory, e.g. prepared by 'yt-dl-cli warmup'",
+    )
+
     # Parse the command line arguments
     args = parser.parse_args()
 
@@ -242,12 +730,27 @@ def parse_arguments() -> Config:
 
     # Clean and filter the URL list
     # Remove empty lines, comments, and strip whitespace
-    urls = [
+    lines = [
         url.strip()
         for url in urls
         if url and url.strip() and not url.strip().startswith("#")
     ]
 
+    # Split off per-line annotations (e.g. "priority=5")
+    urls = []
+    priorities: Dict[str, int] = {}
+    for line in lines:
+        try:
+            url, priority = parse_link_line(line)
+        except ValueError:
+            print(Messages.CLI.INVALID_PRIORITY(line=line, file=args.file), file=sys.stderr)
+            url, priority = line.split()[0], None
+        urls.append(url)
+        if priority is not None:
+            priorities[url] = priority
+
+    check_conflicts(parser, args, urls)
+
     # Create and return the configuration object
     return Config(
         save_dir=Path(args.dir),
@@ -255,4 +758,259 @@ def parse_arguments() -> Config:
         quality=args.quality,
         audio_only=args.audio_only,
         urls=urls,
+        metadata_only=args.metadata_only,
+        metadata_output=(
+            None if args.metadata_output == "-" else Path(args.metadata_output)
+        ),
+        rank_formats=args.rank_formats or args.prefer_codecs is not None,
+        max_filesize=args.max_filesize,
+        prefer_progressive=args.prefer_progressive,
+        preferred_codecs=args.prefer_codecs or list(DEFAULT_CODECS),
+        deadline=args.deadline,
+        max_bandwidth=args.max_bandwidth,
+        replay_dir=Path(args.replay_dir) if args.replay_dir else None,
+        replay_latency=args.replay_latency,
+        replay_error_rate=args.replay_error_rate,
+        record_dir=args.record_dir,
+        profile=args.profile,
+        profile_output=Path(args.profile_output) if args.profile_output else None,
+        trace_output=Path(args.trace_output) if args.trace_output else None,
+        queue_path=Path(args.queue) if args.queue else None,
+        lease_time=args.lease,
+        worker_id=args.worker_id,
+        queue_wal=args.queue_wal,
+        schedule=args.schedule,
+        batch_size=args.batch_size,
+        expand_playlists=args.expand_playlists,
+        playlist_lookahead=args.playlist_lookahead,
+        priorities=priorities,
+        disk_margin=args.disk_margin,
+        disk_full_policy=args.disk_full_policy,
+        postprocess_workers=args.postprocess_workers,
+        stream_output=args.stream,
+        stream_framing=args.stream_framing,
+        storage=args.storage,
+        storage_endpoint=args.storage_endpoint,
+        staging_dir=args.staging_dir,
+        preallocate=args.preallocate,
+        buffer_size=args.buffer_size,
+        http_chunk_size=args.http_chunk_size,
+        no_resize_buffer=args.no_resize_buffer,
+        tune_transfers=args.tune_transfers,
+        tuning_file=Path(args.tuning_file) if args.tuning_file else None,
+        keep_alive=args.keep_alive,
+        keep_alive_per_host=args.keep_alive_per_host,
+        dns_cache=args.dns_cache,
+        dns_ttl=args.dns_ttl,
+        cache_dir=args.cache_dir,
+    )
+
+
+def parse_serve_arguments(
+    argv: Optional[Sequence[str]] = None,
+) -> Tuple[Config, ServerConfig]:
+    """
+    Parse the arguments of the ``yt-dl-cli serve`` daemon.
+
+    The daemon takes its URLs from API submissions instead of a links file, so
+    only the options of the long-lived download engine and the listening
+    address are accepted. Session reuse is enabled and a metadata cache is
+    configured by default, because keeping them warm across submissions is
+    the point of the daemon.
+
+    Command Line Arguments:
+        -d, --dir: Save directory (default: downloads)
+        -w, --workers: Number of parallel downloads (default: 2)
+        -q, --quality: Video quality preference (default: best)
+        -a, --audio-only: Download audio tracks only
+        --max-bandwidth: Total bandwidth per second for all workers
+        --host: Interface of the HTTP API (default: 127.0.0.1)
+        --port: TCP port of the HTTP API, 0 for any free port (default: 8765)
+        --socket: Unix socket path to listen on instead of TCP
+        --metadata-cache: Extracted records kept in memory (default: 1024, 0 disables)
+        --metadata-cache-ttl: Lifetime of cached records (default: 1h)
+        --no-reuse-sessions: Create a YoutubeDL instance per extraction
+        --max-jobs: Finished jobs kept for status queries (default: 1000)
+        --disk-margin: Free space to keep in the save directory (default: no check)
+        --on-disk-full: hold or skip downloads that do not fit (default: hold)
+        --cache-dir: Shared yt-dlp cache directory (default: yt-dlp's per-user cache)
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments after ``serve``. Defaults to
+                                        None (``sys.argv[2:]``).
+
+    Returns:
+        Tuple[Config, ServerConfig]: Download configuration (without URLs)
+                                     and server configuration.
+
+    Raises:
+        SystemExit: If the arguments are invalid (raised by argparse).
+    """
+    parser = argparse.ArgumentParser(
+        prog="yt-dl-cli serve",
+        description="Download daemon with a local JSON submission API",
+    )
+    parser.add_argument(
+        "-d",
+        "--dir",
+        default="downloads",
+        type=ArgValidator.validate_directory,
+        help="Save directory for downloaded files",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=ArgValidator.validate_workers,
+        default=2,
+        help="Maximum number of parallel downloads (default: 2)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quality",
+        choices=["best", "worst", "1080", "720", "480", "360"],
+        type=ArgValidator.validate_quality,
+        default="best",
+        help="Video quality preference (default: best)",
+    )
+    parser.add_argument(
+        "-a",
+        "--audio-only",
+        action="store_true",
+        help="Download audio track only (no video)",
+    )
+    parser.add_argument(
+        "--max-bandwidth",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Total download bandwidth per second for all workers, e.g. 5M",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Interface of the HTTP API (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=ArgValidator.validate_port,
+        default=8765,
+        help="TCP port of the HTTP API, 0 for any free port (default: 8765)",
+    )
+    parser.add_argument(
+        "--socket", default=None, help="Listen on this Unix socket instead of TCP"
+    )
+    parser.add_argument(
+        "--metadata-cache",
+        type=ArgValidator.validate_count,
+        default=1024,
+        help="Extracted records kept in memory (default: 1024)",
+    )
+    parser.add_argument(
+        "--no-metadata-cache",
+        dest="metadata_cache",
+        action="store_const",
+        const=0,
+        help="Extract every submitted URL again",
+    )
+    parser.add_argument(
+        "--metadata-cache-ttl",
+        type=ArgValidator.validate_duration,
+        default=3600.0,
+        help="Lifetime of cached records, e.g. 30m (default: 1h)",
+    )
+    parser.add_argument(
+        "--no-reuse-sessions",
+        dest="reuse_sessions",
+        action="store_false",
+        help="Create a YoutubeDL instance for every extraction",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=ArgValidator.validate_count,
+        default=1000,
+        help="Finished jobs kept for status queries (default: 1000)",
+    )
+    parser.add_argument(
+        "--disk-margin",
+        type=ArgValidator.validate_size,
+        default=None,
+        help="Free space to keep in the save directory, e.g. 2G (enables the check)",
+    )
+    parser.add_argument(
+        "--on-disk-full",
+        dest="disk_full_policy",
+        choices=FULL_POLICIES,
+        default=HOLD,
+        help="hold (wait for running downloads) or skip downloads that do not fit",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=ArgValidator.validate_directory,
+        default=None,
+        help="Shared yt-dlp cache directory, e.g. prepared by 'yt-dl-cli warmup'",
+    )
+    args = parser.parse_args(argv)
+
+    config = Config(
+        save_dir=Path(args.dir),
+        max_workers=args.workers,
+        quality=args.quality,
+        audio_only=args.audio_only,
+        max_bandwidth=args.max_bandwidth,
+        reuse_sessions=args.reuse_sessions,
+        metadata_cache_size=args.metadata_cache,
+        metadata_cache_ttl=args.metadata_cache_ttl,
+        disk_margin=args.disk_margin,
+        disk_full_policy=args.disk_full_policy,
+        cache_dir=args.cache_dir,
+    )
+    server_config = ServerConfig(
+        host=args.host,
+        port=args.port,
+        socket_path=Path(args.socket) if args.socket else None,
+        max_jobs=args.max_jobs,
+    )
+    return config, server_config
+
+
+def parse_warmup_arguments(
+    argv: Optional[Sequence[str]] = None,
+) -> Tuple[Path, Path, List[str]]:
+    """
+    Parse the arguments of the ``yt-dl-cli warmup`` command.
+
+    Command Line Arguments:
+        --cache-dir: Shared yt-dlp cache directory to populate (required)
+        -d, --dir: Directory of the log file (default: downloads)
+        urls: Videos to extract (default: a built-in YouTube video)
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments after ``warmup``. Defaults to
+                                        None (``sys.argv[2:]``).
+
+    Returns:
+        Tuple[Path, Path, List[str]]: Cache directory, log directory and the
+                                      URLs to extract (possibly empty).
+
+    Raises:
+        SystemExit: If the arguments are invalid (raised by argparse).
+    """
+    parser = argparse.ArgumentParser(
+        prog="yt-dl-cli warmup",
+        description="Fill a shared yt-dlp cache directory before starting workers",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=ArgValidator.validate_directory,
+        required=True,
+        help="Shared yt-dlp cache directory to populate",
+    )
+    parser.add_argument(
+        "-d",
+        "--dir",
+        default="downloads",
+        type=ArgValidator.validate_directory,
+        help="Directory of the log file (default: downloads)",
+    )
+    parser.add_argument(
+        "urls", nargs="*", help="Videos to extract (default: a built-in YouTube video)"
     )
+    args = parser.parse_args(argv)
+    return args.cache_dir, args.dir, args.urls
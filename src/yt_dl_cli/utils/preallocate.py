@@ -0,0 +1,154 @@
+"""
+Preallocation of download files whose size is known in advance.
+
+yt-dlp writes a download by appending to a growing ``.part`` file. When
+many downloads append in parallel, the file system hands out blocks to all
+of them in turn and the files end up in many small extents, which makes
+them slow to read sequentially later. When the extracted format has a known
+size, the Preallocator reserves all of its blocks in one ``fallocate`` call
+as soon as yt-dlp has created the file.
+
+The allocation uses FALLOC_FL_KEEP_SIZE: the file's size does not change,
+only blocks beyond its end are reserved. yt-dlp's resume logic, which looks
+at the size of the ``.part`` file, is unaffected, and the writes fill the
+reserved blocks as the download progresses.
+
+fallocate is called through ctypes (the os module has no flag argument).
+On platforms or file systems without it, preallocation is silently skipped.
+
+Classes:
+    Preallocator: yt-dlp progress hook preallocating download files
+
+Functions:
+    fallocate: Reserve blocks of an open file
+
+Example:
+    >>> preallocator = Preallocator()
+    >>> executor = DownloadExecutor(logger, [preallocator.progress_hook])
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+
+FALLOC_FL_KEEP_SIZE = 0x01
+"""fallocate mode that reserves blocks without changing the file size."""
+
+MIN_SIZE = 16 * 1024 * 1024
+"""Files smaller than this are not preallocated."""
+
+_UNSUPPORTED = (errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL)
+
+
+@functools.lru_cache(maxsize=None)
+def _libc_fallocate() -> Optional[Callable[..., int]]:
+    """Return libc's fallocate with 64-bit offsets, or None where it is missing."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+    function = getattr(libc, "fallocate64", None) or getattr(libc, "fallocate", None)
+    if function is None:
+        return None
+    function.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    function.restype = ctypes.c_int
+    return function
+
+
+def fallocate(fd: int, length: int, offset: int = 0, mode: int = FALLOC_FL_KEEP_SIZE) -> bool:
+    """
+    Reserve blocks of an open file.
+
+    Args:
+        fd (int): File descriptor opened for writing.
+        length (int): Bytes to reserve.
+        offset (int): First byte of the range. Defaults to 0.
+        mode (int): fallocate mode. Defaults to FALLOC_FL_KEEP_SIZE.
+
+    Returns:
+        bool: True if the blocks were reserved, False if fallocate is not
+        supported by the platform or file system.
+
+    Raises:
+        OSError: For other errors, e.g. ENOSPC if the blocks do not fit.
+    """
+    function = _libc_fallocate()
+    if function is None:
+        return False
+    if function(fd, mode, offset, length) == 0:
+        return True
+    code = ctypes.get_errno()
+    if code in _UNSUPPORTED:
+        return False
+    raise OSError(code, os.strerror(code))
+
+
+class Preallocator:
+    """
+    yt-dlp progress hook preallocating files of formats with a known size.
+
+    On the first progress report of a file, the format's ``filesize`` (or
+    the exact ``total_bytes`` reported by the server) is reserved for the
+    ``.part`` file yt-dlp is writing. Estimated sizes are not used, since
+    they would leave unused blocks behind.
+
+    Attributes:
+        min_size (int): Smallest size that is preallocated.
+        files (int): Files preallocated.
+        bytes (int): Bytes preallocated.
+    """
+
+    def __init__(self, min_size: int = MIN_SIZE) -> None:
+        """
+        Initialize the hook.
+
+        Args:
+            min_size (int): Smallest size that is preallocated. Defaults to
+                MIN_SIZE.
+        """
+        self.min_size = min_size
+        self.files = 0
+        self.bytes = 0
+        self._seen: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        Preallocate a file the first time it is reported.
+
+        Args:
+            status (Dict[str, Any]): yt-dlp progress dictionary.
+        """
+        path = status.get("tmpfilename") or status.get("filename")
+        if not path:
+            return
+        if status.get("status") != "downloading":
+            with self._lock:
+                self._seen.discard(path)
+            return
+        with self._lock:
+            if path in self._seen:
+                return
+            self._seen.add(path)
+        size = (status.get("info_dict") or {}).get("filesize") or status.get("total_bytes")
+        if not size or size < self.min_size:
+            return
+        try:
+            fd = os.open(path, os.O_WRONLY)
+        except OSError:
+            return
+        try:
+            allocated = fallocate(fd, size)
+        except OSError:
+            # ENOSPC and friends: the download reports its own error if any
+            allocated = False
+        finally:
+            os.close(fd)
+        if allocated:
+            with self._lock:
+                self.files += 1
+                self.bytes += size
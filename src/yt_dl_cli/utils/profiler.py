@@ -0,0 +1,357 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Built-in profiling of download batches.
+
+This module provides the profiling mode of the application. StageProfiler
+accumulates monotonic wall-clock timings per stage (extraction, file check,
+download, transfer, post-processing, statistics and logging) from all worker
+threads, can run cProfile over the workers and merges the results into a
+single pstats file, and names worker threads after the URL
+they are processing so sampling profilers (e.g. py-spy) show useful names.
+
+Components are instrumented without modifying them: the DI container wraps
+them in a proxy that times selected methods, and the profiler provides yt-dlp
+progress and post-processor hooks for the stages that happen inside yt-dlp.
+When profiling is disabled, NullProfiler keeps the same interface at no cost.
+
+cProfile is built on sys.monitoring since Python 3.12: a profiler observes
+every thread and only one can be enabled in the process. There, a single
+process-wide profile is enabled while any item runs; call counts cover all
+workers, while the times of concurrently running workers are interleaved.
+On older versions every worker thread gets its own profile.
+
+Classes:
+    StageStats: Accumulated timings of one stage
+    NullProfiler: No-op profiler used when profiling is disabled
+    StageProfiler: Per-stage timers with optional cProfile
+
+Example:
+    >>> profiler = StageProfiler(cprofile_path=Path("batch.pstats"))
+    >>> checker = profiler.wrap(FileSystemChecker(), {"exists": "check"})
+    >>> with profiler.stage("extract"):
+    ...     info = extractor.extract_record(url, opts)
+    >>> profiler.report(logger, elapsed=12.5)
+"""
+
+import contextlib
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+
+_PROCESS_WIDE_PROFILE = sys.version_info >= (3, 12)
+
+
+class StageStats:
+    """
+    Accumulated timings of one stage.
+
+    Attributes:
+        calls (int): Number of timed calls.
+        total (float): Total time in seconds.
+        max (float): Longest call in seconds.
+    """
+
+    __slots__ = ("calls", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add one timed call."""
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        """float: Mean call time in seconds."""
+        return self.total / self.calls if self.calls else 0.0
+
+
+class NullProfiler:
+    """
+    No-op profiler with the StageProfiler interface.
+
+    Used when profiling is disabled so callers never need to check whether a
+    profiler is present.
+    """
+
+    enabled = False
+
+    def stage(self, name: str) -> contextlib.AbstractContextManager:
+        """Return a context manager that does nothing."""
+        del name
+        return contextlib.nullcontext()
+
+    def wrap(self, target: Any, methods: Mapping[str, str]) -> Any:
+        """Return ``target`` unchanged."""
+        del methods
+        return target
+
+    def run(self, handler: Callable[[str], Any], item: str) -> Any:
+        """Call ``handler(item)`` directly."""
+        return handler(item)
+
+    def report(self, logger: ILogger, elapsed: float) -> None:
+        """Do nothing."""
+
+
+class _ProfiledProxy:
+    """Proxy timing selected methods of a component and delegating the rest."""
+
+    def __init__(self, target: Any, profiler: "StageProfiler", methods: Mapping[str, str]):
+        """Wrap ``target``; ``methods`` maps method names to stage names."""
+        self._target = target
+        self._profiler = profiler
+        self._methods = dict(methods)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute of the target, timed if it is a profiled method."""
+        attr = getattr(self._target, name)
+        stage = self._methods.get(name)
+        if stage is None or not callable(attr):
+            return attr
+        profiler = self._profiler
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with profiler.stage(stage):
+                return attr(*args, **kwargs)
+
+        return timed
+
+
+class StageProfiler(NullProfiler):
+    """
+    Thread-safe per-stage wall-clock profiler with optional cProfile.
+
+    Attributes:
+        cprofile_path (Optional[Path]): Where the merged pstats file is
+            written. None disables cProfile; only stage timers are collected.
+        stages (Dict[str, StageStats]): Accumulated timings per stage.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        cprofile_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            cprofile_path (Optional[Path]): Destination of the merged pstats
+                file. Defaults to None (no cProfile).
+            clock (Callable[[], float]): Monotonic clock. Defaults to
+                time.perf_counter.
+        """
+        self.cprofile_path = cprofile_path
+        self.stages: Dict[str, StageStats] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles: List[cProfile.Profile] = []
+        self._shared: Optional[cProfile.Profile] = None
+        self._active = 0
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Add a timing to a stage.
+
+        Args:
+            name (str): Stage name.
+            seconds (float): Measured time in seconds.
+        """
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.add(seconds)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:  # type: ignore[override]
+        """
+        Time the enclosed block as one call of a stage.
+
+        Args:
+            name (str): Stage name.
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, self._clock() - start)
+
+    def wrap(self, target: Any, methods: Mapping[str, str]) -> Any:
+        """
+        Return a proxy of ``target`` that times the given methods.
+
+        Args:
+            target (Any): Component to instrument.
+            methods (Mapping[str, str]): Method name to stage name.
+
+        Returns:
+            Any: Proxy delegating every attribute to ``target``.
+        """
+        return _ProfiledProxy(target, self, methods)
+
+    def run(self, handler: Callable[[str], Any], item: str) -> Any:
+        """
+        Run one work item in the calling worker thread with profiling.
+
+        The thread is renamed after the item (URL) for the duration of the
+        call. When cProfile output is requested, the thread's own
+        cProfile.Profile is enabled around the call, or on Python 3.12+ the
+        process-wide profile is kept enabled while any item runs.
+
+        Args:
+            handler (Callable[[str], Any]): Blocking per-item function.
+            item (str): Work item, usually a URL.
+
+        Returns:
+            Any: Result of ``handler(item)``.
+        """
+        thread = threading.current_thread()
+        previous_name = thread.name
+        thread.name = f"yt-dl {item}"
+        try:
+            if self.cprofile_path is None:
+                return handler(item)
+            if _PROCESS_WIDE_PROFILE:
+                with self._process_profile():
+                    return handler(item)
+            return self._thread_profile().runcall(handler, item)
+        finally:
+            thread.name = previous_name
+
+    def _thread_profile(self) -> cProfile.Profile:
+        """Return the cProfile.Profile of the calling thread."""
+        profile = getattr(self._local, "profile", None)
+        if profile is None:
+            profile = self._local.profile = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(profile)
+        return profile
+
+    @contextlib.contextmanager
+    def _process_profile(self) -> Iterator[None]:
+        """Keep the process-wide cProfile.Profile enabled while any item runs."""
+        with self._lock:
+            if self._shared is None:
+                self._shared = cProfile.Profile()
+                self._profiles.append(self._shared)
+            shared = self._shared
+            if self._active == 0:
+                try:
+                    shared.enable()
+                except ValueError:
+                    # Another profiling tool owns sys.monitoring; keep the
+                    # stage timers and skip cProfile.
+                    pass
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+                if self._active == 0:
+                    shared.disable()
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp progress hook timing the transfer of every file.
+
+        The "transfer" stage of a file runs from its first progress report to
+        its "finished" or "error" report.
+
+        Args:
+            status (Dict[str, Any]): Progress dictionary passed by yt-dlp.
+        """
+        started: Dict[str, float] = self._local.__dict__.setdefault("transfers", {})
+        key = status.get("filename") or status.get("tmpfilename") or ""
+        if status.get("status") == "downloading":
+            started.setdefault(key, self._clock())
+        elif key in started:
+            self.record("transfer", self._clock() - started.pop(key))
+
+    def postprocessor_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp post-processor hook timing every post-processor run.
+
+        Args:
+            status (Dict[str, Any]): Post-processor status passed by yt-dlp.
+        """
+        started: Dict[str, float] = self._local.__dict__.setdefault("postprocessors", {})
+        name = str(status.get("postprocessor"))
+        if status.get("status") == "started":
+            started[name] = self._clock()
+        elif status.get("status") == "finished" and name in started:
+            self.record("postprocess", self._clock() - started.pop(name))
+
+    def merged_stats(self) -> Optional[pstats.Stats]:
+        """
+        Merge the cProfile data of all worker threads.
+
+        Returns:
+            Optional[pstats.Stats]: Merged statistics, or None if nothing was
+            profiled.
+        """
+        with self._lock:
+            profiles = list(self._profiles)
+        merged: Optional[pstats.Stats] = None
+        for profile in profiles:
+            profile.create_stats()
+            if not profile.stats:  # type: ignore[attr-defined]
+                continue
+            if merged is None:
+                merged = pstats.Stats(profile)
+            else:
+                merged.add(profile)
+        return merged
+
+    def report(self, logger: ILogger, elapsed: float) -> None:
+        """
+        Log the per-stage summary table and write the merged pstats file.
+
+        Stages are listed by total time. The share column relates a stage's
+        total time to the batch wall time; it can exceed 100% because stages
+        run concurrently in several workers.
+
+        Args:
+            logger (ILogger): Logger receiving the table.
+            elapsed (float): Batch wall time in seconds.
+        """
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda kv: kv[1].total, reverse=True)
+        logger.info(Messages.Stats.HEADER)
+        logger.info(Messages.Stats.PROFILE_TITLE())
+        for name, stats in stages:
+            logger.info(
+                Messages.Stats.PROFILE_ROW(
+                    stage=name,
+                    calls=stats.calls,
+                    total=stats.total,
+                    mean=stats.mean * 1000,
+                    max=stats.max * 1000,
+                    share=stats.total / elapsed * 100 if elapsed else 0.0,
+                )
+            )
+        if self.cprofile_path is not None:
+            merged = self.merged_stats()
+            if merged is not None:
+                self.cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+                merged.dump_stats(str(self.cprofile_path))
+                logger.info(Messages.Stats.PROFILE_SAVED(path=self.cprofile_path))
+        logger.info(Messages.Stats.FOOTER)
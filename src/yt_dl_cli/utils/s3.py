@@ -0,0 +1,474 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Dependency-free client for S3-compatible object storage.
+
+Only the handful of requests needed to store downloads are implemented:
+HEAD and PUT of objects and the multipart upload API (create, upload part,
+complete, abort). Requests are signed with AWS Signature Version 4, so the
+client works with AWS S3 and with compatible servers such as MinIO, Ceph or
+a local stand-in used in tests.
+
+An S3MultipartWriter uploads an object in parts while it is being written:
+every time ``part_size`` bytes are buffered, the part is sent by a shared
+upload pool in the background. The object only becomes visible when the
+multipart upload is completed on commit(); an aborted writer leaves nothing
+behind.
+
+Classes:
+    S3Error: Failed S3 request
+    S3Client: Signed requests against an S3 endpoint
+    S3MultipartWriter: Storage writer uploading parts as data arrives
+    S3Storage: Storage backend for a bucket and key prefix
+
+Functions:
+    sign_v4: Add a Signature Version 4 Authorization header to a request
+
+Example:
+    >>> client = S3Client("http://127.0.0.1:9000", access_key="k", secret_key="s")
+    >>> storage = S3Storage(client, "media", "videos/")
+    >>> writer = storage.writer("Title.mp4")
+    >>> writer.write(data)
+    >>> writer.commit()  # s3://media/videos/Title.mp4 now exists
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+import hashlib
+import hmac
+import http.client
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+from xml.etree import ElementTree
+
+PART_SIZE = 8 * 1024 * 1024
+"""Default size of the parts of a multipart upload (S3 requires at least 5 MiB)."""
+
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class S3Error(OSError):
+    """An S3 request failed; ``status`` is the HTTP status (0 for network errors)."""
+
+    def __init__(self, message: str, status: int = 0) -> None:
+        """Create the error with the HTTP status of the failed request."""
+        super().__init__(message)
+        self.status = status
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    """Return the HMAC-SHA256 of a message."""
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
+def sign_v4(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    payload_hash: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    service: str = "s3",
+    now: Optional[datetime] = None,
+) -> Dict[str, str]:
+    """
+    Sign a request with AWS Signature Version 4.
+
+    All given headers are signed, plus "host" and "x-amz-date", which are
+    added if missing.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL; its path must already be URI-encoded.
+        headers (Mapping[str, str]): Headers to send.
+        payload_hash (str): Hex SHA-256 of the body (S3 also expects it in
+            the x-amz-content-sha256 header).
+        access_key (str): Access key id.
+        secret_key (str): Secret access key.
+        region (str): Region, e.g. "us-east-1".
+        service (str): Service name. Defaults to "s3".
+        now (Optional[datetime]): Signing time. Defaults to the current time.
+
+    Returns:
+        Dict[str, str]: The headers with "Authorization" added.
+    """
+    parts = urlsplit(url)
+    signed = {name.lower(): " ".join(str(value).split()) for name, value in headers.items()}
+    signed.setdefault("host", parts.netloc)
+    stamp = (now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    signed.setdefault("x-amz-date", stamp)
+    stamp = signed["x-amz-date"]
+    query = []
+    for pair in parts.query.split("&") if parts.query else []:
+        name, _, value = pair.partition("=")
+        query.append(
+            (quote(unquote(name), safe="-_.~"), quote(unquote(value), safe="-_.~"))
+        )
+    names = sorted(signed)
+    canonical = "\n".join(
+        [
+            method,
+            parts.path or "/",
+            "&".join(f"{name}={value}" for name, value in sorted(query)),
+            "".join(f"{name}:{signed[name]}\n" for name in names),
+            ";".join(names),
+            payload_hash,
+        ]
+    )
+    scope = f"{stamp[:8]}/{region}/{service}/aws4_request"
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            stamp,
+            scope,
+            hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+        ]
+    )
+    key = ("AWS4" + secret_key).encode("utf-8")
+    for item in (stamp[:8], region, service, "aws4_request"):
+        key = _hmac(key, item)
+    signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    result = dict(headers)
+    result.update({"host": signed["host"], "x-amz-date": stamp})
+    result["Authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key}/{scope}, "
+        f"SignedHeaders={';'.join(names)}, Signature={signature}"
+    )
+    return result
+
+
+def _text(body: bytes, tag: str) -> Optional[str]:
+    """Return the text of the first element with a tag (ignoring namespaces)."""
+    for element in ElementTree.fromstring(body).iter():
+        if element.tag.rsplit("}", 1)[-1] == tag:
+            return element.text
+    return None
+
+
+class S3Client:
+    """
+    Signed requests against an S3-compatible endpoint.
+
+    With an explicit endpoint, buckets are addressed path-style
+    (``<endpoint>/<bucket>/<key>``), which compatible servers expect;
+    otherwise the virtual-hosted AWS endpoint of the region is used.
+    Requests without credentials are sent unsigned.
+
+    Attributes:
+        endpoint (Optional[str]): Endpoint URL, or None for AWS.
+        region (str): Signing region.
+        timeout (float): Socket timeout of every request in seconds.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        region: str = "us-east-1",
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        session_token: Optional[str] = None,
+        timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            endpoint (Optional[str]): Endpoint URL, e.g.
+                "http://127.0.0.1:9000". Defaults to AWS.
+            region (str): Signing region. Defaults to "us-east-1".
+            access_key (Optional[str]): Access key id. Defaults to None.
+            secret_key (Optional[str]): Secret access key. Defaults to None.
+            session_token (Optional[str]): Token of temporary credentials.
+                Defaults to None.
+            timeout (float): Socket timeout in seconds. Defaults to 60.
+        """
+        self.endpoint = endpoint.rstrip("/") if endpoint else None
+        self.region = region
+        self.timeout = timeout
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._session_token = session_token
+
+    def url(self, bucket: str, key: str = "") -> str:
+        """Return the URL of an object with its key URI-encoded."""
+        path = quote(key, safe="/-_.~")
+        if self.endpoint:
+            return f"{self.endpoint}/{bucket}/{path}"
+        return f"https://{bucket}.s3.{self.region}.amazonaws.com/{path}"
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
+    def request(
+        self,
+        method: str,
+        bucket: str,
+        key: str,
+        query: str = "",
+        body: bytes = b"",
+        expect: Tuple[int, ...] = (200,),
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        Send a signed request.
+
+        Args:
+            method (str): HTTP method.
+            bucket (str): Bucket name.
+            key (str): Object key.
+            query (str): Encoded query string, e.g. "uploads=". Defaults to "".
+            body (bytes): Request body. Defaults to empty.
+            expect (Tuple[int, ...]): Statuses that are not errors.
+                Defaults to (200,).
+
+        Returns:
+            Tuple[int, bytes, Dict[str, str]]: Status, body and headers
+            (lower-case names) of the response.
+
+        Raises:
+            S3Error: On network errors and unexpected statuses.
+        """
+        url = self.url(bucket, key) + (f"?{query}" if query else "")
+        payload_hash = hashlib.sha256(body).hexdigest() if body else EMPTY_SHA256
+        headers = {"x-amz-content-sha256": payload_hash, "content-length": str(len(body))}
+        if self._session_token:
+            headers["x-amz-security-token"] = self._session_token
+        if self._access_key and self._secret_key:
+            headers = sign_v4(
+                method, url, headers, payload_hash,
+                self._access_key, self._secret_key, self.region,
+            )
+        parts = urlsplit(url)
+        connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        connection = connection_class(parts.netloc, timeout=self.timeout)
+        try:
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+            connection.request(method, target, body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            raise S3Error(f"{method} {url}: {e}") from e
+        finally:
+            connection.close()
+        if response.status not in expect:
+            code = _text(data, "Code") if data.lstrip().startswith(b"<") else None
+            raise S3Error(
+                f"{method} {url}: HTTP {response.status} {code or response.reason}",
+                response.status,
+            )
+        return response.status, data, {k.lower(): v for k, v in response.getheaders()}
+
+    def head_object(self, bucket: str, key: str) -> bool:
+        """Return True if an object exists."""
+        status, _, _ = self.request("HEAD", bucket, key, expect=(200, 404))
+        return status == 200
+
+    def put_object(self, bucket: str, key: str, body: bytes) -> None:
+        """Store an object with a single request."""
+        self.request("PUT", bucket, key, body=body)
+
+    def create_multipart_upload(self, bucket: str, key: str) -> str:
+        """Start a multipart upload and return its upload id."""
+        _, data, _ = self.request("POST", bucket, key, "uploads=")
+        upload_id = _text(data, "UploadId")
+        if not upload_id:
+            raise S3Error(f"no UploadId in response for {key}")
+        return upload_id
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def upload_part(
+        self, bucket: str, key: str, upload_id: str, number: int, body: bytes, retries: int = 3
+    ) -> str:
+        """Upload a part, retrying network and server errors, and return its ETag."""
+        query = f"partNumber={number}&uploadId={quote(upload_id, safe='')}"
+        for attempt in range(retries):
+            try:
+                _, _, headers = self.request("PUT", bucket, key, query, body)
+                return headers.get("etag", "")
+            except S3Error as e:
+                if attempt == retries - 1 or 400 <= e.status < 500:
+                    raise
+        raise AssertionError("unreachable")
+
+    def complete_multipart_upload(
+        self, bucket: str, key: str, upload_id: str, etags: List[str]
+    ) -> None:
+        """Complete a multipart upload, publishing the object."""
+        body = "<CompleteMultipartUpload>" + "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in enumerate(etags, 1)
+        ) + "</CompleteMultipartUpload>"
+        _, data, _ = self.request(
+            "POST", bucket, key, f"uploadId={quote(upload_id, safe='')}", body.encode("utf-8")
+        )
+        # S3 may report a failed completion with status 200 and an Error body
+        if data and _text(data, "Code") is not None:
+            raise S3Error(f"completing {key} failed: {_text(data, 'Code')}")
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        """Abort a multipart upload, deleting its parts."""
+        self.request(
+            "DELETE", bucket, key, f"uploadId={quote(upload_id, safe='')}", expect=(200, 204, 404)
+        )
+
+
+class S3MultipartWriter:
+    """
+    Storage writer uploading an object in parts while it is written.
+
+    Full parts are uploaded by the storage's upload pool; at most
+    ``max_in_flight`` parts of a writer are buffered or uploading at once,
+    so write() blocks when the network falls behind the download. Objects
+    smaller than one part are stored with a single PUT on commit().
+
+    Attributes:
+        bucket (str): Bucket name.
+        key (str): Object key.
+        part_size (int): Bytes per part.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str,
+        key: str,
+        pool: ThreadPoolExecutor,
+        part_size: int = PART_SIZE,
+        max_in_flight: int = 2,
+    ) -> None:
+        """
+        Initialize the writer; the multipart upload starts with the first part.
+
+        Args:
+            client (S3Client): Client sending the requests.
+            bucket (str): Bucket name.
+            key (str): Object key.
+            pool (ThreadPoolExecutor): Pool uploading the parts.
+            part_size (int): Bytes per part. Defaults to PART_SIZE.
+            max_in_flight (int): Parts uploading at once. Defaults to 2.
+        """
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self._pool = pool
+        self._max_in_flight = max_in_flight
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List["Future[str]"] = []
+
+    @property
+    def parts_started(self) -> int:
+        """int: Parts handed to the upload pool so far."""
+        return len(self._parts)
+
+    def write(self, data: bytes) -> None:
+        """Buffer data and upload every full part."""
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._send(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+
+    def _send(self, part: bytes) -> None:
+        """Hand a part to the pool, waiting while too many are in flight."""
+        if self._upload_id is None:
+            self._upload_id = self.client.create_multipart_upload(self.bucket, self.key)
+        running = [future for future in self._parts if not future.done()]
+        if len(running) >= self._max_in_flight:
+            running[0].result()
+        self._parts.append(
+            self._pool.submit(
+                self.client.upload_part,
+                self.bucket, self.key, self._upload_id, len(self._parts) + 1, part,
+            )
+        )
+
+    def commit(self) -> None:
+        """Upload the rest and complete the upload (or PUT a small object)."""
+        try:
+            if self._upload_id is None:
+                self.client.put_object(self.bucket, self.key, bytes(self._buffer))
+                return
+            if self._buffer:
+                self._send(bytes(self._buffer))
+            etags = [future.result() for future in self._parts]
+            self.client.complete_multipart_upload(self.bucket, self.key, self._upload_id, etags)
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._buffer.clear()
+
+    def abort(self) -> None:
+        """Abort the multipart upload, if one was started."""
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+        for future in self._parts:
+            future.exception()
+        upload_id, self._upload_id = self._upload_id, None
+        self.client.abort_multipart_upload(self.bucket, self.key, upload_id)
+
+
+class S3Storage:
+    """
+    Storage backend storing objects in an S3 bucket below a key prefix.
+
+    Attributes:
+        client (S3Client): Client sending the requests.
+        bucket (str): Bucket name.
+        prefix (str): Key prefix, e.g. "videos/".
+        part_size (int): Part size of the writers.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str,
+        prefix: str = "",
+        part_size: int = PART_SIZE,
+        upload_workers: int = 4,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            client (S3Client): Client sending the requests.
+            bucket (str): Bucket name.
+            prefix (str): Key prefix; a "/" is appended to non-empty
+                prefixes. Defaults to "".
+            part_size (int): Part size of the writers. Defaults to PART_SIZE.
+            upload_workers (int): Threads uploading parts of all writers.
+                Defaults to 4.
+        """
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.part_size = part_size
+        self._pool = ThreadPoolExecutor(upload_workers, thread_name_prefix="s3-upload")
+
+    def key(self, name: str) -> str:
+        """Return the object key of a name."""
+        return self.prefix + name
+
+    def exists(self, name: str) -> bool:
+        """Return True if the object exists (HEAD request)."""
+        return self.client.head_object(self.bucket, self.key(name))
+
+    def writer(self, name: str) -> S3MultipartWriter:
+        """Start a multipart writer for a name."""
+        return S3MultipartWriter(
+            self.client, self.bucket, self.key(name), self._pool, self.part_size
+        )
+
+    def location(self, name: str) -> str:
+        """Return the s3:// URL of a name."""
+        return f"s3://{self.bucket}/{self.key(name)}"
+
+    def close(self) -> None:
+        """Wait for running part uploads and stop the upload pool."""
+        self._pool.shutdown(wait=True)
@@ -67,6 +67,17 @@ class StatsManager:
         """
         self.failed += 1
 
+    def record_late_failure(self) -> None:
+        """
+        Turn a recorded success into a failure.
+
+        This method should be called when work that continues in the
+        background after a download was counted as successful (such as
+        post-processing or moving a staged file) fails.
+        """
+        self.success -= 1
+        self.failed += 1
+
     def record_skip(self) -> None:
         """
         Increment the skip counter by one.
@@ -0,0 +1,315 @@
+"""
+Storage backends downloads are written to, and the uploader feeding them.
+
+yt-dlp always downloads into the save directory. With a storage backend,
+the StorageUploader tails every file while yt-dlp writes it (driven by the
+download's progress hooks) and streams the new bytes into a storage writer,
+so a multipart upload to object storage runs alongside the download instead
+of in a second pass. When the download succeeds, DownloaderCore commits the
+final file: the object is published atomically and the local copy removed.
+Intermediate files (the separate parts of a merged format, or the source of
+an audio extraction) are aborted, and a final file that was never tailed
+(e.g. a merge output) is uploaded whole on commit.
+
+Classes:
+    LocalWriter: Writer publishing a temporary file with an atomic rename
+    LocalStorage: Storage backend for a local directory
+    StorageFileChecker: IFileChecker looking up files in a storage backend
+    StorageUploader: Streams downloads into a storage backend
+
+Functions:
+    create_storage: Create the backend of a storage URL
+
+Example:
+    >>> storage = create_storage("s3://media/videos", endpoint="http://127.0.0.1:9000")
+    >>> uploader = StorageUploader(storage)
+    >>> executor = DownloadExecutor(logger, [uploader.progress_hook])
+    >>> executor.execute_download(url, opts)
+    >>> uploader.commit(executor.last_transfer().path)
+    's3://media/videos/Title.mp4'
+"""
+
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any, BinaryIO, Dict, Optional
+from urllib.parse import urlsplit
+
+from yt_dl_cli.interfaces.interfaces import IStorageBackend, IStorageWriter
+from yt_dl_cli.utils.s3 import S3Client, S3Storage
+
+READ_SIZE = 1024 * 1024
+"""Bytes a tailed file must grow by before they are read and uploaded."""
+
+
+class LocalWriter:
+    """
+    Writer for LocalStorage.
+
+    Data goes to a hidden temporary file in the target directory, which is
+    fsynced and renamed over the target on commit, so the file appears
+    complete or not at all.
+    """
+
+    def __init__(self, target: Path) -> None:
+        """Create the temporary file next to the target."""
+        self.target = target
+        # pylint: disable-next=consider-using-with
+        self._file = tempfile.NamedTemporaryFile(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False
+        )
+
+    def write(self, data: bytes) -> None:
+        """Append data to the temporary file."""
+        self._file.write(data)
+
+    def commit(self) -> None:
+        """Flush the temporary file and rename it over the target."""
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self._file.name, self.target)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """Delete the temporary file."""
+        self._file.close()
+        Path(self._file.name).unlink(missing_ok=True)
+
+
+class LocalStorage:
+    """
+    Storage backend for a local directory, e.g. a mounted network share.
+
+    Attributes:
+        root (Path): Directory objects are stored in (created if missing).
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Use a directory, creating it if needed."""
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def exists(self, name: str) -> bool:
+        """Return True if the file exists."""
+        return (self.root / name).is_file()
+
+    def writer(self, name: str) -> LocalWriter:
+        """Start writing a file."""
+        return LocalWriter(self.root / name)
+
+    def location(self, name: str) -> str:
+        """Return the path of a file."""
+        return str(self.root / name)
+
+
+class StorageFileChecker:
+    """
+    File checker looking up downloads in a storage backend by file name.
+
+    Replaces FileSystemChecker when files are moved to storage, so a file
+    that was already uploaded is skipped.
+    """
+
+    def __init__(self, storage: IStorageBackend) -> None:
+        """Check files in a storage backend."""
+        self.storage = storage
+
+    def exists(self, filepath: Path) -> bool:
+        """Return True if the storage holds an object named like the file."""
+        return self.storage.exists(filepath.name)
+
+
+class _Upload:
+    """A file being tailed into a storage writer."""
+
+    def __init__(self, writer: IStorageWriter) -> None:
+        self.writer = writer
+        self.offset = 0
+        self._path: Optional[str] = None
+        self._file: Optional[BinaryIO] = None
+
+    def pump(self, path: str) -> None:
+        """Write everything the file holds beyond the uploaded offset."""
+        if path != self._path:
+            self.close()
+            # pylint: disable-next=consider-using-with
+            self._file = open(path, "rb")
+            self._path = path
+        assert self._file is not None
+        self._file.seek(self.offset)
+        while True:
+            data = self._file.read(READ_SIZE)
+            if not data:
+                return
+            self.writer.write(data)
+            self.offset += len(data)
+
+    def close(self) -> None:
+        """Close the tailed file."""
+        if self._file is not None:
+            self._file.close()
+        self._file = self._path = None
+
+
+class StorageUploader:
+    """
+    Streams downloaded files into a storage backend while they are written.
+
+    progress_hook must be installed on the download executor; commit() and
+    discard() are called by DownloaderCore in the same download thread once
+    the outcome is known. Uploads are tracked per thread, so concurrent
+    downloads do not interfere.
+
+    Attributes:
+        storage (IStorageBackend): Backend receiving the files.
+        keep_local (bool): Keep the local copy after a commit.
+    """
+
+    def __init__(self, storage: IStorageBackend, keep_local: bool = False) -> None:
+        """
+        Initialize the uploader.
+
+        Args:
+            storage (IStorageBackend): Backend receiving the files.
+            keep_local (bool): Keep the local copy after a commit. Defaults
+                to False (the file is moved to storage).
+        """
+        self.storage = storage
+        self.keep_local = keep_local
+        self._local = threading.local()
+
+    def _uploads(self) -> Dict[str, _Upload]:
+        """Return the calling thread's uploads keyed by final file name."""
+        uploads = getattr(self._local, "uploads", None)
+        if uploads is None:
+            uploads = self._local.uploads = {}
+        return uploads
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp progress hook uploading what was written since the last call.
+
+        Reads happen once at least READ_SIZE new bytes were reported, and
+        for the rest of the file when it is finished. A file that shrinks
+        (yt-dlp restarted it) is uploaded again from the start.
+
+        Args:
+            status (Dict[str, Any]): yt-dlp progress dictionary.
+        """
+        filename = status.get("filename")
+        if not filename or status.get("status") not in ("downloading", "finished"):
+            return
+        uploads = self._uploads()
+        upload = uploads.get(filename)
+        if upload is None:
+            upload = uploads[filename] = _Upload(self.storage.writer(Path(filename).name))
+        finished = status["status"] == "finished"
+        path = filename if finished else status.get("tmpfilename") or filename
+        written = status.get("downloaded_bytes") or 0
+        if written < upload.offset:
+            self._abort(upload)
+            upload = uploads[filename] = _Upload(self.storage.writer(Path(filename).name))
+        if finished or written - upload.offset >= READ_SIZE:
+            try:
+                upload.pump(path)
+            except OSError:
+                # do not fail the download: commit() uploads the file whole
+                del uploads[filename]
+                self._abort(upload)
+
+    def commit(self, path: str) -> str:
+        """
+        Publish the final file of the calling thread's download.
+
+        The file's upload is completed (or the file is uploaded whole if it
+        was not tailed), every other upload of the thread is aborted, and
+        the local file is removed unless keep_local is set.
+
+        Args:
+            path (str): Final local path of the download.
+
+        Returns:
+            str: Storage location of the file.
+
+        Raises:
+            OSError: If the file cannot be read or stored; the local file is
+                kept.
+        """
+        uploads = self._uploads()
+        name = Path(path).name
+        upload = uploads.pop(path, None) or _Upload(self.storage.writer(name))
+        try:
+            upload.pump(path)
+            upload.close()
+            upload.writer.commit()
+        except BaseException:
+            upload.close()
+            upload.writer.abort()
+            raise
+        finally:
+            self.discard()
+        location = self.storage.location(name)
+        if not self.keep_local and not _same_file(path, location):
+            Path(path).unlink(missing_ok=True)
+        return location
+
+    def discard(self) -> None:
+        """Abort all uploads of the calling thread (e.g. after a failed download)."""
+        uploads = self._uploads()
+        while uploads:
+            self._abort(uploads.popitem()[1])
+
+    @staticmethod
+    def _abort(upload: _Upload) -> None:
+        """Close an upload's file and abort its writer, ignoring storage errors."""
+        upload.close()
+        try:
+            upload.writer.abort()
+        except OSError:
+            pass
+
+
+def _same_file(path: str, location: str) -> bool:
+    """Return True if a storage location is the local file itself."""
+    try:
+        return os.path.samefile(path, location)
+    except OSError:
+        return False
+
+
+def create_storage(url: str, endpoint: Optional[str] = None) -> IStorageBackend:
+    """
+    Create the storage backend of a URL.
+
+    ``s3://bucket/prefix`` selects S3Storage; credentials and region are
+    read from the standard AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY,
+    AWS_SESSION_TOKEN and AWS_REGION (or AWS_DEFAULT_REGION) environment
+    variables, the endpoint from AWS_ENDPOINT_URL unless given. Anything
+    else (a path or a file:// URL) selects LocalStorage.
+
+    Args:
+        url (str): Storage URL.
+        endpoint (Optional[str]): S3 endpoint URL of a compatible server.
+            Defaults to AWS_ENDPOINT_URL or AWS.
+
+    Returns:
+        IStorageBackend: The backend.
+    """
+    parts = urlsplit(url)
+    if parts.scheme == "s3":
+        client = S3Client(
+            endpoint or os.environ.get("AWS_ENDPOINT_URL"),
+            os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or "us-east-1",
+            os.environ.get("AWS_ACCESS_KEY_ID"),
+            os.environ.get("AWS_SECRET_ACCESS_KEY"),
+            os.environ.get("AWS_SESSION_TOKEN"),
+        )
+        return S3Storage(client, parts.netloc, parts.path)
+    if parts.scheme == "file":
+        return LocalStorage(Path(parts.path))
+    return LocalStorage(Path(url))
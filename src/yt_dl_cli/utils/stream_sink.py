@@ -0,0 +1,209 @@
+"""
+Raw and framed output of streamed media.
+
+Stream mode writes media bytes to stdout or a named pipe instead of files.
+A single URL is written raw: the target receives exactly the bytes of the
+media file. A batch is written in a framed container, because several
+workers stream at the same time and their data is interleaved::
+
+    header  = b"YTDLMUX" + version (1 byte, currently 1)
+    frame   = type (1 byte) + stream id (uint32, big endian)
+              + payload length (uint32, big endian) + payload
+    type    = b"S" (start, JSON payload: url, title, ext, format_id, filesize)
+            | b"D" (data, media bytes)
+            | b"E" (end, JSON payload: status "finished" or "error", bytes,
+                    error message)
+
+Every URL gets a new stream id, its frames arrive in order, and frames are
+never split by frames of other streams.
+
+Classes:
+    StreamSink: Raw or framed writer shared by all workers
+
+Functions:
+    read_frames: Decode a framed stream
+
+Example:
+    >>> for kind, stream_id, payload in read_frames(sys.stdin.buffer):
+    ...     if kind == FRAME_START:
+    ...         print(stream_id, json.loads(payload)["title"])
+"""
+
+import itertools
+import json
+import os
+from pathlib import Path
+import stat
+import struct
+import sys
+import threading
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple
+
+STDOUT = "-"
+"""Stream target meaning standard output."""
+
+AUTO = "auto"
+"""Raw framing for a single URL, framed for batches."""
+
+RAW = "raw"
+"""Media bytes only (a single URL)."""
+
+FRAMED = "framed"
+"""Multiplexed frames (any number of URLs)."""
+
+FRAMINGS = (AUTO, RAW, FRAMED)
+"""All framing modes."""
+
+MAGIC = b"YTDLMUX\x01"
+"""Header of a framed stream."""
+
+FRAME_START = b"S"
+"""Frame type starting a stream (JSON payload)."""
+
+FRAME_DATA = b"D"
+"""Frame type carrying media bytes."""
+
+FRAME_END = b"E"
+"""Frame type ending a stream (JSON payload)."""
+
+_FRAME_HEADER = struct.Struct(">cII")
+
+
+def read_frames(stream: BinaryIO) -> Iterator[Tuple[bytes, int, bytes]]:
+    """
+    Decode a framed stream.
+
+    Args:
+        stream (BinaryIO): Readable binary stream positioned at the header.
+
+    Yields:
+        Tuple[bytes, int, bytes]: Frame type, stream id and payload.
+
+    Raises:
+        ValueError: If the header is missing or a frame is truncated.
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a framed yt-dl-cli stream")
+    while True:
+        header = stream.read(_FRAME_HEADER.size)
+        if not header:
+            return
+        if len(header) < _FRAME_HEADER.size:
+            raise ValueError("truncated frame header")
+        kind, stream_id, length = _FRAME_HEADER.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            raise ValueError("truncated frame payload")
+        yield kind, stream_id, payload
+
+
+class StreamSink:
+    """
+    Thread-safe writer of raw or framed media streams.
+
+    The target is opened on the first write, so opening a named pipe (which
+    blocks until a reader connects) does not delay start-up. A missing named
+    pipe path is created with mkfifo.
+
+    Attributes:
+        target (str): "-" for stdout, or the path of a named pipe (or file).
+        framed (bool): Whether frames are written instead of raw bytes.
+    """
+
+    def __init__(
+        self, target: str, framed: bool, opener: Optional[Callable[[], BinaryIO]] = None
+    ) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            target (str): "-" for stdout, or a path.
+            framed (bool): Write the framed container instead of raw bytes.
+            opener (Optional[Callable[[], BinaryIO]]): Opens the target;
+                injectable for testing. Defaults to stdout or the path.
+        """
+        self.target = target
+        self.framed = framed
+        self._opener = opener or self._open
+        self._stream: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @property
+    def name(self) -> str:
+        """str: Printable name of the target."""
+        return "<stdout>" if self.target == STDOUT else self.target
+
+    def _open(self) -> BinaryIO:
+        """Open stdout or the named pipe (created if missing)."""
+        if self.target == STDOUT:
+            return sys.stdout.buffer
+        path = Path(self.target)
+        if not path.exists():
+            os.mkfifo(path)
+        # pylint: disable-next=consider-using-with
+        return open(path, "wb", buffering=0 if stat.S_ISFIFO(path.stat().st_mode) else -1)
+
+    def _write(self, *chunks: bytes) -> None:
+        """Write chunks as one unit, opening the target first if needed."""
+        with self._lock:
+            if self._stream is None:
+                self._stream = self._opener()
+                if self.framed:
+                    self._stream.write(MAGIC)
+            for chunk in chunks:
+                self._stream.write(chunk)
+
+    def _frame(self, kind: bytes, stream_id: int, payload: bytes) -> None:
+        """Write one frame."""
+        self._write(_FRAME_HEADER.pack(kind, stream_id, len(payload)), payload)
+
+    def start(self, meta: Dict[str, Any]) -> int:
+        """
+        Begin a new stream.
+
+        Args:
+            meta (Dict[str, Any]): JSON-serializable description of the item.
+
+        Returns:
+            int: Id of the new stream.
+        """
+        stream_id = next(self._ids)
+        if self.framed:
+            self._frame(FRAME_START, stream_id, json.dumps(meta).encode("utf-8"))
+        return stream_id
+
+    def data(self, stream_id: int, chunk: bytes) -> None:
+        """Write media bytes of a stream."""
+        if self.framed:
+            self._frame(FRAME_DATA, stream_id, chunk)
+        else:
+            self._write(chunk)
+
+    def end(self, stream_id: int, meta: Dict[str, Any]) -> None:
+        """
+        Finish a stream.
+
+        Args:
+            stream_id (int): Id returned by start().
+            meta (Dict[str, Any]): Outcome (status, bytes, error).
+        """
+        if self.framed:
+            self._frame(FRAME_END, stream_id, json.dumps(meta).encode("utf-8"))
+        self.flush()
+
+    def flush(self) -> None:
+        """Flush the target, if it is open."""
+        with self._lock:
+            if self._stream is not None:
+                self._stream.flush()
+
+    def close(self) -> None:
+        """Flush and close the target (stdout is only flushed)."""
+        with self._lock:
+            stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        stream.flush()
+        if stream is not sys.stdout.buffer:
+            stream.close()
@@ -0,0 +1,154 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Aggregate download throughput measurement.
+
+This module provides the ThroughputMonitor class, a thread-safe sink for
+yt-dlp progress hooks. Every worker thread reports its progress to the same
+monitor, which turns the per-file ``downloaded_bytes`` counters into byte
+deltas and keeps them in a sliding time window. The result is the aggregate
+throughput of the whole running batch, which adaptive strategies use to plan
+how much data the remaining items can afford.
+
+Classes:
+    ThroughputMonitor: Sliding-window aggregate throughput meter
+
+Example:
+    >>> monitor = ThroughputMonitor(window=30.0)
+    >>> opts = {"progress_hooks": [monitor.progress_hook]}
+    >>> # ... downloads run with opts in several threads ...
+    >>> monitor.rate()  # bytes per second over the last 30 seconds
+    1843200.0
+"""
+
+from collections import deque
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+
+class ThroughputMonitor:
+    """
+    Thread-safe sliding-window throughput meter fed by yt-dlp progress hooks.
+
+    yt-dlp reports cumulative ``downloaded_bytes`` per file. The monitor keeps
+    the last reported value of every active file, records the increase as a
+    timestamped sample and drops samples older than the window. Files that
+    report a total size are also tracked as outstanding work until they
+    finish, so planners can account for bytes already committed to in-flight
+    downloads.
+
+    Attributes:
+        window (float): Length of the measurement window in seconds.
+        min_span (float): Minimum observation time before a rate is reported.
+    """
+
+    def __init__(
+        self,
+        window: float = 30.0,
+        min_span: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            window (float): Length of the measurement window in seconds.
+                Defaults to 30.0.
+            min_span (float): Minimum time since the measurement started before
+                rate() returns a value. The first progress report counts as
+                the start of the measurement. Defaults to 1.0.
+            clock (Callable[[], float]): Monotonic clock, injectable for
+                testing. Defaults to time.monotonic.
+        """
+        self.window = window
+        self.min_span = min_span
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._samples: Deque[Tuple[float, int]] = deque()
+        self._window_bytes = 0
+        self._started: Optional[float] = None
+        self._active: Dict[str, Tuple[int, Optional[int]]] = {}
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp progress hook recording the bytes transferred since the last call.
+
+        Args:
+            status (Dict[str, Any]): Progress dictionary passed by yt-dlp.
+        """
+        key = status.get("filename") or status.get("tmpfilename")
+        if not key:
+            return
+        downloaded = status.get("downloaded_bytes") or 0
+        total = status.get("total_bytes") or status.get("total_bytes_estimate")
+        with self._lock:
+            if self._started is None:
+                self._started = self._clock()
+            previous = self._active.get(key, (0, None))[0]
+            if downloaded > previous:
+                self._add_sample(downloaded - previous)
+            if status.get("status") == "downloading":
+                self._active[key] = (max(downloaded, previous), total)
+            else:
+                self._active.pop(key, None)
+
+    def add_bytes(self, count: int) -> None:
+        """
+        Record bytes transferred outside of yt-dlp progress reporting.
+
+        Args:
+            count (int): Number of bytes transferred just now.
+        """
+        if count > 0:
+            with self._lock:
+                self._add_sample(count)
+
+    def rate(self) -> Optional[float]:
+        """
+        Return the aggregate throughput over the measurement window.
+
+        Returns:
+            Optional[float]: Bytes per second, or None if nothing has been
+            measured for at least ``min_span`` seconds yet.
+        """
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            if self._started is None:
+                return None
+            span = min(now - self._started, self.window)
+            if span < self.min_span:
+                return None
+            return self._window_bytes / span
+
+    def outstanding_bytes(self) -> int:
+        """
+        Return the bytes still to be transferred by in-flight downloads.
+
+        Only files whose total size is known (or estimated by yt-dlp) count.
+
+        Returns:
+            int: Sum of ``total - downloaded`` over active files.
+        """
+        with self._lock:
+            return sum(
+                max(total - downloaded, 0)
+                for downloaded, total in self._active.values()
+                if total
+            )
+
+    def _add_sample(self, count: int) -> None:
+        """Append a sample; the caller must hold the lock."""
+        now = self._clock()
+        if self._started is None:
+            self._started = now
+        self._samples.append((now, count))
+        self._window_bytes += count
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Drop samples older than the window; the caller must hold the lock."""
+        cutoff = now - self.window
+        while self._samples and self._samples[0][0] < cutoff:
+            self._window_bytes -= self._samples.popleft()[1]
@@ -0,0 +1,504 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Per-URL lifecycle tracing.
+
+This module records trace spans for every processed URL and exports them as
+OpenTelemetry (OTLP) JSON, so slow items can be analysed span by span in any
+OTLP-aware tool (e.g. Jaeger or Grafana Tempo via the collector's file
+receiver) without adding an OpenTelemetry dependency.
+
+Every URL gets one trace. Its root span ("url") covers the item from the
+moment it is queued until it is done, with child spans for the lifecycle
+phases::
+
+    url                       host, url, outcome
+    ├── queued                time spent waiting for a free worker
+    ├── extracting            extractor, video id
+    ├── checking              target path
+    └── downloading           format selector, format ids, bytes
+        └── merging           post-processors run by yt-dlp
+
+The active span is kept per thread, so code running inside a span (including
+yt-dlp hooks called from the worker thread) parents its spans correctly
+without passing span objects around.
+
+Finished spans are handed to the exporter through an unbounded queue; a
+background thread batches them and appends one OTLP ``ExportTraceServiceRequest``
+JSON document per line to the output file. The hot path therefore only pays
+for building the span and a queue put.
+
+Classes:
+    Span: A single timed operation with attributes and events
+    NullTracer: No-op tracer used when tracing is disabled
+    Tracer: Creates spans and tracks the active span per thread
+    OTLPFileExporter: Batching background writer of OTLP JSON lines
+
+Example:
+    >>> tracer = Tracer(OTLPFileExporter(Path("trace.jsonl")))
+    >>> with tracer.span("url", url=url) as root:
+    ...     with tracer.span("extracting"):
+    ...         info = extractor.extract_record(url, opts)
+    >>> tracer.close()
+"""
+
+import contextlib
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+# OTLP status codes (opentelemetry.proto.trace.v1.Status.StatusCode).
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+# OTLP span kind INTERNAL.
+_KIND_INTERNAL = 1
+
+
+def url_host(url: str) -> str:
+    """Return the host name of a URL, or an empty string if it has none."""
+    return urlsplit(url).hostname or ""
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Convert an attribute value to an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert an attribute dictionary to an OTLP KeyValue list."""
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Span:
+    """
+    A single timed operation of a trace.
+
+    Attributes:
+        name (str): Operation name.
+        trace_id (str): 32 hex digit id shared by all spans of a trace.
+        span_id (str): 16 hex digit id of this span.
+        parent_id (Optional[str]): span_id of the parent span, if any.
+        start_ns (int): Start time in nanoseconds since the epoch.
+        end_ns (Optional[int]): End time, None while the span is open.
+        attributes (Dict[str, Any]): Span attributes.
+        events (List[Dict[str, Any]]): Timestamped events within the span.
+        error (Optional[str]): Error description if the operation failed.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+        "attributes", "events", "error", "_tracer",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"],
+        start_ns: int,
+        attributes: Dict[str, Any],
+    ) -> None:
+        """Initialize an open span; use Tracer.start_span instead."""
+        self.name = name
+        self.trace_id: str = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id: str = os.urandom(8).hex()
+        self.parent_id: Optional[str] = parent.span_id if parent else None
+        self.start_ns = start_ns
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.events: List[Dict[str, Any]] = []
+        self.error: Optional[str] = None
+        self._tracer = tracer
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set (or replace) an attribute."""
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        """Record a timestamped event."""
+        self.events.append(
+            {"name": name, "time_ns": self._tracer.clock(), "attributes": attributes}
+        )
+
+    def set_error(self, error: Any) -> None:
+        """Mark the operation as failed."""
+        self.error = str(error)
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """End the span and hand it to the exporter (only the first call counts)."""
+        if self.end_ns is None:
+            self.end_ns = self._tracer.clock() if end_ns is None else end_ns
+            self._tracer.exporter.export(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Return the span as an OTLP JSON Span object."""
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": (
+                {"code": _STATUS_ERROR, "message": self.error}
+                if self.error is not None
+                else {"code": _STATUS_OK}
+            ),
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.events:
+            span["events"] = [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": str(event["time_ns"]),
+                    "attributes": _otlp_attributes(event["attributes"]),
+                }
+                for event in self.events
+            ]
+        return span
+
+
+class _NullSpan:
+    """Span stand-in that ignores everything."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        """Ignore the event."""
+
+    def set_error(self, error: Any) -> None:
+        """Ignore the error."""
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """Do nothing."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """
+    No-op tracer with the Tracer interface.
+
+    Used when tracing is disabled so callers never need to check whether a
+    tracer is present.
+    """
+
+    enabled = False
+
+    def clock(self) -> int:
+        """Return the current time in nanoseconds."""
+        return time.time_ns()
+
+    def current(self) -> Any:
+        """Return a span that ignores everything."""
+        return _NULL_SPAN
+
+    def start_span(
+        self,
+        name: str,
+        parent: Any = None,
+        start_ns: Optional[int] = None,
+        **attributes: Any,
+    ) -> Any:
+        """Return a span that ignores everything."""
+        del name, parent, start_ns, attributes
+        return _NULL_SPAN
+
+    def span(self, name: str, **attributes: Any) -> contextlib.AbstractContextManager:
+        """Return a context manager yielding a span that ignores everything."""
+        del name, attributes
+        return contextlib.nullcontext(_NULL_SPAN)
+
+    def run(self, span: Any, handler: Callable[[str], Any], item: str) -> Any:
+        """Call ``handler(item)`` directly."""
+        del span
+        return handler(item)
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """Ignore yt-dlp progress."""
+
+    def postprocessor_hook(self, status: Dict[str, Any]) -> None:
+        """Ignore yt-dlp post-processing."""
+
+    def close(self) -> None:
+        """Do nothing."""
+
+
+class Tracer(NullTracer):
+    """
+    Creates spans and keeps track of the active span of every thread.
+
+    Attributes:
+        exporter (OTLPFileExporter): Receives every finished span.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        exporter: "OTLPFileExporter",
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter (OTLPFileExporter): Exporter of finished spans.
+            clock (Callable[[], int]): Wall clock in nanoseconds. Defaults to
+                time.time_ns.
+        """
+        self.exporter = exporter
+        self._clock = clock
+        self._local = threading.local()
+
+    def clock(self) -> int:
+        """Return the current time in nanoseconds."""
+        return self._clock()
+
+    def current(self) -> Any:
+        """Return the active span of the calling thread (or a no-op span)."""
+        return self._active() or _NULL_SPAN
+
+    def _active(self) -> Optional[Span]:
+        """Return the active span of the calling thread, if any."""
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    def start_span(
+        self,
+        name: str,
+        parent: Any = None,
+        start_ns: Optional[int] = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Start a span without activating it.
+
+        Args:
+            name (str): Operation name.
+            parent (Optional[Span]): Parent span. Defaults to the active span
+                of the calling thread; a new trace is started if there is none.
+            start_ns (Optional[int]): Start time. Defaults to now.
+            **attributes: Initial span attributes.
+
+        Returns:
+            Span: The open span; call ``end()`` when the operation is over.
+        """
+        if parent is None:
+            parent = self.current()
+        return Span(
+            self,
+            name,
+            parent if isinstance(parent, Span) else None,
+            self.clock() if start_ns is None else start_ns,
+            attributes,
+        )
+
+    @contextlib.contextmanager
+    def activate(self, span: Span) -> Iterator[Span]:
+        """
+        Make ``span`` the active span of the calling thread within the block.
+
+        Post-processor spans still open when the block exits (yt-dlp raised
+        before reporting "finished") are ended as failed.
+        """
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            while stack and stack[-1] is not span:
+                leaked = stack.pop()
+                leaked.set_error("post-processor did not finish")
+                leaked.end()
+            stack.pop()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:  # type: ignore[override]
+        """
+        Run the block in a new child span of the active span.
+
+        The span is active within the block, ended on exit and marked as
+        failed if the block raises.
+
+        Args:
+            name (str): Operation name.
+            **attributes: Initial span attributes.
+        """
+        span = self.start_span(name, **attributes)
+        with self.activate(span):
+            try:
+                yield span
+            except BaseException as e:
+                span.set_error(repr(e))
+                raise
+            finally:
+                span.end()
+
+    def run(self, span: Any, handler: Callable[[str], Any], item: str) -> Any:
+        """
+        Call ``handler(item)`` in the calling thread with ``span`` active.
+
+        Used by the orchestrator to carry the root span of an item into the
+        worker thread that processes it.
+        """
+        with self.activate(span):
+            return handler(item)
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp progress hook adding format ids and bytes to the active span.
+
+        Args:
+            status (Dict[str, Any]): Progress dictionary passed by yt-dlp.
+        """
+        span = self._active()
+        if status.get("status") != "finished" or span is None:
+            return
+        format_id = (status.get("info_dict") or {}).get("format_id")
+        if format_id is not None:
+            format_ids = span.attributes.get("format_ids", [])
+            span.set_attribute("format_ids", [*format_ids, str(format_id)])
+        received = status.get("downloaded_bytes") or status.get("total_bytes") or 0
+        span.set_attribute("bytes", span.attributes.get("bytes", 0) + int(received))
+
+    def postprocessor_hook(self, status: Dict[str, Any]) -> None:
+        """
+        yt-dlp post-processor hook recording a span per post-processor run.
+
+        Merging separate video and audio streams is reported as "merging",
+        every other post-processor as "postprocessing". An "error" status ends
+        the open span as failed.
+
+        Args:
+            status (Dict[str, Any]): Post-processor status passed by yt-dlp.
+        """
+        name = str(status.get("postprocessor"))
+        if status.get("status") == "started":
+            started = self.start_span(
+                "merging" if name == "Merger" else "postprocessing", postprocessor=name
+            )
+            self._local.__dict__.setdefault("stack", []).append(started)
+        elif status.get("status") in ("finished", "error"):
+            active = self._active()
+            if active is not None and active.attributes.get("postprocessor") == name:
+                self._local.stack.pop()
+                if status.get("status") == "error":
+                    active.set_error(status.get("error") or f"{name} failed")
+                active.end()
+
+    def close(self) -> None:
+        """Flush and close the exporter."""
+        self.exporter.close()
+
+
+class OTLPFileExporter:
+    """
+    Background writer of finished spans as OTLP JSON lines.
+
+    Spans are queued by ``export`` and written by a daemon thread in batches
+    of up to ``batch_size`` spans, at least every ``flush_interval`` seconds.
+    Each line of the output file is one OTLP ExportTraceServiceRequest, the
+    format of the OpenTelemetry collector's file exporter.
+
+    Attributes:
+        path (Path): Output file (appended to).
+        service_name (str): Value of the ``service.name`` resource attribute.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+        service_name: str = "yt-dl-cli",
+    ) -> None:
+        """
+        Initialize the exporter and start its writer thread.
+
+        Args:
+            path (Path): Output file; parent directories are created.
+            batch_size (int): Maximum spans per written line. Defaults to 512.
+            flush_interval (float): Maximum seconds a span waits in memory.
+                Defaults to 1.0.
+            service_name (str): ``service.name`` resource attribute.
+                Defaults to "yt-dl-cli".
+        """
+        self.path = Path(path)
+        self.service_name = service_name
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._closed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._worker, name="trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        """Queue a finished span for writing (never blocks)."""
+        self._queue.put(span)
+
+    def _worker(self) -> None:
+        """Drain the queue in batches until close() posts the sentinel."""
+        with open(self.path, "a", encoding="utf-8") as output:
+            running = True
+            while running:
+                batch: List[Span] = []
+                deadline = time.monotonic() + self._flush_interval
+                while len(batch) < self._batch_size:
+                    try:
+                        span = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if span is None:
+                        running = False
+                        break
+                    batch.append(span)
+                if batch:
+                    output.write(json.dumps(self._request(batch), separators=(",", ":")))
+                    output.write("\n")
+                    output.flush()
+
+    def _request(self, spans: List[Span]) -> Dict[str, Any]:
+        """Wrap spans in an OTLP ExportTraceServiceRequest."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes({"service.name": self.service_name})
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "yt_dl_cli"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def close(self) -> None:
+        """Write all queued spans and stop the writer thread."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
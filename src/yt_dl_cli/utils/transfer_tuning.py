@@ -0,0 +1,323 @@
+# pylint: disable=too-many-instance-attributes
+
+"""
+Transfer buffer and HTTP chunk size settings with per-host calibration.
+
+yt-dlp's HTTP downloader reads a response in blocks of ``buffersize`` bytes
+(1 KiB by default, then resized to the measured rate unless
+``noresizebuffer`` is set) and, with ``http_chunk_size``, requests the file
+in ranges of that size instead of one response. The best values depend on
+the link and on the server: large blocks save system calls on fast links,
+ranged requests avoid per-connection throttling on some CDNs.
+
+The TransferTuner hands out the settings for every download. With fixed
+settings it returns them as configured. In calibration mode it tries a few
+candidate settings per host: each download of a host that has not been
+calibrated yet is run with the next candidate, and its progress hook
+measures the throughput over the first ``probe_bytes`` of the transfer.
+Once every candidate has been measured, the fastest one is used for all
+further downloads of the host. Measurements and results are stored in a
+JSON file, so calibration carries over to the next runs.
+
+Classes:
+    TransferSettings: buffersize / http_chunk_size / noresizebuffer values
+    TransferTuner: Settings per download with optional per-host calibration
+
+Example:
+    >>> tuner = TransferTuner(path=Path("/downloads/.transfer_tuning.json"))
+    >>> executor = DownloadExecutor(logger, [tuner.progress_hook])
+    >>> opts.update(tuner.settings_for(url).opts())
+"""
+
+from dataclasses import asdict, dataclass, fields, replace
+import json
+import os
+from pathlib import Path
+import statistics
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from yt_dl_cli.i18n.messages import Messages
+from yt_dl_cli.interfaces.interfaces import ILogger
+
+PROBE_BYTES = 4 * 1024 * 1024
+"""Bytes of a download measured for calibration."""
+
+
+@dataclass(frozen=True)
+class TransferSettings:
+    """
+    Transfer options of yt-dlp's HTTP downloader; None keeps yt-dlp's default.
+
+    Attributes:
+        buffer_size (Optional[int]): Initial read block size (``buffersize``).
+        http_chunk_size (Optional[int]): Size of the ranges requested one by
+            one (``http_chunk_size``); None downloads in one request unless
+            the extractor asks for chunks.
+        resize_buffer (Optional[bool]): Whether the block size follows the
+            measured rate (False sets ``noresizebuffer``).
+    """
+
+    buffer_size: Optional[int] = None
+    http_chunk_size: Optional[int] = None
+    resize_buffer: Optional[bool] = None
+
+    @property
+    def key(self) -> str:
+        """str: Compact identifier used in the calibration file."""
+        return ",".join(
+            f"{field.name}={json.dumps(getattr(self, field.name))}" for field in fields(self)
+        )
+
+    def override(self, fixed: "TransferSettings") -> "TransferSettings":
+        """Return these settings with the values that are set in ``fixed``."""
+        return replace(
+            self, **{name: value for name, value in asdict(fixed).items() if value is not None}
+        )
+
+    def opts(self) -> Dict[str, Any]:
+        """
+        Return the yt-dlp options for these settings.
+
+        Returns:
+            Dict[str, Any]: ``buffersize``, ``http_chunk_size`` and
+            ``noresizebuffer`` for the values that are set.
+        """
+        opts: Dict[str, Any] = {}
+        if self.buffer_size is not None:
+            opts["buffersize"] = self.buffer_size
+        if self.http_chunk_size is not None:
+            opts["http_chunk_size"] = self.http_chunk_size
+        if self.resize_buffer is not None:
+            opts["noresizebuffer"] = not self.resize_buffer
+        return opts
+
+
+CANDIDATES = (
+    TransferSettings(),
+    TransferSettings(64 * 1024, None, False),
+    TransferSettings(1024 * 1024, None, False),
+    TransferSettings(64 * 1024, 10 * 1024 * 1024, False),
+    TransferSettings(1024 * 1024, 10 * 1024 * 1024, False),
+)
+"""Settings tried per host: yt-dlp's defaults, fixed blocks, ranged requests."""
+
+
+def host_of(url: str) -> str:
+    """Return the host a URL's downloads are calibrated for ("www." removed)."""
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class _Probe:
+    """Measurement of one download, kept in the downloading thread."""
+
+    def __init__(self, host: str, key: str) -> None:
+        self.host = host
+        self.key = key
+        self.start: Optional[float] = None
+        self.offset = 0
+
+
+class TransferTuner:
+    """
+    Hands out transfer settings per download, calibrating them per host.
+
+    Attributes:
+        settings (TransferSettings): Configured settings; the values that
+            are set take precedence over calibrated ones.
+        path (Optional[Path]): Calibration file. None disables calibration.
+        candidates (List[TransferSettings]): Settings tried per host.
+        probe_bytes (int): Bytes measured per calibration download.
+        samples (int): Measurements per candidate before a host is decided.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        settings: TransferSettings = TransferSettings(),
+        path: Optional[Path] = None,
+        logger: Optional[ILogger] = None,
+        candidates: Sequence[TransferSettings] = CANDIDATES,
+        probe_bytes: int = PROBE_BYTES,
+        samples: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the tuner and load the calibration file, if any.
+
+        Args:
+            settings (TransferSettings): Configured settings. Defaults to
+                yt-dlp's defaults.
+            path (Optional[Path]): Calibration file, created if missing.
+                Defaults to None (no calibration).
+            logger (Optional[ILogger]): Receives a message when a host is
+                calibrated. Defaults to None.
+            candidates (Sequence[TransferSettings]): Settings tried per host.
+                Defaults to CANDIDATES.
+            probe_bytes (int): Bytes measured per calibration download.
+                Defaults to PROBE_BYTES.
+            samples (int): Measurements per candidate. Defaults to 1.
+            clock (Callable[[], float]): Monotonic clock. Defaults to
+                time.monotonic.
+        """
+        self.settings = settings
+        self.path = path
+        self.logger = logger
+        self.candidates: List[TransferSettings] = []
+        for candidate in candidates:
+            candidate = candidate.override(settings)
+            if candidate not in self.candidates:
+                self.candidates.append(candidate)
+        self.probe_bytes = probe_bytes
+        self.samples = samples
+        self.clock = clock
+        self._rates: Dict[str, Dict[str, List[float]]] = {}
+        self._best: Dict[str, TransferSettings] = {}
+        self._running: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if path is not None:
+            self._load(path)
+
+    @property
+    def calibrating(self) -> bool:
+        """bool: Whether downloads are used to calibrate hosts."""
+        return self.path is not None and len(self.candidates) > 1
+
+    def best(self, host: str) -> Optional[TransferSettings]:
+        """Return the calibrated settings of a host, if it was calibrated."""
+        with self._lock:
+            return self._best.get(host)
+
+    def settings_for(self, url: str) -> TransferSettings:
+        """
+        Return the settings for a download started by the calling thread.
+
+        For a host still being calibrated, the candidate with the fewest
+        measurements (running downloads included) is returned and the
+        thread's download is measured by progress_hook.
+
+        Args:
+            url (str): URL about to be downloaded.
+
+        Returns:
+            TransferSettings: Settings to add to the download's options.
+        """
+        self._end_probe()
+        if not self.calibrating:
+            return self.settings
+        host = host_of(url)
+        with self._lock:
+            best = self._best.get(host)
+            if best is not None:
+                return best.override(self.settings)
+            rates = self._rates.setdefault(host, {})
+            running = self._running.setdefault(host, {})
+            candidate = min(
+                self.candidates,
+                key=lambda c: len(rates.get(c.key, ())) + running.get(c.key, 0),
+            )
+            running[candidate.key] = running.get(candidate.key, 0) + 1
+        self._local.probe = _Probe(host, candidate.key)
+        return candidate
+
+    def progress_hook(self, status: Dict[str, Any]) -> None:
+        """
+        Measure the first probe_bytes of a calibration download.
+
+        The measurement starts with the first progress report, so the
+        connection setup of the first request is not part of it.
+
+        Args:
+            status (Dict[str, Any]): yt-dlp progress dictionary.
+        """
+        probe = getattr(self._local, "probe", None)
+        if probe is None:
+            return
+        if status.get("status") != "downloading":
+            self._end_probe()
+            return
+        downloaded = int(status.get("downloaded_bytes") or 0)
+        now = self.clock()
+        if probe.start is None:
+            probe.start, probe.offset = now, downloaded
+            return
+        measured = downloaded - probe.offset
+        if measured >= self.probe_bytes and now > probe.start:
+            self._local.probe = None
+            self._record(probe, measured / (now - probe.start))
+
+    def _end_probe(self) -> None:
+        """Forget the thread's unfinished measurement."""
+        probe = getattr(self._local, "probe", None)
+        if probe is None:
+            return
+        self._local.probe = None
+        with self._lock:
+            self._running[probe.host][probe.key] -= 1
+
+    def _record(self, probe: _Probe, rate: float) -> None:
+        """Store a measurement and decide the host once all candidates are measured."""
+        with self._lock:
+            self._running[probe.host][probe.key] -= 1
+            rates = self._rates[probe.host]
+            rates.setdefault(probe.key, []).append(rate)
+            if probe.host in self._best or any(
+                len(rates.get(c.key, ())) < self.samples for c in self.candidates
+            ):
+                return
+            best = max(
+                self.candidates, key=lambda c: statistics.median(rates.get(c.key, [0.0]))
+            )
+            self._best[probe.host] = best
+        if self.logger is not None:
+            described = ", ".join(f"{name}={value}" for name, value in best.opts().items())
+            self.logger.info(
+                Messages.Tuning.CALIBRATED(host=probe.host, settings=described or "defaults")
+            )
+        self.save()
+
+    def _load(self, path: Path) -> None:
+        """Read the calibration file; an unreadable file starts a new calibration."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            hosts = data["hosts"]
+            for host, entry in hosts.items():
+                self._rates[host] = {
+                    key: [float(rate) for rate in rates]
+                    for key, rates in entry.get("rates", {}).items()
+                }
+                if entry.get("best") is not None:
+                    self._best[host] = TransferSettings(**entry["best"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._rates, self._best = {}, {}
+
+    def save(self) -> None:
+        """Write the measurements and calibrated settings to the calibration file."""
+        if self.path is None:
+            return
+        with self._lock:
+            hosts = {
+                host: {
+                    "best": asdict(self._best[host]) if host in self._best else None,
+                    "rates": rates,
+                }
+                for host, rates in self._rates.items()
+                if rates or host in self._best
+            }
+            data = json.dumps({"version": 1, "hosts": hosts}, indent=2, sort_keys=True)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            if self.logger is not None:
+                self.logger.warning(Messages.Tuning.SAVE_FAILED(path=self.path, error=e))
+
+    def close(self) -> None:
+        """Save the measurements, so calibration continues in the next run."""
+        self.save()
@@ -8,6 +8,12 @@ ensuring that provided values adhere to application requirements.
 from pathlib import Path
 from typing import List
 import argparse
+import re
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$", re.IGNORECASE)
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
 
 
 class ArgValidator:
@@ -46,6 +52,91 @@ class ArgValidator:
             )
         return quality
 
+    @staticmethod
+    def validate_size(value: str) -> int:
+        """Validate a byte size such as '1024', '500K', '1.5G' or '200MiB'."""
+        match = _SIZE_RE.match(value)
+        if not match:
+            raise argparse.ArgumentTypeError(
+                f"'{value}' is not a valid size (examples: 500K, 20M, 1.5G)."
+            )
+        size = int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+        if size < 1:
+            raise argparse.ArgumentTypeError("Size must be greater than zero.")
+        return size
+
+    @staticmethod
+    def validate_duration(value: str) -> float:
+        """Validate a duration in seconds such as '600', '90s', '45m' or '1.5h'."""
+        match = _DURATION_RE.match(value)
+        if not match:
+            raise argparse.ArgumentTypeError(
+                f"'{value}' is not a valid duration (examples: 600, 45m, 1.5h)."
+            )
+        seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2).lower()]
+        if seconds <= 0:
+            raise argparse.ArgumentTypeError("Duration must be greater than zero.")
+        return seconds
+
+    @staticmethod
+    def validate_delay(value: str) -> float:
+        """Validate a non-negative delay in seconds such as '0', '0.05' or '2s'."""
+        match = _DURATION_RE.match(value)
+        if not match:
+            raise argparse.ArgumentTypeError(
+                f"'{value}' is not a valid delay (examples: 0, 0.05, 2s)."
+            )
+        return float(match.group(1)) * _DURATION_UNITS[match.group(2).lower()]
+
+    @staticmethod
+    def validate_fraction(value: str) -> float:
+        """Validate a fraction between 0 and 1 such as '0.05'."""
+        try:
+            fraction = float(value)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"'{value}' is not a valid number.") from exc
+        if not 0.0 <= fraction <= 1.0:
+            raise argparse.ArgumentTypeError("Value must be between 0 and 1.")
+        return fraction
+
+    @staticmethod
+    def validate_count(value: str) -> int:
+        """Validate a non-negative integer such as a cache size."""
+        try:
+            count = int(value)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"'{value}' is not a valid integer.") from exc
+        if count < 0:
+            raise argparse.ArgumentTypeError("Value must not be negative.")
+        return count
+
+    @staticmethod
+    def validate_positive_count(value: str) -> int:
+        """Validate a positive integer such as a batch size."""
+        count = ArgValidator.validate_count(value)
+        if count < 1:
+            raise argparse.ArgumentTypeError("Value must be at least 1.")
+        return count
+
+    @staticmethod
+    def validate_port(value: str) -> int:
+        """Validate a TCP port number (0 lets the system pick a free port)."""
+        try:
+            port = int(value)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"'{value}' is not a valid integer.") from exc
+        if not 0 <= port <= 65535:
+            raise argparse.ArgumentTypeError("Port must be between 0 and 65535.")
+        return port
+
+    @staticmethod
+    def validate_codec_list(value: str) -> List[str]:
+        """Validate a comma-separated list of codec prefixes."""
+        codecs = [codec.strip() for codec in value.split(",") if codec.strip()]
+        if not codecs:
+            raise argparse.ArgumentTypeError("Codec list cannot be empty.")
+        return codecs
+
     @staticmethod
     def validate_url_list(urls: List[str]) -> List[str]:
         """Validate that URLs are properly formatted."""
@@ -0,0 +1,144 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli import api
+from yt_dl_cli.api import download_many, iter_downloads
+from yt_dl_cli.core.records import DownloadResult, DownloadStatus
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.stats_manager import StatsManager
+from yt_dl_cli.utils.tracing import NullTracer
+
+
+class DummyCore:
+    """Core with a fixed outcome per URL and a concurrency counter"""
+
+    def __init__(self):
+        self.stats = StatsManager()
+        self.profiler = NullProfiler()
+        self.tracer = NullTracer()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def download_result(self, url):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(0.01 if "slow" not in url else 0.05)
+            if "boom" in url:
+                raise RuntimeError("unexpected")
+            if "fail" in url:
+                return DownloadResult.failure(url, ValueError("bad format"))
+            return DownloadResult(url, DownloadStatus.DOWNLOADED, path=f"/d/{url}", bytes=10)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def make_config(workers=2):
+    return SimpleNamespace(max_workers=workers)
+
+
+def test_download_many_returns_results_in_input_order():
+    """ Testing of download_many result order and failure reporting  """
+    core = DummyCore()
+    urls = ["slow-1", "fail-2", "", "boom-3", "ok-4"]
+    results = asyncio.run(download_many(urls, make_config(), core=core))
+    assert [r.url for r in results] == ["slow-1", "fail-2", "boom-3", "ok-4"]
+    assert [r.status for r in results] == [
+        DownloadStatus.DOWNLOADED,
+        DownloadStatus.FAILED,
+        DownloadStatus.FAILED,
+        DownloadStatus.DOWNLOADED,
+    ]
+    assert (results[1].error, results[1].message) == ("ValueError", "bad format")
+    assert results[2].error == "RuntimeError"
+    assert results[0].path == "/d/slow-1" and results[0].bytes == 10
+    assert all("queued" in r.timings for r in results)
+    assert core.peak <= 2
+
+
+def test_iter_downloads_streams_with_external_executor():
+    """ Testing of iter_downloads with a caller-provided executor  """
+    core = DummyCore()
+
+    async def collect(pool):
+        seen = []
+        async for result in iter_downloads(
+            (f"url-{i}" for i in range(6)), make_config(3), executor=pool, core=core
+        ):
+            seen.append(result.url)
+        return seen
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        seen = asyncio.run(collect(pool))
+        # the caller's executor is still usable afterwards
+        assert pool.submit(lambda: 42).result() == 42
+    assert sorted(seen) == [f"url-{i}" for i in range(6)]
+    assert core.peak <= 3
+
+
+def test_iter_downloads_stops_early():
+    """ Testing that closing the stream early does not start remaining URLs  """
+    core = DummyCore()
+    calls = []
+    original = core.download_result
+    core.download_result = lambda url: calls.append(url) or original(url)
+
+    async def first():
+        stream = iter_downloads([f"u{i}" for i in range(20)], make_config(2), core=core)
+        result = await stream.__anext__()
+        await stream.aclose()
+        return result
+
+    result = asyncio.run(first())
+    assert result.ok
+    assert len(calls) <= 4
+
+
+def test_owned_core_is_built_and_closed_off_the_event_loop(monkeypatch):
+    """ Testing that creating and closing a core built by the API do not block the loop  """
+    threads = {}
+    core = DummyCore()
+
+    def create(config, logger):
+        threads["create"] = threading.current_thread()
+        return core
+
+    def close(*exc_info):
+        threads["close"] = threading.current_thread()
+
+    core.__exit__ = close
+    monkeypatch.setattr(api.DIContainer, "create_downloader_core", create)
+
+    async def run():
+        threads["loop"] = threading.current_thread()
+        return await download_many(["ok-1"], make_config())
+
+    assert [r.ok for r in asyncio.run(run())] == [True]
+    assert threads["create"] is not threads["loop"]
+    assert threads["close"] is not threads["loop"]
+
+
+def test_download_result_to_dict():
+    """ Testing of DownloadResult serialization  """
+    result = DownloadResult.failure("u", OSError("disk full"), timings={"total": 1.0})
+    assert result.to_dict() == {
+        "url": "u",
+        "status": "failed",
+        "title": None,
+        "path": None,
+        "bytes": 0,
+        "timings": {"total": 1.0},
+        "error": "OSError",
+        "message": "disk full",
+    }
+    assert not result.ok
@@ -0,0 +1,63 @@
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.utils.bandwidth import BandwidthLimiter, TokenBucket
+
+
+def test_bucket_unlimited_does_not_wait():
+    """ Testing that an unlimited bucket never blocks  """
+    bucket = TokenBucket()
+    assert bucket.consume(10**9) == 0.0
+
+
+def test_bucket_shared_between_threads():
+    """ Testing that concurrent consumers share one allowance  """
+    bucket = TokenBucket(200_000, burst=0.1)
+
+    def worker():
+        for _ in range(5):
+            bucket.consume(10_000)
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 100 KB in total, 20 KB burst -> at least 0.4 s at 200 KB/s
+    assert 0.35 <= time.monotonic() - start < 2.0
+
+
+def test_bucket_rate_change_wakes_waiters():
+    """ Testing that lifting the cap releases a blocked consumer  """
+    bucket = TokenBucket(1_000, burst=0.0)
+    waited = []
+    thread = threading.Thread(target=lambda: waited.append(bucket.consume(100_000)))
+    thread.start()
+    time.sleep(0.05)
+    bucket.set_rate(None)
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+    assert waited[0] < 1.0
+    with pytest.raises(ValueError):
+        bucket.set_rate(0)
+
+
+def test_limiter_pays_per_block_delta():
+    """ Testing that the progress hook pays only for newly received bytes  """
+    limiter = BandwidthLimiter()
+    paid = []
+    limiter.bucket.consume = paid.append  # type: ignore
+    limiter.progress_hook({"status": "downloading", "filename": "a", "downloaded_bytes": 100})
+    limiter.progress_hook({"status": "downloading", "filename": "b", "downloaded_bytes": 50})
+    limiter.progress_hook({"status": "downloading", "filename": "a", "downloaded_bytes": 300})
+    limiter.progress_hook({"status": "finished", "filename": "a", "downloaded_bytes": 400})
+    assert paid == [100, 50, 200, 100]
+    limiter.set_rate(1024)
+    assert limiter.rate == 1024
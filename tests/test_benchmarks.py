@@ -0,0 +1,40 @@
+import sys
+import os
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../benchmarks")))
+
+from media_server import MediaServer, MediaServerConfig  # noqa: E402
+from bench_throughput import format_report, run_batch  # noqa: E402
+
+
+def test_media_server_ranges_and_playlists():
+    """ Testing progressive range requests and HLS playlists of the media server  """
+    with MediaServer(MediaServerConfig(file_size=1000, segments=3)) as server:
+        url = server.progressive_urls(1)[0]
+        request = urllib.request.Request(url, headers={"Range": "bytes=100-199"})
+        with urllib.request.urlopen(request) as response:
+            assert response.status == 206
+            assert len(response.read()) == 100
+        with urllib.request.urlopen(server.hls_urls(1)[0]) as response:
+            playlist = response.read().decode()
+        assert playlist.count("#EXTINF") == 3
+        # the handler thread records a response after the body was sent
+        deadline = time.monotonic() + 5
+        while server.stats.requests < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server.stats.requests == 2
+
+
+def test_run_batch_end_to_end(tmp_path):
+    """ Testing a real offline batch of progressive and HLS items  """
+    media = MediaServerConfig(file_size=64 * 1024, segment_size=16 * 1024, segments=2)
+    with MediaServer(media) as server:
+        urls = server.progressive_urls(2) + server.hls_urls(1)
+        result = run_batch(urls, 2, str(tmp_path))
+    assert (result.success, result.failed) == (3, 0)
+    assert result.bytes_received == 2 * 64 * 1024 + 2 * 16 * 1024
+    assert len(result.latencies) == 3
+    assert "workers" in format_report([result])
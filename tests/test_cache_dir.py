@@ -0,0 +1,105 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+from yt_dlp.extractor.common import InfoExtractor
+from yt_dlp.utils import ExtractorError
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.cache_dir import CacheDirStrategy, SharedCacheDir, warmup
+from yt_dl_cli.core.orchestration import DIContainer
+from yt_dl_cli.utils.parser import parse_warmup_arguments
+
+
+class WarmExtractor(InfoExtractor):
+    """Extractor caching player data like the YouTube extractor"""
+
+    _VALID_URL = r"warm://(?P<id>.+)"
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+        if video_id == "broken":
+            raise ExtractorError("player unavailable", expected=True)
+        player = video_id.split("-")[0]
+        self.cache.store("test-player", player, {"sig": player})
+        return {"id": video_id, "title": video_id, "url": "http://127.0.0.1:9/v", "ext": "mp4"}
+
+
+class DummyLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, msg):
+        self.messages.append(str(msg))
+
+    def warning(self, msg):
+        self.messages.append(str(msg))
+
+
+def test_layout_is_versioned(tmp_path):
+    """ Testing that each yt-dlp version gets its own subdirectory  """
+    cache = SharedCacheDir(tmp_path, version="2025.01.01")
+    assert cache.path == tmp_path / "yt-dlp-2025.01.01"
+    assert cache.opts() == {"cachedir": str(cache.path)}
+    assert cache.entries() == {}
+
+
+def test_prepare_removes_stale_temporary_files(tmp_path):
+    """ Testing that only abandoned temporary files are removed  """
+    cache = SharedCacheDir(tmp_path, version="1")
+    section = cache.path / "youtube-sigfuncs"
+    section.mkdir(parents=True)
+    (section / "js_abc.json").write_text("{}")
+    stale = section / "tmpold.tmp"
+    stale.write_text("{")
+    fresh = section / "tmpnew.tmp"
+    fresh.write_text("{")
+    os.utime(stale, (1000.0, 1000.0))
+    os.utime(fresh, (4000.0, 4000.0))
+    assert cache.prepare(max_tmp_age=3600.0, clock=lambda: 5000.0) == 1
+    assert not stale.exists() and fresh.exists()
+    assert cache.entries() == {"youtube-sigfuncs": 1}
+
+
+def test_warmup_populates_cache(tmp_path):
+    """ Testing that warmup extracts URLs into the cache and counts failures  """
+    cache = SharedCacheDir(tmp_path, version="1")
+    logger = DummyLogger()
+    urls = ["warm://p1-a", "warm://p1-b", "warm://p2-a", "warm://broken"]
+    result = warmup(cache, urls, logger, extractors=[WarmExtractor()])
+    assert result == {"entries": 2, "added": 2, "failed": 1}
+    assert cache.entries() == {"test-player": 2}
+    assert any("2 entries (2 new), 1 URLs failed" in m for m in logger.messages)
+    again = warmup(cache, urls[:1], DummyLogger(), extractors=[WarmExtractor()])
+    assert again == {"entries": 2, "added": 0, "failed": 0}
+
+
+def test_strategy_and_wiring(tmp_path):
+    """ Testing that a configured cache_dir reaches the options of every YoutubeDL  """
+    config = Config(
+        save_dir=tmp_path / "out",
+        max_workers=1,
+        quality="best",
+        audio_only=False,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    core = DIContainer.create_downloader_core(config, DummyLogger())
+    assert isinstance(core.strategy, CacheDirStrategy)
+    cachedir = core.strategy.get_opts()["cachedir"]
+    assert cachedir.startswith(str(tmp_path / "cache" / "yt-dlp-"))
+    assert os.path.isdir(cachedir)
+    with core:
+        pass
+
+
+def test_parse_warmup_arguments(tmp_path):
+    """ Testing of the warmup command line  """
+    cache_dir, log_dir, urls = parse_warmup_arguments(
+        ["--cache-dir", str(tmp_path / "c"), "-d", str(tmp_path / "logs"), "warm://x"]
+    )
+    assert cache_dir == tmp_path / "c" and log_dir == tmp_path / "logs"
+    assert urls == ["warm://x"]
+    with pytest.raises(SystemExit):
+        parse_warmup_arguments([])
@@ -1,5 +1,7 @@
 import sys
 import os
+from pathlib import Path
+import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 from yt_dl_cli.config.config import Config
@@ -62,9 +64,126 @@ def test_config_quality():
         Config(
             save_dir="d",  # type: ignore
             max_workers=2,
-            quality="1080",
+            quality="999",
             audio_only=False,
             urls=[]
         )  # type: ignore
     except ValueError as e:
-        assert "quality must be one of: best, worst, 720, 480, 360, got 1080" == str(e)
+        assert "quality must be one of: best, worst, 1080, 720, 480, 360, got 999" == str(e)
+
+
+def test_config_accepts_1080():
+    """ Test that 1080 accepted by the parser is accepted by Config  """
+    config = Config(save_dir="d", max_workers=2, quality="1080", audio_only=False)  # type: ignore
+    assert config.quality == "1080"
+
+
+def test_config_invalid_filesize():
+    """ Test invalid max_filesize value  """
+    with pytest.raises(ValueError):
+        Config(
+            save_dir="d", max_workers=2, quality="best", audio_only=False, max_filesize=0
+        )  # type: ignore
+
+
+def test_config_metadata_only_args(tmp_path):
+    """ Test parsing metadata-only options  """
+    sys.argv = [
+        "yt-dl-cli",
+        "--urls",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "--metadata-only",
+        "--metadata-output",
+        str(tmp_path / "meta.jsonl"),
+    ]
+    config = parse_arguments()
+    assert config.metadata_only is True
+    assert config.metadata_output == tmp_path / "meta.jsonl"
+
+    sys.argv = ["yt-dl-cli", "--urls", "https://example.com/v", "--metadata-only"]
+    assert parse_arguments().metadata_output is None
+
+
+def test_config_format_ranking_args():
+    """ Test parsing format ranking options  """
+    sys.argv = [
+        "yt-dl-cli",
+        "--urls",
+        "https://example.com/v",
+        "--max-filesize",
+        "1.5G",
+        "--prefer-codecs",
+        "vp9, opus",
+        "--no-prefer-progressive",
+        "--format-ranking",
+    ]
+    config = parse_arguments()
+    assert config.max_filesize == int(1.5 * 1024**3)
+    assert config.preferred_codecs == ["vp9", "opus"]
+    assert config.prefer_progressive is False
+    assert config.rank_formats is True
+
+    sys.argv = ["yt-dl-cli", "--urls", "https://example.com/v"]
+    assert parse_arguments().rank_formats is False
+
+    for option in (["--max-filesize", "1G"], ["--prefer-codecs", "avc1,mp4a"],
+                   ["--no-prefer-progressive"]):
+        sys.argv = ["yt-dl-cli", "--urls", "https://example.com/v", *option]
+        assert parse_arguments().rank_formats is True
+
+
+def test_config_ranking_options_enable_ranking():
+    """ Test that the ranking tuning options enable format ranking  """
+    base = {"save_dir": "d", "max_workers": 1, "quality": "best", "audio_only": False}
+    assert Config(**base).rank_formats is False  # type: ignore
+    for option in ({"max_filesize": 1024}, {"prefer_progressive": False},
+                   {"preferred_codecs": ["vp9"]}):
+        assert Config(**base, **option).rank_formats is True  # type: ignore
+
+
+def test_config_deadline():
+    """ Test parsing and validation of the batch deadline  """
+    sys.argv = ["yt-dl-cli", "--urls", "https://example.com/v", "--deadline", "45m"]
+    assert parse_arguments().deadline == 2700.0
+    with pytest.raises(ValueError):
+        Config(
+            save_dir="d", max_workers=2, quality="best", audio_only=False, deadline=0
+        )  # type: ignore
+
+
+def test_config_max_bandwidth():
+    """ Test parsing and validation of the bandwidth cap  """
+    sys.argv = ["yt-dl-cli", "--urls", "https://example.com/v", "--max-bandwidth", "5M"]
+    assert parse_arguments().max_bandwidth == 5 * 1024**2
+    with pytest.raises(ValueError):
+        Config(
+            save_dir="d", max_workers=2, quality="best", audio_only=False, max_bandwidth=-1
+        )  # type: ignore
+
+
+def test_config_work_queue():
+    """ Test parsing and validation of the work-queue options  """
+    sys.argv = [
+        "yt-dl-cli", "--urls", "https://example.com/v", "--queue", "job.db",
+        "--lease", "2m", "--worker-id", "node-1",
+    ]
+    config = parse_arguments()
+    assert (config.queue_path, config.lease_time, config.worker_id) == (
+        Path("job.db"), 120.0, "node-1"
+    )
+    assert Config(save_dir="d", max_workers=1, quality="best", audio_only=False).worker_id
+    with pytest.raises(ValueError):
+        Config(
+            save_dir="d", max_workers=2, quality="best", audio_only=False,
+            queue_path="job.db", metadata_only=True,
+        )  # type: ignore
+
+
+def test_config_schedule():
+    """ Test validation of the scheduling policy  """
+    config = Config(save_dir="d", max_workers=1, quality="best", audio_only=False)
+    assert (config.schedule, config.priorities) == ("fifo", {})
+    with pytest.raises(ValueError):
+        Config(
+            save_dir="d", max_workers=1, quality="best", audio_only=False, schedule="random"
+        )  # type: ignore
@@ -0,0 +1,183 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+import yt_dlp
+from yt_dlp.networking import Request
+from yt_dlp.networking.exceptions import UnsupportedRequest
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.connection_pool import ConnectionPool, PooledRH
+from yt_dl_cli.core import orchestration
+from yt_dl_cli.core.orchestration import DIContainer
+
+BODY = b"x" * 50_000
+
+
+class KeepAliveServer(BaseHTTPRequestHandler):
+    """HTTP/1.1 server counting the connections it accepted"""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def handle(self):
+        with KeepAliveServer.lock:
+            KeepAliveServer.connections += 1
+        super().handle()
+
+    def do_GET(self):
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/media")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+        # a server dropping idle connections without announcing it
+        self.close_connection = self.path == "/drop"
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveServer)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    KeepAliveServer.connections = 0
+    yield "http://127.0.0.1:%d" % httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(max_idle_per_host=2)
+    pool.install()
+    yield pool
+    pool.close()
+
+
+def fetch(url, ydl=None):
+    with ydl or yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        with ydl.urlopen(url) as response:
+            return response.read()
+
+
+def test_connections_are_shared_between_sessions(server, pool):
+    """ Testing that two YoutubeDL instances reuse one connection  """
+    assert fetch(server + "/media") == BODY
+    assert fetch(server + "/media") == BODY
+    assert KeepAliveServer.connections == 1
+    summary = pool.summary()
+    assert (summary["requests"], summary["reused"], summary["connections"]) == (2, 1, 1)
+    assert summary["reuse_ratio"] == 0.5 and summary["handshake_time"] > 0
+
+
+def test_without_pool_every_request_connects(server):
+    """ Testing that without an installed pool yt-dlp's urllib handler is used  """
+    fetch(server + "/media")
+    fetch(server + "/media")
+    assert KeepAliveServer.connections == 2
+
+
+def test_redirect_reuses_connection(server, pool):
+    """ Testing that a redirect and its target share the connection  """
+    assert fetch(server + "/redirect") == BODY
+    assert KeepAliveServer.connections == 1
+    assert pool.reused == 1
+
+
+def test_dropped_connection_is_retried(server, pool):
+    """ Testing that a request on a connection closed by the server is retried  """
+    assert fetch(server + "/drop") == BODY
+    assert fetch(server + "/media") == BODY
+    assert KeepAliveServer.connections == 2
+    assert (pool.requests, pool.reused, pool.connections) == (2, 0, 2)
+
+
+def test_unread_response_is_not_reused(server, pool):
+    """ Testing that a response closed before its end discards the connection  """
+    with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        response = ydl.urlopen(server + "/media")
+        response.read(100)
+        response.close()
+        assert pool.idle_count() == 0
+        assert fetch(server + "/media", ydl) == BODY
+    assert KeepAliveServer.connections == 2
+
+
+def test_idle_connections_are_bounded(server, pool):
+    """ Testing that at most max_idle_per_host connections are kept  """
+    with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        responses = [ydl.urlopen(server + "/media") for _ in range(3)]
+        for response in responses:
+            response.read()
+    assert KeepAliveServer.connections == 3
+    assert pool.idle_count() == 2
+    pool.close()
+    assert pool.idle_count() == 0 and PooledRH.pool is None
+
+
+def test_proxied_requests_are_left_to_urllib(pool):
+    """ Testing that the pooled handler declines requests through a proxy  """
+    handler = PooledRH(logger=None, proxies={"http": "http://127.0.0.1:3128"})
+    with pytest.raises(UnsupportedRequest):
+        handler.validate(Request("http://example.com/"))
+    PooledRH(logger=None).validate(Request("http://example.com/"))
+
+
+def test_report_and_wiring(tmp_path, pool):
+    """ Testing of the pool report and its creation from Config  """
+    messages = []
+
+    class DummyLogger:
+        def info(self, msg):
+            messages.append(str(msg))
+
+    pool.record(False, 0.05)
+    pool.record(True)
+    pool.report(DummyLogger())
+    assert "50%" in messages[0] and "50 ms" in messages[0]
+
+    config = Config(
+        save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, keep_alive=True
+    )
+    core = DIContainer.create_downloader_core(config, DummyLogger())
+    assert PooledRH.pool is core.connection_pool is not None
+    with core:
+        pass
+    assert PooledRH.pool is None
+    with pytest.raises(ValueError):
+        Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False,
+               keep_alive_per_host=0)
+
+
+def test_unsupported_yt_dlp_keeps_default_handlers(tmp_path, monkeypatch):
+    """ Testing that --keep-alive falls back with a warning if yt-dlp lacks UrllibRH  """
+    warnings = []
+
+    class DummyLogger:
+        def info(self, msg):
+            pass
+
+        def warning(self, msg):
+            warnings.append(str(msg))
+
+    monkeypatch.setattr(orchestration, "POOL_SUPPORTED", False)
+    config = Config(
+        save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, keep_alive=True
+    )
+    core = DIContainer.create_downloader_core(config, DummyLogger())
+    assert core.connection_pool is None and PooledRH.pool is None
+    assert "--keep-alive" in warnings[0]
@@ -5,7 +5,8 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 import pytest
 
-from yt_dl_cli.core.core import VideoInfoExtractor, DownloadExecutor
+from yt_dl_cli.core.core import DownloaderCore, VideoInfoExtractor, DownloadExecutor
+from yt_dl_cli.core.records import TransferInfo, VideoRecord
 from yt_dl_cli.interfaces.interfaces import ILogger
 
 
@@ -252,14 +253,24 @@ def test_download_single_branches(info, file_exists, expect_failure, expect_skip
         def extract_info(self, url, opts):
             return info
 
+        def extract_record(self, url, opts):
+            return VideoRecord.from_info(url, info) if info else None
+
+        def last_error(self):
+            return None
+
     class DummyDownloadExecutor:
         def execute_download(self, url, opts):
             return True
 
+        def last_transfer(self):
+            return TransferInfo()
+
     # Мокаем config
     class DummyConfig:
         audio_only = False
         save_dir = Path(".")
+        staging_dir = None
 
     core = DownloaderCore(
         config=DummyConfig(),  # type: ignore
@@ -286,3 +297,285 @@ def test_download_single_branches(info, file_exists, expect_failure, expect_skip
         )
     else:
         assert called["skip"] == 0
+
+
+def make_metadata_core(info):
+    """Make DownloaderCore for metadata extraction tests"""
+    from yt_dl_cli.core.core import DownloaderCore
+
+    calls = {"failure": 0, "success": 0, "opts": None}
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {"format": "best"}
+
+    class DummyStats:
+        def record_failure(self):
+            calls["failure"] += 1
+
+        def record_success(self):
+            calls["success"] += 1
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            calls["opts"] = opts
+            return VideoRecord.from_info(url, info) if info else None
+
+    core = DownloaderCore(
+        config=None,  # type: ignore
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=None,  # type: ignore
+        file_checker=None,  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=None,  # type: ignore
+    )
+    return core, calls
+
+
+def test_extract_metadata_compact_record():
+    """Test DownloaderCore.extract_metadata() builds a compact record"""
+    info = {
+        "id": "abc",
+        "title": "Title",
+        "duration": 61,
+        "extractor_key": "Youtube",
+        "thumbnails": [{"url": "x"}] * 50,
+        "formats": [
+            {"format_id": "18", "ext": "mp4", "height": 360, "filesize": 100,
+             "http_headers": {"User-Agent": "x"}},
+            {"format_id": "140", "ext": "m4a", "filesize_approx": 50},
+        ],
+        "requested_formats": [{"filesize": 10}, {"filesize_approx": 5}],
+    }
+    core, calls = make_metadata_core(info)
+    record = core.extract_metadata("https://some.url/v")
+
+    assert record["ok"] is True
+    assert record["id"] == "abc"
+    assert record["filesize"] == 15
+    assert record["formats"] == [
+        {"format_id": "18", "ext": "mp4", "height": 360, "filesize": 100},
+        {"format_id": "140", "ext": "m4a", "filesize": 50},
+    ]
+    assert "thumbnails" not in record
+    assert calls["success"] == 1
+    assert calls["opts"]["skip_download"] is True
+
+
+def test_extract_metadata_failure():
+    """Test DownloaderCore.extract_metadata() records failures"""
+    core, calls = make_metadata_core(None)
+    assert core.extract_metadata("https://some.url/v") == {
+        "url": "https://some.url/v",
+        "ok": False,
+    }
+    assert calls["failure"] == 1
+
+
+def test_extract_record_projects_info(monkeypatch):
+    """Test VideoInfoExtractor.extract_record() returns a VideoRecord"""
+    extractor, logger = make_extractor(monkeypatch, None)
+    record = extractor.extract_record("url", {})
+    assert isinstance(record, VideoRecord)
+    assert record.title == "OK"
+    assert record.url == "url"
+
+
+def test_extract_record_none(monkeypatch):
+    """Test VideoInfoExtractor.extract_record() with failed extraction"""
+    extractor, logger = make_extractor(monkeypatch, "none")
+    assert extractor.extract_record("url", {}) is None
+    assert logger.errors
+
+
+def test_download_single_uses_selected_format(tmp_path):
+    """Test DownloaderCore.download_single() passes the strategy's format choice"""
+    from yt_dl_cli.core.core import DownloaderCore
+
+    captured = {}
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {"format": "static"}
+
+        def select_format(self, record):
+            return "18/static"
+
+    class DummyStats:
+        def record_success(self):
+            captured["success"] = True
+
+    class DummyLogger:
+        def info(self, msg):
+            pass
+
+    class DummyFileChecker:
+        def exists(self, path):
+            return False
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="T")
+
+    class DummyDownloadExecutor:
+        def execute_download(self, url, opts):
+            captured["opts"] = opts
+            return True
+
+        def last_transfer(self):
+            return TransferInfo()
+
+    class DummyConfig:
+        audio_only = False
+        save_dir = tmp_path
+        staging_dir = None
+
+    core = DownloaderCore(
+        config=DummyConfig(),  # type: ignore
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=DummyLogger(),  # type: ignore
+        file_checker=DummyFileChecker(),  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=DummyDownloadExecutor(),  # type: ignore
+    )
+    core.download_single("https://some.url/test")
+    assert captured["opts"]["format"] == "18/static"
+    assert captured["success"]
+
+
+def test_extract_record_reuses_session_and_cache(monkeypatch):
+    """Test VideoInfoExtractor with a SessionCache and a RecordCache"""
+    import yt_dl_cli.core.core as core
+    from yt_dl_cli.core.records import RecordCache
+
+    created, closed, extracted = [], [], []
+
+    class DummyYDL:
+        def __init__(self, opts):
+            created.append(opts)
+
+        def extract_info(self, url, download=False):
+            extracted.append(url)
+            return {"title": url}
+
+        def close(self):
+            closed.append(self)
+
+    monkeypatch.setattr(core.yt_dlp, "YoutubeDL", DummyYDL)
+    sessions = core.SessionCache(max_per_thread=1)
+    extractor = core.VideoInfoExtractor(
+        DummyLogger3(), sessions=sessions, record_cache=RecordCache(8)
+    )
+    assert extractor.extract_record("a", {"q": 1}).title == "a"
+    assert extractor.extract_record("b", {"q": 1}).title == "b"
+    assert extractor.extract_record("a", {"q": 1}).title == "a"
+    assert extracted == ["a", "b"]
+    assert len(created) == 1
+    assert extractor.record_cache.hits == 1
+
+    extractor.extract_record("c", {"q": 2})
+    assert len(created) == 2 and len(closed) == 1
+    sessions.close()
+    assert len(closed) == 2
+
+
+def test_execute_download_tracks_transfer(monkeypatch):
+    """Test DownloadExecutor.last_transfer() collects path, bytes and errors"""
+    import yt_dl_cli.core.core as core
+
+    class DummyYDL:
+        def __init__(self, opts):
+            self.opts = opts
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *a, **k):
+            return False
+
+        def download(self, urls):
+            if urls == ["bad"]:
+                raise RuntimeError("fail-other")
+            for hook in self.opts["progress_hooks"]:
+                hook({"status": "finished", "filename": "v.f137.mp4", "total_bytes": 700})
+                hook({"status": "finished", "filename": "v.f140.m4a", "downloaded_bytes": 300})
+            for hook in self.opts["postprocessor_hooks"]:
+                hook({"status": "finished", "info_dict": {"filepath": "v.mp4"}})
+
+    monkeypatch.setattr(core.yt_dlp, "YoutubeDL", DummyYDL)
+    executor = core.DownloadExecutor(DummyLogger2())
+    assert executor.execute_download("good", {})
+    transfer = executor.last_transfer()
+    assert (transfer.path, transfer.bytes, transfer.error) == ("v.mp4", 1000, None)
+    assert not executor.execute_download("bad", {})
+    assert isinstance(executor.last_transfer().error, RuntimeError)
+    assert executor.last_transfer().bytes == 0
+
+
+def test_download_result_reports_extraction_error(monkeypatch, tmp_path):
+    """Test DownloaderCore.download_result() for a failed extraction"""
+    extractor, _ = make_extractor(monkeypatch, "extractor")
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+    class DummyStats:
+        failures = 0
+
+        def record_failure(self):
+            DummyStats.failures += 1
+
+    core = DownloaderCore(
+        config=None,  # type: ignore
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=DummyLogger3(),  # type: ignore
+        file_checker=None,  # type: ignore
+        info_extractor=extractor,
+        download_executor=None,  # type: ignore
+    )
+    result = core.download_result("url")
+    assert result.status == "failed"
+    assert result.error == "ExtractorError"
+    assert "extract" in result.timings and "total" in result.timings
+    assert DummyStats.failures == 1
+
+
+def test_batch_session_reuses_youtube_dl(monkeypatch, tmp_path):
+    """Test that the downloads of a batch share one YoutubeDL with their own options"""
+    import yt_dlp
+    import yt_dl_cli.core.core as core
+
+    seen = []
+
+    class RecordingYDL(yt_dlp.YoutubeDL):
+        def download(self, urls):
+            if urls == ["bad"]:
+                raise yt_dlp.DownloadError("fail")
+            selector = self.format_selector
+            seen.append((id(self), self.params["outtmpl"]["default"], selector, urls[0]))
+            return 0
+
+    monkeypatch.setattr(core.yt_dlp, "YoutubeDL", RecordingYDL)
+    executor = core.DownloadExecutor(DummyLogger2())
+    opts = {"quiet": True}
+    with executor.batch_session():
+        for name, fmt in (("a", "18"), ("b", None), ("bad", None), ("c", "22")):
+            executor.execute_download(
+                name, dict(opts, outtmpl=str(tmp_path / f"{name}.%(ext)s"), format=fmt)
+            )
+        executor.execute_download("d", {"quiet": False})
+    assert [entry[1] for entry in seen] == [
+        str(tmp_path / "a.%(ext)s"),
+        str(tmp_path / "b.%(ext)s"),
+        str(tmp_path / "c.%(ext)s"),
+        "%(title)s [%(id)s].%(ext)s",
+    ]
+    # a and b share a session; the failure closes it; other options open a new one
+    assert seen[0][0] == seen[1][0] != seen[2][0] != seen[3][0]
+    assert callable(seen[0][2]) and seen[1][2] is None
+    executor.execute_download("e", opts)
+    assert seen[-1][0] not in {entry[0] for entry in seen[:-1]}
@@ -0,0 +1,207 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import DownloaderCore
+from yt_dl_cli.core.records import FormatRecord, TransferInfo, VideoRecord
+from yt_dl_cli.utils.disk_space import (
+    HOLD,
+    SKIP,
+    DiskSpaceAdmission,
+    expected_download_size,
+)
+
+
+class FakeDisk:
+    """Free space that can be changed by the test"""
+
+    def __init__(self, free):
+        self.free = free
+
+    def __call__(self, path):
+        return self.free
+
+
+def test_expected_download_size():
+    """ Testing of expected_download_size for selectors and fallbacks  """
+    record = VideoRecord(
+        "u",
+        duration=100,
+        filesize=5000,
+        formats=(
+            FormatRecord("137", filesize=3000),
+            FormatRecord("140", abr=128),
+        ),
+    )
+    assert expected_download_size(record, "137+140/best") == 3000 + 1_600_000
+    assert expected_download_size(record, "137") == 3000
+    assert expected_download_size(record, "999+140") == 5000
+    assert expected_download_size(record, None) == 5000
+    assert expected_download_size(VideoRecord("u"), "best") is None
+
+
+def test_reserve_and_release_with_margin():
+    """ Testing of reservations against free space and margin  """
+    admission = DiskSpaceAdmission(None, margin=100, policy=SKIP, free_space=FakeDisk(1000))
+    first = admission.reserve(600)
+    assert first is not None
+    assert admission.available() == 300
+    assert admission.reserve(400) is None
+    assert admission.reserve(160, merge=True) is None
+    second = admission.reserve(150)
+    assert second is not None
+    admission.release(first)
+    admission.release(second)
+    assert admission.available() == 900
+    # unknown sizes are admitted with an empty reservation
+    assert admission.reserve(None).size == 0
+
+
+def test_progress_hook_shrinks_reservation():
+    """ Testing that written bytes are no longer counted as reserved  """
+    disk = FakeDisk(1000)
+    admission = DiskSpaceAdmission(None, policy=SKIP, free_space=disk)
+    reservation = admission.reserve(300, merge=True)
+    assert reservation.size == 600
+    admission.progress_hook({"filename": "v.f137.mp4", "downloaded_bytes": 200})
+    admission.progress_hook({"filename": "v.f140.m4a", "downloaded_bytes": 100})
+    disk.free = 700
+    assert admission.available() == 700 - 300
+    admission.release(reservation)
+    # hooks of threads without a reservation are ignored
+    admission.progress_hook({"filename": "x", "downloaded_bytes": 10})
+    assert admission.available() == 700
+
+
+def test_hold_waits_for_release():
+    """ Testing that HOLD waits until a running download releases space  """
+    admission = DiskSpaceAdmission(None, policy=HOLD, free_space=FakeDisk(1000))
+    running = admission.reserve(800)
+    admitted = threading.Event()
+
+    def held():
+        reservation = admission.reserve(500)
+        assert reservation is not None
+        admitted.set()
+
+    thread = threading.Thread(target=held)
+    thread.start()
+    assert not admitted.wait(0.1)
+    admission.release(running)
+    assert admitted.wait(5)
+    thread.join()
+
+
+def test_hold_skips_what_never_fits():
+    """ Testing that HOLD does not wait when nothing is reserved  """
+    admission = DiskSpaceAdmission(None, policy=HOLD, free_space=FakeDisk(1000))
+    assert admission.reserve(2000) is None
+
+
+class DummyStats:
+    def __init__(self):
+        self.failures = 0
+        self.successes = 0
+
+    def record_failure(self):
+        self.failures += 1
+
+    def record_success(self):
+        self.successes += 1
+
+
+class DummyLogger:
+    def __init__(self):
+        self.warnings = []
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        self.warnings.append(str(msg))
+
+
+def make_core(tmp_path, admission, executor):
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+        def select_format(self, record):
+            return "137"
+
+    class DummyFileChecker:
+        def exists(self, path):
+            return False
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="T", formats=(FormatRecord("137", filesize=600),))
+
+    config = Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False)
+    return DownloaderCore(
+        config=config,
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=DummyLogger(),  # type: ignore
+        file_checker=DummyFileChecker(),  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=executor,  # type: ignore
+        admission=admission,
+    )
+
+
+@pytest.mark.parametrize("ok", [True, False])
+def test_core_reserves_and_releases(tmp_path, ok):
+    """ Testing of DownloaderCore releasing its reservation after the download  """
+    admission = DiskSpaceAdmission(tmp_path, policy=SKIP, free_space=FakeDisk(1000))
+    seen = {}
+
+    class DummyExecutor:
+        def execute_download(self, url, opts):
+            seen["available"] = admission.available()
+            return ok
+
+        def last_transfer(self):
+            return TransferInfo(path="p", bytes=600)
+
+    core = make_core(tmp_path, admission, DummyExecutor())
+    result = core.download_result("u")
+    assert result.status == ("downloaded" if ok else "failed")
+    assert seen["available"] == 400
+    assert admission.available() == 1000
+    assert "reserve" in result.timings
+
+
+def test_core_fails_download_that_does_not_fit(tmp_path):
+    """ Testing of DownloaderCore refusing a download that does not fit  """
+    admission = DiskSpaceAdmission(tmp_path, margin=500, policy=SKIP, free_space=FakeDisk(1000))
+
+    class DummyExecutor:
+        def execute_download(self, url, opts):
+            raise AssertionError("must not start")
+
+    core = make_core(tmp_path, admission, DummyExecutor())
+    result = core.download_result("u")
+    assert result.status == "failed"
+    assert result.error == "InsufficientDiskSpace"
+    assert core.stats.failures == 1
+    assert core.logger.warnings
+
+
+def test_config_disk_validation(tmp_path):
+    """ Testing of the disk admission options of Config  """
+    with pytest.raises(ValueError):
+        Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, disk_margin=-1)
+    with pytest.raises(ValueError):
+        Config(
+            save_dir=tmp_path,
+            max_workers=1,
+            quality="best",
+            audio_only=False,
+            disk_full_policy="wait",
+        )
@@ -0,0 +1,174 @@
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+import yt_dlp
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.dns_cache import DNSCache
+from yt_dl_cli.core.orchestration import DIContainer
+
+ANSWER = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 80))]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Resolver:
+    """getaddrinfo stand-in counting its calls"""
+
+    def __init__(self, error=None, delay=0.0):
+        self.calls = []
+        self.error = error
+        self.delay = delay
+
+    def __call__(self, host, port, family=0, type=0, proto=0, flags=0):
+        self.calls.append(host)
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return list(ANSWER)
+
+
+def cache(resolver, clock, ttl=60.0, **kwargs):
+    return DNSCache(ttl=ttl, resolver=resolver, clock=clock, **kwargs)
+
+
+def test_answers_are_cached_until_ttl():
+    """ Testing that a lookup is answered from the cache within its TTL  """
+    clock, resolver = Clock(), Resolver()
+    dns = cache(resolver, clock)
+    assert dns.getaddrinfo("cdn.example", 443) == ANSWER
+    clock.now = 59
+    assert dns.getaddrinfo("CDN.example", 443) == ANSWER
+    assert dns.getaddrinfo("cdn.example", 80) == ANSWER
+    clock.now = 61
+    dns.getaddrinfo("cdn.example", 443)
+    assert resolver.calls == ["cdn.example", "cdn.example", "cdn.example"]
+    assert (dns.hits, dns.misses) == (1, 3)
+
+
+def test_configured_ttl_sets_lifetime():
+    """ Testing that answers live for the configured TTL with one query per miss  """
+    clock, resolver = Clock(), Resolver()
+    dns = cache(resolver, clock, ttl=5.0)
+    dns.getaddrinfo("api.example", 443)
+    clock.now = 4
+    dns.getaddrinfo("api.example", 443)
+    assert resolver.calls == ["api.example"]
+    clock.now = 6
+    dns.getaddrinfo("api.example", 443)
+    assert resolver.calls == ["api.example", "api.example"]
+
+
+def test_missing_names_are_cached():
+    """ Testing of negative caching of names that do not exist  """
+    clock = Clock()
+    resolver = Resolver(socket.gaierror(socket.EAI_NONAME, "Name or service not known"))
+    dns = cache(resolver, clock, negative_ttl=10.0)
+    for _ in range(3):
+        with pytest.raises(socket.gaierror):
+            dns.getaddrinfo("typo.example", 443)
+    assert resolver.calls == ["typo.example"]
+    assert (dns.hits, dns.misses, dns.negative_hits) == (2, 1, 2)
+    clock.now = 11
+    with pytest.raises(socket.gaierror):
+        dns.getaddrinfo("typo.example", 443)
+    assert len(resolver.calls) == 2
+
+
+def test_temporary_failure_uses_expired_answer():
+    """ Testing that a failing resolver is not cached and expired answers are reused  """
+    clock, resolver = Clock(), Resolver()
+    dns = cache(resolver, clock)
+    dns.getaddrinfo("cdn.example", 443)
+    clock.now = 100
+    resolver.error = socket.gaierror(socket.EAI_AGAIN, "Temporary failure")
+    assert dns.getaddrinfo("cdn.example", 443) == ANSWER
+    assert dns.stale == 1
+    with pytest.raises(socket.gaierror):
+        dns.getaddrinfo("other.example", 443)
+    with pytest.raises(socket.gaierror):
+        dns.getaddrinfo("other.example", 443)
+    assert resolver.calls.count("other.example") == 2
+
+
+def test_concurrent_lookups_share_one_query():
+    """ Testing that threads resolving the same host wait for one resolver call  """
+    resolver = Resolver(delay=0.05)
+    dns = cache(resolver, time.monotonic)
+    threads = [
+        threading.Thread(target=dns.getaddrinfo, args=("cdn.example", 443)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert resolver.calls == ["cdn.example"]
+    assert (dns.hits, dns.misses) == (7, 1)
+
+
+def test_literals_bypass_cache():
+    """ Testing that IP addresses are not cached  """
+    resolver = Resolver()
+    dns = cache(resolver, Clock())
+    dns.getaddrinfo("127.0.0.1", 80)
+    dns.getaddrinfo("::1", 80)
+    dns.getaddrinfo("127.0.0.1", 80)
+    assert len(resolver.calls) == 3
+    assert dns.summary()["entries"] == 0 and dns.misses == 0
+
+
+def test_install_covers_yt_dlp_connections(tmp_path):
+    """ Testing that yt-dlp's requests resolve through the installed cache  """
+    dns = DNSCache()
+    original = socket.getaddrinfo
+    dns.install()
+    try:
+        assert socket.getaddrinfo == dns.getaddrinfo
+        with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+            for _ in range(2):
+                with pytest.raises(yt_dlp.networking.exceptions.TransportError):
+                    ydl.urlopen("http://localhost:9/")
+        assert dns.misses == 1 and dns.hits >= 1
+    finally:
+        dns.close()
+    assert socket.getaddrinfo is original
+
+
+def test_report_and_wiring(tmp_path):
+    """ Testing of the cache report and its creation from Config  """
+    messages = []
+
+    class DummyLogger:
+        def info(self, msg):
+            messages.append(str(msg))
+
+    dns = cache(Resolver(), Clock())
+    dns.getaddrinfo("cdn.example", 443)
+    dns.getaddrinfo("cdn.example", 443)
+    dns.report(DummyLogger())
+    assert "1 hits" in messages[0] and "50%" in messages[0]
+
+    def config(**kwargs):
+        return Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, **kwargs)
+
+    original = socket.getaddrinfo
+    core = DIContainer.create_downloader_core(config(dns_cache=True, dns_ttl=30.0), DummyLogger())
+    assert core.dns_cache.ttl == 30.0
+    assert socket.getaddrinfo == core.dns_cache.getaddrinfo
+    with core:
+        pass
+    assert socket.getaddrinfo is original
+    with pytest.raises(ValueError):
+        config(dns_ttl=0)
@@ -0,0 +1,28 @@
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.utils.metadata_writer import MetadataWriter
+
+
+def test_metadata_writer_writes_json_lines(tmp_path):
+    """ Testing of MetadataWriter writing one record per line  """
+    target = tmp_path / "out" / "meta.jsonl"
+    with MetadataWriter(target) as writer:
+        writer.write({"url": "u1", "title": "Відео"})
+        writer.write({"url": "u2", "ok": False})
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert writer.count == 2
+    assert json.loads(lines[0]) == {"url": "u1", "title": "Відео"}
+    assert json.loads(lines[1]) == {"url": "u2", "ok": False}
+    assert " " not in lines[1]
+
+
+def test_metadata_writer_stdout(capsys):
+    """ Testing of MetadataWriter writing to stdout  """
+    with MetadataWriter() as writer:
+        writer.write({"url": "u1"})
+    assert capsys.readouterr().out == '{"url":"u1"}\n'
@@ -0,0 +1,269 @@
+import asyncio
+import errno
+import os
+from pathlib import Path
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import DownloaderCore
+from yt_dl_cli.core.orchestration import AsyncOrchestrator
+from yt_dl_cli.core.records import TransferInfo, VideoRecord
+import yt_dl_cli.utils.mover as mover_module
+from yt_dl_cli.utils.mover import BackgroundMover, move_file
+from yt_dl_cli.utils.stats_manager import StatsManager
+
+
+class DummyLogger:
+    def __init__(self):
+        self.infos = []
+        self.errors = []
+
+    def info(self, msg):
+        self.infos.append(str(msg))
+
+    def error(self, msg):
+        self.errors.append(str(msg))
+
+
+def staged(tmp_path, name, data=b"media"):
+    stage = tmp_path / "stage"
+    stage.mkdir(exist_ok=True)
+    path = stage / name
+    path.write_bytes(data)
+    return path
+
+
+def cross_device(monkeypatch, source):
+    """Make renames of a file fail like a move to another file system"""
+    replace = os.replace
+
+    def fake_replace(src, dst):
+        if Path(src) == source:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", fake_replace)
+
+
+def test_move_renames_on_same_file_system(tmp_path):
+    """ Testing that move_file renames within a file system  """
+    src = staged(tmp_path, "T.mp4")
+    inode = src.stat().st_ino
+    move_file(src, tmp_path / "T.mp4")
+    assert (tmp_path / "T.mp4").stat().st_ino == inode
+    assert not src.exists()
+
+
+def test_move_copies_across_file_systems(monkeypatch, tmp_path):
+    """ Testing of the zero-copy transfer across file systems  """
+    data = os.urandom(200_000)
+    src = staged(tmp_path, "T.mp4", data)
+    os.utime(src, (1_000_000, 1_000_000))
+    cross_device(monkeypatch, src)
+    move_file(src, tmp_path / "T.mp4")
+    assert (tmp_path / "T.mp4").read_bytes() == data
+    assert (tmp_path / "T.mp4").stat().st_mtime == 1_000_000
+    assert not src.exists()
+    assert not (tmp_path / ".T.mp4.moving").exists()
+
+
+def test_move_falls_back_to_sendfile(monkeypatch, tmp_path):
+    """ Testing of the sendfile transfer where copy_file_range is missing  """
+    src = staged(tmp_path, "T.mp4", b"x" * 5000)
+    cross_device(monkeypatch, src)
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    calls = []
+    sendfile = os.sendfile
+
+    def counting_sendfile(*args):
+        calls.append(args)
+        return sendfile(*args)
+
+    monkeypatch.setattr(os, "sendfile", counting_sendfile)
+    move_file(src, tmp_path / "T.mp4")
+    assert calls and (tmp_path / "T.mp4").read_bytes() == b"x" * 5000
+
+
+def test_failed_copy_keeps_source(monkeypatch, tmp_path):
+    """ Testing that a failed transfer leaves the source and no partial file  """
+    src = staged(tmp_path, "T.mp4")
+    cross_device(monkeypatch, src)
+
+    def failing_copy(src, dst):
+        dst.write_bytes(b"part")
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(mover_module, "_copy_file", failing_copy)
+    with pytest.raises(OSError):
+        move_file(src, tmp_path / "T.mp4")
+    assert src.exists()
+    assert sorted(os.listdir(tmp_path)) == ["stage"]
+
+
+def test_background_mover_batches(monkeypatch, tmp_path):
+    """ Testing that files queued during a move are moved in one batch  """
+    library = tmp_path / "library"
+    library.mkdir()
+    started, release = threading.Event(), threading.Event()
+    move = mover_module.move_file
+
+    def slow_first_move(src, dst):
+        started.set()
+        release.wait(5)
+        move(src, dst)
+
+    monkeypatch.setattr(mover_module, "move_file", slow_first_move)
+    logger = DummyLogger()
+    mover = BackgroundMover(logger)
+    targets = [mover.submit(staged(tmp_path, "a.mp4"), library)]
+    assert started.wait(5)
+    targets += [mover.submit(staged(tmp_path, f"{n}.mp4"), library) for n in "bcd"]
+    targets.append(mover.submit(tmp_path / "stage" / "missing.mp4", library))
+    release.set()
+    mover.close()
+    assert all(target.exists() for target in targets[:4])
+    assert (mover.moved, mover.failed, mover.batches) == (4, 1, 2)
+    assert "missing.mp4" in logger.errors[0]
+
+
+def test_core_downloads_into_staging(tmp_path):
+    """ Testing that DownloaderCore downloads into staging_dir and queues the move  """
+    stage = tmp_path / "stage"
+    stage.mkdir()
+    library = tmp_path / "library"
+    seen = {}
+
+    class DummyExecutor:
+        def execute_download(self, url, opts):
+            seen["outtmpl"] = opts["outtmpl"]
+            (stage / "Title.mp4").write_bytes(b"video")
+            return True
+
+        def last_transfer(self):
+            return TransferInfo(path=str(stage / "Title.mp4"), bytes=5)
+
+    class DummyStats:
+        def record_success(self):
+            pass
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+        def select_format(self, record):
+            return None
+
+        def plan_items(self, count):
+            pass
+
+    class DummyFileChecker:
+        def exists(self, path):
+            return False
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="Title")
+
+    mover = BackgroundMover()
+    config = Config(
+        save_dir=library, max_workers=1, quality="best", audio_only=False, staging_dir=stage
+    )
+    core = DownloaderCore(
+        config=config,
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=DummyLogger(),  # type: ignore
+        file_checker=DummyFileChecker(),  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=DummyExecutor(),  # type: ignore
+        mover=mover,
+    )
+    library.mkdir()
+    result = core.download_result("u")
+    assert seen["outtmpl"] == str(stage / "Title.%(ext)s")
+    assert result.path == str(library / "Title.mp4")
+    mover.close()
+    assert (library / "Title.mp4").read_bytes() == b"video"
+    assert os.listdir(stage) == []
+
+
+def test_failed_move_counts_as_failed_download(monkeypatch, tmp_path):
+    """ Testing that a file that cannot be moved turns its download into a failure  """
+    stage = tmp_path / "stage"
+    stage.mkdir()
+
+    def failing_move(src, dst):
+        raise OSError(errno.EIO, "Input/output error")
+
+    monkeypatch.setattr(mover_module, "move_file", failing_move)
+
+    class DummyExecutor:
+        def execute_download(self, url, opts):
+            (stage / "Title.mp4").write_bytes(b"video")
+            return True
+
+        def last_transfer(self):
+            return TransferInfo(path=str(stage / "Title.mp4"), bytes=5)
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+        def select_format(self, record):
+            return None
+
+        def plan_items(self, count):
+            pass
+
+    class DummyFileChecker:
+        def exists(self, path):
+            return False
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="Title")
+
+    logger = DummyLogger()
+    stats = StatsManager()
+    mover = BackgroundMover(logger, stats=stats)
+    config = Config(
+        save_dir=tmp_path / "library",
+        max_workers=1,
+        quality="best",
+        audio_only=False,
+        staging_dir=stage,
+        urls=["u"],
+    )
+    core = DownloaderCore(
+        config=config,
+        strategy=DummyStrategy(),  # type: ignore
+        stats=stats,
+        logger=logger,  # type: ignore
+        file_checker=DummyFileChecker(),  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=DummyExecutor(),  # type: ignore
+        mover=mover,
+    )
+    asyncio.run(AsyncOrchestrator(core, config).run())
+    mover.close()
+    assert stats.get_summary() == {"success": 0, "failed": 1, "skipped": 0, "total": 1}
+    assert "Moved into the library: 0 files, 1 failed" in logger.infos
+    assert (stage / "Title.mp4").exists()
+
+
+def test_config_staging_validation(tmp_path):
+    """ Testing of the staging_dir option of Config  """
+
+    def config(**kwargs):
+        return Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, **kwargs)
+
+    assert config(staging_dir=str(tmp_path / "s")).staging_dir == tmp_path / "s"
+    with pytest.raises(ValueError):
+        config(staging_dir=tmp_path, postprocess_workers=2)
+    with pytest.raises(ValueError):
+        config(staging_dir=tmp_path, stream_output="-", urls=["u"])
@@ -1,6 +1,9 @@
 import asyncio
 
 from yt_dl_cli.core.orchestration import AsyncOrchestrator
+from yt_dl_cli.interfaces.strategies import VideoFormatStrategy
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.tracing import NullTracer
 
 
 class DummyLogger:
@@ -30,6 +33,14 @@ class DummyCore:
         """Init Core for tests"""
         self.logger = DummyLogger()
         self.stats = DummyStats()
+        self.profiler = NullProfiler()
+        self.tracer = NullTracer()
+        self.work_queue = None
+        self.postprocessing = None
+        self.mover = None
+        self.connection_pool = None
+        self.dns_cache = None
+        self.strategy = VideoFormatStrategy("best")
 
     def download_single(self, url):
         """Download single video"""
@@ -41,6 +52,10 @@ class DummyConfig:
         """Init Config for tests"""
         self.urls = []
         self.max_workers = 2
+        self.schedule = "fifo"
+        self.priorities = {}
+        self.batch_size = 1
+        self.expand_playlists = False
 
 
 def test_async_orchestrator_no_urls(monkeypatch):
@@ -58,3 +73,84 @@ def test_async_orchestrator_no_urls(monkeypatch):
     finally:
         loop.close()
     assert ("warning", Messages.Orchestrator.NO_URLS()) in core.logger.calls
+
+
+class RecordingCore(DummyCore):
+    """Core for tests that records processed URLs"""
+    def __init__(self):
+        """Init Core for tests"""
+        super().__init__()
+        self.downloaded = []
+
+    def download_single(self, url):
+        """Download single video"""
+        self.downloaded.append(url)
+
+    def extract_metadata(self, url):
+        """Extract metadata record"""
+        return {"url": url, "ok": True}
+
+
+def test_async_orchestrator_downloads_all_urls():
+    """Test AsyncOrchestrator processes every URL"""
+    core = RecordingCore()
+    config = DummyConfig()
+    config.urls = [f"https://example.com/{i}" for i in range(25)]
+    config.metadata_only = False
+    asyncio.run(AsyncOrchestrator(core, config).run())  # type: ignore
+    assert sorted(core.downloaded) == sorted(config.urls)
+
+
+def test_async_orchestrator_metadata_only(tmp_path):
+    """Test AsyncOrchestrator streams metadata records without downloading"""
+    import json
+
+    core = RecordingCore()
+    config = DummyConfig()
+    config.urls = [f"https://example.com/{i}" for i in range(7)]
+    config.metadata_only = True
+    config.metadata_output = tmp_path / "meta.jsonl"
+    asyncio.run(AsyncOrchestrator(core, config).run())  # type: ignore
+
+    records = [json.loads(l) for l in config.metadata_output.read_text().splitlines()]
+    assert sorted(r["url"] for r in records) == sorted(config.urls)
+    assert core.downloaded == []
+
+
+def test_container_wires_shared_bandwidth_limiter(tmp_path):
+    """Test that every download draws from one adjustable bandwidth limiter"""
+    from yt_dl_cli.config.config import Config
+    from yt_dl_cli.core.orchestration import DIContainer
+
+    config = Config(
+        save_dir=tmp_path, max_workers=4, quality="best", audio_only=False,
+        max_bandwidth=1024,
+    )
+    core = DIContainer.create_downloader_core(config, DummyLogger())
+    limiter = core.bandwidth_limiter
+    assert limiter.rate == 1024
+    assert core.download_executor.progress_hooks == [limiter.progress_hook]
+
+    core.set_bandwidth_limit(None)
+    assert limiter.rate is None
+
+
+def test_container_profiling_mode(tmp_path):
+    """Test that profiling mode times the injected components and reports"""
+    from yt_dl_cli.config.config import Config
+    from yt_dl_cli.core.orchestration import DIContainer
+
+    config = Config(
+        save_dir=tmp_path, max_workers=2, quality="best", audio_only=False,
+        urls=["https://example.com/a", "https://example.com/b"], profile=True,
+    )
+    core = DIContainer.create_downloader_core(config, DummyLogger())
+    core.file_checker.exists(tmp_path / "missing.mp4")
+    core.stats.record_success()
+    core.logger.info("message")
+    assert set(core.profiler.stages) == {"check", "stats", "log"}
+    assert core.stats.success == 1
+
+    core.download_single = lambda url: None
+    asyncio.run(AsyncOrchestrator(core, config).run())
+    assert any("check" in str(msg) for _, msg in core.logger._target.calls)
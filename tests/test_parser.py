@@ -235,3 +235,108 @@ def test_parse_arguments_all_exceptions(
         or Messages.CLI.FILE_NOT_FOUND(file=str(url_file)) in printed["msg"]
     )
     assert printed["file"] == sys.stderr
+
+
+def test_parse_arguments_priorities_and_schedule(tmp_path, capsys):
+    """Test priority annotations in the links file and --schedule."""
+    links = tmp_path / "links.txt"
+    links.write_text(
+        "https://youtube.com/watch?v=a\n"
+        "https://youtube.com/watch?v=b priority=5\n"
+        "https://youtube.com/watch?v=c priority=high\n",
+        encoding="utf-8",
+    )
+    sys.argv = ["yt-dl-cli", "--file", str(links), "--schedule", "sjf"]
+    config = parse_arguments()
+    assert config.urls == [
+        "https://youtube.com/watch?v=a",
+        "https://youtube.com/watch?v=b",
+        "https://youtube.com/watch?v=c",
+    ]
+    assert config.priorities == {"https://youtube.com/watch?v=b": 5}
+    assert config.schedule == "sjf"
+    assert "priority=high" in capsys.readouterr().err
+
+
+def test_parse_arguments_rejects_conflicting_options(tmp_path, capsys):
+    """Test that conflicting options are reported by their command line flags."""
+    sys.argv = [
+        "yt-dl-cli", "--urls", "https://youtube.com/watch?v=a",
+        "--queue", str(tmp_path / "q.db"), "--metadata-only",
+    ]
+    with pytest.raises(SystemExit):
+        parse_arguments()
+    err = capsys.readouterr().err
+    assert "argument --metadata-only: not allowed with argument --queue" in err
+    assert "Traceback" not in err
+
+
+def test_parse_arguments_rejects_stream_conflicts(capsys):
+    """Test the stream mode usage errors."""
+    urls = ["https://youtube.com/watch?v=a", "https://youtube.com/watch?v=b"]
+    sys.argv = ["yt-dl-cli", "--urls", urls[0], "--stream", "-", "--metadata-only"]
+    with pytest.raises(SystemExit):
+        parse_arguments()
+    assert "argument --metadata-only: not allowed with argument --stream" in capsys.readouterr().err
+
+    sys.argv = ["yt-dl-cli", "--urls", *urls, "--stream", "-", "--stream-framing", "raw"]
+    with pytest.raises(SystemExit):
+        parse_arguments()
+    assert "--stream-framing raw needs exactly one URL" in capsys.readouterr().err
+
+
+def test_parse_arguments_rejects_storage_conflicts(capsys):
+    """Test that --storage conflicts are reported by their flags."""
+    url = "https://youtube.com/watch?v=a"
+    for option in (["--stream", "-"], ["--postprocess-workers"]):
+        sys.argv = ["yt-dl-cli", "--urls", url, "--storage", "s3://bucket", *option]
+        with pytest.raises(SystemExit):
+            parse_arguments()
+        err = capsys.readouterr().err
+        assert f"argument {option[0]}: not allowed with argument --storage" in err
+
+
+def test_parse_arguments_rejects_staging_conflicts(tmp_path, capsys):
+    """Test that --staging-dir conflicts are reported by their flags."""
+    url = "https://youtube.com/watch?v=a"
+    for option in (["--stream", "-"], ["--postprocess-workers", "2"]):
+        sys.argv = ["yt-dl-cli", "--urls", url, "--staging-dir", str(tmp_path), *option]
+        with pytest.raises(SystemExit):
+            parse_arguments()
+        err = capsys.readouterr().err
+        assert f"argument {option[0]}: not allowed with argument --staging-dir" in err
+
+
+def test_parse_arguments_rejects_raw_stream_of_playlists(capsys):
+    """Test that raw streaming is rejected with --expand-playlists."""
+    sys.argv = [
+        "yt-dl-cli", "--urls", "https://youtube.com/playlist?list=x",
+        "--stream", "-", "--stream-framing", "raw", "--expand-playlists",
+    ]
+    with pytest.raises(SystemExit):
+        parse_arguments()
+    assert "without --queue or --expand-playlists" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("option", ["--batch-size", "--playlist-lookahead", "--keep-alive-per-host"])
+def test_parse_arguments_rejects_zero_counts(option, capsys):
+    """Test that counts which must be positive are rejected as usage errors."""
+    sys.argv = ["yt-dl-cli", "--urls", "https://youtube.com/watch?v=a", option, "0"]
+    with pytest.raises(SystemExit):
+        parse_arguments()
+    err = capsys.readouterr().err
+    assert f"argument {option}: Value must be at least 1." in err
+    assert "Traceback" not in err
+
+
+def test_parse_arguments_rejects_negative_replay_latency(tmp_path, capsys):
+    """Test that a negative --replay-latency is a usage error."""
+    sys.argv = [
+        "yt-dl-cli", "--urls", "https://youtube.com/watch?v=a",
+        "--replay-dir", str(tmp_path), "--replay-latency", "-1",
+    ]
+    with pytest.raises(SystemExit):
+        parse_arguments()
+    err = capsys.readouterr().err
+    assert "argument --replay-latency" in err
+    assert "Traceback" not in err
@@ -0,0 +1,229 @@
+import asyncio
+import contextlib
+import functools
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+from yt_dlp.extractor.common import InfoExtractor
+from yt_dlp.utils import ExtractorError, OnDemandPagedList
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import create_youtube_dl
+from yt_dl_cli.core.orchestration import AsyncOrchestrator, DIContainer
+from yt_dl_cli.core.playlists import PlaylistExpander
+from yt_dl_cli.core.records import VideoRecord
+from yt_dl_cli.core.scheduling import FIFO
+from yt_dl_cli.interfaces.strategies import AdaptiveQualityStrategy, VideoFormatStrategy
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.throughput import ThroughputMonitor
+from yt_dl_cli.utils.tracing import NullTracer
+
+PAGE_SIZE = 3
+
+
+def video(n):
+    return f"https://www.youtube.com/watch?v=video{n:06d}"
+
+
+class PagesExtractor(InfoExtractor):
+    """Playlists of 10 videos served in pages of 3, recording fetched pages"""
+
+    _VALID_URL = r"pages://(?P<id>\w+)"
+    fetched = []
+
+    def _page(self, playlist, page):
+        PagesExtractor.fetched.append((playlist, page))
+        if playlist == "broken" and page == 1:
+            raise ExtractorError("continuation failed", expected=True)
+        first = page * PAGE_SIZE
+        for n in range(first, min(first + PAGE_SIZE, 10)):
+            yield self.url_result(video(n), "Youtube")
+
+    def _real_extract(self, url):
+        playlist = self._match_id(url)
+        if playlist == "missing":
+            raise ExtractorError("playlist does not exist", expected=True)
+        if playlist == "channel":
+            tabs = [self.url_result("pages://videos"), self.url_result("pages://paged")]
+            return self.playlist_result(tabs, playlist)
+        if playlist == "paged":
+            pages = OnDemandPagedList(functools.partial(self._page, playlist), PAGE_SIZE)
+            return self.playlist_result(pages, playlist)
+        pages = itertools.chain.from_iterable(
+            self._page(playlist, page) for page in itertools.count()
+        )
+        return self.playlist_result(itertools.islice(pages, 10), playlist)
+
+
+class DummyLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, msg):
+        self.messages.append(str(msg))
+
+    warning = info
+
+
+@pytest.fixture
+def expander():
+    PagesExtractor.fetched = []
+    factory = functools.partial(create_youtube_dl, extractors=[PagesExtractor()])
+    return PlaylistExpander(DummyLogger(), factory)
+
+
+@pytest.mark.parametrize("playlist", ["videos", "paged"])
+def test_pages_are_fetched_on_demand(expander, playlist):
+    """ Testing that only the pages of consumed entries are fetched  """
+    urls = expander.expand(f"pages://{playlist}", {"quiet": True})
+    assert list(itertools.islice(urls, 4)) == [video(n) for n in range(4)]
+    assert PagesExtractor.fetched == [(playlist, 0), (playlist, 1)]
+    assert len(list(urls)) == 6
+    assert len(PagesExtractor.fetched) == 4
+
+
+def test_nested_playlists_and_single_videos(expander):
+    """ Testing that channel tabs are expanded and videos are passed through  """
+    urls = list(expander.expand("pages://channel", {"quiet": True}))
+    assert urls == [video(n) for n in range(10)] * 2
+
+    def no_extraction(opts):
+        raise AssertionError("single videos are not extracted")
+
+    single = PlaylistExpander(DummyLogger(), no_extraction)
+    assert list(single.expand(video(1), {})) == [video(1)]
+
+
+def test_failures_are_logged(expander):
+    """ Testing that failed extractions keep the URL and failed pages end the playlist  """
+    assert list(expander.expand("pages://missing", {"quiet": True})) == ["pages://missing"]
+    assert list(expander.expand("pages://broken", {"quiet": True})) == [video(n) for n in range(3)]
+    assert len(expander.logger.messages) == 2
+
+
+class ExpandingCore:
+    """Core expanding every URL into 30 videos, recording the enumeration"""
+
+    def __init__(self):
+        self.logger = DummyLogger()
+        self.stats = self
+        self.profiler = NullProfiler()
+        self.tracer = NullTracer()
+        self.work_queue = None
+        self.postprocessing = None
+        self.mover = None
+        self.connection_pool = None
+        self.dns_cache = None
+        self.strategy = VideoFormatStrategy("best")
+        self.enumerated = 0
+        self.ahead = []
+        self.downloaded = []
+
+    def report(self, logger, elapsed):
+        pass
+
+    def batch_session(self):
+        return contextlib.nullcontext()
+
+    def expand_playlist(self, url):
+        for n in range(30):
+            self.enumerated += 1
+            yield f"{url}/{n}"
+
+    def download_single(self, url):
+        self.ahead.append(self.enumerated - len(self.downloaded))
+        self.downloaded.append(url)
+        return "downloaded"
+
+
+class ExpandingConfig:
+    def __init__(self, urls, batch_size=1):
+        self.urls = urls
+        self.max_workers = 1
+        self.metadata_only = False
+        self.schedule = FIFO
+        self.priorities = {}
+        self.batch_size = batch_size
+        self.expand_playlists = True
+        self.playlist_lookahead = 2
+        self.deadline = None
+
+
+def test_orchestrator_bounds_enumeration():
+    """ Testing that enumeration stays a bounded number of videos ahead of downloads  """
+    core = ExpandingCore()
+    asyncio.run(AsyncOrchestrator(core, ExpandingConfig(["a", "b"])).run())
+    assert core.downloaded == [f"{p}/{n}" for p in "ab" for n in range(30)]
+    assert max(core.ahead) <= 2 + 2
+    assert "Expanded 2 URLs into 60 videos" in core.logger.messages
+    assert "Expanding playlists of 2 URLs, at most 2 videos ahead" in core.logger.messages
+    assert not any(msg.startswith("Starting download") for msg in core.logger.messages)
+
+    core = ExpandingCore()
+    asyncio.run(AsyncOrchestrator(core, ExpandingConfig(["a"], batch_size=4)).run())
+    assert len(core.downloaded) == 30 and core.ahead[0] == 30
+    assert "Starting download of 30 items with 1 workers" in core.logger.messages
+
+
+def test_deadline_plans_with_expanded_item_count():
+    """ Testing that the adaptive strategy is planned with the videos, not the playlists  """
+    core = ExpandingCore()
+    core.strategy = AdaptiveQualityStrategy("best", ThroughputMonitor(), 60.0, 2)
+    planned = []
+    download = core.download_single
+
+    def download_single(url):
+        planned.append(core.strategy.remaining)
+        core.strategy.select_format(VideoRecord.from_info(url, {"formats": []}))
+        return download(url)
+
+    core.download_single = download_single
+    config = ExpandingConfig(["a", "b"])
+    config.deadline = 60.0
+    asyncio.run(AsyncOrchestrator(core, config).run())
+    assert len(core.downloaded) == 60
+    assert planned[0] == 60 and planned[-1] == 1
+
+
+def test_wiring(tmp_path):
+    """ Testing of the expander creation and the lookahead validation  """
+
+    def config(**kwargs):
+        return Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, **kwargs)
+
+    core = DIContainer.create_downloader_core(config(), DummyLogger())
+    assert core.playlist_expander is None
+    assert list(core.expand_playlist("pages://videos")) == ["pages://videos"]
+    core = DIContainer.create_downloader_core(config(expand_playlists=True), DummyLogger())
+    assert core.playlist_expander is not None
+    assert list(core.expand_playlist(video(5))) == [video(5)]
+    with pytest.raises(ValueError):
+        config(playlist_lookahead=0)
+    streamed = config(urls=["pages://videos"], stream_output="-", expand_playlists=True)
+    assert streamed.stream_framing == "framed"
+
+
+def test_scheduled_playlist_is_extracted_once(tmp_path):
+    """ Testing that SJF keeps the probed records of all expanded videos for the downloads  """
+    config = Config(
+        save_dir=tmp_path, max_workers=2, quality="best", audio_only=False,
+        urls=["pages://videos"], expand_playlists=True, schedule="sjf",
+    )
+    core = DIContainer.create_downloader_core(config, DummyLogger())
+    extracted = []
+
+    def extract_info(url, opts):
+        extracted.append(url)
+        return {"id": url[-6:], "title": url[-6:], "ext": "mp4", "duration": int(url[-2:])}
+
+    core.expand_playlist = lambda url: [video(n) for n in range(10)]
+    core.info_extractor.extract_info = extract_info
+    core.download_executor.execute_download = lambda url, opts: True
+    with core:
+        asyncio.run(AsyncOrchestrator(core, config).run())
+    assert sorted(extracted) == [video(n) for n in range(10)]
+    assert core.stats.get_summary()["success"] == 10
@@ -0,0 +1,267 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import stat
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.config.config import Config
+import yt_dl_cli.core.core as core
+from yt_dl_cli.core.orchestration import AsyncOrchestrator
+from yt_dl_cli.core.postprocessing import (
+    HandoffYoutubeDL,
+    PostProcessingPool,
+    PostProcessJob,
+    ffmpeg_command,
+    run_job,
+)
+from yt_dl_cli.core.records import TransferInfo, VideoRecord
+from yt_dl_cli.interfaces.strategies import AudioFormatStrategy
+from yt_dl_cli.utils.stats_manager import StatsManager
+
+
+class DummyLogger:
+    def __init__(self):
+        self.infos = []
+        self.errors = []
+
+    def info(self, msg):
+        self.infos.append(str(msg))
+
+    def error(self, msg):
+        self.errors.append(str(msg))
+
+    def warning(self, msg):
+        self.errors.append(str(msg))
+
+
+def fake_ffmpeg(tmp_path, exit_code=0, delay=0):
+    """Script writing its inputs' names to the target (the last argument)"""
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        "#!/bin/sh\n"
+        f"sleep {delay}\n"
+        f"[ {exit_code} -ne 0 ] && echo 'Invalid data found' >&2 && exit {exit_code}\n"
+        'for last; do :; done\necho "$@" > "$last"\n',
+        encoding="utf-8",
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+def make_parts(tmp_path, *names):
+    for name in names:
+        (tmp_path / name).write_bytes(b"raw")
+    return tuple(str(tmp_path / name) for name in names)
+
+
+def test_ffmpeg_command():
+    """ Testing of the ffmpeg command lines of merges and audio extraction  """
+    merge = PostProcessJob("T.mp4", ("T.f137.mp4", "T.f140.m4a"))
+    command = ffmpeg_command(merge, "T.temp.mp4")
+    assert command[command.index("-i"):command.index("-map")] == [
+        "-i", "T.f137.mp4", "-i", "T.f140.m4a"
+    ]
+    assert command[command.index("-map"):] == ["-map", "0", "-map", "1", "-c", "copy", "T.temp.mp4"]
+    audio = ffmpeg_command(PostProcessJob("T.mp3", ("T.webm",), "mp3"), "T.temp.mp3", "/bin/ff")
+    assert audio[0] == "/bin/ff"
+    assert audio[audio.index("-vn"):] == ["-vn", "-c:a", "libmp3lame", "T.temp.mp3"]
+
+
+def test_run_job_replaces_parts(tmp_path):
+    """ Testing of run_job writing the output and removing the parts  """
+    parts = make_parts(tmp_path, "T.f137.mp4", "T.f140.m4a")
+    output = tmp_path / "T.mp4"
+    assert run_job(PostProcessJob(str(output), parts), fake_ffmpeg(tmp_path)) == str(output)
+    assert "T.f137.mp4" in output.read_text()
+    assert not any(os.path.exists(part) for part in parts)
+    assert not (tmp_path / "T.temp.mp4").exists()
+
+
+def test_run_job_failure_keeps_parts(tmp_path):
+    """ Testing that a failed job reports ffmpeg's error and keeps the parts  """
+    parts = make_parts(tmp_path, "T.f137.mp4", "T.f140.m4a")
+    with pytest.raises(OSError, match="Invalid data found"):
+        run_job(PostProcessJob(str(tmp_path / "T.mp4"), parts), fake_ffmpeg(tmp_path, 1))
+    assert all(os.path.exists(part) for part in parts)
+    assert not (tmp_path / "T.mp4").exists()
+
+
+def test_handoff_youtube_dl_records_jobs():
+    """ Testing of HandoffYoutubeDL recording merges and audio extraction  """
+    ydl = HandoffYoutubeDL({"quiet": True})
+    info = ydl.post_process("d/T.mp4", {"__files_to_merge": ["d/T.f1.mp4", "d/T.f2.m4a"]})
+    assert info["filepath"] == "d/T.mp4"
+    assert ydl.handoffs == [PostProcessJob("d/T.mp4", ("d/T.f1.mp4", "d/T.f2.m4a"))]
+
+    ydl = HandoffYoutubeDL({"quiet": True, **AudioFormatStrategy().get_opts()})
+    info = ydl.post_process("d/T.webm", {})
+    assert info["filepath"] == "d/T.mp3"
+    assert ydl.handoffs == [PostProcessJob("d/T.mp3", ("d/T.webm",), "mp3")]
+
+
+def test_handoff_youtube_dl_keeps_unknown_codecs(monkeypatch):
+    """ Testing that audio codecs the pool cannot encode are converted by yt-dlp  """
+    processed = []
+    monkeypatch.setattr(
+        core.yt_dlp.YoutubeDL,
+        "post_process",
+        lambda self, filename, info, files_to_move=None: processed.append(filename) or info,
+    )
+    ydl = HandoffYoutubeDL(
+        {"quiet": True, "postprocessors": [{"key": "FFmpegExtractAudio", "preferredcodec": "best"}]}
+    )
+    ydl.post_process("d/T.webm", {})
+    assert ydl.handoffs == []
+    assert processed == ["d/T.webm"]
+
+
+@pytest.mark.parametrize(
+    "postprocessor",
+    [{"key": "FFmpegExtractAudio", "preferredcodec": "best"}, {"key": "FFmpegMetadata"}],
+)
+def test_handoff_youtube_dl_keeps_merges_with_other_postprocessors(monkeypatch, postprocessor):
+    """ Testing that merges are not handed off if the pool cannot run every post-processor  """
+    processed = []
+    monkeypatch.setattr(
+        core.yt_dlp.YoutubeDL,
+        "post_process",
+        lambda self, filename, info, files_to_move=None: processed.append(filename) or info,
+    )
+    ydl = HandoffYoutubeDL({"quiet": True, "postprocessors": [postprocessor]})
+    ydl.post_process("d/T.mp4", {"__files_to_merge": ["d/T.f1.mp4", "d/T.f2.m4a"]})
+    assert ydl.handoffs == []
+    assert processed == ["d/T.mp4"]
+
+
+def test_pool_is_bounded_and_counts(tmp_path):
+    """ Testing of PostProcessingPool back-pressure, join and counters  """
+    logger = DummyLogger()
+    executor = ThreadPoolExecutor(max_workers=1)
+    pool = PostProcessingPool(
+        1, logger, fake_ffmpeg(tmp_path, delay=0.2), max_pending=1, executor=executor
+    )
+    first = PostProcessJob(str(tmp_path / "a.mp4"), make_parts(tmp_path, "a.1", "a.2"))
+    second = PostProcessJob(str(tmp_path / "b.mp4"), ("missing", "also-missing"))
+    pool.submit(first)
+    blocked = threading.Event()
+
+    def submit_second():
+        pool.submit(second)
+        blocked.set()
+
+    thread = threading.Thread(target=submit_second)
+    thread.start()
+    assert not blocked.wait(0.05)
+    assert blocked.wait(5)
+    thread.join()
+    pool.close()
+    assert pool.pending == 0
+    assert (tmp_path / "a.mp4").exists()
+    assert len(logger.infos) == 2 and pool.completed == 2
+
+
+def test_pool_runs_jobs_in_processes(tmp_path):
+    """ Testing of the default process pool  """
+    logger = DummyLogger()
+    pool = PostProcessingPool(2, logger, fake_ffmpeg(tmp_path, exit_code=1))
+    try:
+        pool.submit(PostProcessJob(str(tmp_path / "T.mp4"), make_parts(tmp_path, "x", "y")))
+    finally:
+        pool.close()
+    assert pool.failed == 1
+    assert "Invalid data found" in logger.errors[0]
+
+
+def test_executor_hands_off_jobs(monkeypatch, tmp_path):
+    """ Testing that DownloadExecutor submits recorded jobs and reports their output  """
+    job = PostProcessJob(str(tmp_path / "T.mp4"), ("T.f1.mp4", "T.f2.m4a"))
+    factories = []
+
+    class DummyYDL:
+        handoffs = [job]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *a):
+            return False
+
+        def download(self, urls):
+            return 0
+
+    def create(opts, extractors, factory=None):
+        factories.append(factory)
+        return DummyYDL()
+
+    class DummyPool:
+        submitted = []
+
+        def submit(self, job):
+            self.submitted.append(job)
+
+    monkeypatch.setattr(core, "create_youtube_dl", create)
+    pool = DummyPool()
+    executor = core.DownloadExecutor(DummyLogger(), postprocessing=pool)  # type: ignore
+    assert executor.execute_download("u", {})
+    assert factories == [HandoffYoutubeDL]
+    assert pool.submitted == [job]
+    assert executor.last_transfer().path == job.output
+
+
+def test_failed_job_counts_as_failed_download(tmp_path):
+    """ Testing that a failed post-processing job turns its download into a failure  """
+    logger = DummyLogger()
+    stats = StatsManager()
+    pool = PostProcessingPool(
+        1, logger, fake_ffmpeg(tmp_path, exit_code=1), executor=ThreadPoolExecutor(1), stats=stats
+    )
+    job = PostProcessJob(str(tmp_path / "Title.mp4"), make_parts(tmp_path, "a.1", "a.2"))
+
+    class HandoffExecutor:
+        def execute_download(self, url, opts):
+            pool.submit(job)
+            return True
+
+        def last_transfer(self):
+            return TransferInfo(path=job.output)
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+        def select_format(self, record):
+            return None
+
+        def plan_items(self, count):
+            pass
+
+    class DummyFileChecker:
+        def exists(self, path):
+            return False
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="Title")
+
+    config = Config(
+        save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, urls=["u"]
+    )
+    downloader = core.DownloaderCore(
+        config=config,
+        strategy=DummyStrategy(),  # type: ignore
+        stats=stats,
+        logger=logger,  # type: ignore
+        file_checker=DummyFileChecker(),  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=HandoffExecutor(),  # type: ignore
+        postprocessing=pool,
+    )
+    asyncio.run(AsyncOrchestrator(downloader, config).run())
+    pool.close()
+    assert stats.get_summary() == {"success": 0, "failed": 1, "skipped": 0, "total": 1}
+    assert "Post-processing: 0 done, 1 failed" in logger.infos
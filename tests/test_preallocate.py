@@ -0,0 +1,80 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+import yt_dl_cli.utils.preallocate as preallocate_module
+from yt_dl_cli.utils.preallocate import Preallocator, fallocate
+
+
+def status(path, state="downloading", **extra):
+    return {"status": state, "tmpfilename": str(path), "filename": str(path)[:-5], **extra}
+
+
+@pytest.fixture
+def part(tmp_path):
+    path = tmp_path / "Title.mp4.part"
+    path.write_bytes(b"")
+    return path
+
+
+def test_fallocate_keeps_size(part):
+    """ Testing that fallocate reserves blocks without changing the file size  """
+    with open(part, "r+b") as f:
+        if not fallocate(f.fileno(), 4 * 1024 * 1024):
+            pytest.skip("fallocate is not supported here")
+    assert part.stat().st_size == 0
+    assert part.stat().st_blocks * 512 >= 4 * 1024 * 1024
+
+
+def test_fallocate_unavailable(monkeypatch, part):
+    """ Testing that fallocate reports False where libc has no fallocate  """
+    monkeypatch.setattr(preallocate_module, "_libc_fallocate", lambda: None)
+    with open(part, "r+b") as f:
+        assert fallocate(f.fileno(), 1024) is False
+
+
+def test_preallocator_reserves_once(monkeypatch, part):
+    """ Testing that the hook preallocates a file once, with its known size  """
+    calls = []
+    monkeypatch.setattr(
+        preallocate_module, "fallocate", lambda fd, size: calls.append(size) or True
+    )
+    preallocator = Preallocator(min_size=1000)
+    info = {"filesize": 5000}
+    preallocator.progress_hook(status(part, info_dict=info, total_bytes_estimate=9000))
+    preallocator.progress_hook(status(part, info_dict=info, downloaded_bytes=100))
+    assert calls == [5000]
+    assert (preallocator.files, preallocator.bytes) == (1, 5000)
+    # a new download of the same path (e.g. a retry) is preallocated again
+    preallocator.progress_hook(status(part, "error"))
+    preallocator.progress_hook(status(part, total_bytes=6000))
+    assert calls == [5000, 6000]
+
+
+def test_preallocator_skips_unknown_and_small(monkeypatch, part, tmp_path):
+    """ Testing that estimated, small and missing files are not preallocated  """
+    calls = []
+    monkeypatch.setattr(
+        preallocate_module, "fallocate", lambda fd, size: calls.append(size) or True
+    )
+    preallocator = Preallocator(min_size=1000)
+    preallocator.progress_hook(status(part, total_bytes_estimate=9000))
+    preallocator.progress_hook(status(tmp_path / "b.part", total_bytes=500))
+    preallocator.progress_hook(status(tmp_path / "missing.part", total_bytes=5000))
+    preallocator.progress_hook({"status": "downloading"})
+    assert calls == [] and preallocator.files == 0
+
+
+def test_preallocator_ignores_errors(monkeypatch, part):
+    """ Testing that a failed fallocate does not interrupt the download  """
+
+    def failing(fd, size):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(preallocate_module, "fallocate", failing)
+    preallocator = Preallocator(min_size=1)
+    preallocator.progress_hook(status(part, total_bytes=5000))
+    assert preallocator.files == 0
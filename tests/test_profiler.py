@@ -0,0 +1,195 @@
+""" Testing of the stage profiler """
+
+import os
+import pstats
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.utils import profiler as profiler_module
+from yt_dl_cli.utils.profiler import NullProfiler, StageProfiler
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DummyLogger:
+    """Logger collecting info messages"""
+
+    def __init__(self):
+        self.messages = []
+
+    def info(self, msg):
+        """Collect info messages"""
+        self.messages.append(str(msg))
+
+
+class Checker:
+    """Component to instrument"""
+
+    label = "checker"
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def exists(self, path):
+        """Pretend to stat a file"""
+        self.clock.now += 0.5
+        return path == "present"
+
+
+def test_stage_accumulates_calls():
+    """Test that stages aggregate count, total, mean and max"""
+    clock = FakeClock()
+    profiler = StageProfiler(clock=clock)
+    for seconds in (1.0, 3.0):
+        with profiler.stage("extract"):
+            clock.now += seconds
+    stats = profiler.stages["extract"]
+    assert (stats.calls, stats.total, stats.mean, stats.max) == (2, 4.0, 2.0, 3.0)
+
+
+def test_wrap_times_selected_methods_only():
+    """Test that the proxy times listed methods and passes the rest through"""
+    clock = FakeClock()
+    profiler = StageProfiler(clock=clock)
+    checker = profiler.wrap(Checker(clock), {"exists": "check"})
+    assert checker.exists("present") is True
+    assert checker.label == "checker"
+    assert profiler.stages["check"].total == 0.5
+    assert list(profiler.stages) == ["check"]
+
+
+def test_null_profiler_is_transparent():
+    """Test that the null profiler leaves components and calls untouched"""
+    profiler = NullProfiler()
+    checker = Checker(FakeClock())
+    assert profiler.wrap(checker, {"exists": "check"}) is checker
+    assert profiler.run(str.upper, "url") == "URL"
+    with profiler.stage("extract"):
+        pass
+    logger = DummyLogger()
+    profiler.report(logger, 1.0)
+    assert logger.messages == []
+
+
+def test_run_names_thread_after_item():
+    """Test that the worker thread carries the URL while processing it"""
+    profiler = StageProfiler()
+    seen = []
+    name = threading.current_thread().name
+    profiler.run(lambda url: seen.append(threading.current_thread().name), "https://x/1")
+    assert seen == ["yt-dl https://x/1"]
+    assert threading.current_thread().name == name
+
+
+def test_hooks_time_transfer_and_postprocessing():
+    """Test the yt-dlp progress and post-processor hooks"""
+    clock = FakeClock()
+    profiler = StageProfiler(clock=clock)
+    profiler.progress_hook({"status": "downloading", "filename": "a.mp4"})
+    clock.now += 2.0
+    profiler.progress_hook({"status": "downloading", "filename": "a.mp4"})
+    clock.now += 1.0
+    profiler.progress_hook({"status": "finished", "filename": "a.mp4"})
+    profiler.postprocessor_hook({"status": "started", "postprocessor": "Merger"})
+    clock.now += 0.25
+    profiler.postprocessor_hook({"status": "finished", "postprocessor": "Merger"})
+    assert profiler.stages["transfer"].total == 3.0
+    assert profiler.stages["postprocess"].total == 0.25
+
+
+def test_report_merges_worker_profiles(tmp_path):
+    """Test the summary table and the merged cProfile output of several threads"""
+    output = tmp_path / "out" / "batch.pstats"
+    profiler = StageProfiler(cprofile_path=output)
+
+    def work(url):
+        with profiler.stage("download"):
+            return sum(range(1000))
+
+    threads = [threading.Thread(target=profiler.run, args=(work, f"u{i}")) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    logger = DummyLogger()
+    profiler.report(logger, elapsed=1.0)
+    assert any(line.strip().startswith("download") for line in logger.messages)
+    assert output.is_file()
+    functions = {func[2] for func in pstats.Stats(str(output)).stats}  # type: ignore
+    assert "work" in functions
+
+
+def run_concurrently(profiler, work, workers=4):
+    """Run ``work`` in overlapping worker threads and return their errors"""
+    errors = []
+
+    def worker(url):
+        try:
+            profiler.run(work, url)
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(f"u{i}",)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_concurrent_workers_profile(tmp_path):
+    """Test that overlapping workers are profiled on the running Python version"""
+    output = tmp_path / "batch.pstats"
+    profiler = StageProfiler(cprofile_path=output)
+    barrier = threading.Barrier(4)
+
+    def work(url):
+        barrier.wait(timeout=5)
+        return sum(range(1000))
+
+    assert run_concurrently(profiler, work) == []
+    profiler.report(DummyLogger(), elapsed=1.0)
+    functions = {func[2] for func in pstats.Stats(str(output)).stats}  # type: ignore
+    assert "work" in functions
+
+
+class SingleActiveProfile:
+    """cProfile.Profile stand-in allowing one active profiler, as on Python 3.12+"""
+
+    active = None
+    enables = 0
+
+    def enable(self):
+        if SingleActiveProfile.active is not None:
+            raise ValueError("Another profiling tool is already active")
+        SingleActiveProfile.active = self
+        SingleActiveProfile.enables += 1
+
+    def disable(self):
+        if SingleActiveProfile.active is self:
+            SingleActiveProfile.active = None
+
+
+def test_process_wide_profile_shared_by_workers(monkeypatch, tmp_path):
+    """Test that concurrent workers share one enabled profile on Python 3.12+"""
+    monkeypatch.setattr(profiler_module, "_PROCESS_WIDE_PROFILE", True)
+    monkeypatch.setattr(profiler_module.cProfile, "Profile", SingleActiveProfile)
+    monkeypatch.setattr(SingleActiveProfile, "active", None)
+    monkeypatch.setattr(SingleActiveProfile, "enables", 0)
+    profiler = StageProfiler(cprofile_path=tmp_path / "batch.pstats")
+    barrier = threading.Barrier(4)
+
+    assert run_concurrently(profiler, lambda url: barrier.wait(timeout=5)) == []
+    assert SingleActiveProfile.enables == 1
+    assert SingleActiveProfile.active is None
@@ -0,0 +1,102 @@
+import gc
+import sys
+import os
+import weakref
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.core.records import FormatRecord, VideoRecord
+
+
+INFO = {
+    "id": "abc",
+    "title": "Video",
+    "duration": 212,
+    "extractor_key": "Youtube",
+    "webpage_url": "https://www.youtube.com/watch?v=abc",
+    "format_id": "137+140",
+    "formats": [
+        {
+            "format_id": "137",
+            "ext": "mp4",
+            "height": 1080,
+            "vcodec": "avc1.640028",
+            "acodec": "none",
+            "filesize": 9000,
+            "url": "https://rr1.googlevideo.com/videoplayback?sig=x",
+            "http_headers": {"User-Agent": "ua"},
+        },
+        {
+            "format_id": "140",
+            "ext": "m4a",
+            "vcodec": "none",
+            "acodec": "mp4a.40.2",
+            "filesize_approx": 1000,
+        },
+    ],
+    "requested_formats": [{"filesize": 9000}, {"filesize_approx": 1000}],
+    "automatic_captions": {"en": [{"url": "x"}]},
+}
+
+
+def test_video_record_projection():
+    """ Testing of VideoRecord.from_info projection  """
+    record = VideoRecord.from_info("https://youtu.be/abc", INFO)
+    assert record.title == "Video"
+    assert record.extractor == "Youtube"
+    assert record.filesize == 10000
+    assert [f.format_id for f in record.formats] == ["137", "140"]
+    assert record.formats[0].host == "rr1.googlevideo.com"
+    assert record.formats[1].filesize == 1000
+    assert record.formats[0].has_video and not record.formats[0].has_audio
+    assert record.formats[1].has_audio and not record.formats[1].has_video
+
+
+def test_records_are_slotted():
+    """ Testing that records cannot grow arbitrary attributes  """
+    record = VideoRecord.from_info("u", INFO)
+    with pytest.raises(AttributeError):
+        record.thumbnails = []  # type: ignore
+    with pytest.raises(AttributeError):
+        FormatRecord("18").url = "x"  # type: ignore
+
+
+def test_video_record_does_not_retain_info():
+    """ Testing that the raw info dict can be collected after projection  """
+
+    class Info(dict):
+        pass
+
+    info = Info(INFO)
+    ref = weakref.ref(info)
+    record = VideoRecord.from_info("u", info)
+    del info
+    gc.collect()
+    assert ref() is None
+    assert record.title == "Video"
+
+
+def test_video_record_to_dict():
+    """ Testing of VideoRecord.to_dict  """
+    data = VideoRecord.from_info("u", {"title": "T", "formats": [{"format_id": 18}]}).to_dict()
+    assert data == {"url": "u", "title": "T", "formats": [{"format_id": "18"}]}
+
+
+def test_record_cache_lru_and_ttl():
+    """ Testing of RecordCache eviction and expiry  """
+    from yt_dl_cli.core.records import RecordCache
+
+    now = [0.0]
+    cache = RecordCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+    records = {url: VideoRecord.from_info(url, {"title": url}) for url in "abc"}
+    cache.put("a", records["a"])
+    cache.put("b", records["b"])
+    assert cache.get("a") is records["a"]
+    cache.put("c", records["c"])
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
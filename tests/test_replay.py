@@ -0,0 +1,155 @@
+import sys
+import os
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import DownloadExecutor, VideoInfoExtractor
+from yt_dl_cli.core.replay import Cassette, CassetteRecorder, ReplayExtractor
+
+URL = "https://www.youtube.com/watch?v=replay00001"
+
+
+class DummyLogger:
+    """ Logger collecting error messages  """
+
+    def __init__(self):
+        self.errors = []
+
+    def error(self, msg):
+        self.errors.append(str(msg))
+
+
+def make_info():
+    """ Build a small recorded info dictionary  """
+    return {
+        "id": "replay00001",
+        "title": "Recorded",
+        "duration": 10,
+        "extractor_key": "Youtube",
+        "requested_formats": [{"format_id": "18"}],
+        "_filename": "x.mp4",
+        "formats": [
+            {"format_id": "18", "ext": "mp4", "url": "https://cdn.invalid/18.mp4",
+             "vcodec": "avc1", "acodec": "mp4a", "height": 360},
+            {"format_id": "22", "ext": "mp4", "url": "https://cdn.invalid/22.mp4",
+             "vcodec": "avc1", "acodec": "mp4a", "height": 720},
+        ],
+    }
+
+
+def test_cassette_roundtrip_and_sharding(tmp_path):
+    """ Testing storage layout and stripping of processing keys  """
+    cassette = Cassette(tmp_path)
+    path = cassette.save_info(URL, make_info())
+    key = Cassette.key(URL)
+    assert path == tmp_path / "info" / key[:2] / f"{key}.json"
+    info = cassette.load(URL)
+    assert info["title"] == "Recorded"
+    assert "requested_formats" not in info and "_filename" not in info
+    assert cassette.load("https://example.com/other") is None
+    assert not cassette.has("https://example.com/other")
+
+
+def test_cassette_default_template_and_media(tmp_path):
+    """ Testing the default template and local media substitution  """
+    cassette = Cassette(tmp_path)
+    (tmp_path / "default.json").write_text('{"title": "Synthetic", "formats": []}')
+    first = cassette.load("https://example.com/a")
+    second = cassette.load("https://example.com/b")
+    assert first["id"] != second["id"]
+    assert first["title"].startswith("Synthetic ")
+    assert cassette.has("https://example.com/anything")
+
+    cassette.save_info(URL, make_info())
+    media = tmp_path / "src.mp4"
+    media.write_bytes(b"x" * 100)
+    cassette.save_media(URL, "18", media)
+    formats = cassette.load(URL)["formats"]
+    assert [fmt["format_id"] for fmt in formats] == ["18"]
+    assert formats[0]["url"].startswith("file://")
+
+
+def test_replay_through_video_info_extractor(tmp_path):
+    """ Testing offline extraction with injected latency  """
+    cassette = Cassette(tmp_path)
+    cassette.save_info(URL, make_info())
+    extractor = VideoInfoExtractor(DummyLogger(), [ReplayExtractor(cassette, latency=0.05)])
+    start = time.monotonic()
+    record = extractor.extract_record(URL, {"quiet": True})
+    assert time.monotonic() - start >= 0.05
+    assert record.title == "Recorded"
+    assert [fmt.format_id for fmt in record.formats] == ["18", "22"]
+
+
+def test_replay_errors_and_strict_mode(tmp_path):
+    """ Testing injected failures and unrecorded URLs  """
+    cassette = Cassette(tmp_path)
+    cassette.save_info(URL, make_info())
+    logger = DummyLogger()
+    failing = VideoInfoExtractor(logger, [ReplayExtractor(cassette, error_rate=1.0)])
+    assert failing.extract_info(URL, {"quiet": True}) is None
+    assert "injected replay failure" in logger.errors[0]
+
+    strict = VideoInfoExtractor(logger, [ReplayExtractor(cassette)])
+    assert strict.extract_info("https://example.com/unknown", {"quiet": True}) is None
+    assert "not recorded" in logger.errors[1]
+    assert ReplayExtractor(cassette, passthrough=True).suitable(URL)
+    assert not ReplayExtractor(cassette, passthrough=True).suitable("https://example.com/x")
+
+
+
+def test_replay_failures_are_reproducible(tmp_path):
+    """ Testing that injected failures depend only on the seed and the URL  """
+    cassette = Cassette(tmp_path)
+    (tmp_path / "default.json").write_text(
+        '{"title": "Synthetic", "formats": [{"format_id": "18", "ext": "mp4",'
+        ' "url": "https://cdn.invalid/18.mp4"}]}'
+    )
+    extractor = VideoInfoExtractor(
+        DummyLogger(), [ReplayExtractor(cassette, error_rate=0.5, seed=7)]
+    )
+    urls = [f"https://example.com/{i}" for i in range(20)]
+
+    def failures():
+        return [u for u in urls if extractor.extract_info(u, {"quiet": True}) is None]
+
+    first = failures()
+    assert 0 < len(first) < len(urls)
+    assert failures() == first
+
+
+def test_record_then_replay_download(tmp_path):
+    """ Testing that recorded media is replayed without the network  """
+    cassette = Cassette(tmp_path / "cassette")
+    recorder = CassetteRecorder(cassette)
+    recorder.record_info(URL, make_info())
+    downloaded = tmp_path / "Recorded.mp4"
+    downloaded.write_bytes(b"m" * 4096)
+    recorder.progress_hook({"status": "downloading", "filename": str(downloaded)})
+    recorder.progress_hook({
+        "status": "finished",
+        "filename": str(downloaded),
+        "info_dict": {"original_url": URL, "format_id": "18"},
+    })
+
+    out = tmp_path / "out"
+    executor = DownloadExecutor(DummyLogger(), extractors=[ReplayExtractor(cassette)])
+    opts = {"quiet": True, "outtmpl": str(out / "%(title)s.%(ext)s"), "format": "18"}
+    assert executor.execute_download(URL, opts)
+    assert (out / "Recorded.mp4").read_bytes() == b"m" * 4096
+
+
+def test_config_replay_validation():
+    """ Testing validation of the replay options  """
+    base = {"save_dir": "d", "max_workers": 1, "quality": "best", "audio_only": False}
+    with pytest.raises(ValueError):
+        Config(**base, replay_dir="a", record_dir="b")  # type: ignore
+    with pytest.raises(ValueError):
+        Config(**base, replay_error_rate=1.5)  # type: ignore
+    with pytest.raises(ValueError):
+        Config(**base, replay_latency=-1)  # type: ignore
+    assert Config(**base, replay_dir="a").replay_dir.name == "a"  # type: ignore
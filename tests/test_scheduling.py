@@ -0,0 +1,180 @@
+import asyncio
+import contextlib
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.core.orchestration import AsyncOrchestrator
+from yt_dl_cli.core.records import VideoRecord
+from yt_dl_cli.core.scheduling import (
+    FIFO,
+    LJF,
+    NOMINAL_BYTES_PER_SECOND,
+    SJF,
+    estimate_cost,
+    extractor_key,
+    micro_batches,
+    order_urls,
+    parse_link_line,
+)
+from yt_dl_cli.interfaces.strategies import VideoFormatStrategy
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.tracing import NullTracer
+
+
+def test_parse_link_line():
+    """ Testing of links file annotations  """
+    assert parse_link_line("https://x/1") == ("https://x/1", None)
+    assert parse_link_line("https://x/1  priority=-2 other=1") == ("https://x/1", -2)
+    with pytest.raises(ValueError):
+        parse_link_line("https://x/1 priority=high")
+
+
+def test_estimate_cost():
+    """ Testing of cost estimates from records  """
+    assert estimate_cost(None) is None
+    assert estimate_cost(VideoRecord("u", duration=10, filesize=123)) == 123
+    assert estimate_cost(VideoRecord("u", duration=10)) == 10 * NOMINAL_BYTES_PER_SECOND
+    assert estimate_cost(VideoRecord("u")) is None
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (FIFO, ["p", "a", "b", "c", "d"]),
+        (SJF, ["p", "b", "d", "a", "c"]),
+        (LJF, ["p", "a", "d", "b", "c"]),
+    ],
+)
+def test_order_urls(policy, expected):
+    """ Testing of priorities and policies  """
+    costs = {"a": 900.0, "b": 10.0, "c": None, "d": 100.0, "p": 5000.0}
+    assert order_urls(["a", "b", "c", "d", "p"], policy, {"p": 1}, costs) == expected
+
+
+class DummyLogger:
+    def info(self, msg):
+        pass
+
+    warning = info
+
+
+class DummyStats:
+    def report(self, logger, elapsed):
+        pass
+
+
+class DummyCore:
+    """Core with known durations; records probes and downloads"""
+
+    def __init__(self, durations):
+        self.durations = durations
+        self.logger = DummyLogger()
+        self.stats = DummyStats()
+        self.profiler = NullProfiler()
+        self.tracer = NullTracer()
+        self.work_queue = None
+        self.postprocessing = None
+        self.mover = None
+        self.connection_pool = None
+        self.dns_cache = None
+        self.strategy = VideoFormatStrategy("best")
+        self.probed = []
+        self.downloaded = []
+
+    def probe(self, url):
+        self.probed.append(url)
+        duration = self.durations[url]
+        return None if duration is None else VideoRecord(url, duration=duration)
+
+    def download_single(self, url):
+        self.downloaded.append(url)
+        return "downloaded"
+
+
+class DummyConfig:
+    def __init__(self, urls, schedule, priorities=None):
+        self.urls = urls
+        self.max_workers = 1
+        self.metadata_only = False
+        self.schedule = schedule
+        self.priorities = priorities or {}
+        self.batch_size = 1
+        self.expand_playlists = False
+
+
+def test_orchestrator_schedules_shortest_first():
+    """ Testing that the orchestrator probes and queues by SJF  """
+    durations = {"long": 36000, "clip": 30, "broken": None, "medium": 600}
+    core = DummyCore(durations)
+    config = DummyConfig(list(durations), SJF)
+    asyncio.run(AsyncOrchestrator(core, config).run())
+    assert sorted(core.probed) == sorted(durations)
+    assert core.downloaded == ["clip", "medium", "long", "broken"]
+
+
+def test_orchestrator_fifo_applies_priorities_without_probing():
+    """ Testing that FIFO only applies priorities  """
+    core = DummyCore({"a": 1, "b": 2, "c": 3})
+    config = DummyConfig(["a", "b", "c"], FIFO, {"c": 2, "b": 1})
+    asyncio.run(AsyncOrchestrator(core, config).run())
+    assert core.probed == []
+    assert core.downloaded == ["c", "b", "a"]
+
+
+def test_extractor_key():
+    """ Testing that URLs are matched to yt-dlp extractors without extraction  """
+    assert extractor_key("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "Youtube"
+    assert extractor_key("https://vimeo.com/76979871") == "Vimeo"
+    assert extractor_key("https://example.com/clip.mp4") == "Generic"
+
+
+def test_micro_batches_group_by_key_in_queue_order():
+    """ Testing that batches follow the queue order of their first URL  """
+    urls = ["yt1", "vi1", "yt2", "yt3", "vi2", "yt4", "dm1"]
+    batches = list(micro_batches(urls, 3, key=lambda url: url[:2]))
+    assert batches == [["yt1", "yt2", "yt3"], ["vi1", "vi2"], ["yt4"], ["dm1"]]
+    assert list(micro_batches(urls, 1, key=lambda url: url[:2])) == [[url] for url in urls]
+    assert list(micro_batches([], 3)) == []
+
+
+class BatchingCore(DummyCore):
+    """Core recording which URLs were downloaded in which batch session"""
+
+    def __init__(self, durations):
+        super().__init__(durations)
+        self.sessions = []
+
+    @contextlib.contextmanager
+    def batch_session(self):
+        self.sessions.append([])
+        yield
+
+    def download_single(self, url):
+        if url == "https://www.youtube.com/watch?v=broken00000":
+            raise RuntimeError("boom")
+        self.sessions[-1].append(url)
+        return super().download_single(url)
+
+
+def test_orchestrator_runs_micro_batches():
+    """ Testing that every batch runs in one session and failures stay isolated  """
+    youtube = [f"https://www.youtube.com/watch?v=video{n:06d}" for n in range(3)]
+    vimeo = [f"https://vimeo.com/{n}" for n in range(1000, 1002)]
+    urls = [youtube[0], vimeo[0], youtube[1], vimeo[1], youtube[2]]
+    core = BatchingCore(dict.fromkeys(urls, 1))
+    config = DummyConfig(urls, FIFO)
+    config.batch_size = 2
+    asyncio.run(AsyncOrchestrator(core, config).run())
+    assert core.sessions == [youtube[:2], vimeo, youtube[2:]]
+
+    broken = "https://www.youtube.com/watch?v=broken00000"
+    core = BatchingCore(dict.fromkeys([broken, youtube[0]], 1))
+    config = DummyConfig([broken, youtube[0]], FIFO)
+    config.batch_size = 2
+    with pytest.raises(RuntimeError):
+        asyncio.run(AsyncOrchestrator(core, config).run())
+    assert core.sessions == [[youtube[0]]]
@@ -0,0 +1,234 @@
+import http.client
+import json
+import os
+import sys
+import threading
+from types import SimpleNamespace
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.config.config import ServerConfig
+from yt_dl_cli.core import server
+from yt_dl_cli.core.records import DownloadStatus, RecordCache
+from yt_dl_cli.core.server import (
+    DONE,
+    ArchiveIndex,
+    DownloadService,
+    create_server,
+)
+from yt_dl_cli.utils.parser import parse_serve_arguments
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.stats_manager import StatsManager
+from yt_dl_cli.utils.tracing import NullTracer
+
+
+class DummyLogger:
+    def __init__(self):
+        self.messages = []
+
+    def debug(self, msg):
+        self.messages.append(str(msg))
+
+    info = warning = error = critical = debug
+
+
+class DummyCore:
+    """Core whose downloads succeed unless the URL contains 'fail'"""
+
+    def __init__(self, tmp_path, workers=2):
+        self.config = SimpleNamespace(max_workers=workers, save_dir=tmp_path)
+        self.logger = DummyLogger()
+        self.stats = StatsManager()
+        self.profiler = NullProfiler()
+        self.tracer = NullTracer()
+        self.info_extractor = SimpleNamespace(record_cache=RecordCache(4))
+        self.calls = []
+
+    def download_single(self, url):
+        self.calls.append(url)
+        if "fail" in url:
+            self.stats.record_failure()
+            return DownloadStatus.FAILED
+        self.stats.record_success()
+        return DownloadStatus.DOWNLOADED
+
+
+def wait_done(service, job_id):
+    for _ in range(500):
+        job = service.job(job_id)
+        if job.state == DONE:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_service_runs_jobs_and_archives(tmp_path):
+    """ Testing of DownloadService with the archive index  """
+    archive_path = tmp_path / "archive"
+    archive_path.write_text("https://x/old\n", encoding="utf-8")
+    core = DummyCore(tmp_path)
+    service = DownloadService(core, ArchiveIndex(archive_path))
+    try:
+        job = service.submit(["https://x/old", "https://x/new", "https://x/fail", "https://x/new"])
+        job = wait_done(service, job.id)
+    finally:
+        service.close()
+    assert job.results == {
+        "https://x/old": DownloadStatus.SKIPPED,
+        "https://x/new": DownloadStatus.DOWNLOADED,
+        "https://x/fail": DownloadStatus.FAILED,
+    }
+    assert sorted(core.calls) == ["https://x/fail", "https://x/new"]
+    assert job.to_dict()["counts"] == {"skipped": 1, "downloaded": 1, "failed": 1}
+    assert "https://x/new" in ArchiveIndex(archive_path)
+    assert "https://x/fail" not in ArchiveIndex(archive_path)
+    assert service.health()["stats"] == {"success": 1, "failed": 1, "skipped": 1, "total": 3}
+
+
+def test_service_fails_urls_on_unexpected_errors(tmp_path):
+    """ Testing that an unexpected error fails the URL instead of leaving the job running  """
+
+    class BrokenArchive(ArchiveIndex):
+        def add(self, url):
+            raise OSError("disk full")
+
+    service = DownloadService(DummyCore(tmp_path), BrokenArchive())
+    try:
+        job = wait_done(service, service.submit(["https://x/1"]).id)
+    finally:
+        service.close()
+    assert job.results == {"https://x/1": DownloadStatus.FAILED}
+    assert job.to_dict()["errors"] == {"https://x/1": "disk full"}
+
+
+def test_service_close_cancels_queued_urls(monkeypatch, tmp_path):
+    """ Testing that close() waits for running downloads and drops queued ones  """
+    started, release = threading.Event(), threading.Event()
+
+    class ReleasingPool(server.ThreadPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            release.set()  # queued URLs are cancelled by now
+            super().shutdown(*args, **kwargs)
+
+    monkeypatch.setattr(server, "ThreadPoolExecutor", ReleasingPool)
+    core = DummyCore(tmp_path, workers=1)
+    download = core.download_single
+
+    def blocking_download(url):
+        started.set()
+        release.wait(5)
+        return download(url)
+
+    core.download_single = blocking_download
+    service = DownloadService(core)
+    service.submit([f"https://x/{i}" for i in range(5)])
+    assert started.wait(5)
+    service.close()
+    assert core.calls == ["https://x/0"]
+
+
+def test_service_forgets_old_finished_jobs(tmp_path):
+    """ Testing of the job history limit  """
+    service = DownloadService(DummyCore(tmp_path), max_jobs=2)
+    try:
+        ids = []
+        for i in range(3):
+            job = service.submit([f"https://x/{i}"])
+            wait_done(service, job.id)
+            ids.append(job.id)
+    finally:
+        service.close()
+    assert service.job(ids[0]) is None
+    assert [job["id"] for job in service.jobs()] == ids[1:]
+
+
+def request(base, method, path, body=None):
+    data = None if body is None else json.dumps(body).encode()
+    try:
+        with urlopen(Request(base + path, data=data, method=method), timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_http_api_round_trip(tmp_path):
+    """ Testing of the JSON API over HTTP  """
+    service = DownloadService(DummyCore(tmp_path))
+    server = create_server(service, ServerConfig(port=0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = "http://127.0.0.1:%d" % server.server_address[1]
+    try:
+        status, job = request(base, "POST", "/jobs", {"urls": ["https://x/1"]})
+        assert status == 202 and job["id"] == "1"
+        wait_done(service, job["id"])
+        status, job = request(base, "GET", "/jobs/1")
+        assert status == 200
+        assert job["urls"] == {"https://x/1": DownloadStatus.DOWNLOADED}
+        assert request(base, "GET", "/jobs")[1]["jobs"][0]["state"] == DONE
+        health = request(base, "GET", "/health")[1]
+        assert health["archive"] == 1
+        assert health["metadata_cache"] == {"size": 0, "hits": 0, "misses": 0}
+        assert request(base, "POST", "/jobs", {"urls": []})[0] == 400
+        assert request(base, "GET", "/jobs/99")[0] == 404
+        assert request(base, "GET", "/nope")[0] == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def test_http_api_rejects_invalid_content_length(tmp_path):
+    """ Testing that a malformed Content-Length is answered with 400  """
+    service = DownloadService(DummyCore(tmp_path))
+    server = create_server(service, ServerConfig(port=0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for length in ("abc", "-5"):
+            conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+            conn.putrequest("POST", "/jobs")
+            conn.putheader("Content-Length", length)
+            conn.endheaders()
+            response = conn.getresponse()
+            assert response.status == 400
+            assert length in json.loads(response.read())["error"]
+            conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def test_parse_serve_arguments(tmp_path):
+    """ Testing of parse_serve_arguments  """
+    config, server_config = parse_serve_arguments(
+        ["-d", str(tmp_path), "-w", "3", "--port", "0", "--metadata-cache", "10"]
+    )
+    assert config.max_workers == 3
+    assert config.reuse_sessions is True
+    assert config.metadata_cache_size == 10
+    assert config.urls == []
+    assert server_config.port == 0
+    assert server_config.socket_path is None
+
+    config, _ = parse_serve_arguments(
+        ["-d", str(tmp_path), "--no-metadata-cache", "--no-reuse-sessions"]
+    )
+    assert config.metadata_cache_size == 0
+    assert config.reuse_sessions is False
+    with pytest.raises(SystemExit):
+        parse_serve_arguments(["-d", str(tmp_path), "--port", "70000"])
+
+
+def test_server_config_validation():
+    """ Testing of ServerConfig validation  """
+    with pytest.raises(ValueError):
+        ServerConfig(port=-1)
+    with pytest.raises(ValueError):
+        ServerConfig(max_jobs=0)
+    assert ServerConfig(socket_path="/tmp/yt.sock").socket_path.name == "yt.sock"
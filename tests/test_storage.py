@@ -0,0 +1,329 @@
+from datetime import datetime, timezone
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import re
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlsplit
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import DownloaderCore
+from yt_dl_cli.core.records import TransferInfo, VideoRecord
+import yt_dl_cli.utils.storage as storage_module
+from yt_dl_cli.utils.s3 import S3Client, S3Error, S3Storage, sign_v4
+from yt_dl_cli.utils.storage import (
+    LocalStorage,
+    StorageFileChecker,
+    StorageUploader,
+    create_storage,
+)
+
+KEY, SECRET = "test-key", "test-secret"
+
+
+class FakeS3(BaseHTTPRequestHandler):
+    """Local S3 stand-in: path-style objects and multipart uploads, signatures checked"""
+
+    objects = {}
+    uploads = {}
+    log = []
+
+    def _reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _request(self):
+        parts = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        auth = self.headers["Authorization"]
+        signed = auth.split("SignedHeaders=")[1].split(",")[0].split(";")
+        expected = sign_v4(
+            self.command,
+            "http://" + self.headers["Host"] + self.path,
+            {name: self.headers[name] for name in signed},
+            hashlib.sha256(body).hexdigest(),
+            KEY,
+            SECRET,
+            "us-east-1",
+            now=datetime.strptime(self.headers["x-amz-date"], "%Y%m%dT%H%M%SZ"),
+        )["Authorization"]
+        if expected != auth:
+            self._reply(403, b"<Error><Code>SignatureDoesNotMatch</Code></Error>")
+            return None
+        query = {k: v[0] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        FakeS3.log.append((self.command, unquote(parts.path), sorted(query)))
+        return unquote(parts.path), query, body
+
+    def do_HEAD(self):
+        request = self._request()
+        if request:
+            self._reply(200 if request[0] in FakeS3.objects else 404)
+
+    def do_PUT(self):
+        request = self._request()
+        if not request:
+            return
+        path, query, body = request
+        if "uploadId" in query:
+            FakeS3.uploads[query["uploadId"]][int(query["partNumber"])] = body
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            self._reply(200, headers={"ETag": etag})
+        else:
+            FakeS3.objects[path] = body
+            self._reply(200)
+
+    def do_POST(self):
+        request = self._request()
+        if not request:
+            return
+        path, query, body = request
+        if "uploads" in query:
+            upload_id = uuid.uuid4().hex
+            FakeS3.uploads[upload_id] = {}
+            self._reply(200, f"<R><UploadId>{upload_id}</UploadId></R>".encode())
+        else:
+            parts = FakeS3.uploads.pop(query["uploadId"])
+            numbers = [int(n) for n in re.findall(r"<PartNumber>(\d+)<", body.decode())]
+            FakeS3.objects[path] = b"".join(parts[n] for n in numbers)
+            self._reply(200, b"<CompleteMultipartUploadResult/>")
+
+    def do_DELETE(self):
+        request = self._request()
+        if request:
+            FakeS3.uploads.pop(request[1]["uploadId"], None)
+            self._reply(204)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def s3_endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeS3)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    FakeS3.objects, FakeS3.uploads, FakeS3.log = {}, {}, []
+    yield "http://127.0.0.1:%d" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def s3(s3_endpoint):
+    client = S3Client(s3_endpoint, access_key=KEY, secret_key=SECRET)
+    storage = S3Storage(client, "media", "videos", part_size=1000)
+    yield storage
+    storage.close()
+
+
+def download(tmp_path, uploader, name, data, block=300):
+    """Write a file like yt-dlp does, calling the uploader's progress hook"""
+    final = tmp_path / name
+    part = tmp_path / (name + ".part")
+    with open(part, "wb") as f:
+        for offset in range(0, len(data), block):
+            f.write(data[offset:offset + block])
+            f.flush()
+            uploader.progress_hook(
+                {
+                    "status": "downloading",
+                    "filename": str(final),
+                    "tmpfilename": str(part),
+                    "downloaded_bytes": min(offset + block, len(data)),
+                }
+            )
+    os.replace(part, final)
+    uploader.progress_hook(
+        {"status": "finished", "filename": str(final), "downloaded_bytes": len(data)}
+    )
+    return str(final)
+
+
+def test_sign_v4_matches_aws_example():
+    """ Testing of sign_v4 against the example of the AWS documentation  """
+    headers = sign_v4(
+        "GET",
+        "https://iam.amazonaws.com/?Action=ListUsers&Version=2010-05-08",
+        {"content-type": "application/x-www-form-urlencoded; charset=utf-8"},
+        hashlib.sha256(b"").hexdigest(),
+        "AKIDEXAMPLE",
+        "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+        "us-east-1",
+        "iam",
+        datetime(2015, 8, 30, 12, 36, tzinfo=timezone.utc),
+    )
+    assert headers["Authorization"].endswith(
+        "Signature=5d672d79c15b13162d9279b0855cfba6789a8edb4c82c400e06b5924a6f2b5d7"
+    )
+
+
+def test_parts_are_uploaded_while_downloading(monkeypatch, tmp_path, s3):
+    """ Testing that parts are uploaded before the download finishes  """
+    monkeypatch.setattr(storage_module, "READ_SIZE", 500)
+    uploader = StorageUploader(s3)
+    data = os.urandom(3500)
+    path = download(tmp_path, uploader, "Title.mp4", data)
+
+    def parts_received():
+        return sum(1 for method, _, query in FakeS3.log if "partNumber" in query)
+
+    # the three full parts were handed to the upload pool during the download
+    deadline = time.monotonic() + 5
+    while parts_received() < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert parts_received() == 3
+    assert "/media/videos/Title.mp4" not in FakeS3.objects
+    assert uploader.commit(path) == "s3://media/videos/Title.mp4"
+    assert FakeS3.objects["/media/videos/Title.mp4"] == data
+    assert not os.path.exists(path)
+    assert s3.exists("Title.mp4") and not s3.exists("Other.mp4")
+
+
+def test_small_file_is_put_in_one_request(tmp_path, s3):
+    """ Testing that files smaller than a part do not start a multipart upload  """
+    uploader = StorageUploader(s3, keep_local=True)
+    path = download(tmp_path, uploader, "Small.m4a", b"x" * 400)
+    uploader.commit(path)
+    assert [entry[0] for entry in FakeS3.log] == ["PUT"]
+    assert os.path.exists(path)
+
+
+def test_merge_output_is_uploaded_and_parts_aborted(tmp_path, s3):
+    """ Testing of a merged download: part uploads are aborted, the output uploaded  """
+    uploader = StorageUploader(s3)
+    download(tmp_path, uploader, "T.f137.mp4", os.urandom(2500))
+    download(tmp_path, uploader, "T.f140.m4a", os.urandom(300))
+    merged = tmp_path / "T.mp4"
+    merged.write_bytes(b"merged" * 300)
+    uploader.commit(str(merged))
+    assert set(FakeS3.objects) == {"/media/videos/T.mp4"}
+    assert FakeS3.uploads == {}
+    assert any(method == "DELETE" for method, _, _ in FakeS3.log)
+
+
+def test_discard_aborts_started_upload(tmp_path, s3):
+    """ Testing that a failed download leaves no object and no open upload  """
+    uploader = StorageUploader(s3)
+    download(tmp_path, uploader, "Failed.mp4", os.urandom(2500))
+    assert FakeS3.uploads
+    uploader.discard()
+    assert FakeS3.uploads == {} and FakeS3.objects == {}
+
+
+def test_bad_credentials_raise(s3_endpoint):
+    """ Testing that rejected requests raise S3Error with the status  """
+    client = S3Client(s3_endpoint, access_key=KEY, secret_key="wrong")
+    with pytest.raises(S3Error) as error:
+        client.put_object("media", "k", b"data")
+    assert error.value.status == 403
+    assert "SignatureDoesNotMatch" in str(error.value)
+
+
+def test_local_storage_commits_atomically(tmp_path):
+    """ Testing of LocalStorage publishing a file only on commit  """
+    storage = LocalStorage(tmp_path / "nas")
+    writer = storage.writer("T.mp4")
+    writer.write(b"abc")
+    assert not storage.exists("T.mp4")
+    writer.commit()
+    assert (tmp_path / "nas" / "T.mp4").read_bytes() == b"abc"
+    aborted = storage.writer("U.mp4")
+    aborted.write(b"abc")
+    aborted.abort()
+    assert sorted(os.listdir(tmp_path / "nas")) == ["T.mp4"]
+
+
+def test_create_storage(monkeypatch, tmp_path):
+    """ Testing of create_storage for S3 and local URLs  """
+    monkeypatch.setenv("AWS_ENDPOINT_URL", "http://minio:9000")
+    monkeypatch.setenv("AWS_REGION", "eu-central-1")
+    storage = create_storage("s3://bucket/a/b/")
+    assert isinstance(storage, S3Storage)
+    assert storage.location("T.mp4") == "s3://bucket/a/b/T.mp4"
+    assert storage.client.url("bucket", "a/T 1.mp4") == "http://minio:9000/bucket/a/T%201.mp4"
+    assert storage.client.region == "eu-central-1"
+    storage.close()
+    assert isinstance(create_storage(f"file://{tmp_path}"), LocalStorage)
+    assert create_storage(str(tmp_path / "x")).location("T") == str(tmp_path / "x" / "T")
+
+
+def test_core_moves_downloads_to_storage(tmp_path):
+    """ Testing of DownloaderCore committing downloads and skipping stored files  """
+    storage = LocalStorage(tmp_path / "nas")
+    uploader = StorageUploader(storage)
+    save_dir = tmp_path / "downloads"
+    save_dir.mkdir()
+
+    class DummyExecutor:
+        def execute_download(self, url, opts):
+            self.path = download(save_dir, uploader, "Title.mp4", b"video")
+            return True
+
+        def last_transfer(self):
+            return TransferInfo(path=self.path, bytes=5)
+
+    class DummyStats:
+        def record_success(self):
+            pass
+
+        def record_skip(self):
+            pass
+
+    class DummyLogger:
+        def info(self, msg):
+            pass
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+        def select_format(self, record):
+            return None
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="Title")
+
+    core = DownloaderCore(
+        config=Config(save_dir=save_dir, max_workers=1, quality="best", audio_only=False),
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=DummyLogger(),  # type: ignore
+        file_checker=StorageFileChecker(storage),
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=DummyExecutor(),  # type: ignore
+        uploader=uploader,
+    )
+    result = core.download_result("u")
+    assert result.status == "downloaded"
+    assert result.path == str(tmp_path / "nas" / "Title.mp4")
+    assert "store" in result.timings
+    assert os.listdir(save_dir) == []
+    assert core.download_result("u").status == "skipped"
+
+
+def test_config_storage_validation(tmp_path):
+    """ Testing of the storage options of Config  """
+
+    def config(**kwargs):
+        return Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, **kwargs)
+
+    assert config(storage="s3://bucket").storage == "s3://bucket"
+    with pytest.raises(ValueError):
+        config(storage="s3:///prefix")
+    with pytest.raises(ValueError):
+        config(storage="s3://bucket", postprocess_workers=0)
+    with pytest.raises(ValueError):
+        config(storage="s3://bucket", stream_output="-", urls=["u"])
@@ -43,5 +43,192 @@ def test_audio_strategy():
     strategy = AudioFormatStrategy()
     opts = strategy.get_opts()
     assert opts["format"] == "bestaudio/best"
-    assert opts["extractaudio"] is True
-    assert opts["audioformat"] == "mp3"
+    assert opts["postprocessors"] == [{"key": "FFmpegExtractAudio", "preferredcodec": "mp3"}]
+
+
+from yt_dl_cli.core.records import VideoRecord
+from yt_dl_cli.interfaces.strategies import FormatCostModel, FormatRanker, get_strategy
+
+
+def make_record():
+    """ Build a record with progressive, video-only and audio-only formats  """
+    return VideoRecord.from_info("u", {
+        "duration": 100,
+        "formats": [
+            {"format_id": "18", "ext": "mp4", "height": 360, "vcodec": "avc1.42001E",
+             "acodec": "mp4a.40.2", "filesize": 5_000_000},
+            {"format_id": "22", "ext": "mp4", "height": 720, "vcodec": "avc1.64001F",
+             "acodec": "mp4a.40.2", "tbr": 1000},
+            {"format_id": "136", "ext": "mp4", "height": 720, "vcodec": "avc1.4d401f",
+             "acodec": "none", "filesize": 9_000_000},
+            {"format_id": "137", "ext": "mp4", "height": 1080, "vcodec": "avc1.640028",
+             "acodec": "none", "filesize": 30_000_000},
+            {"format_id": "248", "ext": "webm", "height": 1080, "vcodec": "vp9",
+             "acodec": "none", "filesize": 20_000_000},
+            {"format_id": "139", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.5",
+             "abr": 48, "filesize": 600_000},
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2",
+             "abr": 128, "filesize": 1_600_000},
+            {"format_id": "sb0", "ext": "mhtml", "vcodec": "none", "acodec": "none"},
+        ],
+    })
+
+
+def test_ranker_best_quality_merges():
+    """ Testing that the highest quality wins even if it needs a merge  """
+    choice = FormatRanker().best_video(make_record())
+    assert choice.selector == "137+140"
+    assert choice.size == 31_600_000
+    assert choice.needs_merge
+
+
+def test_ranker_prefers_progressive_at_same_height():
+    """ Testing that a progressive format beats a merge of the same height  """
+    ranker = FormatRanker(FormatCostModel(max_height=720))
+    assert ranker.best_video(make_record()).selector == "22"
+
+    ranker = FormatRanker(FormatCostModel(max_height=720, prefer_progressive=False))
+    assert ranker.best_video(make_record()).selector in ("22", "136+140")
+
+
+def test_ranker_size_budget():
+    """ Testing the size budget (estimated from tbr when filesize is unknown)  """
+    # format 22 is estimated at 1000 kbit/s * 100 s = 12.5 MB
+    ranker = FormatRanker(FormatCostModel(max_filesize=13_000_000))
+    assert ranker.best_video(make_record()).selector == "22"
+
+    ranker = FormatRanker(FormatCostModel(max_filesize=1_000))
+    assert ranker.best_video(make_record()).selector == "18"
+
+
+def test_ranker_size_budget_unknown_size():
+    """ Testing that unknown sizes rank between fitting and oversize formats  """
+    formats = [
+        {"format_id": "18", "ext": "mp4", "height": 360, "vcodec": "avc1",
+         "acodec": "mp4a", "filesize": 5_000_000},
+        {"format_id": "22", "ext": "mp4", "height": 720, "vcodec": "avc1",
+         "acodec": "mp4a"},
+        {"format_id": "37", "ext": "mp4", "height": 1080, "vcodec": "avc1",
+         "acodec": "mp4a", "filesize": 50_000_000},
+    ]
+    ranker = FormatRanker(FormatCostModel(max_filesize=10_000_000))
+    record = VideoRecord.from_info("u", {"formats": formats})
+    assert [c.selector for c in ranker.rank_video(record)] == ["18", "22", "37"]
+
+    record = VideoRecord.from_info("u", {"formats": formats[1:]})
+    assert ranker.best_video(record).selector == "22"
+
+
+def test_ranker_preferred_codecs_and_containers():
+    """ Testing codec preference and container restrictions  """
+    model = FormatCostModel(preferred_codecs=("vp9",), video_exts=("mp4", "webm"))
+    assert FormatRanker(model).best_video(make_record()).selector == "248+140"
+
+
+def test_ranker_audio():
+    """ Testing audio-only ranking  """
+    assert FormatRanker().best_audio(make_record()).selector == "140"
+    ranker = FormatRanker(FormatCostModel(max_filesize=1_000_000))
+    assert ranker.best_audio(make_record()).selector == "139"
+
+
+def test_strategies_select_format():
+    """ Testing select_format of the concrete strategies  """
+    ranker = FormatRanker()
+    record = make_record()
+    assert VideoFormatStrategy("best").select_format(record) is None
+    assert VideoFormatStrategy("worst", ranker).select_format(record) is None
+    assert VideoFormatStrategy("480", ranker).select_format(record) == (
+        "18/best[height<=480][ext=mp4]"
+    )
+    assert AudioFormatStrategy(ranker).select_format(record) == "140/bestaudio/best"
+    assert ranker.model.max_height is None
+
+
+def test_get_strategy_with_ranking():
+    """ Testing that get_strategy wires the ranker from the config  """
+
+    class Config:
+        audio_only = False
+        quality = "1080"
+        rank_formats = True
+        max_filesize = None
+        prefer_progressive = True
+        preferred_codecs = ["avc1"]
+
+    strategy = get_strategy(Config())
+    assert isinstance(strategy, VideoFormatStrategy)
+    assert strategy.ranker.model.max_height == 1080
+    assert strategy.select_format(make_record()).startswith("137+140/")
+
+
+from yt_dl_cli.interfaces.strategies import AdaptiveQualityStrategy
+
+
+class FakeMonitor:
+    """ Monitor stub with a fixed rate and outstanding bytes  """
+
+    def __init__(self, rate, outstanding=0):
+        self._rate = rate
+        self._outstanding = outstanding
+
+    def rate(self):
+        return self._rate
+
+    def outstanding_bytes(self):
+        return self._outstanding
+
+
+def test_adaptive_strategy_picks_quality_from_budget():
+    """ Testing that the per-item budget follows throughput, deadline and queue  """
+    now = [0.0]
+    # 1 MB/s for 100 s shared by 4 items -> 25 MB each: 1080p (31.6 MB) does not fit
+    strategy = AdaptiveQualityStrategy(
+        "best", FakeMonitor(1_000_000), 100, 4, clock=lambda: now[0]
+    )
+    assert strategy.item_budget(4) == 25_000_000
+    assert strategy.select_format(make_record()).startswith("22/")
+    assert strategy.remaining == 3
+
+    # 3 items left on a fast link -> full quality
+    strategy.monitor = FakeMonitor(10_000_000)
+    assert strategy.select_format(make_record()).startswith("137+140/")
+
+    # outstanding bytes and elapsed time shrink the budget, past the deadline it is 0
+    strategy.monitor = FakeMonitor(1_000_000, outstanding=90_000_000)
+    assert strategy.item_budget(2) == 5_000_000
+    now[0] = 150.0
+    assert strategy.item_budget(2) == 0
+    assert strategy.select_format(make_record()).startswith("18/")
+
+
+def test_adaptive_strategy_without_measurement():
+    """ Testing that quality is only capped by --quality until a rate is known  """
+    strategy = AdaptiveQualityStrategy("720", FakeMonitor(None), 100, 2)
+    assert strategy.item_budget(2) is None
+    assert strategy.select_format(make_record()) == "22/best[height<=720][ext=mp4]"
+
+
+def test_get_strategy_with_deadline():
+    """ Testing that a deadline selects the adaptive strategy for video only  """
+
+    class Config:
+        audio_only = False
+        quality = "best"
+        rank_formats = False
+        max_filesize = 10_000_000
+        prefer_progressive = True
+        preferred_codecs = ["avc1"]
+        deadline = 60.0
+        urls = ["a", "b", "c"]
+
+    monitor = FakeMonitor(None)
+    strategy = get_strategy(Config(), monitor)
+    assert isinstance(strategy, AdaptiveQualityStrategy)
+    assert strategy.monitor is monitor
+    assert strategy.remaining == 3
+    # the static max_filesize still caps the adaptive budget
+    assert strategy.select_format(make_record()).startswith("18/")
+
+    Config.audio_only = True
+    assert isinstance(get_strategy(Config(), monitor), AudioFormatStrategy)
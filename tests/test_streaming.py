@@ -0,0 +1,210 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+from yt_dlp.extractor.common import InfoExtractor
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.streaming import StreamExecutor, StreamingStrategy, streamable_selector
+from yt_dl_cli.utils.stream_sink import (
+    FRAME_DATA,
+    FRAME_END,
+    FRAME_START,
+    StreamSink,
+    read_frames,
+)
+
+MEDIA = bytes(range(256)) * 40  # 10240 bytes
+
+
+class DummyLogger:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, msg):
+        self.errors.append(str(msg))
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves MEDIA with support for single byte ranges"""
+
+    ranges = []
+
+    def do_GET(self):
+        header = self.headers.get("Range")
+        body, status = MEDIA, 200
+        if header:
+            start, end = header.split("=")[1].split("-")
+            body = MEDIA[int(start):int(end) + 1]
+            status = 206
+            RangeHandler.ranges.append(header)
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def media_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    RangeHandler.ranges = []
+    yield "http://127.0.0.1:%d/media" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def make_extractor(media_url, chunk_size=None, protocol_url=None):
+    class FakeIE(InfoExtractor):
+        IE_NAME = "fake"
+        _VALID_URL = r"fake:(?P<id>.+)"
+
+        def _real_extract(self, url):
+            video_id = self._match_id(url)
+            fmt = {"format_id": "a", "url": protocol_url or media_url, "ext": "m4a"}
+            fmt["filesize"] = len(MEDIA)
+            if chunk_size:
+                fmt["downloader_options"] = {"http_chunk_size": chunk_size}
+            return {"id": video_id, "title": "Title " + video_id, "formats": [fmt]}
+
+    return FakeIE()
+
+
+class Target(io.BytesIO):
+    def close(self):
+        pass
+
+
+def test_streamable_selector():
+    """ Testing of streamable_selector  """
+    assert streamable_selector("137+140/18/best") == "18/best"
+    assert streamable_selector("137+140") is None
+    assert streamable_selector(None) is None
+
+
+def test_framed_sink_round_trip():
+    """ Testing of StreamSink frames and read_frames  """
+    target = Target()
+    sink = StreamSink("-", framed=True, opener=lambda: target)
+    first = sink.start({"url": "a"})
+    second = sink.start({"url": "b"})
+    sink.data(first, b"aa")
+    sink.data(second, b"bb")
+    sink.end(first, {"status": "finished"})
+    sink.end(second, {"status": "error"})
+    frames = list(read_frames(io.BytesIO(target.getvalue())))
+    assert [(kind, sid) for kind, sid, _ in frames] == [
+        (FRAME_START, 1), (FRAME_START, 2), (FRAME_DATA, 1),
+        (FRAME_DATA, 2), (FRAME_END, 1), (FRAME_END, 2),
+    ]
+    assert json.loads(frames[0][2]) == {"url": "a"}
+    with pytest.raises(ValueError):
+        list(read_frames(io.BytesIO(target.getvalue()[:-1])))
+
+
+def test_raw_stream_in_chunks(media_server):
+    """ Testing of StreamExecutor streaming raw bytes with Range requests  """
+    target = Target()
+    sink = StreamSink("-", framed=False, opener=lambda: target)
+    progress = []
+    executor = StreamExecutor(
+        DummyLogger(), sink, [progress.append], [make_extractor(media_server, 4096)], 1000
+    )
+    assert executor.execute_download("fake:1", {"format": "a+b/a"})
+    assert target.getvalue() == MEDIA
+    assert RangeHandler.ranges == ["bytes=0-4095", "bytes=4096-8191", "bytes=8192-12287"]
+    assert executor.last_transfer().bytes == len(MEDIA)
+    assert progress[-1]["status"] == "finished"
+    assert progress[-1]["downloaded_bytes"] == len(MEDIA)
+
+
+def test_framed_stream_of_several_urls(media_server):
+    """ Testing of concurrent framed streams  """
+    target = Target()
+    sink = StreamSink("-", framed=True, opener=lambda: target)
+    executor = StreamExecutor(DummyLogger(), sink, [], [make_extractor(media_server)], 512)
+    threads = [
+        threading.Thread(target=executor.execute_download, args=(f"fake:{i}", {}))
+        for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    streams = {}
+    titles = {}
+    for kind, stream_id, payload in read_frames(io.BytesIO(target.getvalue())):
+        if kind == FRAME_START:
+            titles[stream_id] = json.loads(payload)["title"]
+        elif kind == FRAME_DATA:
+            streams[stream_id] = streams.get(stream_id, b"") + payload
+        else:
+            assert json.loads(payload) == {"status": "finished", "bytes": len(MEDIA)}
+    assert sorted(titles.values()) == ["Title 0", "Title 1", "Title 2"]
+    assert all(data == MEDIA for data in streams.values()) and len(streams) == 3
+
+
+def test_unstreamable_format_fails(media_server):
+    """ Testing that non-HTTP formats are reported as failures  """
+    target = Target()
+    logger = DummyLogger()
+    sink = StreamSink("-", framed=True, opener=lambda: target)
+    extractor = make_extractor(media_server, protocol_url=media_server + ".m3u8")
+    executor = StreamExecutor(logger, sink, [], [extractor])
+    assert not executor.execute_download("fake:1", {})
+    assert "cannot be streamed" in logger.errors[0]
+    assert target.getvalue() == b""
+
+
+def test_stream_to_named_pipe(tmp_path, media_server):
+    """ Testing of streaming into a named pipe created on demand  """
+    fifo = tmp_path / "pipe"
+    sink = StreamSink(str(fifo), framed=False)
+    executor = StreamExecutor(DummyLogger(), sink, [], [make_extractor(media_server)])
+    received = []
+    writer = threading.Thread(target=executor.execute_download, args=("fake:1", {}))
+    writer.start()
+    while not fifo.exists():
+        threading.Event().wait(0.01)
+    with open(fifo, "rb") as reader:
+        writer.join()
+        sink.close()
+        received.append(reader.read())
+    assert received == [MEDIA]
+
+
+def test_streaming_strategy_and_config(tmp_path):
+    """ Testing of StreamingStrategy and the stream options of Config  """
+
+    class Inner:
+        def get_opts(self):
+            return {"format": "best", "postprocessors": [{"key": "FFmpegExtractAudio"}]}
+
+        def select_format(self, record):
+            return "137+140/18"
+
+    strategy = StreamingStrategy(Inner())
+    assert strategy.get_opts() == {"format": "best", "logtostderr": True}
+    assert strategy.select_format(None) == "18"
+
+    def config(**kwargs):
+        return Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=True, **kwargs)
+
+    assert config(urls=["u"], stream_output="-").stream_framing == "raw"
+    assert config(urls=["u", "v"], stream_output="-").stream_framing == "framed"
+    with pytest.raises(ValueError):
+        config(urls=["u", "v"], stream_output="-", stream_framing="raw")
+    with pytest.raises(ValueError):
+        config(urls=["u"], stream_output="-", metadata_only=True)
+    with pytest.raises(ValueError):
+        config(stream_framing="zip")
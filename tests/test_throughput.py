@@ -0,0 +1,60 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from yt_dl_cli.utils.throughput import ThroughputMonitor
+
+
+def make_monitor():
+    """ Build a monitor driven by a fake clock  """
+    now = [0.0]
+    monitor = ThroughputMonitor(window=10.0, min_span=1.0, clock=lambda: now[0])
+    return monitor, now
+
+
+def test_rate_aggregates_files():
+    """ Testing that deltas of concurrent files are summed into one rate  """
+    monitor, now = make_monitor()
+    assert monitor.rate() is None
+    monitor.progress_hook({"status": "downloading", "filename": "a", "downloaded_bytes": 0})
+    monitor.progress_hook({"status": "downloading", "filename": "b", "downloaded_bytes": 0})
+    now[0] = 2.0
+    monitor.progress_hook({"status": "downloading", "filename": "a", "downloaded_bytes": 3000})
+    monitor.progress_hook({"status": "downloading", "filename": "b", "downloaded_bytes": 1000})
+    assert monitor.rate() == 2000.0
+
+
+def test_rate_needs_min_span_and_window():
+    """ Testing min_span and the sliding window  """
+    monitor, now = make_monitor()
+    monitor.add_bytes(500)
+    assert monitor.rate() is None
+    now[0] = 5.0
+    monitor.add_bytes(500)
+    assert monitor.rate() == 200.0
+    now[0] = 12.0
+    # the first sample left the 10 s window
+    assert monitor.rate() == 50.0
+    now[0] = 30.0
+    assert monitor.rate() == 0.0
+
+
+def test_outstanding_bytes():
+    """ Testing the bytes left for in-flight files  """
+    monitor, _ = make_monitor()
+    monitor.progress_hook({
+        "status": "downloading", "filename": "a", "downloaded_bytes": 400, "total_bytes": 1000,
+    })
+    monitor.progress_hook({
+        "status": "downloading", "filename": "b", "downloaded_bytes": 100,
+        "total_bytes_estimate": 300,
+    })
+    monitor.progress_hook({"status": "downloading", "filename": "c", "downloaded_bytes": 50})
+    assert monitor.outstanding_bytes() == 800
+
+    monitor.progress_hook({"status": "finished", "filename": "a", "downloaded_bytes": 1000})
+    assert monitor.outstanding_bytes() == 200
+    monitor.progress_hook({"status": "error", "filename": "b"})
+    assert monitor.outstanding_bytes() == 0
+    assert monitor._window_bytes == 1150
@@ -0,0 +1,167 @@
+""" Testing of per-URL lifecycle tracing """
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.core.orchestration import AsyncOrchestrator
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.tracing import NullTracer, OTLPFileExporter, Tracer, url_host
+
+
+def read_spans(path):
+    """Return all spans of an OTLP JSON lines file"""
+    spans = []
+    for line in path.read_text().splitlines():
+        for resource in json.loads(line)["resourceSpans"]:
+            for scope in resource["scopeSpans"]:
+                spans.extend(scope["spans"])
+    return spans
+
+
+def attributes(span):
+    """Return the attributes of an OTLP span as a plain dict"""
+    return {a["key"]: next(iter(a["value"].values())) for a in span["attributes"]}
+
+
+def test_nested_spans_share_trace_and_parent(tmp_path):
+    """Test parent/child relationships, attributes and error status"""
+    path = tmp_path / "trace.jsonl"
+    tracer = Tracer(OTLPFileExporter(path))
+    with tracer.span("url", host="example.com") as root:
+        with tracer.span("extracting") as child:
+            child.set_attribute("bytes", 42)
+        with pytest.raises(RuntimeError):
+            with tracer.span("downloading"):
+                raise RuntimeError("boom")
+    tracer.close()
+
+    spans = {span["name"]: span for span in read_spans(path)}
+    assert set(spans) == {"url", "extracting", "downloading"}
+    assert "parentSpanId" not in spans["url"]
+    for name in ("extracting", "downloading"):
+        assert spans[name]["traceId"] == root.trace_id
+        assert spans[name]["parentSpanId"] == root.span_id
+    assert attributes(spans["extracting"]) == {"bytes": "42"}
+    assert attributes(spans["url"]) == {"host": "example.com"}
+    assert spans["downloading"]["status"]["code"] == 2
+    assert spans["url"]["status"]["code"] == 1
+
+
+def test_exporter_batches_lines(tmp_path):
+    """Test that spans are written in batches by the background thread"""
+    path = tmp_path / "nested" / "trace.jsonl"
+    tracer = Tracer(OTLPFileExporter(path, batch_size=4, flush_interval=60))
+    for index in range(10):
+        tracer.start_span("url", index=index).end()
+    tracer.close()
+    lines = path.read_text().splitlines()
+    assert len(read_spans(path)) == 10
+    assert 3 <= len(lines) <= 10
+
+
+def test_hooks_annotate_active_span(tmp_path):
+    """Test the yt-dlp progress and post-processor hooks"""
+    path = tmp_path / "trace.jsonl"
+    tracer = Tracer(OTLPFileExporter(path))
+    with tracer.span("downloading"):
+        tracer.progress_hook({"status": "downloading", "downloaded_bytes": 10})
+        tracer.progress_hook(
+            {"status": "finished", "downloaded_bytes": 100, "info_dict": {"format_id": "137"}}
+        )
+        tracer.progress_hook(
+            {"status": "finished", "total_bytes": 50, "info_dict": {"format_id": "140"}}
+        )
+        tracer.postprocessor_hook({"status": "started", "postprocessor": "Merger"})
+        tracer.postprocessor_hook({"status": "finished", "postprocessor": "Merger"})
+    tracer.close()
+
+    spans = {span["name"]: span for span in read_spans(path)}
+    assert attributes(spans["downloading"])["bytes"] == "150"
+    assert spans["merging"]["parentSpanId"] == spans["downloading"]["spanId"]
+
+
+def test_postprocessor_errors_end_span_as_failed(tmp_path):
+    """Test that failed or unfinished post-processor runs are ended as errors"""
+    path = tmp_path / "trace.jsonl"
+    tracer = Tracer(OTLPFileExporter(path))
+    with tracer.span("downloading") as downloading:
+        tracer.postprocessor_hook({"status": "started", "postprocessor": "Merger"})
+        tracer.postprocessor_hook(
+            {"status": "error", "postprocessor": "Merger", "error": "ffmpeg exited 1"}
+        )
+        assert tracer.current() is downloading
+    with pytest.raises(RuntimeError):
+        with tracer.span("downloading"):
+            tracer.postprocessor_hook({"status": "started", "postprocessor": "FFmpegMetadata"})
+            raise RuntimeError("boom")
+    tracer.close()
+
+    spans = {span["name"]: span for span in read_spans(path)}
+    assert spans["merging"]["status"] == {"code": 2, "message": "ffmpeg exited 1"}
+    assert spans["merging"]["parentSpanId"] == downloading.span_id
+    assert spans["postprocessing"]["status"]["code"] == 2
+    assert len(read_spans(path)) == 4
+
+
+class TracedCore:
+    """Core for tests whose handler records a span"""
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.profiler = NullProfiler()
+
+    def download_single(self, url):
+        """Pretend to download"""
+        with self.tracer.span("extracting"):
+            pass
+        self.tracer.current().set_attribute("outcome", "downloaded")
+
+
+class TracedConfig:
+    """Config for tests"""
+
+    def __init__(self, urls):
+        self.urls = urls
+        self.max_workers = 3
+        self.metadata_only = False
+
+
+def test_orchestrator_emits_root_span_per_url(tmp_path):
+    """Test that every URL gets its own trace with queued and handler spans"""
+    path = tmp_path / "trace.jsonl"
+    tracer = Tracer(OTLPFileExporter(path))
+    urls = [f"https://host{i}.example/watch" for i in range(5)]
+    orchestrator = AsyncOrchestrator(TracedCore(tracer), TracedConfig(urls))  # type: ignore
+    asyncio.run(orchestrator._run_workers(urls, orchestrator.core.download_single))
+    tracer.close()
+
+    spans = read_spans(path)
+    roots = [span for span in spans if span["name"] == "url"]
+    assert sorted(attributes(root)["url"] for root in roots) == urls
+    for root in roots:
+        assert attributes(root)["outcome"] == "downloaded"
+        assert [event["name"] for event in root["events"]] == ["done"]
+        children = sorted(
+            span["name"] for span in spans if span.get("parentSpanId") == root["spanId"]
+        )
+        assert children == ["extracting", "queued"]
+    assert len({root["traceId"] for root in roots}) == len(urls)
+
+
+def test_null_tracer_is_transparent():
+    """Test that the null tracer accepts every call"""
+    tracer = NullTracer()
+    with tracer.span("url", host="x") as span:
+        span.set_attribute("bytes", 1)
+    tracer.current().set_attribute("outcome", "ok")
+    tracer.start_span("queued").end()
+    assert tracer.run(None, str.upper, "url") == "URL"
+    tracer.progress_hook({"status": "finished"})
+    tracer.close()
+    assert url_host("https://www.youtube.com/watch?v=x") == "www.youtube.com"
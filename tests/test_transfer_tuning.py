@@ -0,0 +1,205 @@
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.config.config import Config
+from yt_dl_cli.core.core import DownloaderCore
+from yt_dl_cli.core.orchestration import DIContainer
+from yt_dl_cli.core.records import TransferInfo, VideoRecord
+from yt_dl_cli.utils.transfer_tuning import TransferSettings, TransferTuner, host_of
+
+SLOW = TransferSettings()
+FAST = TransferSettings(65536, None, False)
+CHUNKED = TransferSettings(65536, 1000, False)
+
+# seconds needed per 1000 bytes with each candidate
+SPEED = {SLOW: 2.0, FAST: 0.5, CHUNKED: 1.0}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DummyLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, msg):
+        self.messages.append(str(msg))
+
+    def warning(self, msg):
+        self.messages.append(str(msg))
+
+
+def tuner(tmp_path, clock, **kwargs):
+    return TransferTuner(
+        path=tmp_path / "tuning.json",
+        candidates=[SLOW, FAST, CHUNKED],
+        probe_bytes=1000,
+        clock=clock,
+        **kwargs,
+    )
+
+
+def download(tuner, clock, url, size=3000, fail_at=None):
+    """Run the progress hooks of a download at the speed of the settings it got"""
+    settings = tuner.settings_for(url)
+    for downloaded in range(0, size + 1, 500):
+        if downloaded == fail_at:
+            tuner.progress_hook({"status": "error"})
+            return settings
+        clock.now += SPEED.get(settings, 1.0) * 500 / 1000
+        tuner.progress_hook({"status": "downloading", "downloaded_bytes": downloaded})
+    tuner.progress_hook({"status": "finished", "downloaded_bytes": size})
+    return settings
+
+
+def test_settings_opts_and_override():
+    """ Testing of the yt-dlp options of TransferSettings  """
+    assert SLOW.opts() == {}
+    assert CHUNKED.opts() == {"buffersize": 65536, "http_chunk_size": 1000, "noresizebuffer": True}
+    fixed = TransferSettings(http_chunk_size=4096)
+    assert CHUNKED.override(fixed) == TransferSettings(65536, 4096, False)
+    assert host_of("https://WWW.YouTube.com/watch?v=x") == "youtube.com"
+
+
+def test_fixed_settings_without_calibration():
+    """ Testing that without a calibration file the configured settings are used  """
+    fixed = TransferTuner(FAST)
+    assert not fixed.calibrating
+    assert fixed.settings_for("https://a.example/v") == FAST
+    fixed.progress_hook({"status": "downloading", "downloaded_bytes": 10})
+
+
+def test_calibration_picks_fastest_and_persists(tmp_path):
+    """ Testing that each candidate is measured once and the fastest is kept  """
+    clock, logger = Clock(), DummyLogger()
+    first = tuner(tmp_path, clock, logger=logger)
+    used = [download(first, clock, f"https://cdn.example/{n}") for n in range(3)]
+    assert set(used) == {SLOW, FAST, CHUNKED}
+    assert first.best("cdn.example") == FAST
+    assert first.settings_for("https://cdn.example/4") == FAST
+    assert "cdn.example" in logger.messages[0]
+    # other hosts are calibrated separately
+    assert first.settings_for("https://other.example/1") == SLOW
+
+    second = tuner(tmp_path, clock)
+    assert second.settings_for("https://www.cdn.example/5") == FAST
+    stored = json.loads((tmp_path / "tuning.json").read_text())
+    assert stored["hosts"]["cdn.example"]["best"]["buffer_size"] == 65536
+
+
+def test_incomplete_probes_are_retried(tmp_path):
+    """ Testing that failed and short downloads do not count as measurements  """
+    clock = Clock()
+    tuning = tuner(tmp_path, clock)
+    assert download(tuning, clock, "https://cdn.example/1", fail_at=500) == SLOW
+    assert download(tuning, clock, "https://cdn.example/2", size=500) == SLOW
+    assert download(tuning, clock, "https://cdn.example/3") == SLOW
+    assert tuning.best("cdn.example") is None
+    # measurements so far are kept for the next run
+    tuning.close()
+    resumed = tuner(tmp_path, clock)
+    assert resumed.settings_for("https://cdn.example/4") == FAST
+
+
+def test_parallel_downloads_try_different_candidates(tmp_path):
+    """ Testing that concurrent downloads of a host are given different candidates  """
+    tuning = tuner(tmp_path, Clock())
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append(tuning.settings_for("https://cdn.example/v")))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    assert set(seen) == {SLOW, FAST, CHUNKED}
+
+
+def test_configured_sizes_are_kept(tmp_path):
+    """ Testing that calibration only varies the settings that are not configured  """
+    tuning = TransferTuner(TransferSettings(http_chunk_size=4096), tmp_path / "t.json")
+    assert all(c.http_chunk_size == 4096 for c in tuning.candidates)
+    assert len(tuning.candidates) == 3
+    fixed = TransferTuner(TransferSettings(1, 1, True), tmp_path / "t.json")
+    assert not fixed.calibrating
+
+
+def test_unreadable_file_starts_over(tmp_path):
+    """ Testing that a corrupt calibration file is ignored  """
+    (tmp_path / "tuning.json").write_text("{not json")
+    tuning = tuner(tmp_path, Clock())
+    assert tuning.settings_for("https://cdn.example/1") == SLOW
+
+
+def test_core_passes_settings_to_download(tmp_path):
+    """ Testing that DownloaderCore adds the tuner's settings to the download options  """
+    seen = {}
+
+    class DummyExecutor:
+        def execute_download(self, url, opts):
+            seen.update(opts)
+            return True
+
+        def last_transfer(self):
+            return TransferInfo(path=str(tmp_path / "Title.mp4"), bytes=5)
+
+    class DummyStats:
+        def record_success(self):
+            pass
+
+    class DummyStrategy:
+        def get_opts(self):
+            return {}
+
+        def select_format(self, record):
+            return None
+
+    class DummyFileChecker:
+        def exists(self, path):
+            return False
+
+    class DummyInfoExtractor:
+        def extract_record(self, url, opts):
+            return VideoRecord(url, title="Title")
+
+    core = DownloaderCore(
+        config=Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False),
+        strategy=DummyStrategy(),  # type: ignore
+        stats=DummyStats(),  # type: ignore
+        logger=DummyLogger(),  # type: ignore
+        file_checker=DummyFileChecker(),  # type: ignore
+        info_extractor=DummyInfoExtractor(),  # type: ignore
+        download_executor=DummyExecutor(),  # type: ignore
+        transfer_tuner=TransferTuner(TransferSettings(http_chunk_size=10 * 1024 * 1024)),
+    )
+    assert core.download_result("https://cdn.example/v").status == "downloaded"
+    assert seen["http_chunk_size"] == 10 * 1024 * 1024
+    assert "buffersize" not in seen
+
+
+def test_config_transfer_options(tmp_path):
+    """ Testing of the transfer options of Config and their wiring  """
+
+    def config(**kwargs):
+        return Config(save_dir=tmp_path, max_workers=1, quality="best", audio_only=False, **kwargs)
+
+    assert config(tune_transfers=True).tuning_file == tmp_path / ".transfer_tuning.json"
+    assert config(tuning_file=str(tmp_path / "t.json")).tune_transfers
+    with pytest.raises(ValueError):
+        config(buffer_size=0)
+    with pytest.raises(ValueError):
+        config(http_chunk_size=-1)
+    assert DIContainer._create_transfer_tuner(config(), DummyLogger()) is None
+    tuning = DIContainer._create_transfer_tuner(config(no_resize_buffer=True), DummyLogger())
+    assert tuning.settings == TransferSettings(resize_buffer=False)
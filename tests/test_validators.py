@@ -53,3 +53,54 @@ def test_validate_quality(quality, should_raise):
             ArgValidator.validate_quality(quality)
     else:
         assert ArgValidator.validate_quality(quality) == quality
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1024", 1024), ("500K", 500 * 1024), ("20MiB", 20 * 1024**2), ("1.5g", int(1.5 * 1024**3))],
+)
+def test_validate_size(value, expected):
+    assert ArgValidator.validate_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "abc", "-5M", "0", "12X"])
+def test_validate_size_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidator.validate_size(value)
+
+
+def test_validate_codec_list():
+    assert ArgValidator.validate_codec_list("avc1, mp4a,") == ["avc1", "mp4a"]
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidator.validate_codec_list(" , ")
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("600", 600.0), ("90s", 90.0), ("45m", 2700.0), ("1.5H", 5400.0)]
+)
+def test_validate_duration(value, expected):
+    assert ArgValidator.validate_duration(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "soon", "-5m", "0", "10d"])
+def test_validate_duration_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidator.validate_duration(value)
+
+
+def test_validate_positive_count():
+    assert ArgValidator.validate_positive_count("3") == 3
+    for value in ("0", "-1", "x"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            ArgValidator.validate_positive_count(value)
+
+
+@pytest.mark.parametrize("value, expected", [("0", 0.0), ("0.05", 0.05), ("2s", 2.0)])
+def test_validate_delay(value, expected):
+    assert ArgValidator.validate_delay(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "-0.5", "soon"])
+def test_validate_delay_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidator.validate_delay(value)
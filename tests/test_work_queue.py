@@ -0,0 +1,205 @@
+""" Testing of the shared work queue """
+
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from yt_dl_cli.core.orchestration import AsyncOrchestrator
+from yt_dl_cli.core.records import DownloadStatus
+from yt_dl_cli.core.work_queue import LeaseKeeper, MemoryWorkQueue, SQLiteWorkQueue
+from yt_dl_cli.interfaces.strategies import VideoFormatStrategy
+from yt_dl_cli.utils.profiler import NullProfiler
+from yt_dl_cli.utils.tracing import NullTracer
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_queue(request, tmp_path):
+    """Factory of work queues of both implementations sharing one clock"""
+    clock = FakeClock()
+    queues = []
+
+    def make(max_attempts=3):
+        if request.param == "memory":
+            queue = MemoryWorkQueue(max_attempts=max_attempts, clock=clock)
+        else:
+            queue = SQLiteWorkQueue(
+                tmp_path / "queue.db", max_attempts=max_attempts, clock=clock
+            )
+        queues.append(queue)
+        return queue
+
+    make.clock = clock
+    yield make
+    for queue in queues:
+        queue.close()
+
+
+def test_add_ignores_known_urls(make_queue):
+    """Test that queued and finished URLs are not added twice"""
+    queue = make_queue()
+    assert queue.add(["a", "b", "a"]) == 2
+    lease = queue.claim("w1", 60)
+    assert queue.complete(lease, DownloadStatus.DOWNLOADED)
+    assert queue.add(["a", "b", "c"]) == 1
+    assert queue.counts() == {"downloaded": 1, "pending": 2}
+
+
+def test_claims_in_order_until_empty(make_queue):
+    """Test that URLs are claimed once each, in the order they were added"""
+    queue = make_queue()
+    queue.add(["a", "b"])
+    first, second = queue.claim("w1", 60), queue.claim("w2", 60)
+    assert (first.url, second.url) == ("a", "b")
+    assert queue.claim("w3", 60) is None
+    assert queue.counts() == {"leased": 2}
+
+
+def test_expired_lease_is_reassigned(make_queue):
+    """Test that a dead worker's URL goes to the next worker and its result is rejected"""
+    queue = make_queue()
+    queue.add(["a"])
+    dead = queue.claim("dead", 60)
+    make_queue.clock.now += 30
+    assert queue.heartbeat(dead, 60)
+    make_queue.clock.now += 59
+    assert queue.claim("w2", 60) is None
+
+    make_queue.clock.now += 2
+    alive = queue.claim("w2", 60)
+    assert (alive.url, alive.attempts) == ("a", 2)
+    assert not queue.heartbeat(dead, 60)
+    assert not queue.complete(dead, DownloadStatus.FAILED)
+    assert queue.complete(alive, DownloadStatus.SKIPPED)
+    assert queue.counts() == {"skipped": 1}
+
+
+def test_poison_url_fails_after_max_attempts(make_queue):
+    """Test that a URL whose lease keeps expiring is eventually failed"""
+    queue = make_queue(max_attempts=2)
+    queue.add(["poison"])
+    for _ in range(2):
+        assert queue.claim("w", 10) is not None
+        make_queue.clock.now += 11
+    assert queue.claim("w", 10) is None
+    assert queue.counts() == {"failed": 1}
+
+
+def test_sqlite_queue_shared_by_processes(tmp_path):
+    """Test that concurrent workers of several queue instances never share a URL"""
+    urls = [f"https://example.com/{i}" for i in range(200)]
+    SQLiteWorkQueue(tmp_path / "q.db").add(urls)
+    claimed = []
+    lock = threading.Lock()
+
+    def node(name):
+        queue = SQLiteWorkQueue(tmp_path / "q.db")
+        while True:
+            lease = queue.claim(name, 60)
+            if lease is None:
+                break
+            with lock:
+                claimed.append(lease.url)
+            queue.complete(lease, DownloadStatus.DOWNLOADED)
+        queue.close()
+
+    threads = [threading.Thread(target=node, args=(f"n{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == sorted(urls)
+    assert SQLiteWorkQueue(tmp_path / "q.db").counts() == {"downloaded": 200}
+
+
+def test_lease_keeper_reports_lost_leases():
+    """Test that the keeper renews leases and records the ones it lost"""
+    clock = FakeClock()
+    queue = MemoryWorkQueue(clock=clock)
+    queue.add(["a", "b"])
+    kept, stolen = queue.claim("me", 10), queue.claim("me", 10)
+    keeper = LeaseKeeper(queue, 10)
+    keeper.track(kept)
+    keeper.track(stolen)
+    clock.now += 8
+    queue.complete(stolen, DownloadStatus.FAILED)
+    keeper.renew()
+    clock.now += 8
+    assert queue.claim("other", 10) is None
+    assert keeper.lost == {"b"}
+
+
+class QueueCore:
+    """Core for tests backed by a work queue"""
+
+    def __init__(self, work_queue):
+        self.work_queue = work_queue
+        self.postprocessing = None
+        self.mover = None
+        self.connection_pool = None
+        self.dns_cache = None
+        self.strategy = VideoFormatStrategy("best")
+        self.tracer = NullTracer()
+        self.profiler = NullProfiler()
+        self.logger = self
+        self.stats = self
+        self.processed = []
+        self.messages = []
+
+    def info(self, msg):
+        """Collect log messages"""
+        self.messages.append(msg)
+
+    warning = info
+
+    def report(self, logger, elapsed):
+        """Report stats"""
+
+    def download_single(self, url):
+        """Pretend to download"""
+        self.processed.append(url)
+        return DownloadStatus.SKIPPED if url.endswith("skip") else DownloadStatus.DOWNLOADED
+
+
+class QueueConfig:
+    """Config for tests"""
+
+    def __init__(self, urls):
+        self.urls = urls
+        self.max_workers = 3
+        self.metadata_only = False
+        self.queue_path = None
+        self.worker_id = "node-b"
+        self.lease_time = 60.0
+        self.schedule = "fifo"
+        self.priorities = {}
+        self.expand_playlists = False
+
+
+def test_orchestrator_drains_queue_and_takes_over_dead_leases():
+    """Test queue mode: seeding, outcomes, and reassignment of an expired lease"""
+    queue = MemoryWorkQueue()
+    queue.add(["https://x/orphan"])
+    queue.claim("node-a", 0.05)  # node-a dies while holding this URL
+    core = QueueCore(queue)
+    config = QueueConfig(["https://x/1", "https://x/2-skip", "https://x/orphan"])
+    orchestrator = AsyncOrchestrator(core, config)  # type: ignore
+    orchestrator.queue_poll_interval = 0.01
+    asyncio.run(orchestrator.run())
+
+    assert sorted(core.processed) == ["https://x/1", "https://x/2-skip", "https://x/orphan"]
+    assert queue.counts() == {"downloaded": 2, "skipped": 1}